@@ -0,0 +1,42 @@
+"""Synthetic market data and timing helpers shared by the benchmark scripts."""
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+# Trading days per year, used to turn "years" into bar counts
+TRADING_DAYS = 252
+
+
+def make_ohlcv(n: int, seed: int = 0, start: str = "2000-01-03") -> pd.DataFrame:
+    """Create a random-walk OHLCV DataFrame with `n` business-day rows."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, n)))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.005, n) * close,
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(100_000, 10_000_000, n).astype(float),
+        },
+        index=pd.bdate_range(start, periods=n),
+    )
+
+
+def make_universe(n_symbols: int, n: int, seed: int = 0) -> dict[str, pd.DataFrame]:
+    """Create a dict of `n_symbols` independent synthetic OHLCV frames."""
+    return {f"SYM{i:04d}": make_ohlcv(n, seed=seed + i) for i in range(n_symbols)}
+
+
+def best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Return the best wall-clock time in seconds over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
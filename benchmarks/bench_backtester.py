@@ -0,0 +1,88 @@
+"""Benchmark: per-signal backtest loop vs. the array core.
+
+Times one backtest on a signal series four ways: the original loop over
+Signal objects with a date-keyed equity dict, `Backtester.run` (now an
+adapter), `Backtester.run_arrays`, and `simulate` on many paths at once
+(the walk-forward case, metrics only), without and with an execution
+model charging tiered commission, slippage, spread and board lots.
+
+Usage:
+    python benchmarks/bench_backtester.py
+    python benchmarks/bench_backtester.py --years 1 20 --paths 10000
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from _synthetic import TRADING_DAYS, best_of
+
+from ai_financial_advisor.strategies.backtester import Backtester, backtest_years, simulate
+from ai_financial_advisor.strategies.execution import ExecutionModel
+from ai_financial_advisor.strategies.trend_strategy import Signal
+
+
+def original_loop(signals: list[Signal], initial_capital: float = 100000) -> tuple:
+    """The original implementation's hot path: equity dict, Series, metrics."""
+    capital, shares, buy_price, trades = initial_capital, 0.0, 0.0, []
+    equity_values: dict = {}
+    for signal in signals:
+        if signal.action == "buy" and shares == 0:
+            shares, buy_price, capital = capital / signal.price, signal.price, 0.0
+        elif signal.action == "sell" and shares > 0:
+            capital = shares * signal.price
+            trades.append(round((signal.price - buy_price) / buy_price * 100, 4))
+            shares = 0.0
+        equity_values[signal.date] = capital + shares * signal.price
+    if shares > 0:
+        capital = shares * signals[-1].price
+    equity_curve = pd.Series(equity_values)
+    daily_returns = equity_curve.pct_change().dropna()
+    sharpe = float(daily_returns.mean() / daily_returns.std() * np.sqrt(252))
+    drawdown = float(((equity_curve - equity_curve.expanding().max()) / equity_curve.expanding().max()).min())
+    return capital, sharpe, drawdown, trades
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[2, 10])
+    parser.add_argument("--paths", type=int, default=2000, help="Paths for the batched simulate() run.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    costs = ExecutionModel(
+        commission_tiers=((0, 10), (50000, 5)), min_commission=1, slippage_bps=5, spread_fraction=0.1, lot_size=100
+    )
+    print(
+        f"{'Years':>5} {'Loop (ms)':>10} {'run (ms)':>9} {'run_arrays (ms)':>16} "
+        f"{'Batched (bt/s)':>15} {'With costs (bt/s)':>18}"
+    )
+    print("-" * 78)
+    for years in args.years:
+        n = years * TRADING_DAYS
+        rng = np.random.default_rng(years)
+        dates = pd.bdate_range("2000-01-03", periods=n)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+        actions = rng.choice(np.array(["buy", "sell", "hold"], dtype=object), size=n, p=[0.05, 0.05, 0.9])
+        signals = [Signal(date=d, action=a, score=0.0, price=p) for d, a, p in zip(dates, actions, prices.tolist())]
+        bt = Backtester()
+
+        loop_s = best_of(lambda: original_loop(signals), args.repeat)
+        run_s = best_of(lambda: bt.run(signals), args.repeat)
+        arrays_s = best_of(lambda: bt.run_arrays(dates, prices, actions), args.repeat)
+
+        buy = rng.random((n, args.paths)) < 0.05
+        sell = rng.random((n, args.paths)) < 0.05
+        batch_s = best_of(lambda: simulate(prices, buy, sell).metrics(100000, backtest_years(dates)), 1)
+        bars = {"Open": prices, "High": prices * 1.01, "Low": prices * 0.99}
+        costs_s = best_of(
+            lambda: simulate(prices, buy, sell, 100000, costs, bars).metrics(100000, backtest_years(dates)), 1
+        )
+        print(
+            f"{years:>5} {loop_s * 1e3:>10.2f} {run_s * 1e3:>9.2f} {arrays_s * 1e3:>16.2f} "
+            f"{args.paths / batch_s:>15.0f} {args.paths / costs_s:>18.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
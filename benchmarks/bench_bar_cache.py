@@ -0,0 +1,85 @@
+"""Benchmark: cold, warm and top-up runs of download_stock_data through the bar cache.
+
+yfinance is replaced by a local fake that serves synthetic history with a
+fixed per-request latency, so the numbers measure round trips and bytes
+saved rather than network conditions.
+
+Usage:
+    python benchmarks/bench_bar_cache.py
+    python benchmarks/bench_bar_cache.py --latency 0.3 --period 2y
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+from _synthetic import make_ohlcv
+
+from ai_financial_advisor.data import stock_data
+from ai_financial_advisor.data.market_types import WATCHLISTS
+from ai_financial_advisor.data.stock_data import download_stock_data, period_start
+from ai_financial_advisor.data.storage.bar_store import BarStore
+
+
+class FakeYahoo:
+    """Serves a fixed synthetic history per symbol after a simulated delay."""
+
+    def __init__(self, symbols: list[str], latency: float, n: int) -> None:
+        self.latency = latency
+        self.requests = 0
+        self.rows = 0
+        index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=n)
+        self._history = {s: make_ohlcv(n, seed=i).set_axis(index) for i, s in enumerate(symbols)}
+
+    def download(self, symbol: str, interval: str = "1d", progress: bool = False, **kwargs: str) -> pd.DataFrame:
+        df = self._history[symbol]
+        if kwargs.get("start"):
+            df = df[df.index >= pd.Timestamp(kwargs["start"])]
+        elif kwargs.get("period") not in (None, "max"):
+            df = df[df.index >= period_start(kwargs["period"], datetime.now(UTC))]
+        time.sleep(self.latency)
+        self.requests += 1
+        self.rows += len(df)
+        return df.copy()
+
+
+def run(label: str, fake: FakeYahoo, symbols: list[str], period: str, store: BarStore) -> None:
+    fake.requests = fake.rows = 0
+    start = time.perf_counter()
+    for symbol in symbols:
+        download_stock_data(symbol, period=period, store=store)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed:>9.2f} {fake.requests:>9} {fake.rows:>12,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.15, help="Simulated seconds per yfinance request.")
+    parser.add_argument("--period", default="1y")
+    args = parser.parse_args()
+
+    symbols = [s for watchlist in WATCHLISTS.values() for s in watchlist]
+    fake = FakeYahoo(symbols, latency=args.latency, n=2_600)
+    stock_data.yf.download = fake.download
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BarStore(Path(tmp) / "bars.db")
+        print(f"{len(symbols)} symbols, period={args.period}, latency={args.latency}s/request\n")
+        print(f"{'Run':<10} {'Time (s)':>9} {'Requests':>9} {'Rows fetched':>12}")
+        print("-" * 43)
+        run("cold", fake, symbols, args.period, store)
+        run("warm", fake, symbols, args.period, store)
+
+        # Age every series past its last session close to force a top-up
+        with store._conn:
+            stale = (datetime.now(UTC) - timedelta(days=4)).isoformat()
+            store._conn.execute("UPDATE bar_series SET fetched_at = ?", (stale,))
+        run("top-up", fake, symbols, args.period, store)
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: bootstrap confidence intervals, replicate loop vs. matrix.
+
+Resamples the daily returns of a backtest's equity curve with a block
+bootstrap. The loop builds each replicate as a pandas Series and takes
+its Sharpe and drawdown one at a time; `Bootstrapper` scores chunks of
+replicates as one (replicates × days) matrix.
+
+Usage:
+    python benchmarks/bench_bootstrap.py
+    python benchmarks/bench_bootstrap.py --replicates 1000 10000 --years 10
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from _synthetic import TRADING_DAYS, best_of, make_ohlcv
+
+from ai_financial_advisor.strategies.backtester import Backtester
+from ai_financial_advisor.strategies.bootstrap import Bootstrapper
+from ai_financial_advisor.strategies.trend_strategy import TrendScoreStrategy
+
+BLOCK_SIZE = 20
+
+
+def replicate_loop(equity_curve: pd.Series, replicates: int, seed: int = 0) -> np.ndarray:
+    """One pandas Series per replicate, metrics as in `BacktestResult`."""
+    rng = np.random.default_rng(seed)
+    returns = equity_curve.pct_change().dropna().to_numpy()
+    n = len(returns)
+    out = np.empty((replicates, 3))
+    for i in range(replicates):
+        starts = rng.integers(0, n, size=-(-n // BLOCK_SIZE))
+        rows = ((starts[:, None] + np.arange(BLOCK_SIZE)) % n).ravel()[:n]
+        curve = pd.Series(np.concatenate([[1.0], np.cumprod(1 + returns[rows])]))
+        daily = curve.pct_change().dropna()
+        peak = curve.cummax()
+        out[i] = (
+            (curve.iloc[-1] - 1) * 100,
+            daily.mean() / daily.std() * np.sqrt(252),
+            ((curve - peak) / peak).min() * 100,
+        )
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicates", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_ohlcv(args.years * TRADING_DAYS)
+    result = Backtester().run_frame(TrendScoreStrategy(0.2, -0.2).generate_signal_frame(df))
+    curve = result.equity_curve
+    print(f"{len(curve)}-day equity curve, block size {BLOCK_SIZE}")
+    print(f"{'Replicates':>10} {'Loop (s)':>9} {'Matrix (s)':>11} {'Speedup':>8}")
+    print("-" * 41)
+    for replicates in args.replicates:
+        loop_s = best_of(lambda: replicate_loop(curve, replicates), 1)
+        boot = Bootstrapper(replicates, block_size=BLOCK_SIZE, trade_block_size=1, seed=0)
+        matrix_s = best_of(lambda: boot.equity(curve), args.repeat)
+        print(f"{replicates:>10} {loop_s:>9.3f} {matrix_s:>11.3f} {loop_s / matrix_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
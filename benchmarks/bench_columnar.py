@@ -0,0 +1,57 @@
+"""Benchmark: loading cached history, SQLite bar store vs. memory-mapped columns.
+
+Caches 20 years of synthetic daily bars for a universe in both stores,
+then times loading every symbol in full and loading only the last year
+(the `start` cut `download_stock_data` applies for a period), plus one
+full pass over the Close columns so mapped pages are actually read.
+
+Usage:
+    python benchmarks/bench_columnar.py
+    python benchmarks/bench_columnar.py --symbols 500 --years 20
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+from _synthetic import TRADING_DAYS, best_of, make_universe
+
+from ai_financial_advisor.data.storage.bar_store import BarStore
+from ai_financial_advisor.data.storage.columnar_store import ColumnarBarStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--years", type=int, default=20)
+    args = parser.parse_args()
+
+    universe = make_universe(args.symbols, args.years * TRADING_DAYS)
+    symbols = list(universe)
+    last_year = next(iter(universe.values())).index[-TRADING_DAYS]
+    print(f"{args.symbols} symbols × {args.years * TRADING_DAYS} daily bars\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = {"sqlite": BarStore(Path(tmp) / "bars.db"), "columnar": ColumnarBarStore(Path(tmp) / "bars")}
+        print(f"{'Store':<10} {'Write (s)':>10} {'Load all (s)':>13} {'Last year (s)':>14} {'Read closes (s)':>16}")
+        print("-" * 67)
+        for name, store in stores.items():
+            start = time.perf_counter()
+            for symbol, df in universe.items():
+                store.replace(symbol, "1d", df, covered_from=None, fetched_at=datetime.now())
+            write = time.perf_counter() - start
+
+            load_all = best_of(lambda s=store: [s.load(symbol, "1d") for symbol in symbols])
+            load_year = best_of(
+                lambda s=store: [s.load(symbol, "1d", start=pd.Timestamp(last_year)) for symbol in symbols]
+            )
+            read = best_of(lambda s=store: sum(s.load(symbol, "1d")["Close"].sum() for symbol in symbols))
+            print(f"{name:<10} {write:>10.2f} {load_all:>13.3f} {load_year:>14.3f} {read:>16.3f}")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark: near-duplicate clustering time, accuracy and prompt savings.
+
+Builds synthetic news days where each story (200 words from a 20k-word
+Zipf vocabulary) is carried by one to six outlets, each copy with its own
+intro, a couple of words changed and the ending trimmed. Times MinHash + LSH
+clustering as the number of articles grows (near-linear) against
+comparing every pair of signatures, scores the clusters by pair precision
+and recall against the true stories, and reports how many articles, and
+how much article text, the report prompt keeps. Finally times an
+incremental run through SQLiteStore: a day of new articles clustered
+against the signatures of earlier days.
+
+Usage:
+    python benchmarks/bench_dedup.py
+    python benchmarks/bench_dedup.py --sizes 1000 4000 16000 --days 30
+"""
+
+import argparse
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from _synthetic import best_of
+
+from ai_financial_advisor.agents.news_agent import NewsAgent
+from ai_financial_advisor.analysis.dedup import MinHasher, article_text, cluster_articles, similarity
+from ai_financial_advisor.config import Settings
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.data.storage.sqlite_store import SQLiteStore
+from ai_financial_advisor.llm.base import LLMProvider, LLMResponse
+
+_SOURCES = ["Reuters", "Bloomberg", "CNBC", "Financial Times", "WSJ", "AP"]
+_VOCABULARY = np.array([f"w{i}" for i in range(20_000)])
+
+
+class _NoLLM(LLMProvider):
+    """Placeholder provider; clustering never calls the model."""
+
+    def complete(self, messages, *, temperature=0.5, max_tokens=8192) -> LLMResponse:
+        raise NotImplementedError
+
+    @property
+    def name(self) -> str:
+        return "none"
+
+
+def make_articles(n: int, seed: int = 0) -> tuple[list[Article], dict[str, int]]:
+    """`n` articles and the true story of each, by URL."""
+    rng = np.random.default_rng(seed)
+    articles: list[Article] = []
+    stories: dict[str, int] = {}
+    story = 0
+    while len(articles) < n:
+        words = _VOCABULARY[np.minimum(rng.zipf(1.2, size=200), len(_VOCABULARY)) - 1]
+        for copy in range(min(int(rng.integers(1, 7)), n - len(articles))):
+            edited = words[: int(len(words) * rng.uniform(0.85, 1.0))].copy()
+            changed = rng.choice(len(edited), size=len(edited) // 100, replace=False)
+            edited[changed] = rng.choice(_VOCABULARY, size=len(changed))
+            url = f"https://news.example.com/{seed}/{story}/{copy}"
+            intro = " ".join(rng.choice(_VOCABULARY, size=12))
+            articles.append(
+                Article(
+                    title=" ".join(words[:8]),
+                    url=url,
+                    source_name=_SOURCES[copy % len(_SOURCES)],
+                    description="",
+                    published_at=datetime(2025, 7, 11),
+                    content=f"{intro} {' '.join(edited)}",
+                )
+            )
+            stories[url] = story
+        story += 1
+    order = rng.permutation(len(articles))
+    return [articles[i] for i in order], stories
+
+
+def all_pairs(articles: list[Article], hasher: MinHasher, threshold: float = 0.5) -> int:
+    """Baseline: compare every pair of signatures. Returns the matching pairs."""
+    signatures = [hasher.signature(article_text(a)) for a in articles]
+    return sum(
+        similarity(signatures[i], signatures[j]) >= threshold
+        for i in range(len(signatures))
+        for j in range(i + 1, len(signatures))
+    )
+
+
+def pair_scores(clusters: dict[str, str], stories: dict[str, int]) -> tuple[float, float]:
+    """Precision and recall of same-cluster pairs against same-story pairs."""
+
+    def pairs(labels: dict[str, object]) -> set[frozenset[str]]:
+        groups: dict[object, list[str]] = {}
+        for url, label in labels.items():
+            groups.setdefault(label, []).append(url)
+        return {frozenset((a, b)) for urls in groups.values() for i, a in enumerate(urls) for b in urls[i + 1 :]}
+
+    predicted, actual = pairs(clusters), pairs(stories)
+    common = len(predicted & actual)
+    return common / max(len(predicted), 1), common / max(len(actual), 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 4000, 8000])
+    parser.add_argument("--pairs-limit", type=int, default=2000, help="Largest size the all-pairs baseline runs at.")
+    parser.add_argument("--days", type=int, default=10, help="Stored days before the incremental run.")
+    parser.add_argument("--per-day", type=int, default=300)
+    args = parser.parse_args()
+    hasher = MinHasher()
+
+    header = f"{'Articles':>8} {'Stories':>8} {'LSH (s)':>8} {'us/art':>7} {'All pairs (s)':>14}"
+    print(f"{header} {'Precision':>10} {'Recall':>7}")
+    print("-" * 68)
+    for n in args.sizes:
+        articles, stories = make_articles(n)
+        lsh = best_of(lambda: cluster_articles(articles, hasher), repeat=3)
+        clusters = cluster_articles(articles, hasher)
+        assigned = {a.url: c.cluster_id for c in clusters for a in c.articles}
+        precision, recall = pair_scores(assigned, stories)
+        pairs = f"{best_of(lambda: all_pairs(articles, hasher), repeat=1):>14.2f}" if n <= args.pairs_limit else "-"
+        print(
+            f"{n:>8} {len(set(stories.values())):>8} {lsh:>8.2f} {lsh / n * 1e6:>7.0f} {pairs:>14} "
+            f"{precision:>10.3f} {recall:>7.3f}"
+        )
+
+    articles, _ = make_articles(args.per_day, seed=1)
+    clusters = cluster_articles(articles, hasher)
+    kept = sum(len(c.representative.content) for c in clusters)
+    total = sum(len(a.content) for a in articles)
+    print(
+        f"\nReport prompt for {len(articles)} articles: {len(clusters)} stories, "
+        f"{kept / total:.0%} of the article text ({Counter(len(c.articles) for c in clusters).most_common(3)} "
+        "as (copies, stories))"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStore(Path(tmp) / "news.db")
+        agent = NewsAgent(Settings(), llm=_NoLLM(), store=store)
+        for day in range(args.days):
+            agent.deduplicate(make_articles(args.per_day, seed=100 + day)[0])
+        today, _ = make_articles(args.per_day, seed=1)
+        start = time.perf_counter()
+        agent.deduplicate(today)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        agent.deduplicate(today)
+        again = time.perf_counter() - start
+        store.close()
+    print(
+        f"Incremental run against {args.days * args.per_day} stored articles: "
+        f"{first * 1000:.0f} ms for {len(today)} new articles, {again * 1000:.0f} ms when re-run (nothing to hash)"
+    )
+
+
+if __name__ == "__main__":
+    main()
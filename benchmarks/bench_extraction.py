@@ -0,0 +1,99 @@
+"""Benchmark: article extraction speed and text quality per engine.
+
+Runs every engine over the saved pages in ``benchmarks/corpus`` — news
+articles laid out the way common sites do (wire story with navigation
+and related links, ``div``-per-paragraph magazine with comments,
+``<br>``-separated blog post, body split around an ad slot, live blog,
+table layout, script-heavy page with hidden promos, Chinese-language
+page, ASP.NET WebForms page wrapped in one ``<form>``). Each
+``<name>.html`` has the article text it should yield in ``<name>.txt``.
+Quality is the bag-of-words F1 of the extracted text against that
+reference, and between the two engines; CJK text is compared per
+character.
+
+The newspaper engine needs the optional dependency
+(``pip install -e ".[newspaper]"``); without it only readability runs.
+
+Usage:
+    python benchmarks/bench_extraction.py
+    python benchmarks/bench_extraction.py --repeat 20
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from ai_financial_advisor.config import ExtractorEngine, ScraperSettings
+from ai_financial_advisor.data.extraction import ContentExtractor, get_extractor
+
+_CORPUS = Path(__file__).parent / "corpus"
+_TOKEN = re.compile(r"[一-鿿]|\w+")
+_IMPORTS = {
+    ExtractorEngine.READABILITY: "lxml.html",
+    ExtractorEngine.NEWSPAPER: "newspaper",
+}
+
+
+def overlap(text: str, reference: str) -> float:
+    """Bag-of-words F1 between two texts."""
+    ours, theirs = Counter(_TOKEN.findall(text.lower())), Counter(_TOKEN.findall(reference.lower()))
+    common = sum((ours & theirs).values())
+    if not common:
+        return 0.0
+    precision, recall = common / sum(ours.values()), common / sum(theirs.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def import_seconds(module: str) -> float:
+    """Cold import time of a module, in a fresh interpreter."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    return float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the corpus; the fastest counts.")
+    args = parser.parse_args()
+
+    pages = [
+        (p.stem, p.read_text(encoding="utf-8"), p.with_suffix(".txt").read_text(encoding="utf-8"))
+        for p in sorted(_CORPUS.glob("*.html"))
+    ]
+    engines: dict[str, ContentExtractor] = {}
+    for engine in ExtractorEngine:
+        try:
+            engines[engine.value] = get_extractor(ScraperSettings(extractor=engine))
+        except ImportError as exc:
+            print(f"Skipping {engine.value}: {exc}")
+    print(f"{len(pages)} pages, {sum(len(html) for _, html, _ in pages) / 1024:.0f} KiB of HTML\n")
+
+    texts: dict[str, dict[str, str]] = {}
+    print(f"{'Engine':<12} {'Import (ms)':>12} {'Per page (ms)':>14} {'Pages/s':>8} {'Mean F1':>8} {'Min F1':>7}")
+    print("-" * 66)
+    for name, extractor in engines.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            texts[name] = {stem: extractor.extract(html, f"https://example.com/{stem}").text for stem, html, _ in pages}
+            best = min(best, time.perf_counter() - start)
+        scores = [overlap(texts[name][stem], reference) for stem, _, reference in pages]
+        imported = import_seconds(_IMPORTS[ExtractorEngine(name)])
+        print(
+            f"{name:<12} {imported * 1000:>12.0f} {best / len(pages) * 1000:>14.2f} "
+            f"{len(pages) / best:>8.0f} {sum(scores) / len(scores):>8.3f} {min(scores):>7.3f}"
+        )
+
+    print(f"\n{'Page':<20}" + "".join(f" {name + ' F1':>15}" for name in engines) + f" {'Agreement':>10}")
+    print("-" * (20 + 16 * len(engines) + 11))
+    for stem, _, reference in pages:
+        row = "".join(f" {overlap(texts[name][stem], reference):>15.3f}" for name in engines)
+        agreement = overlap(*(texts[name][stem] for name in engines)) if len(engines) == 2 else float("nan")
+        print(f"{stem:<20}{row} {agreement:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark: cost of one new bar, full recompute vs. IndicatorState.update.
+
+Usage:
+    python benchmarks/bench_incremental.py
+    python benchmarks/bench_incremental.py --years 1 20 --bars 200
+"""
+
+import argparse
+import json
+import time
+
+from _synthetic import TRADING_DAYS, make_ohlcv
+
+from ai_financial_advisor.analysis.incremental import IndicatorState
+from ai_financial_advisor.analysis.indicators import compute_all_indicators
+from ai_financial_advisor.analysis.trend_score import calculate_trend_score
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--bars", type=int, default=100, help="New bars to apply after the history.")
+    args = parser.parse_args()
+
+    print(f"{'Years':>5} {'Rows':>7} {'Recompute (ms)':>15} {'Update (us)':>12} {'Speedup':>9} {'Checkpoint (B)':>15}")
+    print("-" * 69)
+    for years in args.years:
+        df = make_ohlcv(years * TRADING_DAYS + args.bars, seed=years)
+        history, new_bars = df.iloc[: -args.bars], df.iloc[-args.bars :]
+
+        start = time.perf_counter()
+        for i in range(1, args.bars + 1):
+            calculate_trend_score(compute_all_indicators(df.iloc[: len(history) + i]))
+        recompute_s = (time.perf_counter() - start) / args.bars
+
+        state = IndicatorState.from_history(history)
+        bars = new_bars.to_dict("records")
+        start = time.perf_counter()
+        for ts, bar in zip(new_bars.index, bars):
+            state.update(bar, timestamp=ts)
+        update_s = (time.perf_counter() - start) / args.bars
+
+        checkpoint = len(json.dumps(state.to_dict()))
+        print(
+            f"{years:>5} {len(history):>7} {recompute_s * 1e3:>15.2f} {update_s * 1e6:>12.1f} "
+            f"{recompute_s / update_s:>8.0f}x {checkpoint:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
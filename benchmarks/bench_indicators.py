@@ -0,0 +1,99 @@
+"""Benchmark: chained pandas indicators vs. the fused array kernel.
+
+Times a full indicator pass over a synthetic universe and reports the
+peak memory allocated (tracemalloc) for one symbol on each path.
+
+Usage:
+    python benchmarks/bench_indicators.py
+    python benchmarks/bench_indicators.py --symbols 100 --years 20
+"""
+
+import argparse
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+from _synthetic import TRADING_DAYS, best_of, make_universe
+
+from ai_financial_advisor.analysis.indicators import INDICATOR_COLUMNS, compute_all_indicators, indicator_kernel
+
+
+def chained_pandas(df: pd.DataFrame) -> pd.DataFrame:
+    """The original implementation: one DataFrame copy and column set per indicator."""
+    df = df.copy()
+    df["EMA_fast"] = df["Close"].ewm(span=12, adjust=False).mean()
+    df["EMA_slow"] = df["Close"].ewm(span=26, adjust=False).mean()
+    df["MACD"] = df["EMA_fast"] - df["EMA_slow"]
+    df["Signal"] = df["MACD"].ewm(span=9, adjust=False).mean()
+    df["Histogram"] = df["MACD"] - df["Signal"]
+
+    df = df.copy()
+    direction = np.sign(df["Close"].diff().fillna(0))
+    df["OBV"] = (direction * df["Volume"]).cumsum()
+
+    df = df.copy()
+    typical_price = (df["High"] + df["Low"] + df["Close"]) / 3
+    raw_money_flow = typical_price * df["Volume"]
+    direction = np.sign(typical_price.diff().fillna(0))
+    positive_flow = (raw_money_flow * (direction > 0)).rolling(window=14).sum()
+    negative_flow = (raw_money_flow * (direction < 0)).rolling(window=14).sum().abs()
+    df["MFI"] = 100 - (100 / (1 + positive_flow / (negative_flow + 1e-9)))
+    return df
+
+
+def peak_kib(fn: Callable[[], object]) -> float:
+    """Peak traced allocation of one call, in KiB."""
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    n = args.years * TRADING_DAYS
+    universe = make_universe(args.symbols, n)
+    arrays = [
+        tuple(df[col].to_numpy(dtype=float) for col in ["High", "Low", "Close", "Volume"]) for df in universe.values()
+    ]
+    buffer = np.empty((n, len(INDICATOR_COLUMNS)))
+
+    sample = next(iter(universe.values()))
+    match = all(chained_pandas(df).equals(compute_all_indicators(df)) for df in universe.values())
+
+    paths: list[tuple[str, float, float]] = [
+        (
+            "chained pandas",
+            best_of(lambda: [chained_pandas(df) for df in universe.values()], args.repeat),
+            peak_kib(lambda: chained_pandas(sample)),
+        ),
+        (
+            "compute_all_indicators",
+            best_of(lambda: [compute_all_indicators(df) for df in universe.values()], args.repeat),
+            peak_kib(lambda: compute_all_indicators(sample)),
+        ),
+        (
+            "indicator_kernel (reused out)",
+            best_of(lambda: [indicator_kernel(*a, out=buffer) for a in arrays], args.repeat),
+            peak_kib(lambda: indicator_kernel(*arrays[0], out=buffer)),
+        ),
+    ]
+
+    baseline = paths[0][1]
+    print(f"{args.symbols} symbols x {n} rows, outputs bit-identical: {match}")
+    print(f"{'Path':<30} {'Total (s)':>10} {'Per sym (ms)':>13} {'Speedup':>8} {'Peak/sym (KiB)':>15}")
+    print("-" * 80)
+    for name, seconds, peak in paths:
+        per_symbol_ms = seconds / args.symbols * 1000
+        print(f"{name:<30} {seconds:>10.3f} {per_symbol_ms:>13.3f} {baseline / seconds:>7.1f}x {peak:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark: event-driven intraday backtest, time and peak memory per symbol.
+
+Replays a year of synthetic 5-minute bars (about 20k per symbol) through
+`IntradayBacktester` and compares with the batch `Backtester` on the
+same frame. Times are the best of three runs; peak memory is measured in
+a separate run with tracemalloc and excludes the input frame.
+
+Usage:
+    python benchmarks/bench_intraday.py
+    python benchmarks/bench_intraday.py --bars 5000 20000 80000
+"""
+
+import argparse
+import tracemalloc
+from collections.abc import Callable
+
+import pandas as pd
+from _synthetic import best_of, make_ohlcv
+
+from ai_financial_advisor.strategies.backtester import Backtester
+from ai_financial_advisor.strategies.intraday import IntradayBacktester
+from ai_financial_advisor.strategies.trend_strategy import TrendScoreStrategy
+
+# 78 five-minute bars per US session × 252 sessions
+YEAR_OF_5M_BARS = 78 * 252
+
+
+def peak_mib(fn: Callable[[], object]) -> float:
+    """Peak memory allocated during one call, in MiB."""
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, nargs="+", default=[YEAR_OF_5M_BARS // 4, YEAR_OF_5M_BARS])
+    args = parser.parse_args()
+
+    print(f"{'Bars':>7} {'Engine':<28} {'Seconds':>8} {'us/bar':>7} {'Peak (MiB)':>11}")
+    print("-" * 65)
+    for n in args.bars:
+        df = make_ohlcv(n)
+        df.index = pd.date_range("2024-01-02 09:30", periods=n, freq="5min")
+        engines = {
+            "batch Backtester": lambda: Backtester().run_frame(TrendScoreStrategy().generate_signal_frame(df)),
+            "event-driven, equity curve": lambda: IntradayBacktester().run(df, symbol="AAPL"),
+            "event-driven, no curve": lambda: IntradayBacktester(record_equity=False).run(df, symbol="AAPL"),
+        }
+        for name, fn in engines.items():
+            seconds = best_of(fn)
+            peak = peak_mib(fn)
+            print(f"{n:>7} {name:<28} {seconds:>8.3f} {seconds / n * 1e6:>7.1f} {peak:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark: per-symbol indicator pipelines vs. one panel computation.
+
+The universe is ragged on purpose: symbols start at different dates and
+a third of them trade on a calendar with extra closed days, as when
+scanning several exchanges at once.
+
+Usage:
+    python benchmarks/bench_panel.py
+    python benchmarks/bench_panel.py --symbols 100 --years 2
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from _synthetic import TRADING_DAYS, best_of, make_universe
+
+from ai_financial_advisor.analysis.indicators import compute_all_indicators
+from ai_financial_advisor.analysis.panel import compute_panel_indicators, to_panel
+from ai_financial_advisor.analysis.trend_score import calculate_trend_score
+
+
+def ragged_universe(n_symbols: int, n: int) -> dict[str, pd.DataFrame]:
+    """Random listing dates, and every third symbol on a sparser calendar."""
+    rng = np.random.default_rng(0)
+    frames = {}
+    for i, (symbol, df) in enumerate(make_universe(n_symbols, n).items()):
+        df = df.iloc[rng.integers(0, n // 2) :]
+        if i % 3 == 0:
+            df = df[rng.random(len(df)) > 0.04]
+        frames[symbol] = df
+    return frames
+
+
+def per_symbol(frames: dict[str, pd.DataFrame]) -> dict[str, float]:
+    return {s: calculate_trend_score(compute_all_indicators(df)).score for s, df in frames.items()}
+
+
+def panel(frames: dict[str, pd.DataFrame]) -> dict[str, float]:
+    scores = compute_panel_indicators(to_panel(frames))["score"]
+    return {s: float(scores.at[df.index[-1], s]) for s, df in frames.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    n = args.years * TRADING_DAYS
+    print(f"{'Symbols':>7} {'Rows':>6} {'Per-symbol (s)':>15} {'Panel (s)':>10} {'Speedup':>8} {'Match':>6}")
+    print("-" * 58)
+    for n_symbols in args.symbols:
+        frames = ragged_universe(n_symbols, n)
+        match = per_symbol(frames) == panel(frames)
+        loop_s = best_of(lambda: per_symbol(frames), args.repeat)
+        panel_s = best_of(lambda: panel(frames), args.repeat)
+        print(f"{n_symbols:>7} {n:>6} {loop_s:>15.3f} {panel_s:>10.3f} {loop_s / panel_s:>7.1f}x {match!s:>6}")
+
+
+if __name__ == "__main__":
+    main()
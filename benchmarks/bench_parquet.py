@@ -0,0 +1,61 @@
+"""Benchmark: reading stored bar history back from Parquet result tables.
+
+Writes a month of daily scans (each with the full bar history of a
+universe) to a `ParquetStore`, then times reading the whole table against
+a projected read (two columns), a single run date and a single symbol,
+which only touch the files and columns they need.
+
+Usage:
+    python benchmarks/bench_parquet.py
+    python benchmarks/bench_parquet.py --symbols 200 --runs 20
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+from _synthetic import TRADING_DAYS, best_of, make_universe
+
+from ai_financial_advisor.data.storage.parquet_store import ParquetStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    universe = make_universe(args.symbols, 2 * TRADING_DAYS)
+    bars = pd.concat(
+        [df.rename_axis("timestamp").reset_index().assign(symbol=symbol) for symbol, df in universe.items()],
+        ignore_index=True,
+    )
+    run_dates = [date(2026, 1, 1) + timedelta(days=i) for i in range(args.runs)]
+    symbol = next(iter(universe))
+    print(f"{args.runs} runs × {len(bars)} bar rows\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ParquetStore(tmp)
+        start = time.perf_counter()
+        for run_date in run_dates:
+            store.write("bars", bars, run_date=run_date)
+        write = time.perf_counter() - start
+
+        reads = {
+            "all columns": lambda: store.read("bars"),
+            "symbol, Close": lambda: store.read("bars", columns=["symbol", "Close"]),
+            "one run": lambda: store.read("bars", dates=[run_dates[-1]]),
+            "one symbol": lambda: store.read("bars", columns=["timestamp", "Close"], symbols=[symbol]),
+        }
+        print(f"Write: {write:.2f}s\n")
+        print(f"{'Read':<15} {'Rows':>10} {'Time (s)':>10}")
+        print("-" * 37)
+        for name, read in reads.items():
+            rows = len(read())
+            print(f"{name:<15} {rows:>10} {best_of(read):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
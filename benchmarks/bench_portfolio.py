@@ -0,0 +1,67 @@
+"""Benchmark: portfolio backtest of every preset watchlist.
+
+Uses the real watchlist symbols (all markets, 76 names) with synthetic
+prices on mixed calendars: crypto trades every day, exchanges on
+business days with their own random holidays. Times the panel build,
+the panel indicators/scores, and the portfolio simulation separately.
+
+Usage:
+    python benchmarks/bench_portfolio.py
+    python benchmarks/bench_portfolio.py --years 20 --sizing inverse_vol --rebalance 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from _synthetic import TRADING_DAYS, make_ohlcv
+
+from ai_financial_advisor.analysis.panel import compute_panel_indicators, to_panel
+from ai_financial_advisor.data.market_types import MarketType, get_watchlist
+from ai_financial_advisor.strategies.portfolio import PortfolioBacktester
+
+
+def watchlist_universe(years: int) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(0)
+    frames = {}
+    for market in MarketType:
+        for symbol in get_watchlist(market):
+            if market == MarketType.CRYPTO:
+                df = make_ohlcv(years * 365, seed=len(frames))
+                df.index = pd.date_range("2010-01-01", periods=len(df), freq="D")
+            else:
+                df = make_ohlcv(years * TRADING_DAYS + 20, seed=len(frames), start="2010-01-01")
+                df = df[rng.random(len(df)) > 0.03]
+            frames[symbol] = df
+    return frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[10])
+    parser.add_argument("--sizing", default="equal")
+    parser.add_argument("--rebalance", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'Years':>5} {'Symbols':>7} {'Days':>6} {'Panel (s)':>10} {'Scores (s)':>11} {'Portfolio (s)':>14}")
+    print("-" * 58)
+    for years in args.years:
+        frames = watchlist_universe(years)
+        start = time.perf_counter()
+        panel = to_panel(frames)
+        panel_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = compute_panel_indicators(panel)["score"]
+        scores_s = time.perf_counter() - start
+
+        bt = PortfolioBacktester(sizing=args.sizing, rebalance_every=args.rebalance)
+        start = time.perf_counter()
+        bt.run(scores, panel["Close"])
+        portfolio_s = time.perf_counter() - start
+        print(f"{years:>5} {len(frames):>7} {len(scores):>6} {panel_s:>10.3f} {scores_s:>11.3f} {portfolio_s:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark: news report prompt size with and without the token budget.
+
+Builds a day of synthetic articles (distinct stories of 600-1200 words
+in sentences, some carried by several outlets) and renders the report
+prompt twice: as before packing (every story, the first 1500 characters
+of its text) and through `NewsAgent`'s packer at the configured budget.
+Reports estimated prompt tokens, how many stories are detailed, listed
+by headline or dropped, whether any snippet ends mid-sentence, and the
+time to prepare the prompt (clustering, ranking, clipping and packing;
+mostly MinHash over the article text). The provider is a stub; nothing
+is sent.
+
+Usage:
+    python benchmarks/bench_prompt_packing.py
+    python benchmarks/bench_prompt_packing.py --articles 100 300 1000 --budget 16000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+from jinja2 import Environment, PackageLoader
+
+from ai_financial_advisor.agents.news_agent import NewsAgent
+from ai_financial_advisor.config import LLMSettings, Settings
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.llm.base import LLMProvider, LLMResponse
+
+_SOURCES = ["Reuters", "Bloomberg", "CNBC", "Financial Times", "WSJ", "AP"]
+_VOCABULARY = np.array([f"w{i}" for i in range(20_000)])
+# The report template as it was before packing: every story, 1500 characters of text each
+_UNPACKED = """{% for article in articles %}
+News {{ loop.index }}:
+Source: {{ article.source_name }}
+Title: {{ article.title }}
+URL: {{ article.url }}
+Summary: {{ article.description or 'N/A' }}
+Content Snippet: {{ article.content[:1500] }}...
+
+---
+{% endfor %}"""
+
+
+class _PromptSizer(LLMProvider):
+    """Stub provider that only records the prompt it is sent."""
+
+    def __init__(self) -> None:
+        self.prompt = ""
+
+    def complete(self, messages, *, temperature=0.5, max_tokens=8192) -> LLMResponse:
+        self.prompt = messages[-1]["content"]
+        return LLMResponse(content="", model="stub")
+
+    @property
+    def name(self) -> str:
+        return "stub"
+
+
+def make_articles(n: int, seed: int = 0) -> list[Article]:
+    """`n` articles; about one in four stories is carried by a second outlet."""
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    articles: list[Article] = []
+    while len(articles) < n:
+        words = _VOCABULARY[np.minimum(rng.zipf(1.2, size=int(rng.integers(600, 1200))), len(_VOCABULARY)) - 1]
+        sentences = [" ".join(words[i : i + 18]).capitalize() + "." for i in range(0, len(words), 18)]
+        story = len(articles)
+        for copy in range(min(1 + int(rng.random() < 0.25), n - len(articles))):
+            articles.append(
+                Article(
+                    title=" ".join(words[:8]),
+                    url=f"https://news.example.com/{story}/{copy}",
+                    source_name=_SOURCES[(story + copy) % len(_SOURCES)],
+                    description=" ".join(sentences[:2]),
+                    published_at=now - timedelta(hours=float(rng.uniform(0, 24))),
+                    content=" ".join(sentences),
+                )
+            )
+    return articles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, nargs="+", default=[50, 100, 300, 1000])
+    parser.add_argument("--budget", type=int, default=LLMSettings().report_prompt_tokens)
+    args = parser.parse_args()
+
+    unpacked = Environment(trim_blocks=True, lstrip_blocks=True).from_string(_UNPACKED)
+    llm = _PromptSizer()
+    agent = NewsAgent(Settings(llm=LLMSettings(report_prompt_tokens=args.budget)), llm=llm)
+    template = Environment(
+        loader=PackageLoader("ai_financial_advisor.agents", "prompts"), trim_blocks=True, lstrip_blocks=True
+    ).get_template("news_report_en.j2")
+    instructions = llm.count_tokens(template.render(detailed=[], headlines=[]))
+
+    print(f"Budget: {args.budget:,} tokens (estimated, 4 characters per token)\n")
+    print(
+        f"{'Articles':>8} {'Before (tok)':>13} {'Mid-sentence':>13} {'Packed (tok)':>13} "
+        f"{'Detailed':>9} {'Headlines':>10} {'Dropped':>8} {'Prep (ms)':>10}"
+    )
+    print("-" * 92)
+    for n in args.articles:
+        articles = make_articles(n)
+        before = unpacked.render(articles=articles)
+        cut = sum(not a.content[:1500].endswith(".") for a in articles)
+        start = time.perf_counter()
+        agent.generate_report(articles)
+        elapsed = time.perf_counter() - start
+        usage = agent.token_usage[-1]
+        snippets = [line for line in llm.prompt.splitlines() if line.startswith("Content Snippet:")]
+        assert all(line.endswith(".") for line in snippets)
+        print(
+            f"{n:>8} {instructions + llm.count_tokens(before):>13,} {cut:>13} {usage.estimated:>13,} "
+            f"{usage.items['detailed']:>9} {usage.items['headlines']:>10} {usage.items['dropped']:>8} "
+            f"{elapsed * 1000:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark: full-text scraping wall time, sequential vs concurrent.
+
+Serves synthetic article pages from a local HTTP server that adds a fixed
+latency per response (a stand-in for remote news sites), under several
+host names that all resolve to this machine. Compares the previous
+scraper, reproduced here (one article at a time, newspaper3k download and
+a 1 s sleep after each), against the concurrent scraper with the same
+per-host politeness delay. The sequential baseline needs the optional
+newspaper3k dependency (``pip install -e ".[newspaper]"``).
+
+Usage:
+    python benchmarks/bench_scraper.py
+    python benchmarks/bench_scraper.py --articles 60 --latency 0.3 --workers 16
+"""
+
+import argparse
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from newspaper import Article as Newspaper3kArticle
+
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.data.news_scraper import SCRAPING_FAILED, scrape_full_text
+
+# Loopback names standing in for distinct news sites
+_HOSTS = ["127.0.0.1", "127.0.0.2", "127.0.0.3", "127.0.0.4", "127.0.0.5", "localhost"]
+_BODY = " ".join(f"Sentence {i} of the story covers markets, rates and earnings." for i in range(40))
+_PAGE = (
+    f"<html><head><title>Story</title></head><body><article><p>{_BODY}</p><p>{_BODY}</p></article></body></html>"
+).encode()
+
+
+def serve(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(_PAGE)))
+            self.end_headers()
+            self.wfile.write(_PAGE)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    httpd = ThreadingHTTPServer(("0.0.0.0", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def sequential_scrape(articles: list[Article], delay: float) -> None:
+    """The previous scraper: one article at a time, sleeping after each."""
+    for article in articles:
+        try:
+            np_article = Newspaper3kArticle(article.url)
+            np_article.download()
+            np_article.parse()
+            article.content = np_article.text
+        except Exception:
+            article.content = SCRAPING_FAILED
+        time.sleep(delay)
+
+
+def make_articles(n: int, port: int) -> list[Article]:
+    return [
+        Article(
+            title=f"Story {i}",
+            url=f"http://{_HOSTS[i % len(_HOSTS)]}:{port}/story/{i}",
+            source_name="Local",
+            description="",
+            published_at=datetime(2025, 1, 1),
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds the server takes per response.")
+    parser.add_argument("--delay", type=float, default=1.0, help="Politeness delay (per host when concurrent).")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    httpd = serve(args.latency)
+    port = httpd.server_address[1]
+    print(f"{args.articles} articles over {len(_HOSTS)} hosts, {args.latency:.2f}s latency, {args.delay:.1f}s delay\n")
+
+    runs = {
+        "sequential": lambda a: sequential_scrape(a, args.delay),
+        f"concurrent ({args.workers} workers)": lambda a: scrape_full_text(
+            a, workers=args.workers, per_host_delay=args.delay
+        ),
+    }
+    print(f"{'Scraper':<26} {'Wall time (s)':>14} {'Articles/s':>11} {'Failed':>7}")
+    print("-" * 61)
+    for name, run in runs.items():
+        articles = make_articles(args.articles, port)
+        start = time.perf_counter()
+        run(articles)
+        elapsed = time.perf_counter() - start
+        failed = sum(a.content == SCRAPING_FAILED for a in articles)
+        print(f"{name:<26} {elapsed:>14.1f} {args.articles / elapsed:>11.1f} {failed:>7}")
+    httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark: full-text article search latency over years of stored news.
+
+Stores synthetic articles (Zipf-distributed words, a few hundred per day)
+through SQLiteStore, so the FTS5 index is built by the same triggers as in
+production, then times searches for rare, common and multi-word queries,
+with and without date and source filters, against a LIKE scan of the
+content column.
+
+Usage:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --years 3 --per-day 300
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from _synthetic import best_of
+
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.data.storage.sqlite_store import SQLiteStore
+
+_SOURCES = ["Reuters", "Bloomberg", "CNBC", "Financial Times", "WSJ"]
+
+
+def make_articles(n: int, start: datetime, per_day: int, first: int = 0) -> list[Article]:
+    """Articles `first`..`first + n` of 160 words drawn from a 20k-word Zipf vocabulary."""
+    rng = np.random.default_rng(first)
+    vocab = np.array([f"w{i}" for i in range(20_000)])
+    ranks = np.minimum(rng.zipf(1.2, size=(n, 160)), len(vocab)) - 1
+    minutes = 24 * 60 / per_day
+    articles = []
+    for i in range(n):
+        words = vocab[ranks[i]]
+        articles.append(
+            Article(
+                title=" ".join(words[:8]),
+                url=f"https://news.example.com/{first + i}",
+                source_name=_SOURCES[i % len(_SOURCES)],
+                description=" ".join(words[8:30]),
+                published_at=start + timedelta(minutes=i * minutes),
+                content=" ".join(words[30:]),
+            )
+        )
+    return articles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--per-day", type=int, default=300)
+    args = parser.parse_args()
+
+    n = args.years * 365 * args.per_day
+    start = datetime(2023, 1, 1)
+    last_year = date(start.year + args.years - 1, 1, 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStore(Path(tmp) / "news.db")
+        elapsed = 0.0
+        for offset in range(0, n, 50_000):
+            batch_start = start + timedelta(days=offset / args.per_day)
+            batch = make_articles(min(50_000, n - offset), batch_start, args.per_day, first=offset)
+            begin = time.perf_counter()
+            stored = store.save_articles(batch)
+            elapsed += time.perf_counter() - begin
+            assert stored == len(batch)
+        print(f"{n:,} articles indexed in {elapsed:.1f}s ({n / elapsed:,.0f} rows/s)\n")
+
+        # Share of articles containing each word, roughly: w15000 0.1%, w1000 1%, w100 10%, w30 35%, w3 ~all
+        queries = {
+            "rare word": dict(query="w15000"),
+            "1% word": dict(query="w1000"),
+            "10% word": dict(query="w100"),
+            "two words": dict(query="w40 w900"),
+            "10%, last year": dict(query="w100", since=last_year),
+            "10%, one source": dict(query="w100", source="Reuters"),
+            "35% word": dict(query="w30"),
+            "stopword (all)": dict(query="w3"),
+        }
+        print(f"{'Query':<20} {'Matches':>8} {'Search (ms)':>12}")
+        print("-" * 42)
+        for name, kwargs in queries.items():
+            matches = store._conn.execute(
+                "SELECT count(*) FROM articles_fts WHERE articles_fts MATCH ?", (kwargs["query"],)
+            ).fetchone()[0]
+            print(f"{name:<20} {matches:>8,} {best_of(lambda k=kwargs: store.search(**k)) * 1000:>12.2f}")
+
+        like = best_of(
+            lambda: store._conn.execute("SELECT url FROM articles WHERE content LIKE '% w15000 %' LIMIT 20").fetchall(),
+            repeat=1,
+        )
+        print(f"{'LIKE scan (rare)':<20} {'':>8} {like * 1000:>12.2f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
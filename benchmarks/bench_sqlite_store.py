@@ -0,0 +1,101 @@
+"""Benchmark: article insert and content update throughput of SQLiteStore.
+
+Compares the store against the previous write path, reproduced here: one
+INSERT per article with a caught IntegrityError per duplicate, and one
+commit per content update, in the default rollback-journal mode. Each
+store saves a batch of synthetic articles, saves it again (all
+duplicates), then writes scraped content for part of them.
+
+Usage:
+    python benchmarks/bench_sqlite_store.py
+    python benchmarks/bench_sqlite_store.py --articles 100000 --updates 5000
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.data.storage.sqlite_store import _SCHEMA, SQLiteStore
+
+
+class RowByRowStore:
+    """The previous SQLiteStore write path."""
+
+    def __init__(self, db_path: Path) -> None:
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.executescript(_SCHEMA)
+
+    def save_articles(self, articles: list[Article]) -> int:
+        inserted = 0
+        for a in articles:
+            try:
+                self._conn.execute(
+                    "INSERT INTO articles (source_name, author, title, description, url, content, published_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (a.source_name, a.author, a.title, a.description, a.url, a.content, a.published_at.isoformat()),
+                )
+                inserted += 1
+            except sqlite3.IntegrityError:
+                pass
+        self._conn.commit()
+        return inserted
+
+    def update_article_contents(self, updates: list[tuple[str, str, str]]) -> int:
+        for url, content, author in updates:
+            self._conn.execute("UPDATE articles SET content = ?, author = ? WHERE url = ?", (content, author, url))
+            self._conn.commit()
+        return len(updates)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def make_articles(n: int) -> list[Article]:
+    start = datetime(2025, 1, 1)
+    return [
+        Article(
+            title=f"Markets move on headline {i}",
+            url=f"https://news.example.com/{i // 1000}/{i}",
+            source_name=("Reuters", "Bloomberg", "CNBC")[i % 3],
+            description="Stocks rose as investors weighed the latest economic data. " * 2,
+            published_at=start + timedelta(minutes=i),
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=5_000, help="Content updates to write.")
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    body = "Full article text. " * 200
+    updates = [(a.url, body, "Staff") for a in articles[: args.updates]]
+    print(f"{args.articles:,} articles, {args.updates:,} content updates\n")
+
+    print(f"{'Store':<14} {'Insert (rows/s)':>16} {'Re-insert (rows/s)':>19} {'Update (rows/s)':>16}")
+    print("-" * 68)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cls in (("row-by-row", RowByRowStore), ("SQLiteStore", SQLiteStore)):
+            store = cls(Path(tmp) / f"{name}.db")
+            rates = []
+            for step, rows in (
+                (lambda: store.save_articles(articles), len(articles)),
+                (lambda: store.save_articles(articles), len(articles)),
+                (lambda: store.update_article_contents(updates), len(updates)),
+            ):
+                start = time.perf_counter()
+                step()
+                rates.append(rows / (time.perf_counter() - start))
+            print(f"{name:<14} {rates[0]:>16,.0f} {rates[1]:>19,.0f} {rates[2]:>16,.0f}")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: threshold grid, one Backtester.run per pair vs. one sweep.
+
+The loop is what repeated `backtest run` invocations do: signals and a
+backtest per (buy, sell) pair. The sweep computes the score history once
+and simulates every pair together.
+
+Usage:
+    python benchmarks/bench_sweep.py
+    python benchmarks/bench_sweep.py --years 2 10 --grid 21
+"""
+
+import argparse
+
+import numpy as np
+from _synthetic import TRADING_DAYS, best_of, make_ohlcv
+
+from ai_financial_advisor.strategies.backtester import Backtester
+from ai_financial_advisor.strategies.sweep import METRIC_COLUMNS, sweep_thresholds
+from ai_financial_advisor.strategies.trend_strategy import TrendScoreStrategy, score_history
+
+
+def loop(df, buys, sells) -> list[tuple]:
+    rows = []
+    for b in buys:
+        for s in sells:
+            result = Backtester().run(TrendScoreStrategy(b, s).generate_signals(df))
+            rows.append(tuple(getattr(result, c) for c in METRIC_COLUMNS))
+    return rows
+
+
+def sweep(df, buys, sells) -> list[tuple]:
+    grid = sweep_thresholds(score_history(df), buys, sells)
+    return list(grid[list(METRIC_COLUMNS)].itertuples(index=False, name=None))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[2, 10])
+    parser.add_argument("--grid", type=int, default=11, help="Thresholds per side (grid is grid x grid).")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    buys = np.round(np.linspace(0.1, 0.6, args.grid), 4)
+    sells = np.round(np.linspace(-0.6, -0.1, args.grid), 4)
+    pairs = len(buys) * len(sells)
+
+    print(f"{'Years':>5} {'Pairs':>6} {'Loop (bt/s)':>12} {'Sweep (bt/s)':>13} {'Speedup':>8} {'Match':>6}")
+    print("-" * 55)
+    for years in args.years:
+        df = make_ohlcv(years * TRADING_DAYS, seed=years)
+        match = loop(df, buys, sells) == sweep(df, buys, sells)
+        loop_s = best_of(lambda: loop(df, buys, sells), 1)
+        sweep_s = best_of(lambda: sweep(df, buys, sells), args.repeat)
+        print(
+            f"{years:>5} {pairs:>6} {pairs / loop_s:>12.0f} {pairs / sweep_s:>13.0f} "
+            f"{loop_s / sweep_s:>7.0f}x {match!s:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
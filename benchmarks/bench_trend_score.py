@@ -0,0 +1,43 @@
+"""Benchmark: per-day trend score loop vs. the vectorized trend_score_series.
+
+Usage:
+    python benchmarks/bench_trend_score.py
+    python benchmarks/bench_trend_score.py --years 1 5 --repeat 5
+"""
+
+import argparse
+
+import pandas as pd
+from _synthetic import TRADING_DAYS, best_of, make_ohlcv
+
+from ai_financial_advisor.analysis.indicators import compute_all_indicators
+from ai_financial_advisor.analysis.trend_score import calculate_trend_score, trend_score_series
+
+
+def per_day_loop(df: pd.DataFrame, min_rows: int = 30) -> pd.Series:
+    """The original O(n²) algorithm: one full calculation per prefix."""
+    return pd.Series({df.index[i - 1]: calculate_trend_score(df.iloc[:i]).score for i in range(min_rows, len(df) + 1)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Years':>5} {'Rows':>7} {'Loop (s)':>10} {'Vector (s)':>11} {'Speedup':>9} {'Match':>6}")
+    print("-" * 53)
+    for years in args.years:
+        df = compute_all_indicators(make_ohlcv(years * TRADING_DAYS, seed=years))
+
+        loop_scores = per_day_loop(df)
+        vector_scores = trend_score_series(df)["score"].iloc[29:]
+        match = bool((loop_scores.to_numpy() == vector_scores.to_numpy()).all())
+
+        loop_s = best_of(lambda: per_day_loop(df), repeat=1)
+        vector_s = best_of(lambda: trend_score_series(df), repeat=args.repeat)
+        print(f"{years:>5} {len(df):>7} {loop_s:>10.3f} {vector_s:>11.4f} {loop_s / vector_s:>8.0f}x {match!s:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: walk-forward optimization, per-fold rescoring vs. cached scores.
+
+The naive approach rescores every train window from its raw bars for
+each parameter set and sweeps thresholds one scoring setup at a time.
+`WalkForwardOptimizer` computes indicators once, caches one score
+history per scoring setup and searches each fold in a single batched
+simulation, optionally running folds on a process pool.
+
+Usage:
+    python benchmarks/bench_walk_forward.py
+    python benchmarks/bench_walk_forward.py --years 10 --workers 1 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from _synthetic import TRADING_DAYS, make_ohlcv
+
+from ai_financial_advisor.strategies.sweep import sweep_thresholds
+from ai_financial_advisor.strategies.trend_strategy import MIN_HISTORY, score_history
+from ai_financial_advisor.strategies.walk_forward import ParameterGrid, WalkForwardOptimizer, walk_forward_splits
+
+TRAIN_DAYS = 504
+TEST_DAYS = 126
+
+
+def naive(df: pd.DataFrame, grid: ParameterGrid) -> list[tuple]:
+    """Rescore each fold's bars for every scoring setup, then sweep thresholds."""
+    chosen = []
+    for train, _ in walk_forward_splits(len(df) - MIN_HISTORY + 1, TRAIN_DAYS, TEST_DAYS):
+        # Score rows are offset by the warm-up; include it in the raw window
+        bars = df.iloc[train.start : train.stop + MIN_HISTORY - 1]
+        best = (-np.inf, None)
+        for params in grid.scoring():
+            history = score_history(
+                bars,
+                weights=params.weights,
+                macd_std_window=params.macd_std_window,
+                obv_slope_window=params.obv_slope_window,
+            )
+            sweep = sweep_thresholds(history, grid.buy_thresholds, grid.sell_thresholds)
+            top = sweep["sharpe_ratio"].max()
+            if top > best[0]:
+                best = (top, params)
+        chosen.append(best)
+    return chosen
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--skip-naive", action="store_true", help="Only time the optimizer.")
+    args = parser.parse_args()
+
+    df = make_ohlcv(args.years * TRADING_DAYS)
+    grid = ParameterGrid()
+    print(f"{len(df)} bars, {grid.size} parameter sets per fold")
+
+    if not args.skip_naive:
+        start = time.perf_counter()
+        naive(df, grid)
+        print(f"Naive rescoring:       {time.perf_counter() - start:8.2f}s")
+
+    for workers in args.workers:
+        report = WalkForwardOptimizer(grid, TRAIN_DAYS, TEST_DAYS, workers=workers).run(df)
+        print(
+            f"Optimizer, {workers} worker(s): {report.seconds:8.2f}s "
+            f"({len(report.folds)} folds, {report.folds['seconds'].mean():.3f}s per fold)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,14 @@ to produce comprehensive investment outlook reports.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from jinja2 import Environment, PackageLoader
 
 from ..analysis.sentiment import SentimentResult, analyze_sentiment
 from ..config import Settings
 from ..llm import LLMProvider, get_llm
+from ..llm.tokens import TokenUsage
 from .stock_agent import StockAgent, StockAnalysis
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ class AnalystReport:
     report: str
     sentiment: SentimentResult
     stocks: list[StockAnalysis]
+    token_usage: list[TokenUsage] = field(default_factory=list)  # per LLM call: sentiment, outlook
 
 
 class AnalystAgent:
@@ -82,7 +84,10 @@ class AnalystAgent:
 
         # Step 1: Extract sentiment from news
         logger.info("Step 1: Analyzing news sentiment...")
-        sentiment = analyze_sentiment(news_report, self._llm)
+        token_usage: list[TokenUsage] = []
+        sentiment = analyze_sentiment(
+            news_report, self._llm, self._settings.llm.sentiment_prompt_tokens, usage=token_usage
+        )
 
         # Step 2: Compute stock trend scores
         logger.info("Step 2: Computing trend scores for %d stocks...", len(symbols))
@@ -92,13 +97,11 @@ class AnalystAgent:
         logger.info("Step 3: Generating investment outlook report...")
         template = _PROMPT_ENV.get_template("analyst_report.j2")
         prompt = template.render(sentiment=sentiment, stocks=stocks)
+        system_prompt = "You are a senior investment analyst providing data-driven portfolio recommendations."
 
         response = self._llm.complete(
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are a senior investment analyst providing data-driven portfolio recommendations.",
-                },
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": prompt},
             ],
             temperature=self._settings.llm.temperature,
@@ -106,9 +109,13 @@ class AnalystAgent:
         )
 
         logger.info("Analyst report generated (%d chars).", len(response.content))
+        # The outlook prompt is bounded by the watchlist, so it is measured but not budgeted
+        estimated = self._llm.count_tokens(system_prompt) + self._llm.count_tokens(prompt)
+        token_usage.append(TokenUsage.record("outlook", None, estimated, response.usage, stocks=len(stocks)))
 
         return AnalystReport(
             report=response.content,
             sentiment=sentiment,
             stocks=stocks,
+            token_usage=token_usage,
         )
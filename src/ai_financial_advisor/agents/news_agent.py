@@ -5,15 +5,28 @@ daily global news reports in English or Chinese.
 """
 
 import logging
-from datetime import date, timedelta
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment, PackageLoader, Template
 
+from ..analysis.dedup import (
+    ArticleCluster,
+    MinHasher,
+    article_text,
+    assign_clusters,
+    group_articles,
+    signature_to_bytes,
+)
+from ..analysis.packing import PackedPrompt, PromptEntry, pack_entries, rank_stories
 from ..config import Settings
+from ..data.extraction import get_extractor
 from ..data.news_fetcher import Article, NewsFetcher
-from ..data.news_scraper import scrape_full_text
+from ..data.news_scraper import SCRAPING_FAILED, scrape_full_text
+from ..data.storage.base import ArticleSignature, DataStore
 from ..llm import LLMProvider, get_llm
+from ..llm.tokens import TokenUsage, clip_text
 
 logger = logging.getLogger(__name__)
 
@@ -41,16 +54,29 @@ class NewsAgent:
         settings: Application settings.
         llm: Optional pre-configured LLM provider. If None, one is
             created from settings.
+        store: Optional article store; fetched articles and their scraped
+            content are saved to it (and become searchable), and it serves
+            as the scrape cache across runs.
+
+    Attributes:
+        token_usage: Tokens used by each LLM call this agent made, in order.
     """
 
-    def __init__(self, settings: Settings, llm: LLMProvider | None = None) -> None:
+    def __init__(self, settings: Settings, llm: LLMProvider | None = None, store: DataStore | None = None) -> None:
         self._settings = settings
         self._fetcher = NewsFetcher(settings.news_api)
         self._llm = llm or get_llm(settings.llm)
+        self._store = store
+        self._extractor = get_extractor(settings.scraper)
+        self._hasher = MinHasher()
+        self.token_usage: list[TokenUsage] = []
 
     def fetch_and_scrape(self) -> list[Article]:
         """Fetch headlines and scrape full text content.
 
+        With a store, headlines and scraped text are saved to it, and pages
+        scraped on earlier runs are reused instead of downloaded again.
+
         Returns:
             List of articles with content populated.
         """
@@ -58,7 +84,79 @@ class NewsAgent:
         if not articles:
             logger.warning("No articles fetched.")
             return []
-        return scrape_full_text(articles)
+        if self._store is None:
+            scraper = self._settings.scraper
+            return scrape_full_text(
+                articles, scraper.workers, scraper.per_host_delay, scraper.timeout, extractor=self._extractor
+            )
+
+        self._store.save_articles(articles)
+        return self._scrape_with_cache(articles, self._store)
+
+    def _scrape_with_cache(self, articles: list[Article], store: DataStore) -> list[Article]:
+        """Scrape only what the store does not already have (or should recheck).
+
+        Articles scraped on an earlier run take their stored content, except
+        where it is due for revalidation; pages that failed are retried only
+        after their backoff has passed, and are marked failed until then.
+        """
+        scraper = self._settings.scraper
+        states = store.get_scrape_states(a.url for a in articles)
+        stored = {url: state.content for url, state in states.items()}
+        now = datetime.now()
+        revalidate_after = timedelta(hours=scraper.revalidate_hours)
+        retry_after = timedelta(hours=scraper.retry_hours)
+        for article in articles:
+            state = states.get(article.url)
+            if state is not None and not state.is_due(now, revalidate_after, retry_after):
+                article.content = state.content or SCRAPING_FAILED
+                article.author = article.author or state.author
+        due = [a for a in articles if not a.content]
+        logger.info("%d of %d articles already scraped.", len(articles) - len(due), len(articles))
+        if not due:
+            return articles
+
+        scrape_full_text(due, scraper.workers, scraper.per_host_delay, scraper.timeout, states, self._extractor)
+        store.update_article_contents(
+            (a.url, a.content, a.author)
+            for a in due
+            if a.content and a.content != SCRAPING_FAILED and a.content != stored.get(a.url)
+        )
+        store.save_scrape_states(states[a.url] for a in due)
+        return articles
+
+    def deduplicate(self, articles: list[Article]) -> list[ArticleCluster]:
+        """Cluster near-duplicate articles (one wire story carried by several sources).
+
+        With a store, signatures and cluster ids are persisted, so articles
+        seen on earlier runs are not hashed again and new ones can join
+        the clusters of stored articles.
+
+        Returns:
+            Clusters in order of their first article.
+        """
+        known: dict[str, ArticleSignature] = {}
+        if self._store is not None:
+            known = self._store.get_article_signatures(a.url for a in articles)
+        fresh = {a.url: self._hasher.signature(article_text(a)) for a in articles if a.url not in known}
+        band_keys = {url: self._hasher.band_keys(signature) for url, signature in fresh.items()}
+
+        candidates = known
+        if self._store is not None:
+            candidates = {
+                **self._store.find_article_signatures(k for keys in band_keys.values() for k in keys),
+                **known,
+            }
+        assigned = assign_clusters(fresh, candidates, self._hasher)
+        if self._store is not None:
+            self._store.save_article_signatures(
+                ArticleSignature(url, signature_to_bytes(fresh[url]), cluster, band_keys[url])
+                for url, cluster in assigned.items()
+            )
+
+        clusters = group_articles(articles, {**{url: s.cluster for url, s in known.items()}, **assigned})
+        logger.info("Clustered %d articles into %d stories.", len(articles), len(clusters))
+        return clusters
 
     def generate_report(
         self,
@@ -67,6 +165,12 @@ class NewsAgent:
     ) -> str:
         """Generate a news report from articles using the LLM.
 
+        Near-duplicates are sent once, as the most complete version with
+        the list of sources that carried it. Stories are ranked by
+        relevance and recency and packed into the prompt token budget
+        (`LLMSettings.report_prompt_tokens`): the top ones in detail, the
+        rest by headline, and only what does not fit even then is dropped.
+
         Args:
             articles: List of articles with content.
             language: Report language ('en' or 'cn').
@@ -75,19 +179,25 @@ class NewsAgent:
             The generated report as a markdown string.
         """
         # Filter out failed scrapes
-        valid_articles = [a for a in articles if a.content and a.content != "SCRAPING_FAILED"]
+        valid_articles = [a for a in articles if a.content and a.content != SCRAPING_FAILED]
 
         if not valid_articles:
             logger.warning("No valid articles to generate report from.")
             return ""
 
-        logger.info("Generating %s report from %d articles...", language, len(valid_articles))
-
+        clusters = rank_stories(self.deduplicate(valid_articles), datetime.now().astimezone())
         template_name = _TEMPLATE_MAP.get(language, _TEMPLATE_MAP["en"])
         template = _PROMPT_ENV.get_template(template_name)
-        prompt = template.render(articles=valid_articles)
-
         system_prompt = _SYSTEM_PROMPTS.get(language, _SYSTEM_PROMPTS["en"])
+        prompt, packed = self._pack_report_prompt(template, system_prompt, clusters)
+        logger.info(
+            "Generating %s report from %d stories (%d in detail, %d by headline, %d dropped)...",
+            language,
+            len(clusters),
+            len(packed.detailed),
+            len(packed.headlines),
+            len(packed.dropped),
+        )
 
         response = self._llm.complete(
             messages=[
@@ -103,8 +213,51 @@ class NewsAgent:
             len(response.content),
             self._llm.name,
         )
+        self.token_usage.append(
+            TokenUsage.record(
+                "news report",
+                self._settings.llm.report_prompt_tokens,
+                self._llm.count_tokens(system_prompt) + self._llm.count_tokens(prompt),
+                response.usage,
+                detailed=len(packed.detailed),
+                headlines=len(packed.headlines),
+                dropped=len(packed.dropped),
+            )
+        )
         return response.content
 
+    def _pack_report_prompt(
+        self, template: Template, system_prompt: str, clusters: list[ArticleCluster]
+    ) -> tuple[str, PackedPrompt]:
+        """Render the report prompt with the ranked stories that fit the token budget.
+
+        Returns:
+            The prompt and the stories it holds, by level of detail.
+        """
+        count = self._llm.count_tokens
+        settings = self._settings.llm
+        entries = [
+            PromptEntry(c, clip_text(c.representative.content or "", settings.snippet_tokens, count)) for c in clusters
+        ]
+        fixed = count(system_prompt) + count(template.render(detailed=[], headlines=[]))
+        # The template's entry macros, so entries are costed exactly as they render
+        story: Callable[..., str] = getattr(template.module, "story")
+        headline: Callable[..., str] = getattr(template.module, "headline")
+        packed = pack_entries(
+            entries,
+            settings.report_prompt_tokens - fixed,
+            lambda entry: count(story(entry, len(entries))),
+            lambda entry: count(headline(entry)),
+        )
+
+        # Section headers and line breaks are not in the entry costs: drop from the bottom should they tip it over
+        while True:
+            prompt = template.render(detailed=packed.detailed, headlines=packed.headlines)
+            tier = packed.headlines or packed.detailed
+            if count(system_prompt) + count(prompt) <= settings.report_prompt_tokens or not tier:
+                return prompt, packed
+            packed.dropped.insert(0, tier.pop())
+
     def save_report(self, report: str, target_date: date, language: str = "en") -> Path:
         """Save a report to the configured reports directory.
 
@@ -134,7 +287,7 @@ class NewsAgent:
         return filepath
 
     def run(self, language: str = "en", target_date: date | None = None) -> Path | None:
-        """Execute the full news pipeline: fetch → scrape → report → save.
+        """Execute the full news pipeline: fetch → scrape → deduplicate → report → save.
 
         Args:
             language: Report language ('en' or 'cn').
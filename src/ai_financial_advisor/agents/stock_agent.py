@@ -1,15 +1,20 @@
 """Stock Agent — fetches stock data, computes indicators and trend scores."""
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from ..analysis.anomaly import Anomaly
-from ..analysis.indicators import compute_all_indicators
+from ..analysis.indicators import INDICATOR_COLUMNS, compute_all_indicators
+from ..analysis.panel import compute_panel_indicators, to_panel
 from ..analysis.trend_score import TrendScoreResult, calculate_trend_score
 from ..data.market_types import get_currency
-from ..data.stock_data import download_stock_data
+from ..data.stock_data import BATCH_SIZE, download_many, download_stock_data
+from ..data.storage.score_store import ScoreRecord
+from ..executor import PoolMode, create_pool, gather
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +37,15 @@ class StockAgent:
 
     Downloads OHLCV data, computes MACD/OBV/MFI indicators,
     and calculates a composite trend score.
+
+    Attributes:
+        last_errors: Symbol → error message for symbols that failed in
+            the most recent `analyze_multiple` call.
     """
 
+    def __init__(self) -> None:
+        self.last_errors: dict[str, str] = {}
+
     def analyze(
         self,
         symbol: str,
@@ -51,46 +63,193 @@ class StockAgent:
         logger.info("Analyzing %s (period=%s)...", symbol, period)
 
         df = download_stock_data(symbol, period=period)
-        df = compute_all_indicators(df)
-        trend = calculate_trend_score(df)
-
-        latest_close = float(df["Close"].iloc[-1])
-
-        logger.info(
-            "%s analysis complete: close=%.2f, score=%.4f (%s)",
-            symbol,
-            latest_close,
-            trend.score,
-            trend.interpretation,
-        )
-
-        return StockAnalysis(
-            symbol=symbol,
-            period=period,
-            latest_close=latest_close,
-            trend=trend,
-            data=df,
-            currency=get_currency(symbol),
-        )
+        return _analyze_frame(symbol, df, period)
 
     def analyze_multiple(
         self,
         symbols: list[str],
         period: str = "1y",
+        max_workers: int = 1,
+        mode: PoolMode = "thread",
     ) -> list[StockAnalysis]:
         """Analyze multiple stocks.
 
+        Data is fetched with batched multi-ticker requests (see
+        `download_many`). By default the whole universe is then scored as
+        one panel computation (see `analysis.panel`). With
+        ``max_workers > 1`` the batches are fetched concurrently on a
+        thread pool and each symbol's indicator math is handed to a thread
+        or process pool as soon as its batch arrives.
+
         Args:
             symbols: List of ticker symbols.
             period: Historical data period.
+            max_workers: Upper bound on concurrent workers per pool (capped
+                by available memory, see `executor.worker_limit`).
+            mode: Pool used for indicator math: "thread" or "process".
 
         Returns:
-            List of StockAnalysis results (skips symbols that fail).
+            List of StockAnalysis results in input order (skips symbols that
+            fail; their errors are kept in `last_errors`).
         """
-        results = []
+        symbols = list(dict.fromkeys(symbols))
+        if max_workers > 1:
+            results, errors = self._analyze_concurrent(symbols, period, max_workers, mode)
+        else:
+            results, errors = self._analyze_panel(symbols, period)
+
+        self.last_errors = errors
+        return [results[s] for s in symbols if s in results]
+
+    def _analyze_panel(
+        self,
+        symbols: list[str],
+        period: str,
+    ) -> tuple[dict[str, StockAnalysis], dict[str, str]]:
+        frames = download_many(symbols, period=period)
+        indicators = compute_panel_indicators(to_panel(frames)) if frames else {}
+
+        results: dict[str, StockAnalysis] = {}
+        errors: dict[str, str] = {}
         for symbol in symbols:
+            if symbol not in frames:
+                errors[symbol] = "No data returned"
+                continue
             try:
-                results.append(self.analyze(symbol, period=period))
+                results[symbol] = _analysis_from_panel(symbol, frames[symbol], indicators, period)
             except Exception as exc:
                 logger.error("Failed to analyze %s: %s", symbol, exc)
-        return results
+                errors[symbol] = str(exc) or type(exc).__name__
+        return results, errors
+
+    def _analyze_concurrent(
+        self,
+        symbols: list[str],
+        period: str,
+        max_workers: int,
+        mode: PoolMode,
+    ) -> tuple[dict[str, StockAnalysis], dict[str, str]]:
+        batches = [symbols[i : i + BATCH_SIZE] for i in range(0, len(symbols), BATCH_SIZE)]
+        analyses: dict[str, Future[StockAnalysis]] = {}
+        errors: dict[str, str] = {}
+
+        io_workers = min(max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=io_workers) as io_pool, create_pool(mode, max_workers) as cpu_pool:
+            fetches = {io_pool.submit(download_many, batch, period=period): batch for batch in batches}
+            for fetch in as_completed(fetches):
+                batch = fetches[fetch]
+                try:
+                    frames = fetch.result()
+                except Exception as exc:
+                    logger.error("Failed to fetch %s: %s", ", ".join(batch), exc)
+                    errors.update(dict.fromkeys(batch, str(exc)))
+                    continue
+                for symbol in batch:
+                    if symbol in frames:
+                        analyses[symbol] = cpu_pool.submit(_analyze_frame, symbol, frames[symbol], period)
+                    else:
+                        errors[symbol] = "No data returned"
+
+            results, analysis_errors = gather(analyses)
+
+        errors.update(analysis_errors)
+        return results, errors
+
+
+def _analyze_frame(symbol: str, df: pd.DataFrame, period: str) -> StockAnalysis:
+    """Compute indicators and the trend score for already-downloaded data."""
+    df = compute_all_indicators(df)
+    return _make_analysis(symbol, df, calculate_trend_score(df), period)
+
+
+def _analysis_from_panel(
+    symbol: str,
+    df: pd.DataFrame,
+    indicators: dict[str, pd.DataFrame],
+    period: str,
+) -> StockAnalysis:
+    """Pick one symbol's indicators and latest trend score out of a panel result."""
+    has_volume = "Volume" in df.columns and (df["Volume"] > 0).any()
+    columns = list(INDICATOR_COLUMNS if has_volume else INDICATOR_COLUMNS[:5])
+    block = pd.DataFrame({c: indicators[c][symbol] for c in columns}).reindex(df.index)
+
+    latest = df.index[-1]
+    score = indicators["score"].at[latest, symbol]
+    if np.isnan(score):
+        raise ValueError(f"Not enough history to score {symbol}")
+    trend = TrendScoreResult(
+        score=float(score),
+        macd_signal=float(indicators["macd_signal"].at[latest, symbol]),
+        mfi_signal=float(indicators["mfi_signal"].at[latest, symbol]),
+        obv_signal=float(indicators["obv_signal"].at[latest, symbol]),
+        interpretation=indicators["interpretation"].at[latest, symbol],
+    )
+    return _make_analysis(symbol, pd.concat([df, block], axis=1), trend, period)
+
+
+def _make_analysis(symbol: str, df: pd.DataFrame, trend: TrendScoreResult, period: str) -> StockAnalysis:
+    latest_close = float(df["Close"].iloc[-1])
+
+    logger.info(
+        "%s analysis complete: close=%.2f, score=%.4f (%s)",
+        symbol,
+        latest_close,
+        trend.score,
+        trend.interpretation,
+    )
+
+    return StockAnalysis(
+        symbol=symbol,
+        period=period,
+        latest_close=latest_close,
+        trend=trend,
+        data=df,
+        currency=get_currency(symbol),
+    )
+
+
+def scan_tables(results: list[StockAnalysis]) -> dict[str, pd.DataFrame]:
+    """Flatten scan results into tables for `ParquetStore`.
+
+    Args:
+        results: Analyses from `StockAgent.analyze_multiple`.
+
+    Returns:
+        ``"scans"``: one row per symbol with the trend score breakdown;
+        ``"bars"``: each symbol's OHLCV and indicator history, with the
+        bar time in a ``timestamp`` column.
+    """
+    scans = pd.DataFrame(
+        {
+            "symbol": [r.symbol for r in results],
+            "period": [r.period for r in results],
+            "currency": [r.currency for r in results],
+            "latest_close": [r.latest_close for r in results],
+            "score": [r.trend.score for r in results],
+            "macd_signal": [r.trend.macd_signal for r in results],
+            "mfi_signal": [r.trend.mfi_signal for r in results],
+            "obv_signal": [r.trend.obv_signal for r in results],
+            "interpretation": [r.trend.interpretation for r in results],
+        }
+    )
+    frames = [
+        r.data.rename_axis("timestamp").reset_index().assign(symbol=r.symbol) for r in results if not r.data.empty
+    ]
+    bars = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame({"symbol": [], "timestamp": []})
+    return {"scans": scans, "bars": bars}
+
+
+def score_records(results: list[StockAnalysis]) -> list[ScoreRecord]:
+    """Scan results as records for `ScoreStore.record_run`."""
+    return [
+        ScoreRecord(
+            symbol=r.symbol,
+            close=r.latest_close,
+            score=r.trend.score,
+            macd_signal=r.trend.macd_signal,
+            mfi_signal=r.trend.mfi_signal,
+            obv_signal=r.trend.obv_signal,
+            interpretation=r.trend.interpretation,
+        )
+        for r in results
+    ]
@@ -1,18 +1,37 @@
 """Pure computation modules for financial analysis."""
 
+from .incremental import IndicatorState, IndicatorUpdate
 from .indicators import (
+    INDICATOR_COLUMNS,
     calculate_macd,
     calculate_mfi,
     calculate_obv,
     compute_all_indicators,
+    indicator_kernel,
+)
+from .panel import compute_panel_indicators, to_panel
+from .trend_score import (
+    TrendScoreResult,
+    calculate_trend_score,
+    score_from_signals,
+    trend_score_arrays,
+    trend_score_series,
 )
-from .trend_score import TrendScoreResult, calculate_trend_score
 
 __all__ = [
+    "INDICATOR_COLUMNS",
     "calculate_macd",
     "calculate_mfi",
     "calculate_obv",
     "compute_all_indicators",
+    "indicator_kernel",
     "calculate_trend_score",
     "TrendScoreResult",
+    "score_from_signals",
+    "trend_score_arrays",
+    "trend_score_series",
+    "compute_panel_indicators",
+    "to_panel",
+    "IndicatorState",
+    "IndicatorUpdate",
 ]
@@ -4,12 +4,15 @@ Uses Z-score and IQR methods to identify unusual price movements
 and volume spikes. Pure computation, no side effects.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date
 
 import numpy as np
 import pandas as pd
 
+from .panel import RowPacking
+
 
 @dataclass
 class Anomaly:
@@ -26,6 +29,11 @@ class Anomaly:
 class AnomalyDetector:
     """Detects price and volume anomalies using statistical methods.
 
+    Z-scores are computed with rolling pandas windows and thresholded with
+    NumPy masks; `Anomaly` records are only built for the hits. Passing
+    ``since`` restricts both the scan and the computation to the tail of
+    the data plus the rolling warm-up rows.
+
     Args:
         z_threshold: Z-score threshold for anomaly detection (default: 2.5).
         lookback: Number of days for rolling statistics (default: 20).
@@ -35,57 +43,46 @@ class AnomalyDetector:
         self._z_threshold = z_threshold
         self._lookback = lookback
 
-    def detect_price_anomalies(self, df: pd.DataFrame, symbol: str) -> list[Anomaly]:
+    def detect_price_anomalies(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        since: date | pd.Timestamp | None = None,
+    ) -> list[Anomaly]:
         """Detect unusual daily price returns.
 
         Args:
             df: DataFrame with a 'Close' column and DatetimeIndex.
             symbol: Ticker symbol for the anomaly records.
+            since: Only report anomalies on or after this date.
 
         Returns:
             List of price anomalies found.
         """
-        returns = df["Close"].pct_change().dropna()
-        rolling_mean = returns.rolling(window=self._lookback).mean()
-        rolling_std = returns.rolling(window=self._lookback).std()
-
-        z_scores = (returns - rolling_mean) / (rolling_std + 1e-9)
-
-        anomalies = []
-        for idx, z in z_scores.items():
-            z_val = float(z)
-            if np.isnan(z_val) or abs(z_val) < self._z_threshold:
-                continue
-
-            ret = float(returns.loc[idx])
-            dt = idx.date() if hasattr(idx, "date") else idx
-
-            if z_val > 0:
-                anomaly_type = "price_spike"
-                desc = f"{symbol} surged {ret:+.2%} (z={z_val:+.2f})"
-            else:
-                anomaly_type = "price_crash"
-                desc = f"{symbol} dropped {ret:+.2%} (z={z_val:+.2f})"
-
-            anomalies.append(
-                Anomaly(
-                    date=dt,
-                    symbol=symbol,
-                    type=anomaly_type,
-                    severity=_classify_severity(abs(z_val), self._z_threshold),
-                    z_score=round(z_val, 4),
-                    description=desc,
-                )
-            )
-
-        return anomalies
-
-    def detect_volume_anomalies(self, df: pd.DataFrame, symbol: str) -> list[Anomaly]:
+        close = df["Close"]
+        # A return needs the previous close, so warm up one extra row
+        start = _warmup_start(close.index, since, self._lookback)
+        returns = close.iloc[start:].pct_change().dropna()
+        values = returns.to_numpy(dtype=float)
+        z_scores, _ = self._z_scores(returns)
+
+        return [
+            _price_anomaly(symbol, returns.index[i], values[i], z_scores[i], self._z_threshold)
+            for i in self._hits(z_scores, returns.index, since)
+        ]
+
+    def detect_volume_anomalies(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        since: date | pd.Timestamp | None = None,
+    ) -> list[Anomaly]:
         """Detect unusual volume spikes or drops.
 
         Args:
             df: DataFrame with a 'Volume' column and DatetimeIndex.
             symbol: Ticker symbol.
+            since: Only report anomalies on or after this date.
 
         Returns:
             List of volume anomalies found.
@@ -93,53 +90,34 @@ class AnomalyDetector:
         if "Volume" not in df.columns or (df["Volume"] <= 0).all():
             return []
 
-        vol = df["Volume"].astype(float)
-        rolling_mean = vol.rolling(window=self._lookback).mean()
-        rolling_std = vol.rolling(window=self._lookback).std()
-
-        z_scores = (vol - rolling_mean) / (rolling_std + 1e-9)
-
-        anomalies = []
-        for idx, z in z_scores.items():
-            z_val = float(z)
-            if np.isnan(z_val) or abs(z_val) < self._z_threshold:
-                continue
-
-            dt = idx.date() if hasattr(idx, "date") else idx
-            ratio = float(vol.loc[idx] / (rolling_mean.loc[idx] + 1e-9))
-
-            if z_val > 0:
-                anomaly_type = "volume_surge"
-                desc = f"{symbol} volume {ratio:.1f}x average (z={z_val:+.2f})"
-            else:
-                anomaly_type = "volume_drop"
-                desc = f"{symbol} volume {ratio:.1f}x average (z={z_val:+.2f})"
-
-            anomalies.append(
-                Anomaly(
-                    date=dt,
-                    symbol=symbol,
-                    type=anomaly_type,
-                    severity=_classify_severity(abs(z_val), self._z_threshold),
-                    z_score=round(z_val, 4),
-                    description=desc,
-                )
-            )
-
-        return anomalies
-
-    def detect_all(self, df: pd.DataFrame, symbol: str) -> list[Anomaly]:
+        start = _warmup_start(df.index, since, self._lookback - 1)
+        vol = df["Volume"].iloc[start:].astype(float)
+        values = vol.to_numpy()
+        z_scores, rolling_mean = self._z_scores(vol)
+
+        return [
+            _volume_anomaly(symbol, vol.index[i], values[i] / (rolling_mean[i] + 1e-9), z_scores[i], self._z_threshold)
+            for i in self._hits(z_scores, vol.index, since)
+        ]
+
+    def detect_all(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        since: date | pd.Timestamp | None = None,
+    ) -> list[Anomaly]:
         """Run both price and volume anomaly detection.
 
         Args:
             df: DataFrame with Close (and optionally Volume) columns.
             symbol: Ticker symbol.
+            since: Only report anomalies on or after this date.
 
         Returns:
             Combined list of anomalies, sorted by date descending.
         """
-        anomalies = self.detect_price_anomalies(df, symbol)
-        anomalies.extend(self.detect_volume_anomalies(df, symbol))
+        anomalies = self.detect_price_anomalies(df, symbol, since=since)
+        anomalies.extend(self.detect_volume_anomalies(df, symbol, since=since))
         anomalies.sort(key=lambda a: a.date, reverse=True)
         return anomalies
 
@@ -154,18 +132,195 @@ class AnomalyDetector:
         Returns:
             Recent anomalies sorted by date descending.
         """
-        all_anomalies = self.detect_all(df, symbol)
-        if not all_anomalies or df.empty:
+        if df.empty:
             return []
+        return self.detect_all(df, symbol, since=_recent_cutoff(df.index[-1], days))
+
+    def detect_panel(
+        self,
+        panel: Mapping[str, pd.DataFrame],
+        since: date | pd.Timestamp | None = None,
+    ) -> list[Anomaly]:
+        """Scan a whole watchlist at once.
 
-        last_date = df.index[-1]
-        if hasattr(last_date, "date"):
-            last_date = last_date.date()
+        Args:
+            panel: Field → dates × symbols matrices (see `analysis.panel.to_panel`);
+                must contain Close, Volume is optional.
+            since: Only report anomalies on or after this date.
+
+        Returns:
+            Anomalies for all symbols, sorted by date descending (ties keep
+            symbol order, price before volume).
+        """
+        if since is None:
+            return self._scan_panel(panel, None)
+        close = panel["Close"]
+        return self._scan_panel(panel, [_as_timestamp(since, close.index)] * len(close.columns))
 
-        cutoff = pd.Timestamp(last_date) - pd.Timedelta(days=days)
-        cutoff_date = cutoff.date()
+    def get_recent_anomalies_panel(self, panel: Mapping[str, pd.DataFrame], days: int = 5) -> list[Anomaly]:
+        """Panel version of `get_recent_anomalies`.
 
-        return [a for a in all_anomalies if a.date >= cutoff_date]
+        The window is counted back from each symbol's own last bar, so a
+        market that was closed today is still checked over its last N days.
+
+        Args:
+            panel: Field → dates × symbols matrices; must contain Close.
+            days: Number of recent days to check.
+
+        Returns:
+            Recent anomalies for all symbols, sorted by date descending.
+        """
+        close = panel["Close"]
+        last_rows = close.notna().to_numpy()[::-1].argmax(axis=0)
+        last_dates = close.index[len(close) - 1 - last_rows]
+        cutoffs = [_as_timestamp(_recent_cutoff(ts, days), close.index) for ts in last_dates]
+        return self._scan_panel(panel, cutoffs)
+
+    def _scan_panel(self, panel: Mapping[str, pd.DataFrame], cutoffs: list[pd.Timestamp] | None) -> list[Anomaly]:
+        """Shared panel scan; `cutoffs` holds each symbol's first date to report."""
+        close = panel["Close"]
+        index, symbols = close.index, list(close.columns)
+        n, k = close.shape
+        if n == 0 or k == 0:
+            return []
+
+        trading = close.notna().to_numpy()
+        packing = RowPacking(trading)
+        rows = packing.pack(np.repeat(np.arange(n, dtype=float)[:, None], k, axis=1))
+        closes = packing.pack(close.to_numpy(dtype=np.float64, copy=True))
+
+        # First packed row each symbol has to report, then trim shared warm-up
+        if cutoffs is None:
+            first_report = np.zeros(k, dtype=int)
+        else:
+            cutoff_rows = index.searchsorted(cutoffs)
+            first_report = (rows < cutoff_rows[None, :]).sum(axis=0)
+        start = max(0, int(first_report.min()) - self._lookback)
+        rows, closes = rows[start:], closes[start:]
+        report = np.arange(start, n)[:, None] >= first_report[None, :]
+
+        hits: list[list[Anomaly]] = [[] for _ in symbols]
+
+        returns = np.full_like(closes, np.nan)
+        np.divide(closes[1:], closes[:-1], out=returns[1:])
+        returns[1:] -= 1
+        z_scores, _ = self._z_scores(returns)
+        for i, j in self._panel_hits(z_scores, report):
+            hits[j].append(
+                _price_anomaly(symbols[j], index[int(rows[i, j])], returns[i, j], z_scores[i, j], self._z_threshold)
+            )
+
+        if "Volume" in panel:
+            volume = panel["Volume"].reindex(index=index, columns=close.columns).to_numpy(dtype=np.float64, copy=True)
+            # Like the per-frame check: skip symbols whose own bars never have volume
+            has_volume = np.asarray(~np.where(trading, volume <= 0, True).all(axis=0))
+            volumes = packing.pack(volume)[start:]
+            z_scores, rolling_mean = self._z_scores(volumes)
+            for i, j in self._panel_hits(z_scores, report & has_volume[None, :]):
+                ratio = volumes[i, j] / (rolling_mean[i, j] + 1e-9)
+                hits[j].append(
+                    _volume_anomaly(symbols[j], index[int(rows[i, j])], ratio, z_scores[i, j], self._z_threshold)
+                )
+
+        anomalies = [a for symbol_hits in hits for a in symbol_hits]
+        anomalies.sort(key=lambda a: a.date, reverse=True)
+        return anomalies
+
+    def _z_scores(self, values: pd.Series | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Rolling z-scores and rolling means along axis 0."""
+        if isinstance(values, np.ndarray):
+            values = pd.DataFrame(values, copy=False)
+        rolling = values.rolling(window=self._lookback)
+        rolling_mean = rolling.mean().to_numpy()
+        rolling_std = rolling.std().to_numpy()
+        return (values.to_numpy() - rolling_mean) / (rolling_std + 1e-9), rolling_mean
+
+    def _hits(self, z_scores: np.ndarray, index: pd.Index, since: date | pd.Timestamp | None) -> np.ndarray:
+        """Positions where |z| crosses the threshold (and on/after `since`)."""
+        mask = np.abs(z_scores) >= self._z_threshold  # NaN compares False
+        if since is not None:
+            mask[: index.searchsorted(_as_timestamp(since, index))] = False
+        return np.flatnonzero(mask)
+
+    def _panel_hits(self, z_scores: np.ndarray, report: np.ndarray) -> list[tuple[int, int]]:
+        """(row, column) hits, column-major so each symbol's hits stay in date order."""
+        mask = (np.abs(z_scores) >= self._z_threshold) & report
+        cols, rows = np.nonzero(mask.T)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+
+def anomaly_frame(anomalies: list[Anomaly]) -> pd.DataFrame:
+    """Anomalies as a table for `ParquetStore`.
+
+    The anomaly date is stored as ``day``: ``date`` is the run-date
+    partition key of stored tables.
+    """
+    return pd.DataFrame(
+        {
+            "day": pd.to_datetime([a.date for a in anomalies]),
+            "symbol": [a.symbol for a in anomalies],
+            "type": [a.type for a in anomalies],
+            "severity": [a.severity for a in anomalies],
+            "z_score": [a.z_score for a in anomalies],
+            "description": [a.description for a in anomalies],
+        }
+    )
+
+
+def _price_anomaly(symbol: str, ts: pd.Timestamp, ret: float, z: float, threshold: float) -> Anomaly:
+    if z > 0:
+        anomaly_type = "price_spike"
+        desc = f"{symbol} surged {ret:+.2%} (z={z:+.2f})"
+    else:
+        anomaly_type = "price_crash"
+        desc = f"{symbol} dropped {ret:+.2%} (z={z:+.2f})"
+    return Anomaly(
+        date=_to_date(ts),
+        symbol=symbol,
+        type=anomaly_type,
+        severity=_classify_severity(abs(z), threshold),
+        z_score=round(float(z), 4),
+        description=desc,
+    )
+
+
+def _volume_anomaly(symbol: str, ts: pd.Timestamp, ratio: float, z: float, threshold: float) -> Anomaly:
+    anomaly_type = "volume_surge" if z > 0 else "volume_drop"
+    return Anomaly(
+        date=_to_date(ts),
+        symbol=symbol,
+        type=anomaly_type,
+        severity=_classify_severity(abs(z), threshold),
+        z_score=round(float(z), 4),
+        description=f"{symbol} volume {ratio:.1f}x average (z={z:+.2f})",
+    )
+
+
+def _to_date(ts: object) -> date:
+    day: date = pd.Timestamp(ts).date()
+    return day
+
+
+def _recent_cutoff(last: object, days: int) -> date:
+    """First date inside a window of `days` ending at `last`."""
+    cutoff: date = (pd.Timestamp(_to_date(last)) - pd.Timedelta(days=days)).date()
+    return cutoff
+
+
+def _as_timestamp(since: date | pd.Timestamp, index: pd.Index) -> pd.Timestamp:
+    """`since` as a Timestamp comparable with `index` (matching its timezone)."""
+    ts = pd.Timestamp(since)
+    tz = getattr(index, "tz", None)
+    if tz is not None and ts.tzinfo is None:
+        ts = ts.tz_localize(tz)
+    return ts
+
+
+def _warmup_start(index: pd.Index, since: date | pd.Timestamp | None, warmup: int) -> int:
+    """Row to start computing from so rows on/after `since` get full windows."""
+    if since is None:
+        return 0
+    return max(0, int(index.searchsorted(_as_timestamp(since, index))) - warmup)
 
 
 def _classify_severity(abs_z: float, threshold: float) -> str:
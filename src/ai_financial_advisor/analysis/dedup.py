@@ -0,0 +1,203 @@
+"""Near-duplicate article clustering with MinHash and locality-sensitive hashing.
+
+The same wire story reaches many outlets with small edits (a new intro, a
+trimmed paragraph). Each article is reduced to a MinHash signature over
+its word 5-shingles (single characters for CJK text), whose share of
+matching positions estimates the Jaccard similarity of the shingle sets.
+Signatures are split into bands; articles that agree on a whole band land
+in the same bucket, and only those candidates are compared. Hashing and
+bucketing are linear in the number of articles, so clustering thousands
+of them never compares all pairs.
+
+Each article joins the cluster of its most similar earlier article if the
+estimated similarity reaches the threshold, otherwise it starts a cluster
+named after its own URL. Signatures and cluster ids can be persisted (see
+`DataStore.save_article_signatures`) so later runs join existing clusters.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..data.news_fetcher import Article
+from ..data.storage.base import ArticleSignature
+
+DEFAULT_THRESHOLD = 0.5
+
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_TOKEN = re.compile(rf"[{_CJK}]|[^\W{_CJK}]+")  # words, or single CJK characters
+_SHINGLE_MULTIPLIER = np.uint64(1_000_003)
+_BAND_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+@dataclass
+class ArticleCluster:
+    """Articles that carry the same story."""
+
+    cluster_id: str
+    articles: list[Article]
+
+    @property
+    def representative(self) -> Article:
+        """The most complete version: longest content, first on ties."""
+        return max(self.articles, key=lambda a: len(a.content or ""))
+
+    @property
+    def sources(self) -> list[str]:
+        """Names of the sources that carried the story, in order of appearance."""
+        return list(dict.fromkeys(a.source_name for a in self.articles))
+
+
+class MinHasher:
+    """Computes MinHash signatures and their LSH band keys.
+
+    With `bands` bands of `num_perm / bands` rows, two articles with
+    Jaccard similarity s share at least one bucket with probability
+    ``1 - (1 - s**rows)**bands``; the defaults (32 x 4) catch pairs above
+    ~0.5 with probability > 0.98.
+
+    Args:
+        num_perm: Signature length (hash functions).
+        bands: LSH bands; must divide `num_perm`.
+        shingle_size: Tokens per shingle.
+        seed: Seed of the hash functions; signatures are only comparable
+            between hashers with the same parameters and seed.
+
+    Raises:
+        ValueError: If `bands` does not divide `num_perm`.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 5, seed: int = 1) -> None:
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: (a * x + b) mod 2**64, keeping the high 32 bits
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._bands = bands
+        self._shingle_size = shingle_size
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature (uint32 array of length `num_perm`) of a text."""
+        shingles = self._shingles(text)
+        if not len(shingles):
+            return np.full(len(self._a), np.iinfo(np.uint32).max, dtype=np.uint32)
+        hashed = (self._a[:, None] * shingles[None, :] + self._b[:, None]) >> np.uint64(32)
+        signature: np.ndarray = hashed.min(axis=1).astype(np.uint32)
+        return signature
+
+    def band_keys(self, signature: np.ndarray) -> list[int]:
+        """One signed 64-bit bucket key per band (distinct across bands)."""
+        rows = signature.reshape(self._bands, -1).astype(np.uint64)
+        keys = np.arange(1, self._bands + 1, dtype=np.uint64) * _BAND_MULTIPLIER
+        for column in rows.T:
+            keys = keys * _SHINGLE_MULTIPLIER + column
+        band_keys: list[int] = keys.view(np.int64).tolist()
+        return band_keys
+
+    def _shingles(self, text: str) -> np.ndarray:
+        tokens = _TOKEN.findall(text.lower())
+        hashes = np.fromiter((zlib.crc32(t.encode()) for t in tokens), dtype=np.uint64, count=len(tokens))
+        count = len(hashes) - self._shingle_size + 1
+        if count < 1:
+            count, size = min(len(hashes), 1), len(hashes)
+        else:
+            size = self._shingle_size
+        shingles = np.zeros(count, dtype=np.uint64)
+        for offset in range(size):
+            shingles = shingles * _SHINGLE_MULTIPLIER + hashes[offset : offset + count]
+        return np.unique(shingles)
+
+
+def signature_to_bytes(signature: np.ndarray) -> bytes:
+    """A signature as stored in `ArticleSignature`: little-endian uint32 values."""
+    return signature.astype("<u4").tobytes()
+
+
+def signature_from_bytes(data: bytes) -> np.ndarray:
+    """The signature stored in `ArticleSignature` bytes (a read-only view)."""
+    return np.frombuffer(data, dtype="<u4")
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+def article_text(article: Article) -> str:
+    """The text an article is compared by."""
+    return f"{article.title}\n{article.content or article.description or ''}"
+
+
+def assign_clusters(
+    fresh: Mapping[str, np.ndarray],
+    known: Mapping[str, ArticleSignature],
+    hasher: MinHasher,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> dict[str, str]:
+    """Assign new signatures to clusters, in order.
+
+    Args:
+        fresh: Signatures of articles not clustered yet, by URL.
+        known: Already clustered articles that may match (e.g. stored ones
+            sharing a band with a fresh signature), by URL.
+        hasher: The hasher that computed the signatures.
+        threshold: Lowest estimated similarity to join a cluster.
+
+    Returns:
+        Cluster id of every URL in `fresh`.
+    """
+    signatures = {url: signature_from_bytes(entry.signature) for url, entry in known.items()}
+    clusters = {url: entry.cluster for url, entry in known.items()}
+    buckets: dict[int, list[str]] = defaultdict(list)
+    for url, signature in signatures.items():
+        for key in hasher.band_keys(signature):
+            buckets[key].append(url)
+
+    assigned = {}
+    for url, signature in fresh.items():
+        keys = hasher.band_keys(signature)
+        best, best_similarity = None, threshold
+        compared: set[str] = set()
+        matched: set[str] = set()
+        for key in keys:
+            for other in buckets.get(key, ()):
+                # One good match per cluster is enough to pick between clusters
+                if other in compared or clusters[other] in matched:
+                    continue
+                compared.add(other)
+                score = similarity(signature, signatures[other])
+                if score >= threshold:
+                    matched.add(clusters[other])
+                    if score >= best_similarity:
+                        best, best_similarity = other, score
+        cluster = clusters[best] if best is not None else url
+        assigned[url] = clusters[url] = cluster
+        signatures[url] = signature
+        for key in keys:
+            buckets[key].append(url)
+    return assigned
+
+
+def group_articles(articles: Iterable[Article], clusters: Mapping[str, str]) -> list[ArticleCluster]:
+    """Group articles by cluster id, clusters ordered by their first article.
+
+    Articles missing from `clusters` form clusters of their own.
+    """
+    groups: dict[str, list[Article]] = {}
+    for article in articles:
+        groups.setdefault(clusters.get(article.url, article.url), []).append(article)
+    return [ArticleCluster(cluster_id, members) for cluster_id, members in groups.items()]
+
+
+def cluster_articles(
+    articles: list[Article], hasher: MinHasher | None = None, threshold: float = DEFAULT_THRESHOLD
+) -> list[ArticleCluster]:
+    """Cluster near-duplicate articles in memory (no persisted signatures)."""
+    hasher = hasher or MinHasher()
+    fresh = {a.url: hasher.signature(article_text(a)) for a in articles}
+    return group_articles(articles, assign_clusters(fresh, {}, hasher, threshold))
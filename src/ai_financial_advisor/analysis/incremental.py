@@ -0,0 +1,212 @@
+"""Incremental indicator state for live bar updates.
+
+`compute_all_indicators` and `calculate_trend_score` recompute the whole
+history for every new bar. `IndicatorState` keeps just the accumulators
+they need (EMAs, running OBV, the MFI money-flow window and the recent
+histogram/OBV values), so each new bar costs O(1). The state round-trips
+through plain dicts for checkpointing between cron runs.
+
+Replaying a history through `IndicatorState` agrees with the batch
+functions to floating-point tolerance (the EMAs are bit-identical; the
+rolling sums and std are summed directly instead of with pandas' running
+updates).
+"""
+
+import math
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .trend_score import TrendScoreResult, score_from_signals
+
+
+@dataclass
+class IndicatorUpdate:
+    """Indicator values and trend score after one bar."""
+
+    macd: float
+    signal: float
+    histogram: float
+    obv: float
+    mfi: float
+    trend: TrendScoreResult
+
+
+@dataclass
+class IndicatorState:
+    """Running MACD/OBV/MFI and trend score state for one symbol.
+
+    Construct with the same parameters as the batch functions, then feed
+    bars oldest first with `update` (or seed from a frame with
+    `from_history`). OBV and MFI only count towards the trend score once a
+    bar with positive volume has been seen, mirroring how
+    `compute_all_indicators` skips them for volume-less assets.
+
+    Attributes:
+        as_of: Timestamp of the last bar applied (ISO format), if known.
+        bars: Number of bars applied.
+    """
+
+    fast: int = 12
+    slow: int = 26
+    signal: int = 9
+    mfi_period: int = 14
+    macd_std_window: int = 5
+    obv_slope_window: int = 5
+    weights: dict[str, float] | None = None
+
+    as_of: str | None = None
+    bars: int = 0
+    ema_fast: float = math.nan
+    ema_slow: float = math.nan
+    signal_ema: float = math.nan
+    last_close: float = math.nan
+    last_typical_price: float = math.nan
+    obv: float = 0.0
+    has_volume: bool = False
+    positive_flows: list[float] = field(default_factory=list)
+    negative_flows: list[float] = field(default_factory=list)
+    recent_histograms: list[float] = field(default_factory=list)
+    recent_obv: list[float] = field(default_factory=list)
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, **params: Any) -> "IndicatorState":
+        """Build a state by replaying an OHLCV frame, oldest bar first.
+
+        Args:
+            df: DataFrame with High, Low, Close, and Volume columns.
+            **params: Indicator parameters passed to the constructor.
+
+        Returns:
+            State positioned after the last row of `df`.
+        """
+        state = cls(**params)
+        for timestamp, bar in zip(df.index, df[["High", "Low", "Close", "Volume"]].itertuples(index=False)):
+            state.update(bar._asdict(), timestamp=timestamp)
+        return state
+
+    def update(self, bar: Mapping[str, float], timestamp: Any = None) -> IndicatorUpdate:
+        """Apply one new bar.
+
+        Args:
+            bar: Mapping with High, Low, Close, and Volume values (e.g. a
+                row of an OHLCV DataFrame).
+            timestamp: Optional bar timestamp, recorded as `as_of`.
+
+        Returns:
+            IndicatorUpdate with the values for this bar.
+
+        Raises:
+            ValueError: If `timestamp` is not after `as_of`, or Close is NaN.
+        """
+        close = float(bar["Close"])
+        volume = float(bar["Volume"])
+        if math.isnan(close):
+            raise ValueError("Cannot update indicator state with a NaN close")
+        if timestamp is not None:
+            as_of = pd.Timestamp(timestamp).isoformat()
+            if self.as_of is not None and as_of <= self.as_of:
+                raise ValueError(f"Bar at {as_of} is not after the last applied bar ({self.as_of})")
+            self.as_of = as_of
+
+        # MACD
+        self.ema_fast = _ema_step(self.ema_fast, close, self.fast)
+        self.ema_slow = _ema_step(self.ema_slow, close, self.slow)
+        macd = self.ema_fast - self.ema_slow
+        self.signal_ema = _ema_step(self.signal_ema, macd, self.signal)
+        histogram = macd - self.signal_ema
+        _push(self.recent_histograms, histogram, self.macd_std_window)
+
+        # OBV
+        if volume == volume:  # NaN volume leaves OBV unchanged
+            self.obv += _direction(close, self.last_close) * volume
+        _push(self.recent_obv, self.obv, self.obv_slope_window)
+        self.last_close = close
+        self.has_volume = self.has_volume or volume > 0
+
+        # MFI
+        typical_price = (float(bar["High"]) + float(bar["Low"]) + close) / 3
+        raw_money_flow = typical_price * volume
+        direction = _direction(typical_price, self.last_typical_price)
+        _push(self.positive_flows, raw_money_flow * (direction > 0), self.mfi_period)
+        _push(self.negative_flows, raw_money_flow * (direction < 0), self.mfi_period)
+        self.last_typical_price = typical_price
+        mfi = self._mfi()
+
+        self.bars += 1
+        return IndicatorUpdate(
+            macd=macd,
+            signal=self.signal_ema,
+            histogram=histogram,
+            obv=self.obv,
+            mfi=mfi,
+            trend=self._trend_score(histogram, mfi),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of the state."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "IndicatorState":
+        """Restore a state saved with `to_dict`."""
+        return cls(**data)
+
+    def _mfi(self) -> float:
+        if len(self.positive_flows) < self.mfi_period:
+            return math.nan
+        positive_flow = sum(self.positive_flows)
+        negative_flow = abs(sum(self.negative_flows))
+        return 100 - (100 / (1 + positive_flow / (negative_flow + 1e-9)))
+
+    def _trend_score(self, histogram: float, mfi: float) -> TrendScoreResult:
+        """Component signals as in `calculate_trend_score`, for the latest bar."""
+        has_mfi = self.has_volume and len(self.positive_flows) == self.mfi_period
+        has_obv = self.has_volume
+
+        hist_std = _sample_std(self.recent_histograms, self.macd_std_window)
+        macd_signal = math.tanh(histogram / (hist_std + 1e-9))
+        mfi_signal = float(np.clip((mfi - 50) / 50, -1, 1)) if has_mfi else 0.0
+        if has_obv:
+            obv_start = self.recent_obv[0] if len(self.recent_obv) == self.obv_slope_window else math.nan
+            obv_signal = math.tanh((self.obv - obv_start) / (abs(obv_start) + 1e-9))
+        else:
+            obv_signal = 0.0
+
+        return score_from_signals(macd_signal, mfi_signal, obv_signal, has_mfi, has_obv, self.weights)
+
+
+def _ema_step(previous: float, value: float, span: int) -> float:
+    """One step of ``ewm(span=span, adjust=False).mean()``, pandas arithmetic."""
+    if math.isnan(previous):
+        return value
+    alpha = 1.0 / (1.0 + (span - 1) / 2.0)
+    old_weight = 1.0 - alpha
+    if previous == value:
+        return previous
+    return (old_weight * previous + alpha * value) / (old_weight + alpha)
+
+
+def _direction(value: float, previous: float) -> float:
+    """Sign of the change; 0 for the first bar, like ``diff().fillna(0)``."""
+    change = value - previous
+    if math.isnan(change):
+        return 0.0
+    return float((change > 0) - (change < 0))
+
+
+def _push(window: list[float], value: float, size: int) -> None:
+    window.append(value)
+    if len(window) > size:
+        del window[0]
+
+
+def _sample_std(values: list[float], window: int) -> float:
+    """Sample std (ddof=1) of a full window, NaN until it is full."""
+    if len(values) < window or window < 2:
+        return math.nan
+    mean = sum(values) / window
+    return math.sqrt(sum((v - mean) ** 2 for v in values) / (window - 1))
@@ -3,11 +3,164 @@
 This is the single source of truth for all technical indicators used
 across the system — CLI, agents, strategies, and web interfaces all
 import from here. No duplication.
+
+The math lives in array helpers that write into caller-provided float64
+buffers; the DataFrame functions are thin wrappers around them, and
+`indicator_kernel` runs every indicator over one set of input arrays
+into a single preallocated output. Arrays are 1-D for one symbol or
+2-D (dates × symbols) for a whole panel, always computed along axis 0.
+Recursive EMAs and rolling sums go through pandas' window kernels on
+the raw arrays, so results are bit-for-bit identical to the column-wise
+pandas formulas.
 """
 
 import numpy as np
 import pandas as pd
 
+# Column order of `indicator_kernel` output
+INDICATOR_COLUMNS = ("EMA_fast", "EMA_slow", "MACD", "Signal", "Histogram", "OBV", "MFI")
+
+_MACD_COLUMNS = list(INDICATOR_COLUMNS[:5])
+
+
+def _wrap(values: np.ndarray) -> pd.Series | pd.DataFrame:
+    """View a 1-D or 2-D array as a Series/DataFrame for pandas window kernels."""
+    if values.ndim == 2:
+        return pd.DataFrame(values, copy=False)
+    return pd.Series(values, copy=False)
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    ema: np.ndarray = _wrap(values).ewm(span=span, adjust=False).mean().to_numpy()
+    return ema
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    total: np.ndarray = _wrap(values).rolling(window=window).sum().to_numpy()
+    return total
+
+
+def _diff_sign(values: np.ndarray) -> np.ndarray:
+    """Sign of the bar-to-bar change, 0 for the first bar and NaN gaps."""
+    sign = np.empty_like(values)
+    sign[:1] = 0.0
+    np.subtract(values[1:], values[:-1], out=sign[1:])
+    np.sign(sign, out=sign)
+    np.nan_to_num(sign, copy=False, nan=0.0)
+    return sign
+
+
+def _fill_macd(close: np.ndarray, out: np.ndarray, fast: int, slow: int, signal: int) -> None:
+    """Write EMA_fast, EMA_slow, MACD, Signal, Histogram into out[:, 0:5]."""
+    out[:, 0] = _ema(close, fast)
+    out[:, 1] = _ema(close, slow)
+    np.subtract(out[:, 0], out[:, 1], out=out[:, 2])
+    out[:, 3] = _ema(out[:, 2], signal)
+    np.subtract(out[:, 2], out[:, 3], out=out[:, 4])
+
+
+def _fill_obv(close: np.ndarray, volume: np.ndarray, out: np.ndarray) -> None:
+    """Write OBV into `out`, skipping NaN volume like pandas cumsum."""
+    flow = np.multiply(_diff_sign(close), volume)
+    missing = np.isnan(flow)
+    if missing.any():
+        flow[missing] = 0.0
+        np.cumsum(flow, axis=0, out=out)
+        out[missing] = np.nan
+    else:
+        np.cumsum(flow, axis=0, out=out)
+
+
+def _fill_mfi(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    out: np.ndarray,
+    period: int,
+) -> None:
+    """Write MFI (0-100 scale) into `out`."""
+    typical_price = np.add(high, low)
+    typical_price += close
+    typical_price /= 3
+    raw_money_flow = np.multiply(typical_price, volume)
+    direction = _diff_sign(typical_price)
+
+    positive_flow = _rolling_sum(raw_money_flow * (direction > 0), period)
+    negative_flow = np.abs(_rolling_sum(raw_money_flow * (direction < 0), period))
+
+    negative_flow += 1e-9
+    np.divide(positive_flow, negative_flow, out=out)
+    out += 1
+    np.divide(100, out, out=out)
+    np.subtract(100, out, out=out)
+
+
+def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+    values: np.ndarray = df[name].to_numpy(dtype=np.float64)
+    return values
+
+
+def _attach(df: pd.DataFrame, out: np.ndarray, columns: list[str]) -> pd.DataFrame:
+    """Return a copy of `df` with the columns of `out` added or overwritten."""
+    if df.columns.intersection(columns).empty:
+        # One block concat instead of a per-column insert into a copied frame
+        block = pd.DataFrame(out, index=df.index, columns=columns, copy=False)
+        return pd.concat([df, block], axis=1)
+    df = df.copy()
+    df[columns] = out
+    return df
+
+
+def indicator_kernel(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    mfi_period: int = 14,
+) -> np.ndarray:
+    """Compute every indicator from raw float64 arrays into one buffer.
+
+    Inputs are 1-D for one symbol, or 2-D (dates × symbols) to compute a
+    whole panel at once; each column is treated as one symbol's history.
+
+    Args:
+        high: High prices.
+        low: Low prices.
+        close: Close prices.
+        volume: Volumes, or None to skip OBV and MFI (left as NaN).
+        out: Optional float64 buffer to write into, e.g. reused across
+            symbols of the same length: shape (n, 7), or (n, 7, k) for
+            2-D inputs with k symbols.
+        fast: Fast EMA period.
+        slow: Slow EMA period.
+        signal: Signal line EMA period.
+        mfi_period: Lookback window for the MFI calculation.
+
+    Returns:
+        The output array; axis 1 follows `INDICATOR_COLUMNS` order.
+
+    Raises:
+        ValueError: If `out` has the wrong shape or dtype.
+    """
+    shape = (len(close), len(INDICATOR_COLUMNS), *close.shape[1:])
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {shape}, got {out.dtype} {out.shape}")
+
+    _fill_macd(close, out, fast, slow, signal)
+    if volume is None:
+        out[:, 5:] = np.nan
+    else:
+        _fill_obv(close, volume, out[:, 5])
+        _fill_mfi(high, low, close, volume, out[:, 6], mfi_period)
+    return out
+
 
 def calculate_macd(
     df: pd.DataFrame,
@@ -26,13 +179,9 @@ def calculate_macd(
     Returns:
         DataFrame with added MACD, Signal, and Histogram columns.
     """
-    df = df.copy()
-    df["EMA_fast"] = df["Close"].ewm(span=fast, adjust=False).mean()
-    df["EMA_slow"] = df["Close"].ewm(span=slow, adjust=False).mean()
-    df["MACD"] = df["EMA_fast"] - df["EMA_slow"]
-    df["Signal"] = df["MACD"].ewm(span=signal, adjust=False).mean()
-    df["Histogram"] = df["MACD"] - df["Signal"]
-    return df
+    out = np.empty((len(df), len(_MACD_COLUMNS)))
+    _fill_macd(_column(df, "Close"), out, fast, slow, signal)
+    return _attach(df, out, _MACD_COLUMNS)
 
 
 def calculate_obv(df: pd.DataFrame) -> pd.DataFrame:
@@ -44,10 +193,9 @@ def calculate_obv(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with added OBV column.
     """
-    df = df.copy()
-    direction = np.sign(df["Close"].diff().fillna(0))
-    df["OBV"] = (direction * df["Volume"]).cumsum()
-    return df
+    out = np.empty(len(df))
+    _fill_obv(_column(df, "Close"), _column(df, "Volume"), out)
+    return _attach(df, out[:, None], ["OBV"])
 
 
 def calculate_mfi(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
@@ -60,17 +208,9 @@ def calculate_mfi(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
     Returns:
         DataFrame with added MFI column (0-100 scale).
     """
-    df = df.copy()
-    typical_price = (df["High"] + df["Low"] + df["Close"]) / 3
-    raw_money_flow = typical_price * df["Volume"]
-    direction = np.sign(typical_price.diff().fillna(0))
-
-    positive_flow = (raw_money_flow * (direction > 0)).rolling(window=period).sum()
-    negative_flow = (raw_money_flow * (direction < 0)).rolling(window=period).sum().abs()
-
-    money_flow_ratio = positive_flow / (negative_flow + 1e-9)
-    df["MFI"] = 100 - (100 / (1 + money_flow_ratio))
-    return df
+    out = np.empty(len(df))
+    _fill_mfi(_column(df, "High"), _column(df, "Low"), _column(df, "Close"), _column(df, "Volume"), out, period)
+    return _attach(df, out[:, None], ["MFI"])
 
 
 def compute_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
@@ -84,12 +224,14 @@ def compute_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with all indicator columns added.
     """
-    df = calculate_macd(df)
-
     # Skip volume-dependent indicators if volume is all zeros or missing
     has_volume = "Volume" in df.columns and (df["Volume"] > 0).any()
+
+    close = _column(df, "Close")
     if has_volume:
-        df = calculate_obv(df)
-        df = calculate_mfi(df)
+        out = indicator_kernel(_column(df, "High"), _column(df, "Low"), close, _column(df, "Volume"))
+        return _attach(df, out, list(INDICATOR_COLUMNS))
 
-    return df
+    out = np.empty((len(df), len(_MACD_COLUMNS)))
+    _fill_macd(close, out, 12, 26, 9)
+    return _attach(df, out, _MACD_COLUMNS)
@@ -0,0 +1,137 @@
+"""Ranking news stories and packing them into a prompt token budget.
+
+Stories (clusters of near-duplicate articles) are ranked by relevance —
+how many outlets carried them, doubled for finance and market news — and
+recency, which halves the score every `half_life` hours. The ranked
+stories are then packed into the budget: every story is listed by its
+headline, as far as a share of the budget allows, and the top stories
+are given detailed entries (title, summary and a snippet of whole
+sentences) with the rest. Overflow is thus summarized as headlines
+before anything is dropped, and rank decides detail: a story never gets
+more room than one ranked above it.
+"""
+
+import math
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ..data.news_fetcher import Article
+from .dedup import ArticleCluster
+
+DEFAULT_HALF_LIFE_HOURS = 24.0
+DEFAULT_HEADLINE_SHARE = 0.25
+
+_FINANCE = re.compile(
+    r"\b(?:market|stock|share|equit|bond|yield|treasur|rate|inflation|fed\b|central bank|earnings|revenue|profit|"
+    r"gdp|tariff|trade|oil|crude|price|econom|bank|currenc|dollar|crypto|bitcoin|invest|ipo|merger|acquisition|"
+    r"recession|jobs|payroll|s&p|nasdaq|dow)|股|债|利率|通胀|央行|经济|财报|营收|利润|关税|贸易|油价|汇率|美元|"
+    r"投资|并购|市场|银行",
+    re.I,
+)
+
+
+@dataclass
+class PromptEntry:
+    """A story as it goes into a prompt."""
+
+    cluster: ArticleCluster
+    snippet: str  # article text for the detailed entry, already clipped
+
+    @property
+    def article(self) -> Article:
+        """The story's representative article."""
+        return self.cluster.representative
+
+
+@dataclass
+class PackedPrompt:
+    """The stories chosen for a prompt, by level of detail."""
+
+    detailed: list[PromptEntry] = field(default_factory=list)
+    headlines: list[PromptEntry] = field(default_factory=list)
+    dropped: list[PromptEntry] = field(default_factory=list)
+    tokens: int = 0  # estimated tokens of the chosen entries
+
+
+def story_score(cluster: ArticleCluster, now: datetime, half_life: float = DEFAULT_HALF_LIFE_HOURS) -> float:
+    """Relevance and recency of a story; higher comes first.
+
+    Args:
+        cluster: The story.
+        now: Reference time for recency.
+        half_life: Hours after which a story's score has halved.
+    """
+    relevance = float(len(cluster.articles))
+    if any(_FINANCE.search(f"{a.title} {a.description or ''}") for a in cluster.articles):
+        relevance *= 2
+    published = [a.published_at for a in cluster.articles if a.published_at is not None]
+    if not published:
+        return relevance
+    latest = max(published, key=_aware)
+    if (latest.tzinfo is None) != (now.tzinfo is None):
+        latest, now = _aware(latest), _aware(now)
+    age = max((now - latest).total_seconds() / 3600, 0.0)
+    return relevance * math.pow(0.5, age / half_life)
+
+
+def _aware(moment: datetime) -> datetime:
+    """`moment` with a time zone; naive times are taken as local time."""
+    return moment if moment.tzinfo is not None else moment.astimezone()
+
+
+def rank_stories(
+    clusters: Sequence[ArticleCluster], now: datetime, half_life: float = DEFAULT_HALF_LIFE_HOURS
+) -> list[ArticleCluster]:
+    """Stories by descending `story_score`, ties in their original order."""
+    scores = [story_score(c, now, half_life) for c in clusters]
+    return [clusters[i] for i in sorted(range(len(clusters)), key=lambda i: -scores[i])]
+
+
+def pack_entries(
+    entries: Sequence[PromptEntry],
+    budget: int,
+    detailed_cost: Callable[[PromptEntry], int],
+    headline_cost: Callable[[PromptEntry], int],
+    headline_share: float = DEFAULT_HEADLINE_SHARE,
+) -> PackedPrompt:
+    """Fit ranked entries into a token budget.
+
+    Entries are first listed by headline, in rank order, using at most
+    `headline_share` of the budget; entries beyond that are dropped. The
+    listed entries are then upgraded to detailed entries, in rank order,
+    while the budget allows.
+
+    Args:
+        entries: Entries in rank order.
+        budget: Tokens available for the entries.
+        detailed_cost: Tokens of an entry rendered in full.
+        headline_cost: Tokens of an entry listed by headline.
+        headline_share: Largest share of the budget spent on headlines.
+
+    Returns:
+        The packed prompt; `detailed` and `headlines` keep rank order.
+    """
+    packed = PackedPrompt()
+    headline_costs = []
+    for entry in entries:
+        cost = headline_cost(entry)
+        if packed.tokens + cost > budget * headline_share:
+            break
+        headline_costs.append(cost)
+        packed.tokens += cost
+    listed = len(headline_costs)
+
+    detailed = 0
+    while detailed < listed:
+        extra = detailed_cost(entries[detailed]) - headline_costs[detailed]
+        if packed.tokens + extra > budget:
+            break
+        packed.tokens += extra
+        detailed += 1
+
+    packed.detailed = list(entries[:detailed])
+    packed.headlines = list(entries[detailed:listed])
+    packed.dropped = list(entries[listed:])
+    return packed
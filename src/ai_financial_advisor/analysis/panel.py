@@ -0,0 +1,154 @@
+"""Panel-mode indicators: a whole universe as (dates × symbols) matrices.
+
+A panel holds one DataFrame per OHLCV field, indexed by the union of all
+symbols' dates with one column per symbol. Symbols listed at different
+times or traded on different exchange calendars leave NaN cells; each
+symbol's own trading rows (non-NaN Close) are computed as one contiguous
+history, so recursive indicators never see another market's calendar.
+Results are scattered back onto the union dates and match
+`compute_all_indicators` + `trend_score_series` run per symbol.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from .indicators import INDICATOR_COLUMNS, indicator_kernel
+from .trend_score import trend_score_arrays
+
+PANEL_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+# Trend score component matrices returned next to the indicators
+SCORE_COLUMNS = ("score", "macd_signal", "mfi_signal", "obv_signal", "interpretation")
+
+
+def to_panel(frames: Mapping[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """Stack per-symbol OHLCV frames into one float64 matrix per field.
+
+    Args:
+        frames: Symbol → OHLCV DataFrame (e.g. from `download_many`); each
+            index must be unique.
+
+    Returns:
+        Field → DataFrame of dates × symbols on the union calendar. Fields
+        missing from every frame (e.g. Volume) are omitted.
+    """
+    symbols = list(frames)
+    # Stack all bars into one long frame, then scatter each field in one step
+    stacked = pd.concat(frames.values())
+    index = stacked.index.unique().sort_values()
+    rows = index.get_indexer(stacked.index)
+    cols = np.repeat(np.arange(len(symbols)), [len(df) for df in frames.values()])
+
+    panel: dict[str, pd.DataFrame] = {}
+    for field in PANEL_FIELDS:
+        if field not in stacked.columns:
+            continue
+        values = np.full((len(index), len(symbols)), np.nan)
+        values[rows, cols] = stacked[field].to_numpy(dtype=np.float64)
+        panel[field] = pd.DataFrame(values, index=index, columns=symbols, copy=False)
+    return panel
+
+
+def compute_panel_indicators(
+    panel: Mapping[str, pd.DataFrame],
+    weights: dict[str, float] | None = None,
+    macd_std_window: int = 5,
+    obv_slope_window: int = 5,
+) -> dict[str, pd.DataFrame]:
+    """Compute indicators and trend scores for every symbol in one pass.
+
+    Rows where a symbol's Close is NaN are treated as non-trading days for
+    that symbol and come back NaN. Symbols without positive volume get NaN
+    OBV and MFI, and their scores use the volume-less weights, as with
+    `compute_all_indicators`.
+
+    Args:
+        panel: Field → dates × symbols matrices (output of `to_panel`);
+            must contain High, Low and Close.
+        weights: Dict with 'macd', 'mfi', 'obv' weights (must sum to 1.0).
+        macd_std_window: Lookback for MACD histogram normalization.
+        obv_slope_window: Lookback for OBV slope calculation.
+
+    Returns:
+        Dict of dates × symbols DataFrames keyed by `INDICATOR_COLUMNS` and
+        `SCORE_COLUMNS`, all shaped like ``panel["Close"]``.
+    """
+    close = panel["Close"]
+    index, symbols = close.index, close.columns
+
+    def field(name: str) -> np.ndarray:
+        # A private copy: packing rewrites gapped columns in place
+        values: np.ndarray = panel[name].reindex(index=index, columns=symbols).to_numpy(dtype=np.float64, copy=True)
+        return values
+
+    trading = close.notna().to_numpy()
+    packing = RowPacking(trading)
+
+    volume = packing.pack(field("Volume")) if "Volume" in panel else None
+    has_volume = (volume > 0).any(axis=0) if volume is not None else np.zeros(len(symbols), dtype=bool)
+
+    out = indicator_kernel(
+        packing.pack(field("High")), packing.pack(field("Low")), packing.pack(field("Close")), volume
+    )
+    out[:, 5:, ~has_volume] = np.nan
+    components = trend_score_arrays(
+        out[:, 4],
+        out[:, 6],
+        out[:, 5],
+        weights=weights,
+        macd_std_window=macd_std_window,
+        obv_slope_window=obv_slope_window,
+    )
+
+    def frame(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=index, columns=symbols, copy=False)
+
+    result = {name: frame(packing.unpack(out[:, i], np.nan)) for i, name in enumerate(INDICATOR_COLUMNS)}
+    result.update({name: frame(packing.unpack(components[name], np.nan)) for name in SCORE_COLUMNS[:-1]})
+
+    # Move labels as integer codes: object arrays are slow to shuffle around
+    labels = np.array(["Bullish", "Bearish", "Neutral", None], dtype=object)
+    interpretation = components["interpretation"]
+    codes = np.select([interpretation == "Bullish", interpretation == "Bearish"], [0, 1], 2)
+    result["interpretation"] = frame(labels[packing.unpack(codes, 3)])
+    return result
+
+
+class RowPacking:
+    """Moves each symbol's trading rows to the top of the time axis and back.
+
+    Leading NaNs (later listings) and trailing NaNs (delistings) do not
+    affect causal indicators, so only columns with interior gaps, i.e.
+    symbols on a sparser calendar than the panel, are repacked.
+    """
+
+    def __init__(self, trading: np.ndarray) -> None:
+        self.trading = trading
+        n = len(trading)
+        counts = trading.sum(axis=0)
+        first = np.argmax(trading, axis=0)
+        last = n - 1 - np.argmax(trading[::-1], axis=0)
+        self.gapped = np.flatnonzero((counts > 0) & (last - first + 1 > counts))
+        # Row order that packs each gapped symbol's trading rows first, in date order
+        self.order = np.argsort(~trading[:, self.gapped], axis=0, kind="stable")
+        self.padding = np.arange(n)[:, None] >= counts[self.gapped]
+
+    def pack(self, values: np.ndarray) -> np.ndarray:
+        """Pack gapped columns of `values` in place and return it."""
+        if self.gapped.size:
+            packed = np.take_along_axis(values[:, self.gapped], self.order, axis=0)
+            packed[self.padding] = np.nan
+            values[:, self.gapped] = packed
+        return values
+
+    def unpack(self, values: np.ndarray, fill: float) -> np.ndarray:
+        """Restore union-calendar rows, writing `fill` on non-trading rows."""
+        values = np.array(values)
+        if self.gapped.size:
+            restored = np.empty((len(values), self.gapped.size), dtype=values.dtype)
+            np.put_along_axis(restored, self.order, values[:, self.gapped], axis=0)
+            values[:, self.gapped] = restored
+        values[~self.trading] = fill
+        return values
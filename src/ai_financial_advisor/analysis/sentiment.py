@@ -10,6 +10,7 @@ import logging
 from dataclasses import dataclass, field
 
 from ..llm.base import LLMProvider
+from ..llm.tokens import TokenUsage, clip_text
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,9 @@ News report:
 ---
 """
 
+_SYSTEM_PROMPT = "You are a financial sentiment analysis system. Return only valid JSON."
+DEFAULT_PROMPT_TOKENS = 4000
+
 
 @dataclass
 class SectorSentiment:
@@ -72,31 +76,58 @@ class SentimentResult:
     affected_tickers: list[str] = field(default_factory=list)
 
 
-def analyze_sentiment(report_text: str, llm: LLMProvider) -> SentimentResult:
+def analyze_sentiment(
+    report_text: str,
+    llm: LLMProvider,
+    max_prompt_tokens: int = DEFAULT_PROMPT_TOKENS,
+    usage: list[TokenUsage] | None = None,
+) -> SentimentResult:
     """Extract structured sentiment data from a news report.
 
+    A report longer than the prompt budget is cut after the last whole
+    sentence that fits; reports list the most important news first.
+
     Args:
         report_text: The news report markdown text.
         llm: LLM provider to use for analysis.
+        max_prompt_tokens: Token budget of the prompt, instructions included.
+        usage: If given, the call's token usage is appended to it.
 
     Returns:
         SentimentResult with overall and per-sector sentiment.
     """
     logger.info("Analyzing sentiment from report (%d chars)...", len(report_text))
 
-    prompt = _SENTIMENT_PROMPT.format(report_text=report_text[:8000])
+    fixed = llm.count_tokens(_SYSTEM_PROMPT) + llm.count_tokens(_SENTIMENT_PROMPT.replace("{report_text}", ""))
+    clipped = clip_text(report_text, max_prompt_tokens - fixed, llm.count_tokens)
+    if len(clipped) < len(report_text):
+        logger.info(
+            "Report clipped to %d of %d chars to fit %d prompt tokens.",
+            len(clipped),
+            len(report_text),
+            max_prompt_tokens,
+        )
+    # Not str.format: the JSON example in the prompt is full of braces
+    prompt = _SENTIMENT_PROMPT.replace("{report_text}", clipped)
 
     response = llm.complete(
         messages=[
-            {
-                "role": "system",
-                "content": "You are a financial sentiment analysis system. Return only valid JSON.",
-            },
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ],
         temperature=0.2,
         max_tokens=2048,
     )
+    stage = TokenUsage.record(
+        "sentiment",
+        max_prompt_tokens,
+        llm.count_tokens(_SYSTEM_PROMPT) + llm.count_tokens(prompt),
+        response.usage,
+        report_chars=len(clipped),
+        clipped_chars=len(report_text) - len(clipped),
+    )
+    if usage is not None:
+        usage.append(stage)
 
     try:
         # Extract JSON from response (handle markdown code blocks)
@@ -48,8 +48,6 @@ def calculate_trend_score(
     Returns:
         TrendScoreResult with the composite score and component signals.
     """
-    w = weights or dict(_DEFAULT_WEIGHTS)
-
     # Check if volume-dependent indicators are available
     has_mfi = "MFI" in df.columns and not df["MFI"].isna().all()
     has_obv = "OBV" in df.columns and not df["OBV"].isna().all()
@@ -74,6 +72,32 @@ def calculate_trend_score(
     else:
         obv_signal = 0.0
 
+    return score_from_signals(macd_signal, mfi_signal, obv_signal, has_mfi, has_obv, weights)
+
+
+def score_from_signals(
+    macd_signal: float,
+    mfi_signal: float,
+    obv_signal: float,
+    has_mfi: bool,
+    has_obv: bool,
+    weights: dict[str, float] | None = None,
+) -> TrendScoreResult:
+    """Combine component signals into a `TrendScoreResult`.
+
+    Args:
+        macd_signal: Normalized MACD histogram signal.
+        mfi_signal: Rescaled MFI signal (ignored if `has_mfi` is False).
+        obv_signal: OBV slope signal (ignored if `has_obv` is False).
+        has_mfi: Whether MFI is available for this asset.
+        has_obv: Whether OBV is available for this asset.
+        weights: Dict with 'macd', 'mfi', 'obv' weights (must sum to 1.0).
+
+    Returns:
+        TrendScoreResult with the composite score and component signals.
+    """
+    w = weights or dict(_DEFAULT_WEIGHTS)
+
     # Redistribute weights if volume indicators are missing (e.g., forex)
     if not has_mfi and not has_obv:
         w = {"macd": 1.0, "mfi": 0.0, "obv": 0.0}
@@ -106,3 +130,157 @@ def calculate_trend_score(
         obv_signal=round(obv_signal, 4),
         interpretation=interpretation,
     )
+
+
+def trend_score_series(
+    df: pd.DataFrame,
+    weights: dict[str, float] | None = None,
+    macd_std_window: int = 5,
+    obv_slope_window: int = 5,
+) -> pd.DataFrame:
+    """Calculate the trend score for every row in one vectorized pass.
+
+    Row ``i`` of the result is identical to
+    ``calculate_trend_score(df.iloc[: i + 1])``, including the weight
+    redistribution for volume-less assets, but the whole history is
+    computed with column operations instead of one call per prefix.
+
+    Args:
+        df: DataFrame that already has Histogram, MFI, and OBV columns
+            (output of `compute_all_indicators`).
+        weights: Dict with 'macd', 'mfi', 'obv' weights (must sum to 1.0).
+        macd_std_window: Lookback for MACD histogram normalization.
+        obv_slope_window: Lookback for OBV slope calculation.
+
+    Returns:
+        DataFrame indexed like `df` with score, macd_signal, mfi_signal,
+        obv_signal, and interpretation columns. Rows without enough
+        history for a component are NaN.
+    """
+    components = trend_score_arrays(
+        df["Histogram"].to_numpy(dtype=float),
+        _optional_column(df, "MFI"),
+        _optional_column(df, "OBV"),
+        weights=weights,
+        macd_std_window=macd_std_window,
+        obv_slope_window=obv_slope_window,
+    )
+    return pd.DataFrame(components, index=df.index)
+
+
+def trend_score_arrays(
+    hist: np.ndarray,
+    mfi: np.ndarray | None,
+    obv: np.ndarray | None,
+    weights: dict[str, float] | None = None,
+    macd_std_window: int = 5,
+    obv_slope_window: int = 5,
+) -> dict[str, np.ndarray]:
+    """Array core of `trend_score_series`, computed along axis 0.
+
+    Inputs are 1-D for one symbol or 2-D (dates × symbols) for a panel;
+    each column is scored as its own history.
+
+    Args:
+        hist: MACD histogram values.
+        mfi: MFI values, or None if the indicator is missing.
+        obv: OBV values, or None if the indicator is missing.
+        weights: Dict with 'macd', 'mfi', 'obv' weights (must sum to 1.0).
+        macd_std_window: Lookback for MACD histogram normalization.
+        obv_slope_window: Lookback for OBV slope calculation.
+
+    Returns:
+        Dict of score, macd_signal, mfi_signal, obv_signal (rounded to 4
+        decimals) and interpretation arrays, all shaped like `hist`.
+    """
+    w = weights or dict(_DEFAULT_WEIGHTS)
+
+    # A prefix "has" an indicator once any non-NaN value has appeared
+    has_mfi = _available_mask(mfi, hist.shape)
+    has_obv = _available_mask(obv, hist.shape)
+
+    # MACD signal: normalized histogram value
+    hist_std = _rolling_std(hist, macd_std_window)
+    macd_signal = np.tanh(hist / (hist_std + 1e-9))
+
+    # MFI signal: rescaled to [-1, 1]
+    if mfi is not None and has_mfi.any():
+        mfi_signal = np.where(has_mfi, np.clip((mfi - 50) / 50, -1, 1), 0.0)
+    else:
+        mfi_signal = np.zeros(hist.shape)
+
+    # OBV signal: relative change over the lookback window
+    if obv is not None and has_obv.any():
+        obv_start = _shift(obv, obv_slope_window - 1)
+        obv_change = np.tanh((obv - obv_start) / (np.abs(obv_start) + 1e-9))
+        obv_signal = np.where(has_obv, obv_change, 0.0)
+    else:
+        obv_signal = np.zeros(hist.shape)
+
+    # Redistribute weights row by row where volume indicators are missing
+    no_volume = ~has_mfi & ~has_obv
+    obv_only = ~has_mfi & has_obv
+    mfi_only = has_mfi & ~has_obv
+    conditions = [no_volume, obv_only, mfi_only]
+    w_macd = np.select(conditions, [1.0, w["macd"] + w["mfi"] / 2, w["macd"] + w["obv"] / 2], w["macd"])
+    w_mfi = np.select(conditions, [0.0, 0.0, w["mfi"] + w["obv"] / 2], w["mfi"])
+    w_obv = np.select(conditions, [0.0, w["obv"] + w["mfi"] / 2, 0.0], w["obv"])
+
+    score = w_macd * macd_signal + w_mfi * mfi_signal + w_obv * obv_signal
+
+    interpretation = np.select([score > 0.3, score < -0.3], ["Bullish", "Bearish"], "Neutral")
+
+    return {
+        "score": round4(score),
+        "macd_signal": round4(macd_signal),
+        "mfi_signal": round4(mfi_signal),
+        "obv_signal": round4(obv_signal),
+        "interpretation": interpretation,
+    }
+
+
+def _optional_column(df: pd.DataFrame, column: str) -> np.ndarray | None:
+    if column not in df.columns:
+        return None
+    values: np.ndarray = df[column].to_numpy(dtype=float)
+    return values
+
+
+def _available_mask(values: np.ndarray | None, shape: tuple[int, ...]) -> np.ndarray:
+    """Boolean mask: True once `values` has had a non-NaN value."""
+    if values is None:
+        return np.zeros(shape, dtype=bool)
+    return np.logical_or.accumulate(~np.isnan(values), axis=0)
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    wrapped = pd.DataFrame(values, copy=False) if values.ndim == 2 else pd.Series(values, copy=False)
+    std: np.ndarray = wrapped.rolling(window=window).std().to_numpy()
+    return std
+
+
+def _shift(values: np.ndarray, periods: int) -> np.ndarray:
+    """Shift forward along axis 0 like ``Series.shift``, padding with NaN."""
+    if periods <= 0:
+        return values
+    shifted = np.full_like(values, np.nan)
+    shifted[periods:] = values[:-periods]
+    return shifted
+
+
+def round4(values: np.ndarray) -> np.ndarray:
+    """Round like the builtin ``round(x, 4)`` used by `TrendScoreResult`.
+
+    ``np.round`` scales by 10**4 and can differ from the builtin in the
+    last digit, which would change threshold decisions in backtests. That
+    only happens when the scaled value sits next to a .5 tie, so those
+    elements go through the builtin and the rest are rounded in bulk.
+    """
+    scaled = values * 1e4
+    rounded = np.rint(scaled) / 1e4
+    with np.errstate(invalid="ignore"):
+        fraction = np.abs(scaled - np.trunc(scaled))
+        near_tie = np.abs(fraction - 0.5) <= 1e-12 * np.maximum(1.0, np.abs(scaled))
+    if near_tie.any():
+        rounded[near_tie] = [round(v, 4) for v in values[near_tie].tolist()]
+    return rounded
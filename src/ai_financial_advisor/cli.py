@@ -2,20 +2,35 @@
 
 Usage:
     ai-advisor news run --lang en
+    ai-advisor news search "rate cut" --since 2025-01-01
     ai-advisor stock score AAPL
     ai-advisor stock scan "AAPL,MSFT,NVDA"
-    ai-advisor stock scan --market cn
+    ai-advisor stock scan --market cn --workers 4
+    ai-advisor stock scan --market us --output parquet
     ai-advisor stock alerts "AAPL,MSFT,NVDA"
     ai-advisor analyze --report data/reports/NR_2025-07-11.md
+    ai-advisor web build
     ai-advisor web launch
     ai-advisor config show
 """
 
 import logging
 from datetime import date, timedelta
+from typing import TYPE_CHECKING, cast
 
 import typer
 
+from .executor import PoolMode
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .config import Settings
+    from .data.storage.parquet_store import ParquetStore
+    from .data.storage.score_store import ScoreRecord
+    from .data.storage.sqlite_store import SQLiteStore
+    from .strategies.execution import ExecutionModel
+
 app = typer.Typer(
     name="ai-advisor",
     help="AI Financial Advisor — data-driven investment insights.",
@@ -48,6 +63,100 @@ def _setup_logging(level: str = "INFO") -> None:
     )
 
 
+def _check_pool_mode(mode: str) -> PoolMode:
+    if mode not in ("thread", "process"):
+        typer.echo(f"Unknown mode: {mode}. Options: thread, process", err=True)
+        raise typer.Exit(code=1)
+    return cast(PoolMode, mode)
+
+
+def _market_watchlist(market: str) -> list[str]:
+    """Preset watchlist for one market, or several joined by commas."""
+    from .data.market_types import MarketType, get_watchlist
+
+    symbol_list: list[str] = []
+    for name in market.split(","):
+        try:
+            market_type = MarketType(name.strip().lower())
+        except ValueError:
+            typer.echo(
+                f"Unknown market: {name}. Options: {', '.join(m.value for m in MarketType if m != MarketType.UNKNOWN)}",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        watchlist = get_watchlist(market_type)
+        if not watchlist:
+            typer.echo(f"No watchlist for market: {name}", err=True)
+            raise typer.Exit(code=1)
+        symbol_list.extend(watchlist)
+    return list(dict.fromkeys(symbol_list))
+
+
+def _execution_model(
+    commission: str, min_commission: float, slippage: float, spread: float, next_open: bool
+) -> "ExecutionModel":
+    """Build the backtest execution model from the shared cost options."""
+    from .strategies.execution import ExecutionModel, parse_commission
+
+    try:
+        return ExecutionModel(
+            commission_tiers=parse_commission(commission),
+            min_commission=min_commission,
+            slippage_bps=slippage,
+            spread_fraction=spread,
+            fill="next_open" if next_open else "close",
+        )
+    except ValueError as exc:
+        typer.echo(f"Invalid execution costs: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+
+def _check_output(output: str) -> "ParquetStore | None":
+    """Validate --output; for parquet, open the results store up front so a missing pyarrow fails fast."""
+    if output == "table":
+        return None
+    if output != "parquet":
+        typer.echo(f"Unknown output: {output}. Options: table, parquet", err=True)
+        raise typer.Exit(code=1)
+    from .config import get_settings
+    from .data.storage.parquet_store import ParquetStore
+
+    try:
+        return ParquetStore(get_settings().storage.results_dir)
+    except ImportError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+
+
+def _write_results(store: "ParquetStore", tables: "dict[str, pd.DataFrame]") -> None:
+    """Write result tables to the Parquet store, partitioned by today's date and market."""
+    for name, df in tables.items():
+        path = store.write(name, df)
+        typer.echo(f"Wrote {len(df)} {name} rows to {path}")
+
+
+def _record_scores(records: "list[ScoreRecord]") -> None:
+    """Record a scan's scores in the score store."""
+    from .config import get_settings
+    from .data.storage.score_store import ScoreStore
+
+    store = ScoreStore(get_settings().storage.scores_path)
+    try:
+        store.record_run(records)
+    finally:
+        store.close()
+
+
+def _article_store(settings: "Settings") -> "SQLiteStore | None":
+    """The configured article store, or None for backends without a local store."""
+    from .config import StorageBackend
+    from .data.storage.sqlite_store import SQLiteStore
+
+    if settings.storage.backend != StorageBackend.SQLITE:
+        return None
+    return SQLiteStore(settings.storage.sqlite_path)
+
+
 @news_app.command("run")
 def news_run(
     lang: str = typer.Option("en", "--lang", "-l", help="Report language: 'en' or 'cn'."),
@@ -62,9 +171,16 @@ def news_run(
 
     dt = date.fromisoformat(target_date) if target_date else date.today() - timedelta(days=1)
 
-    agent = NewsAgent(settings)
-    result = agent.run(language=lang, target_date=dt)
+    store = _article_store(settings)
+    try:
+        agent = NewsAgent(settings, store=store)
+        result = agent.run(language=lang, target_date=dt)
+    finally:
+        if store is not None:
+            store.close()
 
+    for usage in agent.token_usage:
+        typer.echo(f"Tokens ({usage.stage}): {usage.summary()}")
     if result:
         typer.echo(f"Report saved to: {result}")
     else:
@@ -72,6 +188,43 @@ def news_run(
         raise typer.Exit(code=1)
 
 
+@news_app.command("search")
+def news_search(
+    query: str = typer.Argument(..., help="Words to search for in articles and reports."),
+    since: str | None = typer.Option(None, "--since", help="Only results published on or after (YYYY-MM-DD)."),
+    source: str | None = typer.Option(None, "--source", help="Only articles from this source, or 'report'."),
+    limit: int = typer.Option(20, "--limit", "-n", help="Maximum number of results."),
+) -> None:
+    """Full-text search over stored articles and news reports."""
+    from .config import get_settings
+    from .data.storage.sqlite_store import SQLiteStore
+
+    settings = get_settings()
+    _setup_logging("WARNING")
+    try:
+        since_date = date.fromisoformat(since) if since else None
+    except ValueError as exc:
+        typer.echo(f"Invalid --since date: {since} (expected YYYY-MM-DD)", err=True)
+        raise typer.Exit(code=1) from exc
+
+    store = SQLiteStore(settings.storage.sqlite_path)
+    try:
+        store.index_reports(settings.storage.reports_dir)
+        hits = store.search(query, since=since_date, source=source, limit=limit)
+    finally:
+        store.close()
+
+    if not hits:
+        typer.echo(f"No results for: {query}")
+        return
+    for hit in hits:
+        published = (hit.published or "")[:10]
+        typer.echo(f"\n{published:<10}  [{hit.source}] {hit.title}")
+        typer.echo(f"            {hit.location}")
+        typer.echo(f"            {' '.join(hit.snippet.split())}")
+    typer.echo(f"\n{len(hits)} results.\n")
+
+
 @stock_app.command("score")
 def stock_score(
     symbol: str = typer.Argument(..., help="Stock ticker symbol (e.g., AAPL)."),
@@ -110,28 +263,21 @@ def stock_scan(
         "-m",
         help="Use preset watchlist: us, cn, hk, eu, jp, crypto, forex, commodity.",
     ),
+    workers: int = typer.Option(1, "--workers", "-w", help="Concurrent workers (capped by available memory)."),
+    mode: str = typer.Option("thread", "--mode", help="Pool for indicator math: 'thread' or 'process'."),
+    output: str = typer.Option("table", "--output", "-o", help="Output: 'table' or 'parquet' (STORAGE_RESULTS_DIR)."),
+    record: bool = typer.Option(True, "--record/--no-record", help="Record the scores (STORAGE_SCORES_PATH)."),
 ) -> None:
     """Scan multiple stocks and rank by trend score."""
-    from .agents.stock_agent import StockAgent
-    from .data.market_types import MarketType, get_watchlist
+    from .agents.stock_agent import StockAgent, scan_tables, score_records
 
     _setup_logging("WARNING")
+    pool_mode = _check_pool_mode(mode)
+    store = _check_output(output)
 
     if market:
-        try:
-            market_type = MarketType(market.lower())
-        except ValueError:
-            typer.echo(
-                f"Unknown market: {market}. "
-                f"Options: {', '.join(m.value for m in MarketType if m != MarketType.UNKNOWN)}",
-                err=True,
-            )
-            raise typer.Exit(code=1)
-        symbol_list = get_watchlist(market_type)
-        if not symbol_list:
-            typer.echo(f"No watchlist for market: {market}", err=True)
-            raise typer.Exit(code=1)
-        typer.echo(f"Scanning {market_type.value.upper()} market ({len(symbol_list)} symbols)...\n")
+        symbol_list = _market_watchlist(market)
+        typer.echo(f"Scanning {market.upper()} market ({len(symbol_list)} symbols)...\n")
     elif symbols:
         symbol_list = [s.strip() for s in symbols.split(",")]
     else:
@@ -149,11 +295,20 @@ def stock_scan(
         ]
 
     agent = StockAgent()
-    results = agent.analyze_multiple(symbol_list, period=period)
+    results = agent.analyze_multiple(symbol_list, period=period, max_workers=workers, mode=pool_mode)
+    for symbol, error in agent.last_errors.items():
+        typer.echo(f"Warning: {symbol} failed: {error}", err=True)
+
+    if record and results:
+        _record_scores(score_records(results))
 
     # Sort by score descending
     results.sort(key=lambda r: r.trend.score, reverse=True)
 
+    if store is not None:
+        _write_results(store, scan_tables(results))
+        return
+
     typer.echo(f"\n{'Symbol':<12} {'Currency':>8} {'Close':>12} {'Score':>8} {'Signal':<10}")
     typer.echo("-" * 54)
     for r in results:
@@ -169,32 +324,35 @@ def stock_alerts(
     symbols: str = typer.Argument(..., help="Comma-separated list of ticker symbols."),
     days: int = typer.Option(5, "--days", "-d", help="Look back N days for recent anomalies."),
     threshold: float = typer.Option(2.5, "--threshold", "-t", help="Z-score threshold for anomaly detection."),
+    output: str = typer.Option("table", "--output", "-o", help="Output: 'table' or 'parquet' (STORAGE_RESULTS_DIR)."),
 ) -> None:
     """Detect price and volume anomalies for given symbols."""
-    from .analysis.anomaly import AnomalyDetector
-    from .data.stock_data import download_stock_data
+    from .analysis.anomaly import AnomalyDetector, anomaly_frame
+    from .analysis.panel import to_panel
+    from .data.stock_data import download_many
 
     _setup_logging("WARNING")
+    store = _check_output(output)
 
     detector = AnomalyDetector(z_threshold=threshold)
     symbol_list = [s.strip() for s in symbols.split(",")]
-
-    all_anomalies = []
+    frames = download_many(symbol_list, period="6mo")
     for symbol in symbol_list:
-        try:
-            df = download_stock_data(symbol, period="6mo")
-            anomalies = detector.get_recent_anomalies(df, symbol, days=days)
-            all_anomalies.extend(anomalies)
-        except Exception as exc:
-            typer.echo(f"Warning: Failed to check {symbol}: {exc}", err=True)
+        if symbol not in frames:
+            typer.echo(f"Warning: No data for {symbol}", err=True)
+
+    # The whole watchlist is scanned as one panel, newest anomalies first
+    all_anomalies = detector.get_recent_anomalies_panel(to_panel(frames), days=days) if frames else []
+
+    if store is not None:
+        _write_results(store, {"anomalies": anomaly_frame(all_anomalies)})
+        return
 
     if not all_anomalies:
         typer.echo(f"\nNo anomalies detected in the last {days} days for: {', '.join(symbol_list)}")
         typer.echo()
         return
 
-    all_anomalies.sort(key=lambda a: a.date, reverse=True)
-
     typer.echo(f"\n{'Date':<12} {'Symbol':<10} {'Type':<15} {'Severity':<10} {'Z-Score':>8}")
     typer.echo("-" * 60)
     for a in all_anomalies:
@@ -332,35 +490,79 @@ def analyze(
     typer.echo("  Investment Outlook Report")
     typer.echo(f"{'=' * 50}\n")
     typer.echo(result.report)
+    typer.echo("")
+    for usage in result.token_usage:
+        typer.echo(f"Tokens ({usage.stage}): {usage.summary()}")
 
 
 @backtest_app.command("run")
 def backtest_run(
     symbol: str = typer.Argument(..., help="Stock ticker symbol (e.g., AAPL)."),
     period: str = typer.Option("2y", "--period", "-p", help="Data period (e.g., 2y, 1y, 6mo)."),
+    interval: str = typer.Option(
+        "1d", "--interval", "-i", help="Bar interval: 1m, 5m, 15m, 30m, 1h or 1d (intraday replays bar by bar)."
+    ),
     buy_threshold: float = typer.Option(0.3, "--buy", "-b", help="Buy threshold for trend score."),
     sell_threshold: float = typer.Option(-0.3, "--sell", "-s", help="Sell threshold for trend score."),
     capital: float = typer.Option(100000, "--capital", "-c", help="Initial capital."),
+    commission: str = typer.Option("0", "--commission", help="Commission in bps, or tiers as from:bps,from:bps."),
+    min_commission: float = typer.Option(0.0, "--min-commission", help="Minimum commission per trade."),
+    slippage: float = typer.Option(0.0, "--slippage", help="Slippage per fill in bps."),
+    spread: float = typer.Option(0.0, "--spread", help="Share of the High-Low range paid as bid-ask spread."),
+    next_open: bool = typer.Option(False, "--next-open", help="Fill at the next bar's open instead of the close."),
+    lots: bool = typer.Option(False, "--lots", help="Trade whole board lots of the symbol's market."),
+    bootstrap: int = typer.Option(0, "--bootstrap", help="Bootstrap replicates for confidence intervals (0: off)."),
+    method: str = typer.Option("block", "--method", help="Bootstrap method: block or shuffle."),
+    block_size: int = typer.Option(20, "--block-size", help="Days per bootstrap block."),
+    seed: int | None = typer.Option(None, "--seed", help="Seed for a reproducible bootstrap."),
 ) -> None:
     """Run a backtest on a single symbol using the trend score strategy."""
+    from .data.market_types import INTERVAL_MINUTES, bars_per_year, detect_market_type
     from .data.stock_data import download_stock_data
     from .strategies.backtester import Backtester
-    from .strategies.trend_strategy import TrendScoreStrategy
+    from .strategies.bootstrap import Bootstrapper
+    from .strategies.intraday import IntradayBacktester
+    from .strategies.trend_strategy import MIN_HISTORY, TrendScoreStrategy
 
     _setup_logging("WARNING")
 
-    typer.echo(f"Backtesting {symbol} over {period}...")
-    df = download_stock_data(symbol, period=period)
-
-    strategy = TrendScoreStrategy(buy_threshold=buy_threshold, sell_threshold=sell_threshold)
-    signals = strategy.generate_signals(df)
-
-    if not signals:
-        typer.echo("Not enough data to generate signals.", err=True)
+    if interval not in INTERVAL_MINUTES:
+        typer.echo(f"Unknown interval: {interval}. Options: {', '.join(INTERVAL_MINUTES)}", err=True)
         raise typer.Exit(code=1)
 
-    bt = Backtester(initial_capital=capital)
-    result = bt.run(signals, symbol=symbol, period=period)
+    execution = _execution_model(commission, min_commission, slippage, spread, next_open)
+    if lots:
+        execution = execution.for_symbol(symbol)
+    try:
+        bootstrapper = Bootstrapper(
+            max(bootstrap, 1),
+            method=method,
+            block_size=block_size,
+            seed=seed,
+            periods_per_year=bars_per_year(interval, detect_market_type(symbol)),
+        )
+    except ValueError as exc:
+        typer.echo(f"Invalid bootstrap settings: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"Backtesting {symbol} over {period} ({interval} bars)...")
+    df = download_stock_data(symbol, period=period, interval=interval)
+
+    if interval == "1d":
+        strategy = TrendScoreStrategy(buy_threshold=buy_threshold, sell_threshold=sell_threshold)
+        signals = strategy.generate_signal_frame(df)
+        if signals.empty:
+            typer.echo("Not enough data to generate signals.", err=True)
+            raise typer.Exit(code=1)
+        bt = Backtester(initial_capital=capital, execution=execution)
+        result = bt.run_frame(signals, symbol=symbol, period=period, bars=df)
+    else:
+        if len(df) < MIN_HISTORY:
+            typer.echo("Not enough data to generate signals.", err=True)
+            raise typer.Exit(code=1)
+        intraday = IntradayBacktester(capital, buy_threshold, sell_threshold, interval=interval, execution=execution)
+        result = intraday.run(df, symbol=symbol, period=f"{period}, {interval}")
+    date_width = 10 if interval == "1d" else 16
 
     typer.echo(f"\n{'=' * 45}")
     typer.echo(f"  {result.symbol} Backtest Results ({result.period})")
@@ -373,17 +575,249 @@ def backtest_run(
     typer.echo(f"  Max Drawdown:       {result.max_drawdown:.2f}%")
     typer.echo(f"  Win Rate:           {result.win_rate:.1f}%")
     typer.echo(f"  Total Trades:       {result.total_trades}")
+    typer.echo(f"  Trading Costs:      ${result.total_costs:,.2f}")
     typer.echo(f"{'=' * 45}")
 
     if result.trades:
-        typer.echo(f"\n  {'Buy Date':<12} {'Buy $':>10} {'Sell Date':<12} {'Sell $':>10} {'Return':>8} {'Days':>5}")
-        typer.echo(f"  {'-' * 60}")
+        typer.echo(
+            f"\n  {'Buy Date':<{date_width + 2}} {'Buy $':>10} {'Sell Date':<{date_width + 2}} {'Sell $':>10} "
+            f"{'Return':>8} {'Days':>5}"
+        )
+        typer.echo(f"  {'-' * (date_width * 2 + 40)}")
         for t in result.trades:
             typer.echo(
-                f"  {str(t.buy_date)[:10]:<12} {t.buy_price:>10.2f} "
-                f"{str(t.sell_date)[:10]:<12} {t.sell_price:>10.2f} "
+                f"  {str(t.buy_date)[:date_width]:<{date_width + 2}} {t.buy_price:>10.2f} "
+                f"{str(t.sell_date)[:date_width]:<{date_width + 2}} {t.sell_price:>10.2f} "
                 f"{t.return_pct:>+7.2f}% {t.holding_days:>5}"
             )
+
+    if bootstrap > 0 and len(result.equity_curve) >= 3:
+        report = bootstrapper.run(result)
+        confidence = f"{report.equity.confidence:.0%}"
+        typer.echo(f"\n  Bootstrap ({bootstrap} {method} replicates, {confidence} intervals)")
+        typer.echo(f"  {'Metric':<20} {'Observed':>10} {'Lower':>10} {'Median':>10} {'Upper':>10}")
+        typer.echo(f"  {'-' * 63}")
+        for source, boot in (("", report.equity), ("trades ", report.trades)):
+            if boot is None:
+                continue
+            for name, row in boot.intervals.iterrows():
+                typer.echo(
+                    f"  {source + name:<20} {row['observed']:>10.4f} {row['lower']:>10.4f} "
+                    f"{row['median']:>10.4f} {row['upper']:>10.4f}"
+                )
+        typer.echo(f"  Probability of loss: {report.equity.probability_of_loss:.1%}")
+    typer.echo()
+
+
+@backtest_app.command("sweep")
+def backtest_sweep(
+    symbol: str = typer.Argument(..., help="Stock ticker symbol (e.g., AAPL)."),
+    period: str = typer.Option("2y", "--period", "-p", help="Data period (e.g., 2y, 1y, 6mo)."),
+    buy: str = typer.Option("0.1:0.6:0.05", "--buy", "-b", help="Buy thresholds: start:stop:step or a,b,c."),
+    sell: str = typer.Option("-0.6:-0.1:0.05", "--sell", "-s", help="Sell thresholds: start:stop:step or a,b,c."),
+    capital: float = typer.Option(100000, "--capital", "-c", help="Initial capital."),
+    sort: str = typer.Option("sharpe_ratio", "--sort", help="Metric to rank threshold pairs by (highest first)."),
+    top: int = typer.Option(10, "--top", "-n", help="Number of threshold pairs to show."),
+) -> None:
+    """Backtest a grid of buy/sell thresholds on one symbol."""
+    from .data.stock_data import download_stock_data
+    from .strategies.backtester import METRIC_COLUMNS
+    from .strategies.sweep import sweep_thresholds, threshold_range
+    from .strategies.trend_strategy import score_history
+
+    _setup_logging("WARNING")
+
+    if sort not in METRIC_COLUMNS:
+        typer.echo(f"Unknown metric: {sort}. Options: {', '.join(METRIC_COLUMNS)}", err=True)
+        raise typer.Exit(code=1)
+    try:
+        buy_thresholds, sell_thresholds = threshold_range(buy), threshold_range(sell)
+    except ValueError as exc:
+        typer.echo(f"Invalid threshold grid: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"Sweeping {len(buy_thresholds) * len(sell_thresholds)} threshold pairs on {symbol} over {period}...")
+    history = score_history(download_stock_data(symbol, period=period))
+    if history.empty:
+        typer.echo("Not enough data to generate signals.", err=True)
+        raise typer.Exit(code=1)
+
+    grid = sweep_thresholds(history, buy_thresholds, sell_thresholds, initial_capital=capital)
+    grid = grid.sort_values(sort, ascending=False, kind="stable").head(top)
+
+    typer.echo(
+        f"\n{'Buy':>6} {'Sell':>6} {'Return':>10} {'Annual':>10} "
+        f"{'Sharpe':>8} {'MaxDD':>8} {'WinRate':>8} {'Trades':>7}"
+    )
+    typer.echo("-" * 69)
+    for r in grid.itertuples():
+        typer.echo(
+            f"{r.buy_threshold:>+6.2f} {r.sell_threshold:>+6.2f} {r.total_return:>+9.2f}% "
+            f"{r.annualized_return:>+9.2f}% {r.sharpe_ratio:>8.4f} {r.max_drawdown:>7.2f}% "
+            f"{r.win_rate:>7.1f}% {r.total_trades:>7}"
+        )
+    typer.echo()
+
+
+@backtest_app.command("walkforward")
+def backtest_walkforward(
+    symbol: str = typer.Argument(..., help="Stock ticker symbol (e.g., AAPL)."),
+    period: str = typer.Option("10y", "--period", "-p", help="Data period (e.g., 10y, 5y)."),
+    train: int = typer.Option(504, "--train", help="Trading days in each train window."),
+    test: int = typer.Option(126, "--test", help="Trading days in each test window."),
+    step: int | None = typer.Option(None, "--step", help="Days between folds (default: the test window)."),
+    anchored: bool = typer.Option(False, "--anchored", help="Grow train windows from the start of the history."),
+    objective: str = typer.Option("sharpe_ratio", "--objective", help="Metric maximized on each train window."),
+    weight_step: float = typer.Option(0.25, "--weight-step", help="Spacing of the trend score weight grid."),
+    macd_windows: str = typer.Option("5,10,20", "--macd-windows", help="MACD std windows: start:stop:step or a,b,c."),
+    obv_windows: str = typer.Option("5,10,20", "--obv-windows", help="OBV slope windows: start:stop:step or a,b,c."),
+    buy: str = typer.Option("0.1:0.5:0.1", "--buy", "-b", help="Buy thresholds: start:stop:step or a,b,c."),
+    sell: str = typer.Option("-0.5:-0.1:0.1", "--sell", "-s", help="Sell thresholds: start:stop:step or a,b,c."),
+    capital: float = typer.Option(100000, "--capital", "-c", help="Initial capital of each test window."),
+    workers: int = typer.Option(1, "--workers", "-w", help="Folds run concurrently (capped by available memory)."),
+    mode: str = typer.Option("process", "--mode", help="Pool for folds: 'thread' or 'process'."),
+) -> None:
+    """Walk-forward optimize the trend strategy and report out-of-sample results."""
+    from .data.stock_data import download_stock_data
+    from .strategies.backtester import METRIC_COLUMNS
+    from .strategies.sweep import threshold_range
+    from .strategies.walk_forward import ParameterGrid, WalkForwardOptimizer, weight_grid
+
+    _setup_logging("WARNING")
+    pool_mode = _check_pool_mode(mode)
+
+    if objective not in METRIC_COLUMNS:
+        typer.echo(f"Unknown metric: {objective}. Options: {', '.join(METRIC_COLUMNS)}", err=True)
+        raise typer.Exit(code=1)
+    try:
+        grid = ParameterGrid(
+            weights=weight_grid(weight_step),
+            macd_std_windows=[int(w) for w in threshold_range(macd_windows)],
+            obv_slope_windows=[int(w) for w in threshold_range(obv_windows)],
+            buy_thresholds=threshold_range(buy).tolist(),
+            sell_thresholds=threshold_range(sell).tolist(),
+        )
+        optimizer = WalkForwardOptimizer(
+            grid,
+            train_days=train,
+            test_days=test,
+            step_days=step,
+            anchored=anchored,
+            objective=objective,
+            initial_capital=capital,
+            workers=workers,
+            mode=pool_mode,
+        )
+    except ValueError as exc:
+        typer.echo(f"Invalid parameter grid: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"Walk-forward on {symbol} over {period}: {grid.size} parameter sets per fold...")
+    try:
+        report = optimizer.run(download_stock_data(symbol, period=period), symbol=symbol)
+    except ValueError as exc:
+        typer.echo(f"Cannot run walk-forward: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+    for label, error in report.errors.items():
+        typer.echo(f"Warning: {label} failed: {error}", err=True)
+
+    typer.echo(
+        f"\n{'Fold':>4} {'Test window':<23} {'Weights':<14} {'Windows':>7} {'Buy':>6} {'Sell':>6} "
+        f"{'Train':>8} {'Return':>9} {'Sharpe':>8} {'MaxDD':>8} {'Trades':>6} {'Secs':>6}"
+    )
+    typer.echo("-" * 115)
+    for r in report.folds.itertuples():
+        window = f"{str(r.test_start)[:10]}..{str(r.test_end)[:10]}"
+        weights = f"{r.w_macd:.2f}/{r.w_mfi:.2f}/{r.w_obv:.2f}"
+        typer.echo(
+            f"{r.fold:>4} {window:<23} {weights:<14} {r.macd_std_window:>3}/{r.obv_slope_window:<3} "
+            f"{r.buy_threshold:>+6.2f} {r.sell_threshold:>+6.2f} {r.train_objective:>8.4f} "
+            f"{r.total_return:>+8.2f}% {r.sharpe_ratio:>8.4f} {r.max_drawdown:>7.2f}% "
+            f"{r.total_trades:>6} {r.seconds:>6.2f}"
+        )
+
+    typer.echo(f"\n{'=' * 45}")
+    typer.echo(f"  Out-of-Sample Results: {symbol} ({len(report.folds)} folds)")
+    typer.echo(f"{'=' * 45}")
+    typer.echo(f"  Total Return:       {report.total_return:+.2f}%")
+    typer.echo(f"  Annualized Return:  {report.annualized_return:+.2f}%")
+    typer.echo(f"  Mean Sharpe Ratio:  {report.mean_sharpe:.4f}")
+    typer.echo(f"  Profitable Folds:   {report.profitable_folds}/{len(report.folds)}")
+    typer.echo(f"  Wall-clock:         {report.seconds:.2f}s")
+    typer.echo(f"{'=' * 45}\n")
+
+
+@backtest_app.command("portfolio")
+def backtest_portfolio(
+    symbols: str = typer.Argument(None, help="Comma-separated list of ticker symbols. Ignored if --market is set."),
+    market: str | None = typer.Option(
+        None, "--market", "-m", help="Preset watchlist(s), e.g. 'us' or 'us,crypto,commodity'."
+    ),
+    period: str = typer.Option("2y", "--period", "-p", help="Data period."),
+    buy_threshold: float = typer.Option(0.3, "--buy", "-b", help="Buy threshold."),
+    sell_threshold: float = typer.Option(-0.3, "--sell", "-s", help="Sell threshold."),
+    sizing: str = typer.Option("equal", "--sizing", help="Position sizing: equal, score, or inverse_vol."),
+    max_weight: float = typer.Option(1.0, "--max-weight", help="Cap on any single position's weight."),
+    rebalance: int = typer.Option(1, "--rebalance", "-r", help="Rebalance to target weights every N days."),
+    capital: float = typer.Option(100000, "--capital", "-c", help="Initial capital."),
+) -> None:
+    """Backtest the trend strategy on a watchlist as one portfolio."""
+    from .analysis.panel import to_panel
+    from .data.stock_data import download_many
+    from .strategies.portfolio import SIZING_RULES, PortfolioBacktester
+
+    _setup_logging("WARNING")
+
+    if sizing not in SIZING_RULES:
+        typer.echo(f"Unknown sizing rule: {sizing}. Options: {', '.join(SIZING_RULES)}", err=True)
+        raise typer.Exit(code=1)
+    if market:
+        symbol_list = _market_watchlist(market)
+    elif symbols:
+        symbol_list = [s.strip() for s in symbols.split(",")]
+    else:
+        typer.echo("Pass symbols or --market.", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(f"Backtesting a {len(symbol_list)}-symbol portfolio over {period}...")
+    frames = download_many(symbol_list, period=period)
+    for sym in symbol_list:
+        if sym not in frames:
+            typer.echo(f"Warning: {sym} failed: no data returned", err=True)
+    if not frames:
+        typer.echo("No data to backtest.", err=True)
+        raise typer.Exit(code=1)
+
+    bt = PortfolioBacktester(
+        initial_capital=capital,
+        buy_threshold=buy_threshold,
+        sell_threshold=sell_threshold,
+        sizing=sizing,
+        max_weight=max_weight,
+        rebalance_every=rebalance,
+    )
+    result = bt.run_panel(to_panel(frames))
+
+    typer.echo(f"\n{'=' * 45}")
+    typer.echo(f"  Portfolio Backtest Results ({period}, {sizing})")
+    typer.echo(f"{'=' * 45}")
+    typer.echo(f"  Initial Capital:    ${result.initial_capital:,.2f}")
+    typer.echo(f"  Final Value:        ${result.final_value:,.2f}")
+    typer.echo(f"  Total Return:       {result.total_return:+.2f}%")
+    typer.echo(f"  Annualized Return:  {result.annualized_return:+.2f}%")
+    typer.echo(f"  Sharpe Ratio:       {result.sharpe_ratio:.4f}")
+    typer.echo(f"  Max Drawdown:       {result.max_drawdown:.2f}%")
+    typer.echo(f"  Turnover:           {result.turnover:.2f}x ({result.rebalances} rebalances)")
+    typer.echo(f"{'=' * 45}")
+
+    attribution = result.attribution.sort_values("pnl", ascending=False)
+    typer.echo(f"\n  {'Symbol':<12} {'P&L':>12} {'Contrib':>9} {'AvgWt':>7} {'Days':>6}")
+    typer.echo(f"  {'-' * 50}")
+    for sym, row in attribution.iterrows():
+        typer.echo(
+            f"  {sym:<12} {row['pnl']:>12,.2f} {row['contribution']:>+8.2f}% "
+            f"{row['avg_weight']:>7.2%} {int(row['days_held']):>6}"
+        )
     typer.echo()
 
 
@@ -394,28 +828,56 @@ def backtest_scan(
     buy_threshold: float = typer.Option(0.3, "--buy", "-b", help="Buy threshold."),
     sell_threshold: float = typer.Option(-0.3, "--sell", "-s", help="Sell threshold."),
     capital: float = typer.Option(100000, "--capital", "-c", help="Initial capital."),
+    commission: str = typer.Option("0", "--commission", help="Commission in bps, or tiers as from:bps,from:bps."),
+    min_commission: float = typer.Option(0.0, "--min-commission", help="Minimum commission per trade."),
+    slippage: float = typer.Option(0.0, "--slippage", help="Slippage per fill in bps."),
+    spread: float = typer.Option(0.0, "--spread", help="Share of the High-Low range paid as bid-ask spread."),
+    next_open: bool = typer.Option(False, "--next-open", help="Fill at the next day's open instead of the close."),
+    lots: bool = typer.Option(False, "--lots", help="Trade whole board lots of the symbol's market."),
+    workers: int = typer.Option(1, "--workers", "-w", help="Concurrent workers (capped by available memory)."),
+    mode: str = typer.Option("process", "--mode", help="Pool for backtests with --workers > 1: 'thread' or 'process'."),
+    output: str = typer.Option("table", "--output", "-o", help="Output: 'table' or 'parquet' (STORAGE_RESULTS_DIR)."),
 ) -> None:
     """Backtest multiple symbols and compare results."""
-    from .data.stock_data import download_stock_data
-    from .strategies.backtester import Backtester
+    from .data.stock_data import download_many
+    from .executor import create_pool, gather
+    from .strategies.backtester import Backtester, backtest_symbol, backtest_tables
     from .strategies.trend_strategy import TrendScoreStrategy
 
     _setup_logging("WARNING")
+    pool_mode = _check_pool_mode(mode)
+    store = _check_output(output)
+    execution = _execution_model(commission, min_commission, slippage, spread, next_open)
 
     symbol_list = [s.strip() for s in symbols.split(",")]
     strategy = TrendScoreStrategy(buy_threshold=buy_threshold, sell_threshold=sell_threshold)
-    bt = Backtester(initial_capital=capital)
+    frames = download_many(symbol_list, period=period)
 
-    results = []
     for sym in symbol_list:
-        try:
-            df = download_stock_data(sym, period=period)
-            signals = strategy.generate_signals(df)
-            if signals:
-                result = bt.run(signals, symbol=sym, period=period)
-                results.append(result)
-        except Exception as exc:
-            typer.echo(f"Warning: {sym} failed: {exc}", err=True)
+        if sym not in frames:
+            typer.echo(f"Warning: {sym} failed: no data returned", err=True)
+
+    def backtester(sym: str) -> Backtester:
+        return Backtester(capital, execution.for_symbol(sym) if lots else execution)
+
+    if workers > 1:
+        with create_pool(pool_mode, workers) as pool:
+            futures = {
+                sym: pool.submit(backtest_symbol, df, strategy, backtester(sym), sym, period)
+                for sym, df in frames.items()
+            }
+            outcomes, errors = gather(futures)
+    else:
+        outcomes, errors = {}, {}
+        for sym, df in frames.items():
+            try:
+                outcomes[sym] = backtest_symbol(df, strategy, backtester(sym), sym, period)
+            except Exception as exc:
+                errors[sym] = str(exc) or type(exc).__name__
+
+    for sym, error in errors.items():
+        typer.echo(f"Warning: {sym} failed: {error}", err=True)
+    results = [r for r in outcomes.values() if r is not None]
 
     if not results:
         typer.echo("No backtest results generated.", err=True)
@@ -423,14 +885,20 @@ def backtest_scan(
 
     results.sort(key=lambda r: r.total_return, reverse=True)
 
+    if store is not None:
+        _write_results(store, backtest_tables(results))
+        return
+
     typer.echo(
-        f"\n{'Symbol':<10} {'Return':>10} {'Annual':>10} {'Sharpe':>8} {'MaxDD':>8} {'WinRate':>8} {'Trades':>7}"
+        f"\n{'Symbol':<10} {'Return':>10} {'Annual':>10} {'Sharpe':>8} {'MaxDD':>8} {'WinRate':>8} {'Trades':>7} "
+        f"{'Costs':>12}"
     )
-    typer.echo("-" * 65)
+    typer.echo("-" * 78)
     for r in results:
         typer.echo(
             f"{r.symbol:<10} {r.total_return:>+9.2f}% {r.annualized_return:>+9.2f}% "
-            f"{r.sharpe_ratio:>8.4f} {r.max_drawdown:>7.2f}% {r.win_rate:>7.1f}% {r.total_trades:>7}"
+            f"{r.sharpe_ratio:>8.4f} {r.max_drawdown:>7.2f}% {r.win_rate:>7.1f}% {r.total_trades:>7} "
+            f"{r.total_costs:>12,.2f}"
         )
     typer.echo()
 
@@ -479,8 +947,13 @@ def notify_digest(
         help="Comma-separated stock symbols.",
     ),
     period: str = typer.Option("6mo", "--period", "-p", help="Data period."),
+    max_age: float = typer.Option(
+        12.0, "--max-age", help="Reuse scores recorded within this many hours; 0 re-analyzes everything."
+    ),
 ) -> None:
     """Send a daily market digest via Telegram."""
+    from .config import get_settings
+    from .data.storage.score_store import ScoreStore
     from .notifications.alert_manager import AlertManager
 
     _setup_logging("WARNING")
@@ -488,7 +961,11 @@ def notify_digest(
     manager = AlertManager(notifier)
 
     symbol_list = [s.strip() for s in symbols.split(",")]
-    ok = manager.send_digest(symbol_list, period=period)
+    scores = ScoreStore(get_settings().storage.scores_path)
+    try:
+        ok = manager.send_digest(symbol_list, period=period, scores=scores, max_age=timedelta(hours=max_age))
+    finally:
+        scores.close()
 
     if ok:
         typer.echo(f"Digest sent for {len(symbol_list)} symbols.")
@@ -519,6 +996,24 @@ def notify_alerts(
         typer.echo("No anomalies detected. No alerts sent.")
 
 
+@web_app.command("build")
+def web_build(
+    output_dir: str = typer.Option("docs/site", "--output-dir", "-o", help="Directory for the generated site."),
+) -> None:
+    """Build the static site from saved reports and the latest recorded scan scores."""
+    from .config import get_settings
+    from .web.site_builder import generate_site, market_data_from_scores
+
+    settings = get_settings()
+    _setup_logging(settings.log_level)
+
+    market_data = market_data_from_scores(settings.storage.scores_path)
+    if not market_data:
+        typer.echo("No recorded scores; run `ai-advisor stock scan` first for market pages.", err=True)
+    path = generate_site(settings.storage.reports_dir, output_dir, market_data=market_data)
+    typer.echo(f"Site built in {path} with {len(market_data)} markets.")
+
+
 @web_app.command("launch")
 def web_launch(
     share: bool = typer.Option(False, "--share", help="Create a public Gradio share link."),
@@ -22,6 +22,16 @@ class StorageBackend(StrEnum):
     GCS = "gcs"
 
 
+class BarCacheFormat(StrEnum):
+    SQLITE = "sqlite"
+    COLUMNAR = "columnar"
+
+
+class ExtractorEngine(StrEnum):
+    READABILITY = "readability"
+    NEWSPAPER = "newspaper"
+
+
 class LLMSettings(BaseSettings):
     """LLM provider configuration.
 
@@ -37,6 +47,9 @@ class LLMSettings(BaseSettings):
     base_url: str | None = None
     temperature: float = 0.5
     max_tokens: int = 8192
+    report_prompt_tokens: int = 32000  # budget of the news report prompt (instructions and news material)
+    snippet_tokens: int = 400  # most article text per story in the news report prompt
+    sentiment_prompt_tokens: int = 4000  # budget of the sentiment extraction prompt
 
 
 class NewsAPISettings(BaseSettings):
@@ -55,6 +68,20 @@ class NewsAPISettings(BaseSettings):
     page_size: int = 100
 
 
+class ScraperSettings(BaseSettings):
+    """Full-text article scraper configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="SCRAPER_", env_file=".env", extra="ignore")
+
+    workers: int = 8  # concurrent downloads
+    per_host_delay: float = 1.0  # seconds between requests to the same host
+    timeout: float = 15.0  # seconds per download
+    revalidate_hours: float = 24.0  # recheck scraped pages (ETag / Last-Modified) after this long
+    retry_hours: float = 1.0  # first retry of a failed page; doubles with each further failure
+    extractor: ExtractorEngine = ExtractorEngine.READABILITY
+    fallback_extractor: ExtractorEngine | None = None  # tried when the extractor finds too little text
+
+
 class StorageSettings(BaseSettings):
     """Data storage configuration."""
 
@@ -64,6 +91,12 @@ class StorageSettings(BaseSettings):
     sqlite_path: Path = Path("data/news.db")
     gcs_bucket: str = ""
     reports_dir: Path = Path("data/reports")
+    bar_cache_enabled: bool = True
+    bar_cache_path: Path = Path("data/bars.db")
+    bar_cache_format: BarCacheFormat = BarCacheFormat.SQLITE
+    bar_cache_dir: Path = Path("data/bars")  # root of the columnar format
+    scores_path: Path = Path("data/scores.db")  # trend scores of every recorded scan
+    results_dir: Path = Path("data/results")  # Parquet datasets written by --output parquet
 
 
 class FREDSettings(BaseSettings):
@@ -97,6 +130,7 @@ class Settings(BaseSettings):
 
     llm: LLMSettings = Field(default_factory=LLMSettings)
     news_api: NewsAPISettings = Field(default_factory=NewsAPISettings)
+    scraper: ScraperSettings = Field(default_factory=ScraperSettings)
     storage: StorageSettings = Field(default_factory=StorageSettings)
     fred: FREDSettings = Field(default_factory=FREDSettings)
     notify: NotificationSettings = Field(default_factory=NotificationSettings)
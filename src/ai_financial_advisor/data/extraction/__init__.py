@@ -0,0 +1,7 @@
+"""Article body extraction engines with a common interface."""
+
+from .base import ContentExtractor, ExtractedContent
+from .factory import get_extractor
+from .readability import ReadabilityExtractor
+
+__all__ = ["ContentExtractor", "ExtractedContent", "ReadabilityExtractor", "get_extractor"]
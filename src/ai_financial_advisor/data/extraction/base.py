@@ -0,0 +1,59 @@
+"""Abstract base class for article extraction engines."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ExtractedContent:
+    """Main text and metadata extracted from one article page."""
+
+    text: str  # body paragraphs separated by blank lines
+    authors: list[str] = field(default_factory=list)
+    title: str | None = None
+
+
+class ContentExtractor(ABC):
+    """Abstract interface for pulling the article body out of an HTML page.
+
+    Implementations must be safe to call from several threads at once;
+    the scraper runs extraction on a thread pool.
+    """
+
+    @abstractmethod
+    def extract(self, html: str, url: str) -> ExtractedContent:
+        """Extract the article text from a downloaded page.
+
+        Args:
+            html: The page's HTML.
+            url: The page's URL (for resolving relative links and logging).
+
+        Returns:
+            The extracted content; `text` is empty when no body is found.
+        """
+
+
+class FallbackExtractor(ContentExtractor):
+    """Uses a second engine when the first finds too little text.
+
+    Args:
+        primary: Engine tried first.
+        fallback: Engine tried when the primary's text is shorter than
+            `min_length` characters (or it raises).
+        min_length: Shortest text accepted from the primary engine.
+    """
+
+    def __init__(self, primary: ContentExtractor, fallback: ContentExtractor, min_length: int = 100) -> None:
+        self._primary = primary
+        self._fallback = fallback
+        self._min_length = min_length
+
+    def extract(self, html: str, url: str) -> ExtractedContent:
+        try:
+            content = self._primary.extract(html, url)
+        except Exception:
+            return self._fallback.extract(html, url)
+        if len(content.text) >= self._min_length:
+            return content
+        fallback = self._fallback.extract(html, url)
+        return fallback if len(fallback.text) > len(content.text) else content
@@ -0,0 +1,36 @@
+"""Factory for creating extraction engines from configuration."""
+
+from ...config import ExtractorEngine, ScraperSettings
+from .base import ContentExtractor, FallbackExtractor
+from .readability import ReadabilityExtractor
+
+
+def get_extractor(settings: ScraperSettings) -> ContentExtractor:
+    """Create the configured extraction engine, with its fallback if one is set.
+
+    Args:
+        settings: Scraper configuration from the application settings.
+
+    Returns:
+        A ContentExtractor ready for use.
+
+    Raises:
+        ValueError: If an engine is not recognized.
+        ImportError: If a configured engine's dependency is not installed.
+    """
+    extractor = _engine(settings.extractor)
+    if settings.fallback_extractor is None or settings.fallback_extractor == settings.extractor:
+        return extractor
+    return FallbackExtractor(extractor, _engine(settings.fallback_extractor))
+
+
+def _engine(engine: ExtractorEngine) -> ContentExtractor:
+    if engine == ExtractorEngine.READABILITY:
+        return ReadabilityExtractor()
+
+    if engine == ExtractorEngine.NEWSPAPER:
+        from .newspaper_extractor import NewspaperExtractor
+
+        return NewspaperExtractor()
+
+    raise ValueError(f"Unknown extraction engine: {engine}")
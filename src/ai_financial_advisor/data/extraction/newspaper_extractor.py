@@ -0,0 +1,31 @@
+"""newspaper3k extraction engine.
+
+Requires the optional ``newspaper3k`` dependency
+(``pip install 'ai-financial-advisor[newspaper]'``), which is imported on
+first use: it takes a noticeable fraction of a second to import.
+"""
+
+from .base import ContentExtractor, ExtractedContent
+
+
+class NewspaperExtractor(ContentExtractor):
+    """Extracts article text with newspaper3k's parser.
+
+    Raises:
+        ImportError: If newspaper3k is not installed.
+    """
+
+    def __init__(self) -> None:
+        try:
+            from newspaper import Article
+        except ImportError as exc:
+            raise ImportError(
+                "The newspaper extractor requires newspaper3k: pip install 'ai-financial-advisor[newspaper]'"
+            ) from exc
+        self._article_cls = Article
+
+    def extract(self, html: str, url: str) -> ExtractedContent:
+        article = self._article_cls(url)
+        article.download(input_html=html)
+        article.parse()
+        return ExtractedContent(text=article.text, authors=list(article.authors), title=article.title or None)
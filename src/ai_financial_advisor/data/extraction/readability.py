@@ -0,0 +1,260 @@
+"""Fast article extraction with lxml, after Arc90's Readability.
+
+Boilerplate (scripts, navigation, sidebars, comments, share bars, and
+forms without prose such as search and sign-up boxes) is dropped first;
+forms holding prose stay, since some sites (ASP.NET WebForms) wrap the
+whole page in one. Every block holding at least a sentence of text then adds
+a score — one point, plus one per comma and per 100 characters (up to
+three) — to its parent and half of it to its grandparent. The container
+with the best score, discounted by the share of its text inside links, is
+the article; sibling blocks that score nearly as well (bodies split over
+several ``div``s) are kept with it. Its text is read block by block, one
+paragraph per block, skipping link lists.
+"""
+
+import re
+
+import lxml.html
+from lxml import etree
+
+from .base import ContentExtractor, ExtractedContent
+
+# Removed with their content before scoring
+_JUNK_TAGS = (
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "iframe",
+    "svg",
+    "button",
+    "select",
+    "textarea",
+    "figcaption",
+    "h1",
+)
+# Elements whose text forms its own paragraph
+_BLOCK_TAGS = frozenset(
+    {"p", "div", "section", "article", "main", "pre", "blockquote", "li", "ul", "ol", "table", "tr", "td", "dl", "dd"}
+    | {"h2", "h3", "h4", "h5", "h6"}
+)
+# Blocks whose own text is scored
+_TEXT_TAGS = ("p", "pre", "td", "blockquote", "div", "section")
+
+_UNLIKELY = re.compile(
+    r"comment|disqus|sidebar|share|social|related|recommend|promo|sponsor|advert|\bads?\b|cookie|consent|"
+    r"newsletter|subscribe|popup|modal|menu|breadcrumb|pagination|outbrain|taboola|widget|masthead|toolbar",
+    re.I,
+)
+_MAYBE = re.compile(r"article|body|content|main|story|column", re.I)
+_POSITIVE = re.compile(r"article|body|content|entry|main|post|story|text|blog", re.I)
+_NEGATIVE = re.compile(r"comment|footer|footnote|meta|sidebar|share|social|related|promo|sponsor|advert|caption", re.I)
+_BYLINE = re.compile(r"byline|author", re.I)
+_BY_PREFIX = re.compile(r"^\s*(?:posted\s+|written\s+)?(?:by|from)\s+", re.I)
+_AUTHOR_SPLIT = re.compile(r"\s*(?:,|\band\b|&)\s*", re.I)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+_MIN_BLOCK_LENGTH = 25  # characters for a block to count as prose
+_MIN_FORM_TEXT = 200  # characters outside links for a form to be kept
+_META_AUTHOR_XPATH = (
+    "//meta[@name='author' or @name='byl' or @name='article:author' or @name='sailthru.author' "
+    "or @property='article:author' or @property='author']/@content"
+)
+
+
+class ReadabilityExtractor(ContentExtractor):
+    """Extracts the article body from a page's DOM with content scoring."""
+
+    def extract(self, html: str, url: str) -> ExtractedContent:
+        root = _parse_html(html)
+        if root is None:
+            return ExtractedContent(text="")
+        title = _title(root)
+        authors = _authors(root)
+        _clean(root)
+        body = root.find("body")
+        if body is None:
+            body = root
+        blocks = _article_blocks(body) or [body]
+        text = "\n\n".join(paragraph for block in blocks for paragraph in _paragraphs(block))
+        return ExtractedContent(text=text, authors=authors, title=title)
+
+
+def _parse_html(html: str) -> etree._Element | None:
+    if not html.strip():
+        return None
+    try:
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # Strings that declare their own encoding must be parsed as bytes
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def _title(root: etree._Element) -> str | None:
+    for value in root.xpath("//meta[@property='og:title']/@content | //title/text() | //h1//text()"):
+        if value.strip():
+            return " ".join(value.split())
+    return None
+
+
+def _authors(root: etree._Element) -> list[str]:
+    """Author names from meta tags, rel/itemprop=author and short byline elements."""
+    names = [value for value in root.xpath(_META_AUTHOR_XPATH) if not value.startswith("http")]
+    if not names:
+        for el in root.xpath("//*[@rel='author' or @itemprop='author']"):
+            name = el.xpath("string(.//*[@itemprop='name'])") or el.text_content()
+            names.append(name)
+    if not names:
+        for el in root.iter("span", "div", "p", "a", "address"):
+            if _BYLINE.search(_class_and_id(el)):
+                text = " ".join(el.text_content().split())
+                if 0 < len(text) <= 60:
+                    names.append(text)
+                    break
+
+    authors: list[str] = []
+    for name in names:
+        for part in _AUTHOR_SPLIT.split(_BY_PREFIX.sub("", " ".join(name.split()))):
+            if part and part not in authors and len(part.split()) <= 5:
+                authors.append(part)
+    return authors
+
+
+def _clean(root: etree._Element) -> None:
+    """Drop boilerplate and hidden elements, and turn <br> into line breaks."""
+    etree.strip_elements(root, etree.Comment, *_JUNK_TAGS, with_tail=False)
+    doomed = [form for form in root.iter("form") if not _holds_prose(form)]
+    for el in root.iter():
+        if not isinstance(el.tag, str) or el.tag in ("html", "body", "article", "main"):
+            continue
+        if el.get("hidden") is not None or el.get("aria-hidden") == "true":
+            doomed.append(el)
+            continue
+        style = el.get("style")
+        if style and "display:none" in style.replace(" ", ""):
+            doomed.append(el)
+            continue
+        attrs = _class_and_id(el)
+        if attrs and _UNLIKELY.search(attrs) and not _MAYBE.search(attrs):
+            doomed.append(el)
+    for el in doomed:
+        el.drop_tree()
+    for br in root.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+
+
+def _article_blocks(body: etree._Element) -> list[etree._Element]:
+    """The best-scoring container and the sibling blocks that belong with it."""
+    scores: dict[etree._Element, float] = {}
+    for node in body.iter(*_TEXT_TAGS):
+        if node.tag in ("div", "section") and any(child.tag in _BLOCK_TAGS for child in node):
+            continue  # a container, not a paragraph
+        text = node.text_content()
+        length = len(text.strip())
+        if length < _MIN_BLOCK_LENGTH:
+            continue
+        score = 1 + text.count(",") + min(length // 100, 3)
+        parent = node.getparent()
+        if parent is None:
+            continue
+        for ancestor, share in ((parent, 1.0), (parent.getparent(), 0.5)):
+            if ancestor is None or not isinstance(ancestor.tag, str):
+                break
+            if ancestor not in scores:
+                scores[ancestor] = _initial_score(ancestor)
+            scores[ancestor] += score * share
+
+    if not scores:
+        return []
+    final = {el: score * (1 - _link_density(el)) for el, score in scores.items()}
+    top = max(final, key=lambda el: final[el])
+    parent = top.getparent()
+    if parent is None:
+        return [top]
+    threshold = max(10.0, final[top] * 0.2)
+    blocks = []
+    for sibling in parent:
+        if sibling is top or final.get(sibling, 0.0) >= threshold:
+            blocks.append(sibling)
+        elif sibling.tag == "p" and len(sibling.text_content()) > 80 and _link_density(sibling) < 0.25:
+            blocks.append(sibling)
+    return blocks
+
+
+def _paragraphs(root: etree._Element) -> list[str]:
+    """The text of `root`, one entry per block, without link lists."""
+    has_blocks = set()
+    for el in root.iter(*_BLOCK_TAGS):
+        for ancestor in el.iterancestors():
+            if ancestor in has_blocks:
+                break
+            has_blocks.add(ancestor)
+
+    out: list[str] = []
+
+    def emit(text: str) -> None:
+        for chunk in _PARAGRAPH_BREAK.split(text):
+            chunk = " ".join(chunk.split())
+            if chunk:
+                out.append(chunk)
+
+    def walk(el: etree._Element) -> None:
+        loose = [el.text or ""]
+        for child in el:
+            if not isinstance(child.tag, str):
+                loose.append(child.tail or "")
+            elif child.tag in _BLOCK_TAGS or child in has_blocks:
+                emit("".join(loose))
+                if child in has_blocks:
+                    walk(child)
+                elif _link_density(child) <= 0.5:
+                    emit(child.text_content())
+                loose = [child.tail or ""]
+            else:
+                loose.append(child.text_content() + (child.tail or ""))
+        emit("".join(loose))
+
+    if root in has_blocks:
+        walk(root)
+    else:
+        emit(root.text_content())
+    return out
+
+
+def _holds_prose(form: etree._Element) -> bool:
+    """Whether a form holds more than a box's worth of text, mostly outside links."""
+    length = len(" ".join(form.text_content().split()))
+    return length >= _MIN_FORM_TEXT and _link_density(form) <= 0.5
+
+
+def _link_density(el: etree._Element) -> float:
+    length = len(el.text_content())
+    if not length:
+        return 0.0
+    return sum(len(a.text_content()) for a in el.iter("a")) / length
+
+
+def _initial_score(el: etree._Element) -> float:
+    score = {"article": 10.0, "main": 5.0, "div": 5.0, "section": 3.0, "pre": 3.0, "td": 3.0, "blockquote": 3.0}.get(
+        el.tag, 0.0
+    )
+    if el.tag in ("ol", "ul", "dl", "form", "li"):
+        score -= 3
+    attrs = _class_and_id(el)
+    if attrs:
+        if _POSITIVE.search(attrs):
+            score += 25
+        if _NEGATIVE.search(attrs):
+            score -= 25
+    return score
+
+
+def _class_and_id(el: etree._Element) -> str:
+    return f"{el.get('class', '')} {el.get('id', '')}".strip()
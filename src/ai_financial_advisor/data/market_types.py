@@ -1,6 +1,9 @@
 """Market type detection and preset watchlists for global markets."""
 
+import math
+from datetime import datetime, time, timedelta
 from enum import StrEnum
+from zoneinfo import ZoneInfo
 
 
 class MarketType(StrEnum):
@@ -129,6 +132,80 @@ MARKET_CURRENCIES: dict[MarketType, str] = {
 # Markets where Volume data is not available (skip OBV/MFI)
 VOLUME_UNAVAILABLE_MARKETS = {MarketType.FOREX}
 
+# Daily session close per market: (IANA timezone, local close time).
+# A new daily bar is only complete once this time has passed.
+MARKET_SESSIONS: dict[MarketType, tuple[str, time]] = {
+    MarketType.US: ("America/New_York", time(16, 0)),
+    MarketType.CN: ("Asia/Shanghai", time(15, 0)),
+    MarketType.HK: ("Asia/Hong_Kong", time(16, 10)),  # after closing auction
+    MarketType.EU: ("Europe/Paris", time(17, 35)),  # Xetra/Euronext/LSE close together
+    MarketType.JP: ("Asia/Tokyo", time(15, 30)),
+    MarketType.CRYPTO: ("UTC", time(0, 0)),  # daily candles roll at UTC midnight
+    MarketType.FOREX: ("America/New_York", time(17, 0)),  # conventional FX roll
+    MarketType.COMMODITY: ("America/New_York", time(17, 0)),  # CME Globex daily close
+    MarketType.UNKNOWN: ("America/New_York", time(16, 0)),
+}
+
+# Markets that trade seven days a week
+ALWAYS_OPEN_MARKETS = {MarketType.CRYPTO}
+
+# Minimum tradable quantity (board lot) per market; None means fractional
+# quantities are allowed (crypto, FX, and futures/commodities modeled as CFDs).
+LOT_SIZES: dict[MarketType, int | None] = {
+    MarketType.US: 1,
+    MarketType.CN: 100,  # A-share buys must be whole 100-share lots
+    MarketType.HK: 100,  # default; each issuer sets its own lot, see HK_BOARD_LOTS
+    MarketType.EU: 1,
+    MarketType.JP: 100,  # unified trading unit since 2018
+    MarketType.CRYPTO: None,
+    MarketType.FOREX: None,
+    MarketType.COMMODITY: None,
+    MarketType.UNKNOWN: 1,
+}
+
+# Board lots of HK watchlist stocks that differ from the default
+HK_BOARD_LOTS: dict[str, int] = {
+    "0005.HK": 400,
+    "1299.HK": 200,
+    "2318.HK": 500,
+    "0941.HK": 500,
+    "1810.HK": 200,
+    "9618.HK": 50,
+}
+
+# Bar intervals the data layer can load, with their length in minutes
+# (None for daily bars)
+INTERVAL_MINUTES: dict[str, int | None] = {
+    "1m": 1,
+    "5m": 5,
+    "15m": 15,
+    "30m": 30,
+    "1h": 60,
+    "1d": None,
+}
+
+# Trading days per year; daily metrics annualize with 252 everywhere
+TRADING_DAYS_PER_YEAR = 252
+
+# Regular session length in hours, for counting intraday bars per day
+SESSION_HOURS: dict[MarketType, float] = {
+    MarketType.US: 6.5,  # 09:30-16:00
+    MarketType.CN: 4.0,  # 09:30-11:30, 13:00-15:00
+    MarketType.HK: 5.5,  # 09:30-12:00, 13:00-16:00
+    MarketType.EU: 8.5,  # 09:00-17:30 (Xetra, Euronext)
+    MarketType.JP: 5.0,  # 09:00-11:30, 12:30-15:30
+    MarketType.CRYPTO: 24.0,
+    MarketType.FOREX: 24.0,
+    MarketType.COMMODITY: 23.0,  # CME Globex
+    MarketType.UNKNOWN: 6.5,
+}
+
+# Sessions per year for intraday annualization (calendar days for crypto)
+SESSIONS_PER_YEAR: dict[MarketType, int] = {
+    MarketType.CRYPTO: 365,
+    MarketType.FOREX: 260,
+}
+
 
 def detect_market_type(symbol: str) -> MarketType:
     """Detect market type from a ticker symbol.
@@ -202,6 +279,21 @@ def get_currency(symbol: str) -> str:
     return MARKET_CURRENCIES.get(market, "USD")
 
 
+def get_lot_size(symbol: str) -> int | None:
+    """Get the minimum tradable lot for a symbol.
+
+    Args:
+        symbol: Ticker symbol.
+
+    Returns:
+        Lot size in shares, or None if fractional quantities trade.
+    """
+    s = symbol.upper().strip()
+    if s in HK_BOARD_LOTS:
+        return HK_BOARD_LOTS[s]
+    return LOT_SIZES.get(detect_market_type(s), 1)
+
+
 def has_volume(symbol: str) -> bool:
     """Check if volume data is available for a symbol.
 
@@ -214,3 +306,58 @@ def has_volume(symbol: str) -> bool:
         True if volume data is expected to be available.
     """
     return detect_market_type(symbol) not in VOLUME_UNAVAILABLE_MARKETS
+
+
+def last_session_close(market: MarketType, now: datetime) -> datetime:
+    """Get the most recent daily session close at or before `now`.
+
+    Weekends are skipped for exchange-traded markets; exchange holidays
+    are not modeled, so a holiday simply looks like a session with no
+    new bar.
+
+    Args:
+        market: The market type.
+        now: Timezone-aware current time.
+
+    Returns:
+        Timezone-aware datetime of the last session close.
+    """
+    tz_name, close_time = MARKET_SESSIONS.get(market, MARKET_SESSIONS[MarketType.UNKNOWN])
+    tz = ZoneInfo(tz_name)
+    local_now = now.astimezone(tz)
+
+    close = datetime.combine(local_now.date(), close_time, tzinfo=tz)
+    if close > local_now:
+        close -= timedelta(days=1)
+    if market not in ALWAYS_OPEN_MARKETS:
+        while close.weekday() >= 5:
+            close -= timedelta(days=1)
+    return close
+
+
+def bars_per_year(interval: str, market: MarketType = MarketType.US) -> float:
+    """Get the number of bars in a trading year, for annualizing metrics.
+
+    Daily bars use `TRADING_DAYS_PER_YEAR` in every market, matching
+    `Backtester`. Intraday bars count the bars of one regular session
+    (a partial last bar counts as a bar, as providers report it) times
+    the sessions in a year.
+
+    Args:
+        interval: Bar interval (a key of `INTERVAL_MINUTES`).
+        market: The market type.
+
+    Returns:
+        Bars per year.
+
+    Raises:
+        ValueError: If the interval is not supported.
+    """
+    if interval not in INTERVAL_MINUTES:
+        raise ValueError(f"Unsupported interval: {interval}. Options: {', '.join(INTERVAL_MINUTES)}")
+    minutes = INTERVAL_MINUTES[interval]
+    if minutes is None:
+        return float(TRADING_DAYS_PER_YEAR)
+    hours = SESSION_HOURS.get(market, SESSION_HOURS[MarketType.UNKNOWN])
+    sessions = SESSIONS_PER_YEAR.get(market, TRADING_DAYS_PER_YEAR)
+    return float(math.ceil(hours * 60 / minutes) * sessions)
@@ -1,16 +1,53 @@
-"""Stock data downloader — OHLCV data via yfinance."""
+"""Stock data downloader — OHLCV data via yfinance.
+
+Daily bars are served through a local bar cache when it is enabled: the
+first request for a symbol downloads its history, later requests only
+fetch bars newer than the last cached session. The cache is a SQLite
+`BarStore` or, with ``STORAGE_BAR_CACHE_FORMAT=columnar``, a memory-mapped
+`ColumnarBarStore` whose frames are served without parsing or copying.
+
+Intraday bars (see `market_types.INTERVAL_MINUTES`) are always
+downloaded: providers only keep a short rolling window of them (about 7
+days of 1-minute and 60 days of 5-minute bars on Yahoo), and the last bar
+keeps changing until it closes.
+"""
 
 import logging
+import re
+import threading
+from datetime import UTC, date, datetime
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
-from .market_types import has_volume
+from .market_types import INTERVAL_MINUTES, detect_market_type, has_volume, last_session_close
+from .storage.bar_store import BarSeriesInfo, BarStore
+from .storage.columnar_store import ColumnarBarStore
 
 logger = logging.getLogger(__name__)
 
+# Interval served through the bar cache
+_INTERVAL = "1d"
+
+# Either bar cache implementation; they share one interface
+BarCache = BarStore | ColumnarBarStore
+BATCH_SIZE = 25
+_EXPECTED_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+_PERIOD_PATTERN = re.compile(r"^(\d+)(d|wk|mo|y)$")
+
+# Relative tolerance when checking a re-downloaded bar against the cache.
+# A larger difference means the provider re-adjusted history (split/dividend).
+_ADJUSTMENT_RTOL = 1e-4
+
 
-def download_stock_data(symbol: str, period: str = "1y") -> pd.DataFrame:
+def download_stock_data(
+    symbol: str,
+    period: str = "1y",
+    store: BarCache | None = None,
+    interval: str = "1d",
+) -> pd.DataFrame:
     """Download OHLCV data for a stock symbol.
 
     For assets without meaningful volume data (e.g., forex pairs),
@@ -19,20 +56,324 @@ def download_stock_data(symbol: str, period: str = "1y") -> pd.DataFrame:
     Args:
         symbol: Ticker symbol (e.g., 'AAPL', '600519.SS', 'BTC-USD').
         period: Data period (e.g., '1y', '6mo', '3mo', '1mo').
+        store: Bar store to read through. Defaults to the cache configured
+            in settings (``STORAGE_BAR_CACHE_*``); None there disables caching.
+        interval: Bar interval ('1m', '5m', '15m', '30m', '1h' or '1d').
+            Intraday bars bypass the store.
 
     Returns:
         DataFrame with columns: Open, High, Low, Close, Volume.
 
     Raises:
-        ValueError: If no data is returned for the symbol.
+        ValueError: If the interval is unsupported or no data is returned
+            for the symbol.
     """
-    logger.info("Downloading %s data (period=%s)...", symbol, period)
+    _check_interval(interval)
+    store = store if store is not None else get_bar_store()
 
-    df = yf.download(symbol, period=period, interval="1d", progress=False)
+    if store is None or interval != _INTERVAL:
+        logger.info("Downloading %s data (period=%s, interval=%s)...", symbol, period, interval)
+        df = _download(symbol, interval=interval, period=period)
+    else:
+        df = _read_through(store, symbol, period)
 
     if df.empty:
         raise ValueError(f"No data returned for {symbol} (period={period})")
 
+    logger.info("Loaded %d rows for %s.", len(df), symbol)
+    return df
+
+
+def download_many(
+    symbols: list[str],
+    period: str = "1y",
+    store: BarCache | None = None,
+    batch_size: int = BATCH_SIZE,
+    interval: str = "1d",
+) -> dict[str, pd.DataFrame]:
+    """Download OHLCV data for many symbols using multi-ticker requests.
+
+    Symbols are grouped into batches of `batch_size` per yfinance call.
+    With the bar cache enabled, fresh symbols are served locally and only
+    the cold and stale ones are requested. A symbol that fails does not
+    affect the others; it is logged and left out of the result.
+
+    Args:
+        symbols: Ticker symbols (duplicates are ignored).
+        period: Data period (e.g., '1y', '6mo').
+        store: Bar store to read through (see `download_stock_data`).
+        batch_size: Maximum tickers per yfinance request.
+        interval: Bar interval (see `download_stock_data`).
+
+    Returns:
+        Dict of symbol → OHLCV DataFrame, in input order, for every
+        symbol that returned data.
+
+    Raises:
+        ValueError: If the interval is unsupported.
+    """
+    _check_interval(interval)
+    store = store if store is not None else get_bar_store()
+    symbols = list(dict.fromkeys(symbols))
+
+    if store is None or interval != _INTERVAL:
+        frames = _download_batched(symbols, batch_size, interval=interval, period=period)
+    else:
+        frames = _read_through_many(store, symbols, period, batch_size)
+
+    results = {}
+    for symbol in symbols:
+        df = frames.get(symbol)
+        if df is None or df.empty:
+            logger.error("No data returned for %s (period=%s)", symbol, period)
+            continue
+        results[symbol] = df
+
+    logger.info("Loaded data for %d/%d symbols.", len(results), len(symbols))
+    return results
+
+
+def get_bar_store() -> BarCache | None:
+    """Return the process-wide bar cache from settings, or None if disabled."""
+    with _default_store_lock:
+        return _default_bar_store()
+
+
+_default_store_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _default_bar_store() -> BarCache | None:
+    from ..config import get_settings
+
+    settings = get_settings().storage
+    if not settings.bar_cache_enabled:
+        return None
+    if settings.bar_cache_format == "columnar":
+        return ColumnarBarStore(settings.bar_cache_dir)
+    return BarStore(settings.bar_cache_path)
+
+
+def period_start(period: str, now: datetime) -> pd.Timestamp | None:
+    """Translate a yfinance-style period into the first date it covers.
+
+    Args:
+        period: Period string ('5d', '6mo', '1y', 'ytd', 'max', ...).
+        now: Reference time.
+
+    Returns:
+        Start date as a naive Timestamp, or None for 'max'.
+
+    Raises:
+        ValueError: If the period string is not recognized.
+    """
+    today = pd.Timestamp(now.date())
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(year=today.year, month=1, day=1)
+
+    match = _PERIOD_PATTERN.match(period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+
+    count, unit = int(match.group(1)), match.group(2)
+    offsets = {
+        "d": pd.offsets.BDay(count),
+        "wk": pd.DateOffset(weeks=count),
+        "mo": pd.DateOffset(months=count),
+        "y": pd.DateOffset(years=count),
+    }
+    return today - offsets[unit]
+
+
+def is_fresh(symbol: str, info: BarSeriesInfo, now: datetime) -> bool:
+    """Check whether cached daily bars can be served without asking the provider.
+
+    The cache is fresh when it was fetched after the symbol's most recent
+    session close, i.e. no newer completed bar can exist yet.
+    """
+    return info.fetched_at >= last_session_close(detect_market_type(symbol), now)
+
+
+def _read_through(store: BarCache, symbol: str, period: str) -> pd.DataFrame:
+    """Serve a period slice from the store, fetching only what is missing."""
+    now = datetime.now(UTC)
+    start = period_start(period, now)
+    covered_from = start.date() if start is not None else None
+    info = store.get_info(symbol, _INTERVAL)
+
+    if info is None or not _covers(info.covered_from, covered_from):
+        logger.info("Downloading %s data (period=%s)...", symbol, period)
+        df = _download(symbol, period=period)
+        if df.empty:
+            return df
+        store.replace(symbol, _INTERVAL, df, covered_from=covered_from, fetched_at=now)
+    elif not is_fresh(symbol, info, now):
+        _top_up(store, symbol, info, now)
+    else:
+        logger.info("Serving %s from bar cache (fetched %s).", symbol, info.fetched_at.isoformat())
+
+    return store.load(symbol, _INTERVAL, start=start)
+
+
+def _read_through_many(
+    store: BarCache,
+    symbols: list[str],
+    period: str,
+    batch_size: int,
+) -> dict[str, pd.DataFrame]:
+    """Batched counterpart of `_read_through`: one request per batch of cold or stale symbols."""
+    now = datetime.now(UTC)
+    start = period_start(period, now)
+    covered_from = start.date() if start is not None else None
+
+    cold: list[str] = []
+    stale: dict[str, BarSeriesInfo] = {}
+    for symbol in symbols:
+        info = store.get_info(symbol, _INTERVAL)
+        if info is None or not _covers(info.covered_from, covered_from):
+            cold.append(symbol)
+        elif not is_fresh(symbol, info, now):
+            stale[symbol] = info
+
+    if cold:
+        logger.info("Downloading %d uncached symbols (period=%s)...", len(cold), period)
+        for symbol, df in _download_batched(cold, batch_size, period=period).items():
+            if not df.empty:
+                store.replace(symbol, _INTERVAL, df, covered_from=covered_from, fetched_at=now)
+
+    if stale:
+        cached = {symbol: store.load(symbol, _INTERVAL) for symbol in stale}
+        earliest = min(_top_up_anchor(df) for df in cached.values())
+        logger.info("Topping up %d symbols from %s...", len(stale), earliest.date())
+        fetched = _download_batched(list(stale), batch_size, start=earliest.strftime("%Y-%m-%d"))
+        for symbol, info in stale.items():
+            if symbol in fetched:
+                _merge_top_up(store, symbol, info, cached[symbol], fetched[symbol], now)
+
+    return {symbol: store.load(symbol, _INTERVAL, start=start) for symbol in symbols}
+
+
+def _top_up(store: BarCache, symbol: str, info: BarSeriesInfo, now: datetime) -> None:
+    """Fetch bars after the last cached session and upsert them."""
+    cached = store.load(symbol, _INTERVAL)
+    anchor = _top_up_anchor(cached)
+
+    logger.info("Topping up %s from %s...", symbol, anchor.date())
+    fresh = _download(symbol, start=anchor.strftime("%Y-%m-%d"))
+    _merge_top_up(store, symbol, info, cached, fresh, now)
+
+
+def _top_up_anchor(cached: pd.DataFrame) -> pd.Timestamp:
+    """First date to re-download when topping up a cached series.
+
+    The download starts at the second-to-last cached bar: the last one may
+    have been a partial intraday bar and is overwritten, while the one
+    before it is complete and is used to detect re-adjusted history.
+    """
+    return cached.index[max(len(cached) - 2, 0)]
+
+
+def _merge_top_up(
+    store: BarCache,
+    symbol: str,
+    info: BarSeriesInfo,
+    cached: pd.DataFrame,
+    fresh: pd.DataFrame,
+    now: datetime,
+) -> None:
+    """Upsert downloaded bars, or refresh everything if history was re-adjusted."""
+    anchor = _top_up_anchor(cached)
+    fresh = fresh[fresh.index >= anchor]
+    if fresh.empty:
+        store.append(symbol, _INTERVAL, fresh, fetched_at=now)
+        return
+
+    if anchor in fresh.index and not np.isclose(
+        fresh.at[anchor, "Close"], cached.at[anchor, "Close"], rtol=_ADJUSTMENT_RTOL
+    ):
+        logger.info("%s history was re-adjusted; refreshing the full series.", symbol)
+        start = info.covered_from.isoformat() if info.covered_from else None
+        full = _download(symbol, start=start) if start else _download(symbol, period="max")
+        store.replace(symbol, _INTERVAL, full, covered_from=info.covered_from, fetched_at=now)
+        return
+
+    store.append(symbol, _INTERVAL, fresh, fetched_at=now)
+
+
+def _covers(cached_from: date | None, wanted_from: date | None) -> bool:
+    """Whether a series cached from `cached_from` contains everything since `wanted_from`."""
+    if cached_from is None:
+        return True
+    return wanted_from is not None and wanted_from >= cached_from
+
+
+def _check_interval(interval: str) -> None:
+    if interval not in INTERVAL_MINUTES:
+        raise ValueError(f"Unsupported interval: {interval}. Options: {', '.join(INTERVAL_MINUTES)}")
+
+
+def _download(symbol: str, interval: str = _INTERVAL, **kwargs: str) -> pd.DataFrame:
+    """Call yfinance for one symbol and normalize the result (may be empty)."""
+    df = yf.download(symbol, interval=interval, progress=False, **kwargs)
+    if df is None or df.empty:
+        return pd.DataFrame(columns=_EXPECTED_COLUMNS)
+    return _normalize(df, symbol)
+
+
+def _download_batched(
+    symbols: list[str], batch_size: int, interval: str = _INTERVAL, **kwargs: str
+) -> dict[str, pd.DataFrame]:
+    """Download symbols in multi-ticker batches and split them per symbol.
+
+    Symbols whose batch raised are missing from the result; symbols that
+    returned nothing map to an empty DataFrame.
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    for i in range(0, len(symbols), batch_size):
+        batch = symbols[i : i + batch_size]
+        try:
+            raw = yf.download(batch, interval=interval, group_by="ticker", progress=False, **kwargs)
+        except Exception as exc:
+            logger.error("Batch download failed for %s: %s", ", ".join(batch), exc)
+            continue
+
+        for symbol in batch:
+            try:
+                frames[symbol] = _split_symbol(raw, symbol, batch)
+            except Exception as exc:
+                logger.error("Failed to parse %s from batch download: %s", symbol, exc)
+    return frames
+
+
+def _split_symbol(raw: pd.DataFrame | None, symbol: str, batch: list[str]) -> pd.DataFrame:
+    """Extract one symbol's frame from a multi-ticker download."""
+    empty = pd.DataFrame(columns=_EXPECTED_COLUMNS)
+    if raw is None or raw.empty:
+        return empty
+
+    if isinstance(raw.columns, pd.MultiIndex):
+        # yfinance upper-cases tickers in multi-ticker results
+        tickers = raw.columns.get_level_values(0)
+        key = symbol if symbol in tickers else symbol.upper()
+        if key not in tickers:
+            return empty
+        df = raw[key].copy()
+    elif len(batch) == 1:
+        df = raw.copy()
+    else:
+        return empty
+
+    # Batches share a union calendar; drop the padding rows where this symbol didn't trade
+    df = df.dropna(subset=["Close"])
+    if df.empty:
+        return empty
+    return _normalize(df, symbol)
+
+
+def _normalize(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """Flatten yfinance columns and apply the volume special case."""
     # yfinance may return MultiIndex columns for single ticker; flatten
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = df.columns.get_level_values(0)
@@ -43,10 +384,8 @@ def download_stock_data(symbol: str, period: str = "1y") -> pd.DataFrame:
         logger.info("Volume data unavailable for %s, set to 0.", symbol)
 
     # Ensure standard column names
-    expected_cols = ["Open", "High", "Low", "Close", "Volume"]
-    missing = [c for c in expected_cols if c not in df.columns]
+    missing = [c for c in _EXPECTED_COLUMNS if c not in df.columns]
     if missing:
         raise ValueError(f"Missing columns for {symbol}: {missing}")
 
-    logger.info("Downloaded %d rows for %s.", len(df), symbol)
     return df
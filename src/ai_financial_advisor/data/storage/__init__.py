@@ -1,6 +1,23 @@
 """Storage backends for persisting articles and data."""
 
-from .base import DataStore
-from .sqlite_store import SQLiteStore
+from .bar_store import BarSeriesInfo, BarStore
+from .base import ArticleSignature, DataStore, ScrapeState
+from .columnar_store import ColumnarBarStore
+from .parquet_store import ParquetStore
+from .score_store import ScoreMove, ScoreRecord, ScoreStore
+from .sqlite_store import SearchHit, SQLiteStore
 
-__all__ = ["DataStore", "SQLiteStore"]
+__all__ = [
+    "ArticleSignature",
+    "BarSeriesInfo",
+    "BarStore",
+    "ColumnarBarStore",
+    "DataStore",
+    "ParquetStore",
+    "SQLiteStore",
+    "ScoreMove",
+    "ScoreRecord",
+    "ScoreStore",
+    "ScrapeState",
+    "SearchHit",
+]
@@ -0,0 +1,135 @@
+"""SQLite-backed OHLCV bar store for the local market data cache."""
+
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume REAL,
+    PRIMARY KEY (symbol, interval, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS bar_series (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    covered_from TEXT,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (symbol, interval)
+);
+"""
+
+_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+@dataclass
+class BarSeriesInfo:
+    """Bookkeeping for one cached (symbol, interval) series."""
+
+    covered_from: date | None  # earliest start fetched; None means full history
+    fetched_at: datetime  # when the provider was last asked for new bars
+
+
+class BarStore:
+    """Persistent OHLCV history keyed by (symbol, interval).
+
+    The store only persists bars; the policy for when to fetch lives in
+    `data.stock_data`. Safe to share across threads.
+
+    Args:
+        db_path: Path to the SQLite database file.
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def get_info(self, symbol: str, interval: str) -> BarSeriesInfo | None:
+        """Return bookkeeping for a series, or None if nothing is cached."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_from, fetched_at FROM bar_series WHERE symbol = ? AND interval = ?",
+                (symbol, interval),
+            ).fetchone()
+        if row is None:
+            return None
+        return BarSeriesInfo(
+            covered_from=date.fromisoformat(row[0]) if row[0] else None,
+            fetched_at=datetime.fromisoformat(row[1]),
+        )
+
+    def load(self, symbol: str, interval: str, start: pd.Timestamp | None = None) -> pd.DataFrame:
+        """Load cached bars, optionally only those at or after `start`.
+
+        Returns:
+            DataFrame with Open, High, Low, Close, Volume columns and a
+            DatetimeIndex named 'Date' (empty if nothing is cached).
+        """
+        query = "SELECT ts, open, high, low, close, volume FROM bars WHERE symbol = ? AND interval = ?"
+        params: list[str] = [symbol, interval]
+        if start is not None:
+            query += " AND ts >= ?"
+            params.append(start.isoformat())
+        query += " ORDER BY ts"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        index = pd.DatetimeIndex(pd.to_datetime([r[0] for r in rows]), name="Date")
+        return pd.DataFrame([r[1:] for r in rows], columns=_COLUMNS, index=index, dtype=float)
+
+    def replace(
+        self,
+        symbol: str,
+        interval: str,
+        df: pd.DataFrame,
+        covered_from: date | None,
+        fetched_at: datetime,
+    ) -> None:
+        """Replace the whole cached series (used for cold fetches and re-adjustments)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval))
+            self._write_bars(symbol, interval, df)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bar_series (symbol, interval, covered_from, fetched_at) VALUES (?, ?, ?, ?)",
+                (symbol, interval, covered_from.isoformat() if covered_from else None, fetched_at.isoformat()),
+            )
+        logger.debug("Cached %d %s bars for %s.", len(df), interval, symbol)
+
+    def append(self, symbol: str, interval: str, df: pd.DataFrame, fetched_at: datetime) -> None:
+        """Upsert newer bars into an existing series and record the fetch time."""
+        with self._lock, self._conn:
+            self._write_bars(symbol, interval, df)
+            self._conn.execute(
+                "UPDATE bar_series SET fetched_at = ? WHERE symbol = ? AND interval = ?",
+                (fetched_at.isoformat(), symbol, interval),
+            )
+        logger.debug("Topped up %d %s bars for %s.", len(df), interval, symbol)
+
+    def _write_bars(self, symbol: str, interval: str, df: pd.DataFrame) -> None:
+        values = df[_COLUMNS].to_numpy(dtype=float).tolist()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO bars (symbol, interval, ts, open, high, low, close, volume) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(symbol, interval, ts.isoformat(), *row) for ts, row in zip(df.index, values)],
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
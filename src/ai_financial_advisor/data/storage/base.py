@@ -1,9 +1,64 @@
 """Abstract storage interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 from ..news_fetcher import Article
 
+# Longest wait before a page that keeps failing is tried again
+_MAX_RETRY_BACKOFF = timedelta(days=7)
+
+
+@dataclass
+class ScrapeState:
+    """What earlier scrapes learned about one article URL.
+
+    Lets a run skip pages it already has, revalidate them cheaply with the
+    server's validators, and back off from pages that keep failing.
+    """
+
+    url: str
+    content: str | None = None  # last successfully scraped text
+    author: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    failures: int = 0  # consecutive failed attempts
+    checked_at: datetime | None = None
+
+    def is_due(self, now: datetime, revalidate_after: timedelta, retry_after: timedelta) -> bool:
+        """Whether the page should be requested again at `now`.
+
+        A failing page is retried after `retry_after`, doubling with each
+        further failure (up to a week). A scraped page is revalidated
+        after `revalidate_after`, but only if the server sent a validator;
+        without one it is never fetched again.
+        """
+        if self.checked_at is None:
+            return self.content is None
+        age = now - self.checked_at
+        if self.failures:
+            return bool(age >= min(retry_after * 2 ** (self.failures - 1), _MAX_RETRY_BACKOFF))
+        if self.content is None:
+            return True
+        return bool(self.etag or self.last_modified) and age >= revalidate_after
+
+
+@dataclass
+class ArticleSignature:
+    """MinHash signature of an article and the near-duplicate cluster it joined.
+
+    See `analysis.dedup`, which encodes signatures to bytes and back;
+    `band_keys` are written with the signature to index it for candidate
+    lookups, and are not read back.
+    """
+
+    url: str
+    signature: bytes  # little-endian uint32 values
+    cluster: str  # URL of the cluster's first article
+    band_keys: list[int] = field(default_factory=list)
+
 
 class DataStore(ABC):
     """Abstract base class for article storage backends."""
@@ -20,5 +75,41 @@ class DataStore(ABC):
         """Return articles that haven't been scraped yet (content is NULL)."""
 
     @abstractmethod
-    def update_article_content(self, url: str, content: str, author: str) -> None:
+    def update_article_content(self, url: str, content: str, author: str | None) -> None:
         """Update an article's content and author after scraping."""
+
+    def update_article_contents(self, updates: Iterable[tuple[str, str, str | None]]) -> int:
+        """Update many articles' content and author, given as ``(url, content, author)``.
+
+        Backends should override this with a batched write; the default
+        updates one article at a time.
+
+        Returns:
+            Number of updates applied.
+        """
+        count = 0
+        for url, content, author in updates:
+            self.update_article_content(url, content, author)
+            count += 1
+        return count
+
+    def get_scrape_states(self, urls: Iterable[str]) -> dict[str, ScrapeState]:
+        """Return what is known from earlier scrapes of these URLs, by URL.
+
+        The default knows nothing, so every article is scraped every run.
+        """
+        return {}
+
+    def save_scrape_states(self, states: Iterable[ScrapeState]) -> None:
+        """Remember scrape outcomes for later runs; the default discards them."""
+
+    def get_article_signatures(self, urls: Iterable[str]) -> dict[str, ArticleSignature]:
+        """Return the stored signatures of these URLs; the default stores none."""
+        return {}
+
+    def find_article_signatures(self, band_keys: Iterable[int]) -> dict[str, ArticleSignature]:
+        """Return stored signatures sharing any of these LSH band keys, by URL."""
+        return {}
+
+    def save_article_signatures(self, signatures: Iterable[ArticleSignature]) -> None:
+        """Store signatures and their cluster ids; the default discards them."""
@@ -0,0 +1,290 @@
+"""Columnar on-disk OHLCV store, read through ``numpy.memmap``.
+
+Each (symbol, interval) series is a directory of raw little-endian
+arrays plus a small JSON manifest::
+
+    <root>/<interval>/<quoted symbol>/
+        manifest.json            rows, generation, time unit and zone, fetch bookkeeping
+        index.<generation>.i8    int64 timestamps
+        Open.<generation>.f8     one contiguous float64 array per field
+        ...
+
+`load` maps the files read-only and wraps them in a DataFrame without
+parsing or copying: each column is a view of the mapped file, and a
+`start` cut is a slice of those views. Opening twenty years of daily bars
+for hundreds of symbols costs a manifest read per symbol, and pages are
+only read when a column is used. Timezone-aware (intraday) indexes are
+the exception: converting them copies the index, never the columns.
+
+Writers never change bytes that an open frame may have mapped. New rows
+after the last cached bar extend the current files, first cutting them
+back to the manifest's row count in case an earlier append died before
+its manifest was written. Any other write (a replaced series, or a
+top-up that rewrites the last bars) writes a new generation of files and
+swaps the manifest atomically, so frames that are already loaded keep
+their old mapping. One writing process at a time is supported; readers
+can be anywhere.
+
+The interface matches `BarStore`, so `data.stock_data` can read through
+either.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, cast
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+from .bar_store import BarSeriesInfo
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+_MANIFEST = "manifest.json"
+_FORMAT_VERSION = 1
+
+
+class ColumnarBarStore:
+    """Persistent OHLCV history as memory-mapped column files.
+
+    Safe to share across threads.
+
+    Args:
+        root: Directory holding one subdirectory per interval.
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def get_info(self, symbol: str, interval: str) -> BarSeriesInfo | None:
+        """Return bookkeeping for a series, or None if nothing is cached."""
+        manifest = self._manifest(self._series_dir(symbol, interval))
+        if manifest is None:
+            return None
+        covered_from = manifest["covered_from"]
+        return BarSeriesInfo(
+            covered_from=date.fromisoformat(covered_from) if covered_from else None,
+            fetched_at=datetime.fromisoformat(manifest["fetched_at"]),
+        )
+
+    def load(self, symbol: str, interval: str, start: pd.Timestamp | None = None) -> pd.DataFrame:
+        """Load cached bars as views of the mapped files.
+
+        The columns are read-only: call ``.copy()`` on the frame (or a
+        column) before modifying it in place.
+
+        Args:
+            symbol: Ticker symbol.
+            interval: Bar interval.
+            start: If given, only bars at or after it (a slice, not a copy).
+
+        Returns:
+            DataFrame with Open, High, Low, Close, Volume columns and a
+            DatetimeIndex named 'Date' (empty if nothing is cached).
+        """
+        directory = self._series_dir(symbol, interval)
+        manifest = self._manifest(directory)
+        if manifest is None or manifest["rows"] == 0:
+            return _empty_frame()
+
+        index, columns = _map_series(directory, manifest)
+        first = 0
+        if start is not None:
+            first = int(np.searchsorted(index, _to_int(start, manifest["unit"], manifest["tz"]), side="left"))
+        window = {name: values[first:] for name, values in columns.items()}
+        return _frame(index[first:], window, manifest["unit"], manifest["tz"])
+
+    def replace(
+        self,
+        symbol: str,
+        interval: str,
+        df: pd.DataFrame,
+        covered_from: date | None,
+        fetched_at: datetime,
+    ) -> None:
+        """Replace the whole cached series (used for cold fetches and re-adjustments)."""
+        directory = self._series_dir(symbol, interval)
+        with self._lock:
+            previous = self._manifest(directory)
+            self._write_generation(
+                directory,
+                _normalize(df),
+                {
+                    "symbol": symbol,
+                    "interval": interval,
+                    "covered_from": covered_from.isoformat() if covered_from else None,
+                    "fetched_at": fetched_at.isoformat(),
+                },
+                previous,
+            )
+        logger.debug("Cached %d %s bars for %s.", len(df), interval, symbol)
+
+    def append(self, symbol: str, interval: str, df: pd.DataFrame, fetched_at: datetime) -> None:
+        """Upsert newer bars into an existing series and record the fetch time.
+
+        Raises:
+            ValueError: If the series is not cached, or the new bars'
+                timezone differs from the cached ones.
+        """
+        directory = self._series_dir(symbol, interval)
+        with self._lock:
+            manifest = self._manifest(directory)
+            if manifest is None:
+                raise ValueError(f"No cached {interval} series for {symbol}")
+            manifest["fetched_at"] = fetched_at.isoformat()
+            df = _normalize(df)
+            if df.empty:
+                _write_manifest(directory, manifest)
+                return
+            if _tz_name(df.index) != manifest["tz"]:
+                raise ValueError(f"Timezone of new {symbol} bars does not match the cached series")
+
+            new_index = df.index.as_unit(manifest["unit"]).asi8
+            rows = manifest["rows"]
+            last = _map_series(directory, manifest)[0][-1] if rows else None
+            if last is None or new_index[0] > last:
+                # Pure append: extend the current files past what readers have mapped
+                _append_arrays(directory, manifest["generation"], rows, new_index, df)
+                manifest["rows"] = rows + len(df)
+                _write_manifest(directory, manifest)
+            else:
+                cached = self.load(symbol, interval)
+                merged = pd.concat([cached[~cached.index.isin(df.index)], df]).sort_index()
+                self._write_generation(directory, merged, manifest, manifest)
+        logger.debug("Topped up %d %s bars for %s.", len(df), interval, symbol)
+
+    def symbols(self, interval: str) -> list[str]:
+        """Cached symbols for an interval, sorted."""
+        interval_dir = self._root / interval
+        if not interval_dir.is_dir():
+            return []
+        return sorted(unquote(p.name) for p in interval_dir.iterdir() if (p / _MANIFEST).is_file())
+
+    def close(self) -> None:
+        """Nothing to release: mappings close with the frames that use them."""
+
+    def _series_dir(self, symbol: str, interval: str) -> Path:
+        return self._root / interval / quote(symbol, safe="")
+
+    def _manifest(self, directory: Path) -> dict[str, Any] | None:
+        try:
+            return cast(dict[str, Any], json.loads((directory / _MANIFEST).read_text()))
+        except FileNotFoundError:
+            return None
+
+    def _write_generation(
+        self,
+        directory: Path,
+        df: pd.DataFrame,
+        fields: dict[str, Any],
+        previous: dict[str, Any] | None,
+    ) -> None:
+        """Write `df` as a new generation of files, then point the manifest at it."""
+        directory.mkdir(parents=True, exist_ok=True)
+        generation = previous["generation"] + 1 if previous else 1
+        _remove_generation(directory, generation)  # leftovers of an interrupted write
+        unit = df.index.unit
+        _append_arrays(directory, generation, 0, df.index.asi8, df)
+        manifest = {
+            "version": _FORMAT_VERSION,
+            "symbol": fields["symbol"],
+            "interval": fields["interval"],
+            "rows": len(df),
+            "generation": generation,
+            "unit": unit,
+            "tz": _tz_name(df.index),
+            "covered_from": fields["covered_from"],
+            "fetched_at": fields["fetched_at"],
+        }
+        _write_manifest(directory, manifest)
+        if previous:
+            # Mapped files stay readable after unlink on POSIX; elsewhere they linger until the next write
+            _remove_generation(directory, previous["generation"])
+
+
+def _map_series(directory: Path, manifest: dict[str, Any]) -> tuple[np.memmap, dict[str, np.memmap]]:
+    """Map the index and columns of a non-empty series read-only."""
+    rows, generation = manifest["rows"], manifest["generation"]
+    index = np.memmap(directory / f"index.{generation}.i8", dtype="<i8", mode="r", shape=(rows,))
+    columns = {
+        name: np.memmap(directory / f"{name}.{generation}.f8", dtype="<f8", mode="r", shape=(rows,))
+        for name in _COLUMNS
+    }
+    return index, columns
+
+
+def _frame(index: np.ndarray, columns: dict[str, np.ndarray], unit: str, tz: str | None) -> pd.DataFrame:
+    dates = pd.DatetimeIndex(index.view(f"M8[{unit}]"), copy=False, name="Date")
+    if tz is not None:
+        dates = dates.tz_localize("UTC").tz_convert(tz)
+    return pd.DataFrame(columns, index=dates, copy=False)
+
+
+def _empty_frame() -> pd.DataFrame:
+    return pd.DataFrame(columns=_COLUMNS, index=pd.DatetimeIndex([], name="Date"), dtype=float)
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Sorted bars with unique timestamps (the last duplicate wins) and float columns."""
+    df = df[_COLUMNS].astype(float)
+    df.index = pd.DatetimeIndex(df.index)
+    return df[~df.index.duplicated(keep="last")].sort_index()
+
+
+def _tz_name(index: pd.DatetimeIndex) -> str | None:
+    return str(index.tz) if index.tz is not None else None
+
+
+def _to_int(timestamp: pd.Timestamp, unit: str, tz: str | None) -> int:
+    """A timestamp as stored in the index: integer `unit`s, UTC for aware series."""
+    timestamp = pd.Timestamp(timestamp)
+    if tz is None:
+        timestamp = timestamp.tz_localize(None)  # naive series store wall-clock times
+    else:
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.tz_localize(tz)
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return int(timestamp.to_datetime64().astype(f"M8[{unit}]").astype(np.int64))
+
+
+def _append_arrays(directory: Path, generation: int, rows: int, index: np.ndarray, df: pd.DataFrame) -> None:
+    """Write the new rows after the first `rows` of each file.
+
+    Bytes past `rows` are not covered by the manifest (an append that
+    died before updating it) and are cut off first; readers never map them.
+    """
+    _write_after(directory / f"index.{generation}.i8", rows, np.ascontiguousarray(index, dtype="<i8"))
+    for name in _COLUMNS:
+        _write_after(
+            directory / f"{name}.{generation}.f8", rows, np.ascontiguousarray(df[name].to_numpy(), dtype="<f8")
+        )
+
+
+def _write_after(path: Path, rows: int, values: np.ndarray) -> None:
+    offset = rows * values.itemsize
+    with open(path, "r+b" if path.exists() else "wb") as f:
+        f.truncate(offset)
+        f.seek(offset)
+        f.write(values.tobytes())
+
+
+def _write_manifest(directory: Path, manifest: dict[str, Any]) -> None:
+    tmp = directory / f"{_MANIFEST}.tmp"
+    tmp.write_text(json.dumps(manifest))
+    os.replace(tmp, directory / _MANIFEST)
+
+
+def _remove_generation(directory: Path, generation: int) -> None:
+    for path in directory.glob(f"*.{generation}.[fi]8"):
+        try:
+            path.unlink()
+        except OSError as exc:
+            logger.debug("Could not remove %s: %s", path, exc)
@@ -0,0 +1,150 @@
+"""Partitioned Parquet datasets for scan, backtest and alert results.
+
+Each table is a Hive-partitioned Arrow dataset keyed by run date and
+market::
+
+    <root>/<table>/date=2026-03-20/market=us/part-0.parquet
+
+Writing a table replaces the partitions it touches, so re-running a scan
+on the same day overwrites that day's rows for the scanned markets and
+leaves the rest alone. Reads are lazy: `dataset` returns a
+`pyarrow.dataset.Dataset` that only touches the files and columns a query
+needs, and `read` projects columns and pushes the date, market and symbol
+filters down to the partition and row-group level.
+
+Requires the optional ``pyarrow`` dependency
+(``pip install 'ai-financial-advisor[parquet]'``).
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from ..market_types import detect_market_type
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # optional dependency, checked by ParquetStore
+    pa = ds = None
+
+logger = logging.getLogger(__name__)
+
+# Partition columns, outermost first
+PARTITION_COLUMNS = ("date", "market")
+
+
+class ParquetStore:
+    """Reads and writes result tables as partitioned Parquet datasets.
+
+    Args:
+        root: Directory holding one dataset per table.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        if pa is None:
+            raise ImportError("Parquet output needs pyarrow: pip install 'ai-financial-advisor[parquet]'")
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def write(self, table: str, df: pd.DataFrame, run_date: date | None = None) -> Path:
+        """Write rows of one run, replacing the (date, market) partitions they touch.
+
+        Args:
+            table: Table name (e.g. "scans").
+            df: Rows with a symbol column. A market column is derived
+                from the symbol if missing; a date column must not be
+                present (it is the run date).
+            run_date: Date the rows belong to (default: today).
+
+        Returns:
+            Directory of the table.
+
+        Raises:
+            ValueError: If `df` has no symbol column or has a date column.
+        """
+        if "symbol" not in df.columns:
+            raise ValueError(f"Table {table} needs a symbol column")
+        if "date" in df.columns:
+            raise ValueError(f"Table {table} must not have a date column; it is the partition key")
+
+        rows = df.assign(date=(run_date or date.today()).isoformat())
+        if "market" not in rows.columns:
+            rows["market"] = [detect_market_type(s).value for s in rows["symbol"]]
+        path = self._root / table
+        ds.write_dataset(
+            pa.Table.from_pandas(rows, preserve_index=False),
+            path,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([(c, pa.string()) for c in PARTITION_COLUMNS]), flavor="hive"),
+            existing_data_behavior="delete_matching",
+        )
+        logger.info("Wrote %d rows to %s.", len(rows), path)
+        return path
+
+    def dataset(self, table: str) -> "ds.Dataset":
+        """Open a table lazily; nothing is read until it is scanned.
+
+        Raises:
+            FileNotFoundError: If the table has not been written.
+        """
+        path = self._root / table
+        if not path.is_dir():
+            raise FileNotFoundError(f"No {table} table under {self._root}")
+        return ds.dataset(path, format="parquet", partitioning="hive")
+
+    def read(
+        self,
+        table: str,
+        columns: list[str] | None = None,
+        dates: Iterable[date | str] | None = None,
+        markets: Iterable[str] | None = None,
+        symbols: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """Read a table with column projection and filter pushdown.
+
+        Args:
+            table: Table name.
+            columns: Columns to load (default: all, partition keys included).
+            dates: Run dates to keep (default: all).
+            markets: Markets to keep, e.g. ``["us", "hk"]`` (default: all).
+            symbols: Symbols to keep (default: all).
+
+        Returns:
+            DataFrame of the matching rows.
+
+        Raises:
+            FileNotFoundError: If the table has not been written.
+        """
+        conditions = []
+        if dates is not None:
+            conditions.append(ds.field("date").isin([_iso(d) for d in dates]))
+        if markets is not None:
+            conditions.append(ds.field("market").isin(list(markets)))
+        if symbols is not None:
+            conditions.append(ds.field("symbol").isin(list(symbols)))
+        condition = None
+        for c in conditions:
+            condition = c if condition is None else condition & c
+        return self.dataset(table).to_table(columns=columns, filter=condition).to_pandas()
+
+    def dates(self, table: str) -> list[str]:
+        """Run dates present in a table, oldest first."""
+        path = self._root / table
+        if not path.is_dir():
+            return []
+        return sorted(p.name.removeprefix("date=") for p in path.glob("date=*") if p.is_dir())
+
+    def tables(self) -> list[str]:
+        """Names of the tables written so far."""
+        return sorted(p.name for p in self._root.iterdir() if p.is_dir())
+
+
+def _iso(value: date | str) -> str:
+    return value if isinstance(value, str) else value.isoformat()
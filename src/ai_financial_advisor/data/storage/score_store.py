@@ -0,0 +1,247 @@
+"""SQLite-backed history of trend scan results.
+
+Every scan is recorded as a run, one row per symbol, so later readers (the
+static site, the Telegram digest) can reuse the latest scores instead of
+re-running the analysis, and score changes between runs can be queried.
+
+Rows are clustered by (symbol, run), so a symbol's score history is a
+single index range. A small pointer table keeps each symbol's latest and
+previous run, which makes "latest scores" and "top movers since the last
+run" lookups proportional to the number of symbols, not to the history.
+"""
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scan_runs (
+    run_id INTEGER PRIMARY KEY,
+    run_ts TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scan_scores (
+    symbol TEXT NOT NULL,
+    run_id INTEGER NOT NULL,
+    close REAL,
+    score REAL NOT NULL,
+    macd_signal REAL,
+    mfi_signal REAL,
+    obv_signal REAL,
+    interpretation TEXT,
+    PRIMARY KEY (symbol, run_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scan_latest (
+    symbol TEXT PRIMARY KEY,
+    run_id INTEGER NOT NULL,
+    previous_run_id INTEGER
+) WITHOUT ROWID;
+"""
+
+_FIELDS = ["close", "score", "macd_signal", "mfi_signal", "obv_signal", "interpretation"]
+
+
+@dataclass
+class ScoreRecord:
+    """Trend score of one symbol in one scan."""
+
+    symbol: str
+    close: float
+    score: float
+    macd_signal: float
+    mfi_signal: float
+    obv_signal: float
+    interpretation: str
+    run_ts: datetime | None = None  # set when read back from the store
+
+
+@dataclass
+class ScoreMove:
+    """Change in a symbol's score between its last two recorded scans."""
+
+    symbol: str
+    run_ts: datetime
+    close: float
+    score: float
+    interpretation: str
+    previous_run_ts: datetime
+    previous_close: float
+    previous_score: float
+
+    @property
+    def change(self) -> float:
+        return self.score - self.previous_score
+
+
+class ScoreStore:
+    """Persistent trend scan results keyed by (symbol, run).
+
+    Safe to share across threads.
+
+    Args:
+        db_path: Path to the SQLite database file.
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def record_run(self, records: Iterable[ScoreRecord], run_ts: datetime | None = None) -> datetime:
+        """Record the results of one scan.
+
+        Args:
+            records: One record per scanned symbol; their `run_ts` is ignored.
+            run_ts: Time of the scan (default: now).
+
+        Returns:
+            The recorded run time.
+        """
+        run_ts = (run_ts or datetime.now()).replace(microsecond=0)
+        records = list(records)
+        with self._lock, self._conn:
+            run_id = self._conn.execute("INSERT INTO scan_runs (run_ts) VALUES (?)", (run_ts.isoformat(),)).lastrowid
+            self._conn.executemany(
+                "INSERT INTO scan_scores (symbol, run_id, close, score, macd_signal, mfi_signal, obv_signal, "
+                "interpretation) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (r.symbol, run_id, r.close, r.score, r.macd_signal, r.mfi_signal, r.obv_signal, r.interpretation)
+                    for r in records
+                ],
+            )
+            # The right-hand side sees the old row, so the current run becomes the previous one
+            self._conn.executemany(
+                "INSERT INTO scan_latest (symbol, run_id) VALUES (?, ?) "
+                "ON CONFLICT (symbol) DO UPDATE SET previous_run_id = run_id, run_id = excluded.run_id",
+                [(r.symbol, run_id) for r in records],
+            )
+        logger.debug("Recorded %d scores for the %s scan.", len(records), run_ts)
+        return run_ts
+
+    def latest(self, symbols: Iterable[str] | None = None, since: datetime | None = None) -> list[ScoreRecord]:
+        """Most recent recorded score of each symbol.
+
+        Args:
+            symbols: Symbols to look up (default: all recorded symbols).
+                Symbols never recorded are left out.
+            since: Leave out scores recorded before this time.
+
+        Returns:
+            Records in symbol order, with `run_ts` set.
+        """
+        query = (
+            "SELECT l.symbol, s.close, s.score, s.macd_signal, s.mfi_signal, s.obv_signal, s.interpretation, r.run_ts "
+            "FROM scan_latest l JOIN scan_scores s ON s.symbol = l.symbol AND s.run_id = l.run_id "
+            "JOIN scan_runs r ON r.run_id = l.run_id"
+        )
+        conditions, params = _filters(symbols, since)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY l.symbol", params).fetchall()
+        return [
+            ScoreRecord(
+                symbol=row[0],
+                close=row[1],
+                score=row[2],
+                macd_signal=row[3],
+                mfi_signal=row[4],
+                obv_signal=row[5],
+                interpretation=row[6],
+                run_ts=datetime.fromisoformat(row[7]),
+            )
+            for row in rows
+        ]
+
+    def history(self, symbol: str, since: datetime | None = None) -> pd.DataFrame:
+        """Recorded scores of one symbol, oldest first.
+
+        Returns:
+            DataFrame with close, score, macd_signal, mfi_signal,
+            obv_signal and interpretation columns and a DatetimeIndex
+            named 'run_ts' (empty if the symbol was never recorded).
+        """
+        query = (
+            "SELECT r.run_ts, s.close, s.score, s.macd_signal, s.mfi_signal, s.obv_signal, s.interpretation "
+            "FROM scan_scores s JOIN scan_runs r ON r.run_id = s.run_id WHERE s.symbol = ?"
+        )
+        params: list[str] = [symbol]
+        if since is not None:
+            query += " AND r.run_ts >= ?"
+            params.append(since.isoformat())
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY s.run_id", params).fetchall()
+
+        index = pd.DatetimeIndex(pd.to_datetime([r[0] for r in rows]), name="run_ts")
+        return pd.DataFrame([r[1:] for r in rows], columns=_FIELDS, index=index)
+
+    def top_movers(self, limit: int = 10, symbols: Iterable[str] | None = None) -> list[ScoreMove]:
+        """Symbols whose score changed most between their last two scans.
+
+        Args:
+            limit: Maximum number of moves to return.
+            symbols: Symbols to consider (default: all recorded symbols).
+                Symbols recorded only once are left out.
+
+        Returns:
+            Moves ordered by absolute score change, largest first.
+        """
+        query = (
+            "SELECT l.symbol, r.run_ts, s.close, s.score, s.interpretation, pr.run_ts, p.close, p.score "
+            "FROM scan_latest l "
+            "JOIN scan_scores s ON s.symbol = l.symbol AND s.run_id = l.run_id "
+            "JOIN scan_scores p ON p.symbol = l.symbol AND p.run_id = l.previous_run_id "
+            "JOIN scan_runs r ON r.run_id = l.run_id JOIN scan_runs pr ON pr.run_id = l.previous_run_id"
+        )
+        conditions, params = _filters(symbols, None)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY ABS(s.score - p.score) DESC, l.symbol LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(query, [*params, limit]).fetchall()
+        return [
+            ScoreMove(
+                symbol=row[0],
+                run_ts=datetime.fromisoformat(row[1]),
+                close=row[2],
+                score=row[3],
+                interpretation=row[4],
+                previous_run_ts=datetime.fromisoformat(row[5]),
+                previous_close=row[6],
+                previous_score=row[7],
+            )
+            for row in rows
+        ]
+
+    def last_run(self) -> datetime | None:
+        """Time of the most recent recorded scan, or None if there is none."""
+        with self._lock:
+            row = self._conn.execute("SELECT run_ts FROM scan_runs ORDER BY run_id DESC LIMIT 1").fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def _filters(symbols: Iterable[str] | None, since: datetime | None) -> tuple[list[str], list[str]]:
+    """WHERE conditions on `scan_latest l` and the latest run `r`."""
+    conditions: list[str] = []
+    params: list[str] = []
+    if symbols is not None:
+        symbol_list = list(symbols)
+        conditions.append(f"l.symbol IN ({', '.join('?' * len(symbol_list))})")
+        params.extend(symbol_list)
+    if since is not None:
+        conditions.append("r.run_ts >= ?")
+        params.append(since.isoformat())
+    return conditions, params
@@ -1,11 +1,26 @@
-"""SQLite storage backend."""
+"""SQLite storage backend.
+
+Besides the articles, the database remembers how each article page was
+last scraped (HTTP validators, consecutive failures), keeps each
+article's MinHash signature and near-duplicate cluster with an LSH band
+index for finding similar stored articles, and keeps a full-text index
+(SQLite FTS5) over article titles, descriptions and content, and over
+the generated ``NR_*.md`` reports. The article index is maintained by
+triggers, so every insert or content update through the store updates it
+in the same transaction; reports are re-read only when their file
+changes.
+"""
 
 import logging
+import re
 import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
 
 from ..news_fetcher import Article
-from .base import DataStore
+from .base import ArticleSignature, DataStore, ScrapeState
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +37,96 @@ CREATE TABLE IF NOT EXISTS articles (
     fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 CREATE INDEX IF NOT EXISTS idx_published_at ON articles (published_at);
+CREATE TABLE IF NOT EXISTS scrape_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    failures INTEGER NOT NULL DEFAULT 0,
+    checked_at DATETIME
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS article_signatures (
+    url TEXT PRIMARY KEY,
+    signature BLOB NOT NULL,
+    cluster TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS signature_bands (
+    band_key INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (band_key, url)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_signature_bands_url ON signature_bands (url);
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    filename TEXT UNIQUE NOT NULL,
+    report_date TEXT,
+    title TEXT,
+    body TEXT,
+    mtime REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, content, content='articles', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+    title, body, content='reports', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, description, content)
+    VALUES (new.id, new.title, new.description, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.id, old.title, old.description, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, description, content ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.id, old.title, old.description, old.content);
+    INSERT INTO articles_fts (rowid, title, description, content)
+    VALUES (new.id, new.title, new.description, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS reports_fts_insert AFTER INSERT ON reports BEGIN
+    INSERT INTO reports_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS reports_fts_delete AFTER DELETE ON reports BEGIN
+    INSERT INTO reports_fts (reports_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS reports_fts_update AFTER UPDATE OF title, body ON reports BEGIN
+    INSERT INTO reports_fts (reports_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO reports_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
 """
 
+# BM25 column weights: a match in the title counts most, then the description
+_ARTICLE_WEIGHTS = "10.0, 5.0, 1.0"
+_REPORT_WEIGHTS = "10.0, 1.0"
+_SNIPPET_TOKENS = 16
+
+# Source name of report hits; pass it as `source` to search reports only
+REPORT_SOURCE = "report"
+
+# WAL lets readers run alongside the writer and makes a commit one sequential
+# log append; with synchronous=NORMAL a crash can lose the last commits but
+# never corrupts the database.
+_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA busy_timeout = 5000;
+"""
+
+
+@dataclass
+class SearchHit:
+    """One full-text search result."""
+
+    kind: str  # "article" or "report"
+    title: str
+    location: str  # article URL or report filename
+    source: str  # article source name, or REPORT_SOURCE
+    published: str | None  # ISO publication time (articles) or report date
+    snippet: str  # best matching passage, matches wrapped in **
+    score: float  # BM25 relevance, higher is better
+
 
 class SQLiteStore(DataStore):
     """SQLite-backed article storage with URL deduplication.
@@ -36,19 +139,29 @@ class SQLiteStore(DataStore):
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(self._db_path))
+        self._conn.executescript(_PRAGMAS)
+        indexed = self._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'").fetchone()
         self._conn.executescript(_SCHEMA)
+        if not indexed:
+            # Databases created before the index existed: index what is already stored
+            with self._conn:
+                self._conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
 
     def save_articles(self, articles: list[Article]) -> int:
-        """Insert articles, skipping duplicates by URL."""
+        """Insert articles in one transaction, skipping duplicates by URL.
+
+        Returns:
+            Number of rows actually inserted (SQLite's change count, so
+            duplicates of stored or earlier URLs in the batch are not counted).
+        """
         if not articles:
             return 0
 
-        inserted = 0
-        for article in articles:
-            try:
-                self._conn.execute(
-                    """INSERT INTO articles (source_name, author, title, description, url, content, published_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        with self._conn:
+            cursor = self._conn.executemany(
+                """INSERT OR IGNORE INTO articles (source_name, author, title, description, url, content, published_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
                     (
                         article.source_name,
                         article.author,
@@ -57,13 +170,11 @@ class SQLiteStore(DataStore):
                         article.url,
                         article.content,
                         article.published_at.isoformat() if article.published_at else None,
-                    ),
-                )
-                inserted += 1
-            except sqlite3.IntegrityError:
-                pass  # Duplicate URL, skip
-
-        self._conn.commit()
+                    )
+                    for article in articles
+                ),
+            )
+        inserted = cursor.rowcount
         logger.info(
             "Saved %d new articles (%d duplicates skipped).",
             inserted,
@@ -90,14 +201,235 @@ class SQLiteStore(DataStore):
             for row in cursor.fetchall()
         ]
 
-    def update_article_content(self, url: str, content: str, author: str) -> None:
+    def update_article_content(self, url: str, content: str, author: str | None) -> None:
         """Update content and author for a given article URL."""
-        self._conn.execute(
-            "UPDATE articles SET content = ?, author = ? WHERE url = ?",
-            (content, author, url),
-        )
-        self._conn.commit()
+        self.update_article_contents([(url, content, author)])
+
+    def update_article_contents(self, updates: Iterable[tuple[str, str, str | None]]) -> int:
+        """Update content and author of many articles in one transaction.
+
+        Args:
+            updates: ``(url, content, author)`` per scraped article.
+
+        Returns:
+            Number of stored articles updated.
+        """
+        with self._conn:
+            cursor = self._conn.executemany(
+                "UPDATE articles SET content = ?, author = ? WHERE url = ?",
+                ((content, author, url) for url, content, author in updates),
+            )
+        return cursor.rowcount
+
+    def get_scrape_states(self, urls: Iterable[str]) -> dict[str, ScrapeState]:
+        """Return the stored content and scrape history of these URLs.
+
+        Only URLs that were scraped before (or stored with content) appear.
+        """
+        urls = list(urls)
+        states = {}
+        # Stay under SQLite's default host-parameter limit
+        for start in range(0, len(urls), 500):
+            chunk = urls[start : start + 500]
+            rows = self._conn.execute(
+                "SELECT a.url, a.content, a.author, s.etag, s.last_modified, coalesce(s.failures, 0), s.checked_at "
+                "FROM articles a LEFT JOIN scrape_cache s ON s.url = a.url "
+                f"WHERE a.url IN ({', '.join('?' * len(chunk))}) AND (a.content IS NOT NULL OR s.url IS NOT NULL)",
+                chunk,
+            ).fetchall()
+            for url, content, author, etag, last_modified, failures, checked_at in rows:
+                states[url] = ScrapeState(
+                    url,
+                    content,
+                    author,
+                    etag,
+                    last_modified,
+                    failures,
+                    datetime.fromisoformat(checked_at) if checked_at else None,
+                )
+        return states
+
+    def save_scrape_states(self, states: Iterable[ScrapeState]) -> None:
+        """Record scrape outcomes (validators, failures, check time) by URL.
+
+        Article content is not written here; use `update_article_contents`.
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO scrape_cache (url, etag, last_modified, failures, checked_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified, "
+                "failures = excluded.failures, checked_at = excluded.checked_at",
+                (
+                    (
+                        state.url,
+                        state.etag,
+                        state.last_modified,
+                        state.failures,
+                        state.checked_at.isoformat() if state.checked_at else None,
+                    )
+                    for state in states
+                ),
+            )
+
+    def get_article_signatures(self, urls: Iterable[str]) -> dict[str, ArticleSignature]:
+        """Return the stored signatures and clusters of these URLs."""
+        urls = list(urls)
+        found = {}
+        for start in range(0, len(urls), 500):
+            chunk = urls[start : start + 500]
+            rows = self._conn.execute(
+                f"SELECT url, signature, cluster FROM article_signatures WHERE url IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            found.update(_signature_rows(rows))
+        return found
+
+    def find_article_signatures(self, band_keys: Iterable[int]) -> dict[str, ArticleSignature]:
+        """Return stored signatures that share any of these LSH band keys, by URL."""
+        keys = list(set(band_keys))
+        found = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            rows = self._conn.execute(
+                "SELECT s.url, s.signature, s.cluster FROM article_signatures s "
+                "WHERE s.url IN (SELECT url FROM signature_bands "
+                f"WHERE band_key IN ({', '.join('?' * len(chunk))}))",
+                chunk,
+            )
+            found.update(_signature_rows(rows))
+        return found
+
+    def save_article_signatures(self, signatures: Iterable[ArticleSignature]) -> None:
+        """Store signatures, their clusters and their band keys (replacing earlier ones)."""
+        signatures = list(signatures)
+        with self._conn:
+            self._conn.executemany("DELETE FROM signature_bands WHERE url = ?", ((s.url,) for s in signatures))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO article_signatures (url, signature, cluster) VALUES (?, ?, ?)",
+                ((s.url, s.signature, s.cluster) for s in signatures),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO signature_bands (band_key, url) VALUES (?, ?)",
+                ((key, s.url) for s in signatures for key in s.band_keys),
+            )
+
+    def index_reports(self, reports_dir: Path | str) -> int:
+        """Bring the report index up to date with the ``NR_*.md`` files in a directory.
+
+        Only new or modified files are read; reports whose file was
+        removed are dropped from the index.
+
+        Returns:
+            Number of reports (re)indexed.
+        """
+        files = {p.name: p for p in Path(reports_dir).glob("NR_*.md")}
+        stored = dict(self._conn.execute("SELECT filename, mtime FROM reports").fetchall())
+        changed = [p for name, p in files.items() if stored.get(name) != p.stat().st_mtime]
+        removed = [(name,) for name in stored if name not in files]
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO reports (filename, report_date, title, body, mtime) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (filename) DO UPDATE SET report_date = excluded.report_date, title = excluded.title, "
+                "body = excluded.body, mtime = excluded.mtime",
+                (_report_row(p) for p in changed),
+            )
+            self._conn.executemany("DELETE FROM reports WHERE filename = ?", removed)
+        if changed or removed:
+            logger.info("Indexed %d reports (%d removed).", len(changed), len(removed))
+        return len(changed)
+
+    def search(
+        self,
+        query: str,
+        since: date | None = None,
+        source: str | None = None,
+        limit: int = 20,
+        raw: bool = False,
+    ) -> list[SearchHit]:
+        """Full-text search over stored articles and indexed reports, best match first.
+
+        Args:
+            query: Words to find; all must occur (in any column). With
+                `raw`, an FTS5 query instead (phrases, OR, NOT, prefix*).
+            since: Only articles published, and reports dated, on or after
+                this date (or datetime).
+            source: Only articles from this source (case-insensitive), or
+                only reports when `REPORT_SOURCE`.
+            limit: Maximum number of hits.
+            raw: Pass `query` to FTS5 unchanged.
+
+        Returns:
+            Hits ordered by BM25 relevance.
+
+        Raises:
+            sqlite3.OperationalError: If a raw query is not valid FTS5 syntax.
+        """
+        match = query if raw else _match_expression(query)
+        if not match:
+            return []
+
+        selects: list[str] = []
+        params: list[object] = []
+        if source is None or source.lower() != REPORT_SOURCE:
+            sql = (
+                "SELECT 'article', a.title, a.url, a.source_name, a.published_at, "
+                f"snippet(articles_fts, -1, '**', '**', '…', {_SNIPPET_TOKENS}), "
+                f"bm25(articles_fts, {_ARTICLE_WEIGHTS}) AS rank "
+                "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid WHERE articles_fts MATCH ?"
+            )
+            params.append(match)
+            if since is not None:
+                sql += " AND a.published_at >= ?"
+                params.append(since.isoformat())
+            if source is not None:
+                sql += " AND a.source_name = ? COLLATE NOCASE"
+                params.append(source)
+            selects.append(sql)
+        if source is None or source.lower() == REPORT_SOURCE:
+            sql = (
+                f"SELECT 'report', r.title, r.filename, '{REPORT_SOURCE}', r.report_date, "
+                f"snippet(reports_fts, -1, '**', '**', '…', {_SNIPPET_TOKENS}), "
+                f"bm25(reports_fts, {_REPORT_WEIGHTS}) AS rank "
+                "FROM reports_fts JOIN reports r ON r.id = reports_fts.rowid WHERE reports_fts MATCH ?"
+            )
+            params.append(match)
+            if since is not None:
+                sql += " AND r.report_date >= ?"
+                params.append(since.isoformat()[:10])
+            selects.append(sql)
+
+        rows = self._conn.execute(" UNION ALL ".join(selects) + " ORDER BY rank LIMIT ?", [*params, limit]).fetchall()
+        return [
+            SearchHit(
+                kind=kind,
+                title=title,
+                location=location,
+                source=source_name,
+                published=published,
+                snippet=snippet,
+                score=-rank,
+            )
+            for kind, title, location, source_name, published, snippet, rank in rows
+        ]
 
     def close(self) -> None:
         """Close the database connection."""
         self._conn.close()
+
+
+def _match_expression(query: str) -> str:
+    """Plain words as an FTS5 query matching all of them, with FTS syntax quoted away."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+def _signature_rows(rows: Iterable[tuple[str, bytes, str]]) -> dict[str, ArticleSignature]:
+    return {url: ArticleSignature(url, blob, cluster) for url, blob, cluster in rows}
+
+
+def _report_row(path: Path) -> tuple[str, str | None, str, str, float]:
+    body = path.read_text(encoding="utf-8")
+    first_line = body.split("\n", 1)[0]
+    match = re.search(r"NR_(\d{4}-\d{2}-\d{2})", path.name)
+    title = first_line.lstrip("# ").strip() or path.stem
+    return path.name, match.group(1) if match else None, title, body, path.stat().st_mtime
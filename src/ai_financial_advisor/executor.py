@@ -0,0 +1,90 @@
+"""Bounded worker pools for per-symbol work.
+
+Thread pools suit network-bound steps (downloads); process pools suit
+indicator math and backtests, which hold the GIL. Pool sizes are capped
+by the memory budget of the production server (see PLAN.md: ~3.8 GB RAM
+shared with the cron jobs), so a large ``--workers`` value cannot push
+the box into swap.
+"""
+
+import logging
+import os
+from collections.abc import Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PoolMode = Literal["thread", "process"]
+
+MEMORY_BUDGET_MB = 3800
+
+# Rough peak resident memory per worker: a thread holds one symbol's frames,
+# a process additionally carries its own interpreter with numpy/pandas loaded.
+_WORKER_MEMORY_MB: dict[str, int] = {"thread": 50, "process": 200}
+
+
+def available_memory_mb() -> int:
+    """Return currently available physical memory in MB (budget if unknown)."""
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return MEMORY_BUDGET_MB
+    return int(pages * page_size / (1024 * 1024))
+
+
+def worker_limit(mode: PoolMode, requested: int, budget_mb: int = MEMORY_BUDGET_MB) -> int:
+    """Cap a requested worker count by memory (and CPUs, for processes).
+
+    Args:
+        mode: "thread" or "process".
+        requested: Workers asked for by the caller.
+        budget_mb: Memory the pool may use at most.
+
+    Returns:
+        Number of workers to start (at least 1).
+    """
+    if mode not in _WORKER_MEMORY_MB:
+        raise ValueError(f"Unknown pool mode: {mode!r} (expected 'thread' or 'process')")
+
+    usable_mb = min(budget_mb, available_memory_mb())
+    limit = max(1, usable_mb // _WORKER_MEMORY_MB[mode])
+    if mode == "process":
+        limit = min(limit, os.cpu_count() or 1)
+
+    workers = max(1, min(requested, limit))
+    if workers < requested:
+        logger.info("Capping %s pool at %d workers (requested %d, %d MB usable).", mode, workers, requested, usable_mb)
+    return workers
+
+
+def create_pool(mode: PoolMode, max_workers: int) -> Executor:
+    """Create a thread or process pool sized by `worker_limit`."""
+    workers = worker_limit(mode, max_workers)
+    if mode == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def gather(futures: Mapping[str, Future[T]]) -> tuple[dict[str, T], dict[str, str]]:
+    """Wait for per-symbol futures, separating results from errors.
+
+    Args:
+        futures: Symbol → future, in the order results should be returned.
+
+    Returns:
+        Tuple of (symbol → result, symbol → error message), both in the
+        order of `futures`.
+    """
+    results: dict[str, T] = {}
+    errors: dict[str, str] = {}
+    for symbol, future in futures.items():
+        try:
+            results[symbol] = future.result()
+        except Exception as exc:
+            logger.error("Failed to process %s: %s", symbol, exc)
+            errors[symbol] = str(exc) or type(exc).__name__
+    return results, errors
@@ -2,5 +2,6 @@
 
 from .base import LLMProvider, LLMResponse
 from .factory import get_llm
+from .tokens import TokenUsage, clip_text, estimate_tokens
 
-__all__ = ["LLMProvider", "LLMResponse", "get_llm"]
+__all__ = ["LLMProvider", "LLMResponse", "get_llm", "TokenUsage", "clip_text", "estimate_tokens"]
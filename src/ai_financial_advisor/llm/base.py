@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+from .tokens import estimate_tokens
+
 
 @dataclass
 class LLMResponse:
@@ -22,6 +24,10 @@ class LLMProvider(ABC):
     the application is decoupled from any specific LLM vendor.
     """
 
+    # Tokenizer ratios behind count_tokens; providers adjust them to their vendor's tokenizer
+    chars_per_token: float = 4.0
+    tokens_per_cjk_char: float = 1.0
+
     @abstractmethod
     def complete(
         self,
@@ -41,6 +47,10 @@ class LLMProvider(ABC):
             LLMResponse with the generated content.
         """
 
+    def count_tokens(self, text: str) -> int:
+        """Estimated number of tokens `text` takes in this provider's prompts."""
+        return estimate_tokens(text, self.chars_per_token, self.tokens_per_cjk_char)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -16,6 +16,10 @@ class ClaudeProvider(LLMProvider):
     Claude requires system prompts to be passed separately.
     """
 
+    # Claude's tokenizer splits text a little finer than OpenAI's
+    chars_per_token = 3.5
+    tokens_per_cjk_char = 1.2
+
     def __init__(self, api_key: str, model: str = "claude-sonnet-4-6") -> None:
         self._model = model
         self._client = anthropic.Anthropic(api_key=api_key)
@@ -29,6 +29,10 @@ class OpenAIProvider(LLMProvider):
         self._model = model
         self._client = OpenAI(api_key=api_key, base_url=base_url)
         self._base_url = base_url
+        if self._is_deepseek:
+            # DeepSeek's published ratios: ~0.3 tokens per English character, ~0.6 per Chinese one
+            self.chars_per_token = 3.3
+            self.tokens_per_cjk_char = 0.6
 
     def complete(
         self,
@@ -63,7 +67,9 @@ class OpenAIProvider(LLMProvider):
 
     @property
     def name(self) -> str:
-        label = "OpenAI"
-        if self._base_url and "deepseek" in self._base_url:
-            label = "DeepSeek"
+        label = "DeepSeek" if self._is_deepseek else "OpenAI"
         return f"{label} ({self._model})"
+
+    @property
+    def _is_deepseek(self) -> bool:
+        return bool(self._base_url and "deepseek" in self._base_url)
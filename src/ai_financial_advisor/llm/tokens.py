@@ -0,0 +1,118 @@
+"""Token estimates, sentence-aware clipping and per-stage token accounting.
+
+Providers tokenize differently and exact counts would need each vendor's
+tokenizer (or an API call), so prompts are sized with an estimate: about
+four characters per token for alphabetic text and about one token per
+CJK character. Each provider can adjust the ratios
+(`LLMProvider.count_tokens`); the counts the provider reports after a
+call are recorded next to the estimate.
+"""
+
+import logging
+import math
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+_CJK_RANGES = "\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef"
+_CJK = re.compile(f"[{_CJK_RANGES}]")
+# Where a text may be clipped: after sentence punctuation (and closing quotes), or at a line break
+_SENTENCE_BREAK = re.compile(r"[.!?;:][\"'”’)\]]*(?=\s)|[。！？；][”’」』）]*|\n")
+# Fallback cuts inside an overlong sentence: before a space, or after a CJK character
+_WORD_BREAK = re.compile(rf"(?=\s)|(?<=[{_CJK_RANGES}])")
+_ELLIPSIS = "…"
+
+
+def estimate_tokens(text: str, chars_per_token: float = 4.0, tokens_per_cjk: float = 1.0) -> int:
+    """Estimated token count of a text.
+
+    Args:
+        text: Text to measure.
+        chars_per_token: Characters per token outside CJK scripts.
+        tokens_per_cjk: Tokens per CJK character.
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK.findall(text))
+    return math.ceil((len(text) - cjk) / chars_per_token + cjk * tokens_per_cjk)
+
+
+def clip_text(text: str, max_tokens: int, count: Callable[[str], int] = estimate_tokens) -> str:
+    """The longest prefix of whole sentences (or lines) within `max_tokens`.
+
+    Only when the first sentence alone is too long is it cut, between
+    words (or CJK characters), and marked with an ellipsis.
+
+    Args:
+        text: Text to clip.
+        max_tokens: Token budget.
+        count: Token counter, e.g. `LLMProvider.count_tokens`.
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    if count(text) <= max_tokens:
+        return text
+    clipped = _longest_fit(text, [m.end() for m in _SENTENCE_BREAK.finditer(text)], max_tokens, count)
+    if clipped:
+        return clipped
+    return _longest_fit(text, [m.start() for m in _WORD_BREAK.finditer(text)], max_tokens, count, _ELLIPSIS)
+
+
+def _longest_fit(text: str, cuts: list[int], max_tokens: int, count: Callable[[str], int], suffix: str = "") -> str:
+    """The longest ``text[:cut] + suffix`` within the budget, or "" if none fits."""
+    best = ""
+    # Token counts only grow with the prefix, so the longest fitting cut is found by bisection
+    lo, hi = 0, len(cuts) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        prefix = text[: cuts[mid]].rstrip()
+        if prefix and count(prefix + suffix) <= max_tokens:
+            best, lo = prefix + suffix, mid + 1
+        else:
+            hi = mid - 1
+    return best
+
+
+@dataclass
+class TokenUsage:
+    """Tokens used by one pipeline stage (one LLM call)."""
+
+    stage: str
+    budget: int | None  # prompt token budget, None if the prompt is not budgeted
+    estimated: int  # estimated prompt tokens, system prompt included
+    prompt_tokens: int | None = None  # as reported by the provider
+    completion_tokens: int | None = None
+    items: dict[str, int] = field(default_factory=dict)  # e.g. stories detailed / listed / dropped
+
+    @classmethod
+    def record(
+        cls,
+        stage: str,
+        budget: int | None,
+        estimated: int,
+        reported: dict[str, int],
+        **items: int,
+    ) -> "TokenUsage":
+        """Build and log the usage of a completed call.
+
+        Args:
+            stage: Pipeline stage name.
+            budget: Prompt token budget, if any.
+            estimated: Estimated prompt tokens.
+            reported: The provider's counts (`LLMResponse.usage`).
+            **items: Counts of what the prompt held, in display order.
+        """
+        usage = cls(stage, budget, estimated, reported.get("prompt_tokens"), reported.get("completion_tokens"), items)
+        logger.info("Tokens used by %s: %s", stage, usage.summary())
+        return usage
+
+    def summary(self) -> str:
+        """One-line description, e.g. ``~2,110 of 4,000 budgeted in; 1,874 in / 412 out``."""
+        parts = [f"~{self.estimated:,} of {self.budget:,} budgeted in" if self.budget else f"~{self.estimated:,} in"]
+        if self.prompt_tokens is not None:
+            parts.append(f"{self.prompt_tokens:,} in / {self.completion_tokens or 0:,} out")
+        if self.items:
+            parts.append(", ".join(f"{count} {name.replace('_', ' ')}" for name, count in self.items.items()))
+        return "; ".join(parts)
@@ -1,8 +1,9 @@
 """Alert manager — orchestrates anomaly detection and notification dispatch."""
 
 import logging
-from datetime import date
+from datetime import date, datetime, timedelta
 
+from ..data.storage.score_store import ScoreStore
 from .base import Notifier
 
 logger = logging.getLogger(__name__)
@@ -30,25 +31,17 @@ class AlertManager:
             Number of anomalies found.
         """
         from ..analysis.anomaly import AnomalyDetector
-        from ..data.stock_data import download_stock_data
+        from ..analysis.panel import to_panel
+        from ..data.stock_data import download_many
 
         detector = AnomalyDetector(z_threshold=threshold)
-        all_anomalies = []
-
-        for symbol in symbols:
-            try:
-                df = download_stock_data(symbol, period="6mo")
-                anomalies = detector.get_recent_anomalies(df, symbol, days=days)
-                all_anomalies.extend(anomalies)
-            except Exception:
-                logger.exception("Failed to check %s", symbol)
+        frames = download_many(symbols, period="6mo")
+        all_anomalies = detector.get_recent_anomalies_panel(to_panel(frames), days=days) if frames else []
 
         if not all_anomalies:
             logger.info("No anomalies detected for %s", ", ".join(symbols))
             return 0
 
-        all_anomalies.sort(key=lambda a: a.date, reverse=True)
-
         lines = [f"🚨 *{len(all_anomalies)} Anomalies Detected*\n"]
         for a in all_anomalies:
             emoji = {"critical": "🔴", "alert": "🟡", "warning": "⚪"}.get(a.severity, "⚪")
@@ -63,31 +56,52 @@ class AlertManager:
         self,
         symbols: list[str],
         period: str = "6mo",
+        scores: ScoreStore | None = None,
+        max_age: timedelta | None = None,
     ) -> bool:
         """Send a daily digest with trend scores for the given symbols.
 
+        With a score store, recorded scores are reused and only symbols
+        without a recent enough score are analyzed (and recorded); the
+        digest then also lists the biggest score changes since each
+        symbol's previous scan.
+
         Args:
             symbols: List of ticker symbols to analyze.
             period: Data period for analysis.
+            scores: Store of recorded scan results (default: always analyze).
+            max_age: Oldest recorded score to reuse (default: any age).
 
         Returns:
             True if the digest was sent successfully.
         """
-        from ..agents.stock_agent import StockAgent
-
-        agent = StockAgent()
-        results = agent.analyze_multiple(symbols, period=period)
-        results.sort(key=lambda r: r.trend.score, reverse=True)
+        from ..agents.stock_agent import StockAgent, score_records
+
+        records = []
+        if scores is not None:
+            records = scores.latest(symbols, since=datetime.now() - max_age if max_age is not None else None)
+        recorded = {r.symbol for r in records}
+        missing = [s for s in symbols if s not in recorded]
+        if missing:
+            fresh = score_records(StockAgent().analyze_multiple(missing, period=period))
+            if scores is not None and fresh:
+                scores.record_run(fresh)
+            records.extend(fresh)
+        records.sort(key=lambda r: r.score, reverse=True)
 
         lines = [f"📊 *Daily Market Digest — {date.today()}*\n"]
         lines.append(f"`{'Symbol':<10} {'Close':>10} {'Score':>8} {'Signal':<10}`")
         lines.append("`" + "-" * 42 + "`")
 
-        for r in results:
-            emoji = {"Bullish": "🟢", "Bearish": "🔴"}.get(r.trend.interpretation, "⚪")
-            lines.append(
-                f"`{r.symbol:<10} {r.latest_close:>10.2f} {r.trend.score:>+7.4f}` {emoji} {r.trend.interpretation}"
-            )
+        for r in records:
+            emoji = {"Bullish": "🟢", "Bearish": "🔴"}.get(r.interpretation, "⚪")
+            lines.append(f"`{r.symbol:<10} {r.close:>10.2f} {r.score:>+7.4f}` {emoji} {r.interpretation}")
+
+        movers = scores.top_movers(limit=5, symbols=symbols) if scores is not None else []
+        if movers:
+            lines.append("\n*Top Movers*")
+            for m in movers:
+                lines.append(f"`{m.symbol:<10} {m.previous_score:>+7.4f} → {m.score:>+7.4f}` ({m.change:+.4f})")
 
         message = "\n".join(lines)
         return self._notifier.send_long(message)
@@ -5,12 +5,16 @@ total return, Sharpe ratio, max drawdown, and win rate.
 """
 
 import logging
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 
-from .trend_strategy import Signal
+from ..analysis.trend_score import round4
+from ..data.market_types import TRADING_DAYS_PER_YEAR
+from .execution import ExecutionModel
+from .trend_strategy import Signal, TrendScoreStrategy
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +47,227 @@ class BacktestResult:
     total_trades: int
     trades: list[Trade]
     equity_curve: pd.Series  # daily portfolio value
+    total_costs: float = 0.0  # commission, slippage and spread paid
+
+
+# Metric arrays computed by `Simulation.metrics`, in `BacktestResult` units
+METRIC_COLUMNS = (
+    "final_value",
+    "total_return",
+    "annualized_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "win_rate",
+    "total_trades",
+)
+
+
+@dataclass
+class Simulation:
+    """Array state of one or more all-in/all-out backtest paths.
+
+    Arrays are days × paths (one column per path, e.g. per threshold pair
+    in a sweep); per-trade tables are paths × trades, NaN-padded.
+    """
+
+    holding: np.ndarray
+    entries: np.ndarray
+    exits: np.ndarray
+    equity: np.ndarray
+    buy_prices: np.ndarray  # fill prices, after slippage and spread
+    sell_prices: np.ndarray
+    shares: np.ndarray  # 0 where not even one lot was affordable
+    trade_returns: np.ndarray  # percent, net of costs; NaN unless closed and filled
+    costs: np.ndarray  # commission + slippage + spread paid per trade
+    n_entries: np.ndarray
+    n_exits: np.ndarray
+    final_value: np.ndarray
+
+    def metrics(
+        self, initial_capital: float, years: float | None, periods_per_year: float = TRADING_DAYS_PER_YEAR
+    ) -> dict[str, np.ndarray]:
+        """Unrounded per-path metrics keyed by `METRIC_COLUMNS`.
+
+        Args:
+            initial_capital: Starting portfolio value.
+            years: Length of the backtest in years, or None for fewer than
+                two days (annualized return is then 0).
+            periods_per_year: Bars per year, for annualizing the Sharpe
+                ratio (see `market_types.bars_per_year`).
+        """
+        ratio = self.final_value / initial_capital
+        annualized = (ratio ** (1 / years) - 1) * 100 if years is not None else np.zeros_like(ratio)
+
+        wins = (self.trade_returns > 0).sum(axis=1)
+        trades = (~np.isnan(self.trade_returns)).sum(axis=1)
+        win_rate = np.divide(wins, trades, out=np.zeros(len(wins)), where=trades > 0) * 100
+
+        return {
+            "final_value": self.final_value,
+            "total_return": (ratio - 1) * 100,
+            "annualized_return": annualized,
+            "sharpe_ratio": sharpe_ratios(self.equity, periods_per_year),
+            "max_drawdown": max_drawdowns(self.equity),
+            "win_rate": win_rate,
+            "total_trades": trades,
+        }
+
+
+def positions(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """Whether a position is held after each day, along axis 0.
+
+    Buys open a position when flat and sells close it when holding, so the
+    position only depends on whether the latest buy or sell was a buy. A
+    day with both signals counts as a buy.
+
+    Args:
+        buy: Boolean buy signals, days first.
+        sell: Boolean sell signals, same shape.
+
+    Returns:
+        Boolean array shaped like `buy`.
+    """
+    buy = np.asarray(buy, dtype=bool)
+    signalled = buy | sell
+    rows = np.arange(len(buy)).reshape((-1,) + (1,) * (buy.ndim - 1))
+    last_signal = np.where(signalled, rows, -1)
+    np.maximum.accumulate(last_signal, axis=0, out=last_signal)
+    return np.take_along_axis(buy, np.maximum(last_signal, 0), axis=0) & (last_signal >= 0)
+
+
+def simulate(
+    prices: np.ndarray,
+    buy: np.ndarray,
+    sell: np.ndarray,
+    initial_capital: float = 100000,
+    execution: ExecutionModel | None = None,
+    bars: Mapping[str, np.ndarray] | None = None,
+) -> Simulation:
+    """Simulate all-in/all-out trading on raw arrays.
+
+    A buy signal invests all capital when flat, a sell signal liquidates
+    when holding, anything else is a no-op (see `positions`). Trades are
+    then replayed with the same float operations a per-signal
+    loop would use, so results do not depend on how paths are batched.
+
+    Args:
+        prices: Prices per day, shape (n,).
+        buy: Buy signals, shape (n,) or (n, paths).
+        sell: Sell signals, same shape as `buy`; ignored where `buy` is set.
+        initial_capital: Starting portfolio value.
+        execution: Fill and cost model (default: close fills, no costs).
+        bars: Open, High and Low arrays aligned with `prices`, for
+            execution models that need them.
+
+    Returns:
+        Simulation with days × paths arrays (a single path for 1-D signals).
+    """
+    execution = execution or ExecutionModel()
+    reference, buy_fills, sell_fills = execution.fill_prices(prices, bars)
+    if buy.ndim == 1:
+        buy, sell = buy[:, None], sell[:, None]
+    if execution.fill == "next_open":
+        # Orders go in at the close and fill at the next day's open
+        buy, sell = _next_day(buy), _next_day(sell)
+    n, width = buy.shape
+    price_column = prices[:, None]
+
+    holding = positions(buy, sell)
+    previous = np.zeros_like(holding)
+    previous[1:] = holding[:-1]
+    entries = holding & ~previous
+    exits = previous & ~holding
+
+    # Trade k of each path, in date order (column-major nonzero)
+    entry_cols, entry_rows = np.nonzero(entries.T)
+    exit_cols, exit_rows = np.nonzero(exits.T)
+    n_entries = np.bincount(entry_cols, minlength=width)
+    n_exits = np.bincount(exit_cols, minlength=width)
+    max_trades = int(n_entries.max()) if width else 0
+
+    def by_trade(cols: np.ndarray, rows: np.ndarray, counts: np.ndarray, values: np.ndarray) -> np.ndarray:
+        table = np.full((width, max_trades), np.nan)
+        starts = np.cumsum(counts) - counts
+        table[cols, np.arange(len(cols)) - starts[cols]] = values[rows]
+        return table
+
+    buy_prices = by_trade(entry_cols, entry_rows, n_entries, buy_fills)
+    sell_prices = by_trade(exit_cols, exit_rows, n_exits, sell_fills)
+    buy_reference = by_trade(entry_cols, entry_rows, n_entries, reference)
+    sell_reference = by_trade(exit_cols, exit_rows, n_exits, reference)
+
+    # Replay the trades in sequence: shares = capital / buy, capital = shares * sell,
+    # less commission, and any cash left over from rounding to whole lots
+    capital = np.empty((width, max_trades + 1))
+    capital[:, 0] = initial_capital
+    shares = np.zeros((width, max_trades))
+    cash = np.zeros((width, max_trades))
+    buy_fees = np.zeros((width, max_trades))
+    sell_fees = np.zeros((width, max_trades))
+    for k in range(max_trades):
+        # Paths without a k-th trade carry NaN prices, so their shares come out NaN
+        budget = capital[:, k]
+        exact = execution.max_notional(budget) / buy_prices[:, k]
+        bought = execution.round_shares(exact)
+        spent = bought * buy_prices[:, k]
+        buy_fees[:, k] = np.where(bought > 0, execution.commission(spent), 0.0)
+        cash[:, k] = np.where(bought < exact, budget - spent - buy_fees[:, k], 0.0)
+        shares[:, k] = bought
+
+        proceeds = bought * sell_prices[:, k]
+        sell_fees[:, k] = np.where(bought > 0, execution.commission(proceeds), 0.0)
+        capital[:, k + 1] = np.where(k < n_exits, proceeds - sell_fees[:, k] + cash[:, k], budget)
+    np.nan_to_num(shares, copy=False)
+    sell_fees[np.isnan(sell_prices)] = 0.0
+
+    # Per-share prices after commission give each round trip's net return
+    filled = shares > 0
+    closed = np.arange(max_trades)[None, :] < n_exits[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        net_buy = buy_prices + np.where(filled, buy_fees / shares, 0.0)
+        net_sell = sell_prices - np.where(filled, sell_fees / shares, 0.0)
+        trade_returns = np.where(closed & filled, round4((net_sell - net_buy) / net_buy * 100), np.nan)
+    costs = np.where(filled, buy_fees + shares * (buy_prices - buy_reference), 0.0)
+    costs = costs + np.where(closed & filled, sell_fees + shares * (sell_reference - sell_prices), 0.0)
+
+    # Daily equity is cash + shares * price while holding, capital otherwise
+    columns = np.arange(width)[None, :]
+    closed_trades = np.cumsum(exits, axis=0)
+    if max_trades:
+        current = np.maximum(np.cumsum(entries, axis=0) - 1, 0)
+        held, spare = shares[columns, current], cash[columns, current]
+    else:
+        held = spare = np.zeros((n, width))
+    equity = np.where(holding, spare + held * price_column, capital[columns, closed_trades] + 0.0 * price_column)
+    equity = np.asfortranarray(equity)
+
+    # An open position is marked to market at the last price
+    final_value = capital[np.arange(width), n_exits]
+    if n:
+        final_value = np.where(n_entries > n_exits, equity[-1], final_value)
+    final_value = np.where(final_value > 0, final_value, float(initial_capital))
+
+    return Simulation(
+        holding=holding,
+        entries=entries,
+        exits=exits,
+        equity=equity,
+        buy_prices=buy_prices,
+        sell_prices=sell_prices,
+        shares=shares,
+        trade_returns=trade_returns,
+        costs=costs,
+        n_entries=n_entries,
+        n_exits=n_exits,
+        final_value=final_value,
+    )
+
+
+def _next_day(signals: np.ndarray) -> np.ndarray:
+    """Move signals one day later; the last day's signals are dropped."""
+    shifted = np.zeros_like(signals)
+    shifted[1:] = signals[:-1]
+    return shifted
 
 
 class Backtester:
@@ -50,10 +275,20 @@ class Backtester:
 
     Args:
         initial_capital: Starting portfolio value (default: 100000).
+        execution: Fill and cost model (default: close fills, no costs).
+        periods_per_year: Bars per year for the Sharpe ratio (default:
+            252 daily bars; see `market_types.bars_per_year` for intraday).
     """
 
-    def __init__(self, initial_capital: float = 100000) -> None:
+    def __init__(
+        self,
+        initial_capital: float = 100000,
+        execution: ExecutionModel | None = None,
+        periods_per_year: float = TRADING_DAYS_PER_YEAR,
+    ) -> None:
         self._initial_capital = initial_capital
+        self._execution = execution or ExecutionModel()
+        self._periods_per_year = periods_per_year
 
     def run(
         self,
@@ -64,6 +299,7 @@ class Backtester:
         """Execute a backtest from a list of trading signals.
 
         Simple model: all-in on buy, all-out on sell, no partial positions.
+        Adapter over `run_arrays`.
 
         Args:
             signals: List of Signal objects (must be chronologically ordered).
@@ -73,90 +309,229 @@ class Backtester:
         Returns:
             BacktestResult with performance metrics.
         """
-        capital = self._initial_capital
-        shares = 0.0
-        buy_price = 0.0
-        buy_date = None
-        trades: list[Trade] = []
-        equity_values: dict = {}
-
-        for signal in signals:
-            if signal.action == "buy" and shares == 0:
-                # Buy: invest all capital
-                shares = capital / signal.price
-                buy_price = signal.price
-                buy_date = signal.date
-                capital = 0.0
-
-            elif signal.action == "sell" and shares > 0:
-                # Sell: liquidate all shares
-                capital = shares * signal.price
-                ret = (signal.price - buy_price) / buy_price
-                days = (pd.Timestamp(signal.date) - pd.Timestamp(buy_date)).days
-                trades.append(
-                    Trade(
-                        buy_date=buy_date,
-                        buy_price=buy_price,
-                        sell_date=signal.date,
-                        sell_price=signal.price,
-                        return_pct=round(ret * 100, 4),
-                        holding_days=max(days, 1),
-                    )
-                )
-                shares = 0.0
-
-            # Record equity
-            portfolio_value = capital + shares * signal.price
-            equity_values[signal.date] = portfolio_value
-
-        # If still holding, mark to market
-        if shares > 0 and signals:
-            capital = shares * signals[-1].price
-            shares = 0.0
-
-        final_value = capital if capital > 0 else self._initial_capital
-        equity_curve = pd.Series(equity_values)
-
-        # Metrics
-        total_return = (final_value / self._initial_capital - 1) * 100
-
-        # Annualized return
-        if len(signals) >= 2:
-            days = (pd.Timestamp(signals[-1].date) - pd.Timestamp(signals[0].date)).days
-            years = max(days / 365.25, 0.01)
-            annualized = ((final_value / self._initial_capital) ** (1 / years) - 1) * 100
-        else:
-            annualized = 0.0
-
-        # Sharpe ratio (daily returns)
-        sharpe = 0.0
-        if len(equity_curve) > 1:
-            daily_returns = equity_curve.pct_change().dropna()
-            if daily_returns.std() > 0:
-                sharpe = float(daily_returns.mean() / daily_returns.std() * np.sqrt(252))
-
-        # Max drawdown
-        max_drawdown = 0.0
-        if len(equity_curve) > 0:
-            peak = equity_curve.expanding().max()
-            drawdown = (equity_curve - peak) / peak * 100
-            max_drawdown = float(drawdown.min())
-
-        # Win rate
-        wins = sum(1 for t in trades if t.return_pct > 0)
-        win_rate = (wins / len(trades) * 100) if trades else 0.0
+        return self.run_arrays(
+            [s.date for s in signals],
+            np.array([s.price for s in signals], dtype=float),
+            np.array([s.action for s in signals], dtype=object),
+            symbol=symbol,
+            period=period,
+        )
+
+    def run_frame(
+        self,
+        signals: pd.DataFrame,
+        symbol: str = "",
+        period: str = "",
+        bars: pd.DataFrame | None = None,
+    ) -> BacktestResult:
+        """Execute a backtest from a signal frame.
+
+        Args:
+            signals: DataFrame indexed by date with price and action columns
+                (e.g. `TrendScoreStrategy.generate_signal_frame`).
+            symbol: Symbol name for the result.
+            period: Period description for the result.
+            bars: OHLC frame the signals came from, for execution models
+                that fill at the open or estimate the spread.
+
+        Returns:
+            BacktestResult with performance metrics.
+        """
+        if bars is not None:
+            bars = bars.reindex(signals.index)
+        return self.run_arrays(
+            signals.index,
+            signals["price"].to_numpy(dtype=float),
+            signals["action"].to_numpy(),
+            symbol=symbol,
+            period=period,
+            bars=bars,
+        )
+
+    def run_arrays(
+        self,
+        dates: Sequence[object] | pd.Index,
+        prices: np.ndarray,
+        actions: np.ndarray,
+        symbol: str = "",
+        period: str = "",
+        bars: Mapping[str, np.ndarray] | pd.DataFrame | None = None,
+    ) -> BacktestResult:
+        """Execute a backtest from parallel date, price and action arrays.
+
+        Args:
+            dates: Signal dates in chronological order.
+            prices: Prices on those dates.
+            actions: "buy", "sell" or "hold" per date.
+            symbol: Symbol name for the result.
+            period: Period description for the result.
+            bars: Open, High and Low values aligned with `dates`, if the
+                execution model needs them.
+
+        Returns:
+            BacktestResult with performance metrics.
+        """
+        dates = pd.Index(dates)
+        prices = np.asarray(prices, dtype=float)
+        actions = np.asarray(actions)
+        if bars is not None:
+            bars = {field: np.asarray(bars[field], dtype=float) for field in ("Open", "High", "Low")}
+        sim = simulate(prices, actions == "buy", actions == "sell", self._initial_capital, self._execution, bars)
+        metrics = sim.metrics(self._initial_capital, backtest_years(dates), self._periods_per_year)
+        metrics = {name: values[0] for name, values in metrics.items()}
+
+        # Trade ledger: closed round trips that bought at least one lot
+        exit_rows = np.flatnonzero(sim.exits[:, 0])
+        entry_rows = np.flatnonzero(sim.entries[:, 0])[: len(exit_rows)]
+        filled = sim.shares[0, : len(exit_rows)] > 0
+        entry_rows, exit_rows = entry_rows[filled], exit_rows[filled]
+        buy_dates, sell_dates = dates[entry_rows], dates[exit_rows]
+        holding_days = (pd.DatetimeIndex(sell_dates) - pd.DatetimeIndex(buy_dates)).days
+        buy_prices = sim.buy_prices[0, : len(filled)][filled]
+        sell_prices = sim.sell_prices[0, : len(filled)][filled]
+        returns = sim.trade_returns[0, : len(filled)][filled]
+        trades = [
+            Trade(
+                buy_date=buy_date,
+                buy_price=buy_price,
+                sell_date=sell_date,
+                sell_price=sell_price,
+                return_pct=ret,
+                holding_days=max(days, 1),
+            )
+            for buy_date, buy_price, sell_date, sell_price, ret, days in zip(
+                buy_dates,
+                buy_prices.tolist(),
+                sell_dates,
+                sell_prices.tolist(),
+                returns.tolist(),
+                holding_days.tolist(),
+            )
+        ]
 
         return BacktestResult(
             symbol=symbol,
             period=period,
             initial_capital=self._initial_capital,
-            final_value=round(final_value, 2),
-            total_return=round(total_return, 4),
-            annualized_return=round(annualized, 4),
-            sharpe_ratio=round(sharpe, 4),
-            max_drawdown=round(max_drawdown, 4),
-            win_rate=round(win_rate, 2),
+            final_value=round(float(metrics["final_value"]), 2),
+            total_return=round(float(metrics["total_return"]), 4),
+            annualized_return=round(float(metrics["annualized_return"]), 4),
+            sharpe_ratio=round(float(metrics["sharpe_ratio"]), 4),
+            max_drawdown=round(float(metrics["max_drawdown"]), 4),
+            win_rate=round(float(metrics["win_rate"]), 2),
             total_trades=len(trades),
             trades=trades,
-            equity_curve=equity_curve,
+            equity_curve=pd.Series(sim.equity[:, 0], index=dates),
+            total_costs=round(float(sim.costs[0].sum()), 2),
         )
+
+
+def backtest_symbol(
+    df: pd.DataFrame,
+    strategy: TrendScoreStrategy,
+    backtester: Backtester,
+    symbol: str = "",
+    period: str = "",
+) -> BacktestResult | None:
+    """Generate signals for one symbol's OHLCV data and backtest them.
+
+    Module-level so it can be shipped to a process pool.
+
+    Returns:
+        BacktestResult, or None if there is not enough data for signals.
+    """
+    signals = strategy.generate_signal_frame(df)
+    if signals.empty:
+        return None
+    return backtester.run_frame(signals, symbol=symbol, period=period, bars=df)
+
+
+def backtest_tables(results: Sequence[BacktestResult]) -> dict[str, pd.DataFrame]:
+    """Flatten backtest results into tables for `ParquetStore`.
+
+    Args:
+        results: Results of one backtest run.
+
+    Returns:
+        ``"backtests"``: one row of metrics per symbol; ``"equity"``: the
+        equity curves as (symbol, timestamp, equity) rows; ``"trades"``:
+        one row per round trip.
+    """
+    backtests = pd.DataFrame(
+        {
+            "symbol": [r.symbol for r in results],
+            "period": [r.period for r in results],
+            "initial_capital": [float(r.initial_capital) for r in results],
+            **{name: [getattr(r, name) for r in results] for name in METRIC_COLUMNS},
+            "total_costs": [r.total_costs for r in results],
+        }
+    )
+    curves = [
+        pd.DataFrame(
+            {
+                "symbol": r.symbol,
+                "timestamp": pd.DatetimeIndex(r.equity_curve.index),
+                "equity": r.equity_curve.to_numpy(),
+            }
+        )
+        for r in results
+        if not r.equity_curve.empty
+    ]
+    equity = (
+        pd.concat(curves, ignore_index=True)
+        if curves
+        else pd.DataFrame({"symbol": [], "timestamp": pd.DatetimeIndex([]), "equity": []})
+    )
+    trades = pd.DataFrame(
+        [
+            {
+                "symbol": r.symbol,
+                "buy_date": pd.Timestamp(t.buy_date),
+                "buy_price": t.buy_price,
+                "sell_date": pd.Timestamp(t.sell_date),
+                "sell_price": t.sell_price,
+                "return_pct": t.return_pct,
+                "holding_days": t.holding_days,
+            }
+            for r in results
+            for t in r.trades
+        ],
+        columns=["symbol", "buy_date", "buy_price", "sell_date", "sell_price", "return_pct", "holding_days"],
+    )
+    return {"backtests": backtests, "equity": equity, "trades": trades}
+
+
+def backtest_years(dates: pd.Index) -> float | None:
+    """Backtest length in years for annualizing, None below two dates."""
+    if len(dates) < 2:
+        return None
+    days: int = (pd.Timestamp(dates[-1]) - pd.Timestamp(dates[0])).days
+    return max(days / 365.25, 0.01)
+
+
+def sharpe_ratios(equity: np.ndarray, periods_per_year: float = TRADING_DAYS_PER_YEAR) -> np.ndarray:
+    """Annualized Sharpe of per-bar equity returns per column, 0 without variance.
+
+    Column-major reductions follow pandas' summation order, so each column
+    is bit-identical to ``pct_change().dropna()`` mean / std on a Series.
+    """
+    sharpe = np.zeros(equity.shape[1])
+    if len(equity) < 3:
+        # Fewer than two returns: the sample std is undefined
+        return sharpe
+    returns = np.asfortranarray(equity[1:] / equity[:-1] - 1)
+    count = len(returns)
+    mean = returns.sum(axis=0) / count
+    std = np.sqrt(((mean - returns) ** 2).sum(axis=0) / (count - 1))
+    positive = std > 0
+    sharpe[positive] = mean[positive] / std[positive] * np.sqrt(periods_per_year)
+    return sharpe
+
+
+def max_drawdowns(equity: np.ndarray) -> np.ndarray:
+    """Worst peak-to-trough drop per column, in percent (0 without data)."""
+    if len(equity) == 0:
+        return np.zeros(equity.shape[1])
+    peak = np.maximum.accumulate(equity, axis=0)
+    drawdown: np.ndarray = ((equity - peak) / peak * 100).min(axis=0)
+    return drawdown
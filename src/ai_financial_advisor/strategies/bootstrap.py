@@ -0,0 +1,249 @@
+"""Bootstrap robustness checks for backtest results.
+
+A `BacktestResult` is one draw of history: its Sharpe ratio and drawdown
+say nothing about how much they owe to luck. `Bootstrapper` resamples the
+daily returns of the equity curve (and separately the trade returns)
+thousands of times and reports confidence intervals for each metric.
+
+Two resampling methods are supported:
+
+- ``block``: circular block bootstrap. Returns are drawn in runs of
+  `block_size` consecutive days, which keeps short-range autocorrelation
+  (volatility clusters) intact. Use a block size of 1 for the plain iid
+  bootstrap.
+- ``shuffle``: random permutation of the observed returns. Total return
+  and Sharpe are order-independent, so only path metrics (drawdown)
+  vary; this isolates how much the drawdown depends on the ordering.
+
+Replicates are computed as a (replicates × days) matrix, in chunks sized
+to `memory_mb`. Each group of 64 replicates draws from its own child of
+the seed, so a seeded run gives the same replicates whatever the memory
+budget.
+"""
+
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from ..data.market_types import TRADING_DAYS_PER_YEAR
+from .backtester import BacktestResult, Trade, max_drawdowns, sharpe_ratios
+
+BOOTSTRAP_METHODS = ("block", "shuffle")
+
+# Metrics resampled from the equity curve and from the trade list
+EQUITY_METRICS = ("total_return", "sharpe_ratio", "max_drawdown")
+TRADE_METRICS = ("total_return", "max_drawdown", "win_rate")
+
+# Replicates drawn from one child seed; chunks are whole groups
+_SEED_GROUP = 64
+
+# Float (replicates × days) arrays alive at once while scoring a chunk
+_TEMPORARIES = 6
+
+# (growth, returns), both days × replicates → metric name → per-replicate values
+MetricFunction = Callable[[np.ndarray, np.ndarray], dict[str, np.ndarray]]
+
+
+@dataclass
+class BootstrapResult:
+    """Resampled distribution of a set of metrics.
+
+    Attributes:
+        method: Resampling method ("block" or "shuffle").
+        replicates: Number of replicates drawn.
+        confidence: Confidence level of the intervals (e.g. 0.95).
+        intervals: One row per metric with the observed value and the
+            lower, median and upper percentiles of the replicates.
+        samples: One row per replicate, one column per metric.
+    """
+
+    method: str
+    replicates: int
+    confidence: float
+    intervals: pd.DataFrame
+    samples: pd.DataFrame
+
+    @property
+    def probability_of_loss(self) -> float:
+        """Share of replicates that end with a negative total return."""
+        return float((self.samples["total_return"] < 0).mean())
+
+
+@dataclass
+class RobustnessReport:
+    """Bootstrap results for one backtest."""
+
+    equity: BootstrapResult
+    trades: BootstrapResult | None  # None without completed trades
+
+
+class Bootstrapper:
+    """Resamples backtest returns to put confidence intervals on metrics.
+
+    Args:
+        replicates: Number of resampled histories (default: 1000).
+        method: One of `BOOTSTRAP_METHODS`.
+        block_size: Days per block for the equity curve (block method).
+        trade_block_size: Trades per block for the trade list (block
+            method); 1 treats trades as independent.
+        confidence: Two-sided confidence level of the intervals.
+        seed: Seed for reproducible runs; None draws fresh entropy.
+        memory_mb: Budget for the replicate matrices of one chunk.
+        periods_per_year: Bars per year for the Sharpe ratio; match the
+            backtest (see `market_types.bars_per_year` for intraday).
+
+    Raises:
+        ValueError: If an argument is out of range.
+    """
+
+    def __init__(
+        self,
+        replicates: int = 1000,
+        method: str = "block",
+        block_size: int = 20,
+        trade_block_size: int = 1,
+        confidence: float = 0.95,
+        seed: int | None = None,
+        memory_mb: int = 256,
+        periods_per_year: float = TRADING_DAYS_PER_YEAR,
+    ) -> None:
+        if method not in BOOTSTRAP_METHODS:
+            raise ValueError(f"Unknown bootstrap method: {method}. Options: {', '.join(BOOTSTRAP_METHODS)}")
+        if replicates < 1 or block_size < 1 or trade_block_size < 1:
+            raise ValueError("Replicates and block sizes must be at least 1")
+        if not 0 < confidence < 1:
+            raise ValueError(f"Confidence must be between 0 and 1, got {confidence}")
+        self._replicates = replicates
+        self._method = method
+        self._block_size = block_size
+        self._trade_block_size = trade_block_size
+        self._confidence = confidence
+        self._seed = seed
+        self._memory_mb = memory_mb
+        self._periods_per_year = periods_per_year
+
+    def run(self, result: BacktestResult) -> RobustnessReport:
+        """Bootstrap both the equity curve and the trade list of a backtest."""
+        trades = self.trades(result.trades) if result.trades else None
+        return RobustnessReport(equity=self.equity(result.equity_curve), trades=trades)
+
+    def equity(self, equity_curve: pd.Series) -> BootstrapResult:
+        """Resample the daily returns of an equity curve.
+
+        Observed values equal the (unrounded) `BacktestResult` metrics of
+        the curve when `periods_per_year` matches the backtest's bars.
+
+        Args:
+            equity_curve: Daily portfolio values.
+
+        Returns:
+            BootstrapResult over `EQUITY_METRICS`.
+
+        Raises:
+            ValueError: If the curve has fewer than 3 values (2 returns).
+        """
+        values = equity_curve.to_numpy(dtype=np.float64)
+        if len(values) < 3:
+            raise ValueError(f"Need at least 3 equity values to bootstrap, got {len(values)}")
+        returns = values[1:] / values[:-1] - 1
+        metric_fn = partial(_equity_metrics, periods_per_year=self._periods_per_year)
+        observed = metric_fn(values[:, None], returns[:, None])
+        return self._bootstrap(returns, self._block_size, metric_fn, observed)
+
+    def trades(self, trades: Sequence[Trade]) -> BootstrapResult:
+        """Resample the returns of completed round trips.
+
+        Trades are compounded in sequence, so total_return is the growth
+        of capital that stays fully invested trade after trade.
+
+        Args:
+            trades: Completed trades, oldest first.
+
+        Returns:
+            BootstrapResult over `TRADE_METRICS`.
+
+        Raises:
+            ValueError: If there are no trades.
+        """
+        if not trades:
+            raise ValueError("Need at least 1 trade to bootstrap")
+        returns = np.array([t.return_pct for t in trades], dtype=np.float64) / 100
+        growth = np.ones(len(returns) + 1)
+        growth[1:] = np.cumprod(1 + returns)
+        observed = _trade_metrics(growth[:, None], returns[:, None])
+        return self._bootstrap(returns, self._trade_block_size, _trade_metrics, observed)
+
+    def _bootstrap(
+        self,
+        returns: np.ndarray,
+        block_size: int,
+        metric_fn: MetricFunction,
+        observed: dict[str, np.ndarray],
+    ) -> BootstrapResult:
+        n = len(returns)
+        groups = np.random.SeedSequence(self._seed).spawn(math.ceil(self._replicates / _SEED_GROUP))
+        budget = self._memory_mb * 2**20 // (8 * (n + 1) * _TEMPORARIES)
+        chunk_groups = max(1, budget // _SEED_GROUP)
+
+        parts = []
+        for first in range(0, len(groups), chunk_groups):
+            draws = np.concatenate(
+                [
+                    self._draw(returns, block_size, np.random.default_rng(seed), self._group_size(g))
+                    for g, seed in enumerate(groups[first : first + chunk_groups], start=first)
+                ]
+            )
+            growth = np.ones((len(draws), n + 1))
+            np.cumprod(1 + draws, axis=1, out=growth[:, 1:])
+            # Transposed views are days × replicates in column-major order
+            parts.append(metric_fn(growth.T, draws.T))
+        samples = pd.DataFrame({name: np.concatenate([p[name] for p in parts]) for name in observed})
+
+        tail = (1 - self._confidence) / 2 * 100
+        lower, median, upper = np.percentile(samples.to_numpy(), [tail, 50, 100 - tail], axis=0)
+        intervals = pd.DataFrame(
+            {
+                "observed": [float(v[0]) for v in observed.values()],
+                "lower": lower,
+                "median": median,
+                "upper": upper,
+            },
+            index=list(observed),
+        )
+        return BootstrapResult(self._method, self._replicates, self._confidence, intervals, samples)
+
+    def _group_size(self, group: int) -> int:
+        return min(_SEED_GROUP, self._replicates - group * _SEED_GROUP)
+
+    def _draw(self, returns: np.ndarray, block_size: int, rng: np.random.Generator, count: int) -> np.ndarray:
+        """One (count × days) matrix of resampled returns."""
+        n = len(returns)
+        if self._method == "shuffle":
+            return rng.permuted(np.tile(returns, (count, 1)), axis=1)
+        block = min(block_size, n)
+        starts = rng.integers(0, n, size=(count, -(-n // block)))
+        rows = (starts[:, :, None] + np.arange(block)) % n
+        draws: np.ndarray = returns[rows.reshape(count, -1)[:, :n]]
+        return draws
+
+
+def _equity_metrics(
+    growth: np.ndarray, returns: np.ndarray, periods_per_year: float = TRADING_DAYS_PER_YEAR
+) -> dict[str, np.ndarray]:
+    return {
+        "total_return": (growth[-1] / growth[0] - 1) * 100,
+        "sharpe_ratio": sharpe_ratios(growth, periods_per_year),
+        "max_drawdown": max_drawdowns(growth),
+    }
+
+
+def _trade_metrics(growth: np.ndarray, returns: np.ndarray) -> dict[str, np.ndarray]:
+    return {
+        "total_return": (growth[-1] / growth[0] - 1) * 100,
+        "max_drawdown": max_drawdowns(growth),
+        "win_rate": (returns > 0).mean(axis=0) * 100,
+    }
@@ -0,0 +1,174 @@
+"""Execution models — how backtest orders fill and what they cost.
+
+`simulate` asks an `ExecutionModel` four questions, each answered for
+all paths of a trade at once (or, from the intraday backtester, for a
+single fill; scalars are accepted wherever arrays are):
+
+- `fill_prices`: the price each day's buy and sell orders fill at (the
+  close or the next open, moved by slippage and half the estimated
+  bid-ask spread);
+- `max_notional`: how much can be bought with some capital once
+  commission is paid;
+- `round_shares`: the quantity actually bought (whole board lots);
+- `commission`: the fee for a trade's notional.
+
+Subclass and override any of them to plug in another cost structure.
+The default model fills at the close with no costs and fractional
+shares, which is exactly the original backtester.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..data.market_types import get_lot_size
+
+FillTiming = Literal["close", "next_open"]
+
+FILL_TIMINGS = ("close", "next_open")
+
+
+@dataclass(frozen=True)
+class ExecutionModel:
+    """Commission, slippage, spread, fill timing and lot size.
+
+    Attributes:
+        commission_bps: Commission rate in basis points of notional.
+        commission_tiers: Marginal commission brackets as ``(from
+            notional, bps)`` pairs, starting at 0: each rate applies to
+            the part of a trade's notional above its threshold, like tax
+            brackets. Overrides `commission_bps` when set.
+        min_commission: Minimum fee per trade, in the asset's currency.
+        slippage_bps: Adverse price move per fill, in basis points.
+        spread_fraction: Share of the day's High-Low range taken as the
+            bid-ask spread; half of it is paid on each side. Needs bars.
+        fill: "close" fills on the signal day's close; "next_open" fills
+            on the next day's open (signals on the last day never fill).
+            Needs bars.
+        lot_size: Shares per board lot, or None for fractional shares.
+    """
+
+    commission_bps: float = 0.0
+    commission_tiers: Sequence[tuple[float, float]] = ()
+    min_commission: float = 0.0
+    slippage_bps: float = 0.0
+    spread_fraction: float = 0.0
+    fill: FillTiming = "close"
+    lot_size: float | None = None
+    # Commission bracket tables, derived from the tiers in __post_init__
+    _starts: np.ndarray = field(init=False, repr=False, compare=False)
+    _rates: np.ndarray = field(init=False, repr=False, compare=False)
+    _fee_at_start: np.ndarray = field(init=False, repr=False, compare=False)
+    _total_at_start: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.fill not in FILL_TIMINGS:
+            raise ValueError(f"Unknown fill timing: {self.fill}. Options: {', '.join(FILL_TIMINGS)}")
+        tiers = self.commission_tiers or ((0.0, self.commission_bps),)
+        starts = np.array([start for start, _ in tiers], dtype=float)
+        rates = np.array([bps for _, bps in tiers], dtype=float) / 1e4
+        if starts[0] != 0 or (np.diff(starts) <= 0).any():
+            raise ValueError("Commission tiers must start at 0 and increase")
+        if min(*rates, self.min_commission, self.slippage_bps, self.spread_fraction) < 0:
+            raise ValueError("Costs must not be negative")
+        if self.lot_size is not None and self.lot_size <= 0:
+            raise ValueError(f"Lot size must be positive, got {self.lot_size}")
+        # Bracket tables, computed once: commission is called per trade in `simulate`
+        fee_at_start = np.concatenate([[0.0], np.cumsum(np.diff(starts) * rates[:-1])])
+        object.__setattr__(self, "_starts", starts)
+        object.__setattr__(self, "_rates", rates)
+        object.__setattr__(self, "_fee_at_start", fee_at_start)
+        object.__setattr__(self, "_total_at_start", starts + fee_at_start)
+
+    @property
+    def needs_bars(self) -> bool:
+        """Whether fills use Open/High/Low in addition to the close."""
+        return self.fill == "next_open" or self.spread_fraction > 0
+
+    def for_symbol(self, symbol: str) -> "ExecutionModel":
+        """This model with the board lot of `symbol` (see `market_types`)."""
+        return replace(self, lot_size=get_lot_size(symbol))
+
+    def fill_prices(
+        self, close: ArrayLike, bars: Mapping[str, ArrayLike] | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fill prices of orders executed on each day.
+
+        Args:
+            close: Closes per day.
+            bars: Open, High and Low arrays aligned with `close`; required
+                if `needs_bars`.
+
+        Returns:
+            Tuple of (reference, buy, sell) prices per day: the price
+            before costs, and what buys pay and sells receive.
+
+        Raises:
+            ValueError: If bars are needed but missing.
+        """
+        if bars is None:
+            if self.needs_bars:
+                raise ValueError("This execution model needs Open/High/Low bars")
+            bars = {}
+        reference = np.asarray(bars["Open"] if self.fill == "next_open" else close, dtype=float)
+        slippage = self.slippage_bps / 1e4
+        buy = reference * (1 + slippage)
+        sell = reference * (1 - slippage)
+        if self.spread_fraction > 0:
+            half_spread = self.spread_fraction * (np.asarray(bars["High"]) - np.asarray(bars["Low"])) / 2
+            buy = buy + half_spread
+            sell = sell - half_spread
+        return reference, buy, sell
+
+    def commission(self, notional: ArrayLike) -> np.ndarray:
+        """Fee for trades of the given notional values."""
+        notional = np.asarray(notional, dtype=float)
+        if len(self._rates) == 1:
+            fee: np.ndarray = notional * self._rates[0]
+        else:
+            tier = np.maximum(np.searchsorted(self._starts, notional, side="right") - 1, 0)
+            fee = self._fee_at_start[tier] + (notional - self._starts[tier]) * self._rates[tier]
+        return np.maximum(fee, self.min_commission) if self.min_commission > 0 else fee
+
+    def max_notional(self, capital: ArrayLike) -> np.ndarray:
+        """Largest notional whose cost plus commission fits in `capital`."""
+        capital = np.asarray(capital, dtype=float)
+        if len(self._rates) == 1:
+            notional: np.ndarray = capital / (1 + self._rates[0])
+        else:
+            # Notional + fee rises piecewise linearly; invert it on the bracket `capital` falls in
+            tier = np.maximum(np.searchsorted(self._total_at_start, capital, side="right") - 1, 0)
+            notional = self._starts[tier] + (capital - self._total_at_start[tier]) / (1 + self._rates[tier])
+        if self.min_commission > 0:
+            notional = np.maximum(np.minimum(notional, capital - self.min_commission), 0.0)
+        return notional
+
+    def round_shares(self, shares: ArrayLike) -> np.ndarray:
+        """Round share counts down to whole lots."""
+        shares = np.asarray(shares, dtype=float)
+        if self.lot_size is None:
+            return shares
+        # The tolerance keeps 299.99999999 shares from rounding down a whole lot
+        return np.floor(shares / self.lot_size + 1e-9) * self.lot_size
+
+
+def parse_commission(spec: str) -> tuple[tuple[float, float], ...]:
+    """Parse a commission spec: ``"5"`` (flat bps) or ``"0:10,50000:5"`` (tiers).
+
+    Args:
+        spec: Flat rate in bps, or comma-separated ``from:bps`` brackets.
+
+    Returns:
+        Commission tiers for `ExecutionModel.commission_tiers`.
+
+    Raises:
+        ValueError: If the spec is malformed.
+    """
+    tiers = []
+    for part in spec.split(","):
+        start, _, bps = part.rpartition(":")
+        tiers.append((float(start) if start else 0.0, float(bps)))
+    return tuple(tiers)
@@ -0,0 +1,276 @@
+"""Event-driven backtests for intraday bars.
+
+`Backtester` scores a whole history at once, which suits a few thousand
+daily bars. Intraday histories are an order of magnitude longer (a year
+of 5-minute bars is about 20k bars per symbol) and often arrive as a
+stream, so `IntradayBacktester` walks them one bar at a time:
+
+1. a pending next-open order fills at the new bar's open;
+2. the bar updates an `IndicatorState`, an O(1) step;
+3. the trend score is checked against the thresholds and an order is
+   filled at the close or queued for the next open;
+4. the bar's equity updates running return, Sharpe and drawdown
+   accumulators.
+
+Orders fill and pay costs through the same `ExecutionModel` as daily
+backtests, and the trading rules match `simulate`: on daily bars both
+engines make the same trades. Without a recorded equity curve, memory
+grows with the number of trades only, not with the number of bars.
+"""
+
+import math
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, TypedDict
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.incremental import IndicatorState
+from ..analysis.trend_score import round4
+from ..data.market_types import bars_per_year, detect_market_type
+from .backtester import BacktestResult, Trade, backtest_years
+from .execution import ExecutionModel
+from .trend_strategy import MIN_HISTORY
+
+# A bar event: (timestamp, mapping with Open, High, Low, Close and Volume)
+BarEvent = tuple[Any, Mapping[str, float]]
+
+_BAR_FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Frame rows converted to bar events at a time
+_CHUNK_ROWS = 4096
+
+
+class _IndicatorParams(TypedDict):
+    """`IndicatorState` parameters a backtester starts each run with."""
+
+    weights: dict[str, float] | None
+    macd_std_window: int
+    obv_slope_window: int
+
+
+class _RunningMetrics:
+    """Return, Sharpe and drawdown of an equity series, one value at a time.
+
+    Returns are accumulated with Welford's update, so the Sharpe ratio
+    equals the two-pass `sharpe_ratios` to floating-point tolerance.
+    """
+
+    def __init__(self) -> None:
+        self.last = math.nan
+        self.count = 0  # returns seen
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.peak = -math.inf
+        self.max_drawdown = 0.0
+
+    def add(self, equity: float) -> None:
+        if not math.isnan(self.last):
+            ret = equity / self.last - 1
+            self.count += 1
+            delta = ret - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (ret - self.mean)
+        self.last = equity
+        self.peak = max(self.peak, equity)
+        self.max_drawdown = min(self.max_drawdown, (equity - self.peak) / self.peak * 100)
+
+    def sharpe(self, periods_per_year: float) -> float:
+        if self.count < 2:
+            return 0.0
+        std = math.sqrt(self.m2 / (self.count - 1))
+        return self.mean / std * math.sqrt(periods_per_year) if std > 0 else 0.0
+
+
+class IntradayBacktester:
+    """Event-driven trend score backtest over intraday (or any) bars.
+
+    Args:
+        initial_capital: Starting portfolio value (default: 100000).
+        buy_threshold: Score above which to buy (default: 0.3).
+        sell_threshold: Score below which to sell (default: -0.3).
+        interval: Bar interval, used to annualize the Sharpe ratio (see
+            `market_types.bars_per_year`).
+        execution: Fill and cost model (default: close fills, no costs);
+            "next_open" fills at the next bar's open.
+        weights: Trend score component weights (default: equal).
+        macd_std_window: Bars in the MACD histogram std window.
+        obv_slope_window: Bars in the OBV slope window.
+        record_equity: Keep the equity curve (one value per scored bar)
+            in the result. Without it the curve is empty and memory does
+            not grow with the number of bars replayed.
+
+    Raises:
+        ValueError: If the interval is not supported.
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 100000,
+        buy_threshold: float = 0.3,
+        sell_threshold: float = -0.3,
+        interval: str = "5m",
+        execution: ExecutionModel | None = None,
+        weights: dict[str, float] | None = None,
+        macd_std_window: int = 5,
+        obv_slope_window: int = 5,
+        record_equity: bool = True,
+    ) -> None:
+        bars_per_year(interval)  # validates the interval
+        self._initial_capital = initial_capital
+        self._buy_threshold = buy_threshold
+        self._sell_threshold = sell_threshold
+        self._interval = interval
+        self._execution = execution or ExecutionModel()
+        self._indicator_params: _IndicatorParams = {
+            "weights": weights,
+            "macd_std_window": macd_std_window,
+            "obv_slope_window": obv_slope_window,
+        }
+        self._record_equity = record_equity
+
+    def run(self, bars: pd.DataFrame | Iterable[BarEvent], symbol: str = "", period: str = "") -> BacktestResult:
+        """Replay bars oldest first and trade on the trend score.
+
+        Trading starts once `MIN_HISTORY` bars have been seen, like the
+        daily strategy. A buy invests all capital when flat and a sell
+        liquidates when holding; an open position is marked to market at
+        the last close.
+
+        Args:
+            bars: OHLCV DataFrame (rows with a missing close are skipped),
+                or an iterable of ``(timestamp, bar)`` events, e.g. from a
+                live feed or a file reader.
+            symbol: Symbol name for the result; also picks the market
+                session used to annualize the Sharpe ratio.
+            period: Period description for the result.
+
+        Returns:
+            BacktestResult with performance metrics.
+
+        Raises:
+            ValueError: If bars are out of order or a close is missing.
+        """
+        events = _frame_events(bars) if isinstance(bars, pd.DataFrame) else iter(bars)
+        execution = self._execution
+        next_open = execution.fill == "next_open"
+        state = IndicatorState(**self._indicator_params)
+        metrics = _RunningMetrics()
+        timestamps: list[Any] = []
+        values: list[float] = []
+        trades: list[Trade] = []
+
+        capital = float(self._initial_capital)  # value when flat
+        holding = False  # position state; shares may be 0 if no lot was affordable
+        shares = cash = buy_price = buy_fee = buy_reference = 0.0
+        buy_date: Any = None
+        total_costs = 0.0
+        order: str | None = None  # queued for the next bar's open
+        first_date = last_date = None
+
+        def fill(action: str, timestamp: Any, bar: Mapping[str, float], close: float) -> None:
+            nonlocal holding, capital, shares, cash, buy_price, buy_fee, buy_reference, buy_date, total_costs
+            reference, buy_fill, sell_fill = (
+                float(v) for v in execution.fill_prices(close, bar if execution.needs_bars else None)
+            )
+            if action == "buy":
+                exact = float(execution.max_notional(capital)) / buy_fill
+                shares = float(execution.round_shares(exact))
+                spent = shares * buy_fill
+                buy_fee = float(execution.commission(spent)) if shares > 0 else 0.0
+                cash = capital - spent - buy_fee if shares < exact else 0.0
+                holding, buy_price, buy_reference, buy_date = True, buy_fill, reference, timestamp
+                return
+
+            holding = False
+            if shares == 0:
+                return
+            proceeds = shares * sell_fill
+            sell_fee = float(execution.commission(proceeds))
+            capital = proceeds - sell_fee + cash
+            total_costs += buy_fee + shares * (buy_price - buy_reference) + sell_fee + shares * (reference - sell_fill)
+            net_buy = buy_price + buy_fee / shares
+            net_sell = sell_fill - sell_fee / shares
+            days = (pd.Timestamp(timestamp) - pd.Timestamp(buy_date)).days
+            trades.append(
+                Trade(
+                    buy_date=buy_date,
+                    buy_price=buy_price,
+                    sell_date=timestamp,
+                    sell_price=sell_fill,
+                    return_pct=float(round4(np.array([(net_sell - net_buy) / net_buy * 100]))[0]),
+                    holding_days=max(days, 1),
+                )
+            )
+
+        for timestamp, bar in events:
+            close = float(bar["Close"])
+            if order is not None:
+                fill(order, timestamp, bar, close)
+                order = None
+
+            score = state.update(bar, timestamp=timestamp).trend.score
+            if state.bars < MIN_HISTORY:
+                continue
+
+            if score > self._buy_threshold:
+                action = None if holding else "buy"
+            elif score < self._sell_threshold:
+                action = "sell" if holding else None
+            else:
+                action = None
+            if action is not None:
+                if next_open:
+                    order = action
+                else:
+                    fill(action, timestamp, bar, close)
+
+            equity = cash + shares * close if holding else capital
+            metrics.add(equity)
+            if first_date is None:
+                first_date = timestamp
+            last_date = timestamp
+            if self._record_equity:
+                timestamps.append(timestamp)
+                values.append(equity)
+
+        if holding and shares > 0:
+            # Mark to market, and count what the open position has paid so far
+            total_costs += buy_fee + shares * (buy_price - buy_reference)
+        final_value = metrics.last if holding else capital
+        if not final_value > 0:  # also NaN when no bar was scored
+            final_value = float(self._initial_capital)
+        years = backtest_years(pd.Index([first_date, last_date])) if first_date is not None else None
+        ratio = final_value / self._initial_capital
+        wins = sum(t.return_pct > 0 for t in trades)
+
+        return BacktestResult(
+            symbol=symbol,
+            period=period,
+            initial_capital=self._initial_capital,
+            final_value=round(final_value, 2),
+            total_return=round((ratio - 1) * 100, 4),
+            annualized_return=round((ratio ** (1 / years) - 1) * 100, 4) if years is not None else 0.0,
+            sharpe_ratio=round(metrics.sharpe(bars_per_year(self._interval, detect_market_type(symbol))), 4),
+            max_drawdown=round(metrics.max_drawdown, 4),
+            win_rate=round(wins / len(trades) * 100, 2) if trades else 0.0,
+            total_trades=len(trades),
+            trades=trades,
+            equity_curve=pd.Series(values, index=pd.Index(timestamps), dtype=float),
+            total_costs=round(total_costs, 2),
+        )
+
+
+def _frame_events(df: pd.DataFrame) -> Iterator[BarEvent]:
+    """Yield the rows of an OHLCV frame as bar events, skipping missing closes.
+
+    Rows are converted in chunks: ``itertuples`` builds Python lists of
+    whole columns, which would cost more than the frame itself.
+    """
+    fields = [f for f in _BAR_FIELDS if f in df.columns]
+    for start in range(0, len(df), _CHUNK_ROWS):
+        chunk = df.iloc[start : start + _CHUNK_ROWS]
+        for timestamp, row in zip(chunk.index, chunk[fields].itertuples(index=False, name=None)):
+            bar = dict(zip(fields, row))
+            if bar["Close"] == bar["Close"]:
+                yield timestamp, bar
@@ -0,0 +1,232 @@
+"""Portfolio backtesting — trade a whole watchlist from one capital pool.
+
+Trend scores and closes come in as dates × symbols matrices on a union
+calendar (see `analysis.panel`). Each symbol follows the same buy/sell
+threshold rules as `TrendScoreStrategy`; a sizing rule then turns the
+set of symbols currently held into target weights, and the portfolio is
+rebalanced to them at the close.
+
+Everything is computed with matrix operations: between two rebalances
+the holdings are fixed share counts, so each day's value is the value
+at the last rebalance times the price growth since then, and values at
+rebalance days are a cumulative product. No Python loop over days.
+
+Returns are taken in each asset's own currency (no FX conversion). On
+days an asset's market is closed its last close is carried forward, so
+it contributes a zero return and trades there fill at that close.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.panel import compute_panel_indicators
+from .backtester import backtest_years, max_drawdowns, positions, sharpe_ratios
+from .trend_strategy import MIN_HISTORY
+
+# (held, scores, returns) → target weights, all dates × symbols arrays
+SizingRule = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+def equal_weight(held: np.ndarray, scores: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    """Split capital equally across held symbols."""
+    counts = held.sum(axis=1, keepdims=True)
+    weights: np.ndarray = np.divide(held, counts, out=np.zeros(held.shape), where=counts > 0)
+    return weights
+
+
+def score_weight(held: np.ndarray, scores: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    """Weight held symbols by their (positive) trend score."""
+    strength = np.where(held, np.clip(np.nan_to_num(scores), 0, None), 0.0)
+    totals = strength.sum(axis=1, keepdims=True)
+    weights: np.ndarray = np.divide(strength, totals, out=np.zeros(held.shape), where=totals > 0)
+    return weights
+
+
+def inverse_volatility(held: np.ndarray, scores: np.ndarray, returns: np.ndarray, lookback: int = 20) -> np.ndarray:
+    """Weight held symbols by the inverse of their recent return volatility."""
+    volatility = pd.DataFrame(returns, copy=False).rolling(window=lookback).std().to_numpy()
+    with np.errstate(divide="ignore"):
+        inverse = np.where(held & (volatility > 0), 1 / volatility, 0.0)
+    totals = inverse.sum(axis=1, keepdims=True)
+    weights: np.ndarray = np.divide(inverse, totals, out=np.zeros(held.shape), where=totals > 0)
+    return weights
+
+
+SIZING_RULES: dict[str, SizingRule] = {
+    "equal": equal_weight,
+    "score": score_weight,
+    "inverse_vol": inverse_volatility,
+}
+
+
+@dataclass
+class PortfolioResult:
+    """Portfolio backtest results."""
+
+    initial_capital: float
+    final_value: float
+    total_return: float  # as percentage
+    annualized_return: float  # as percentage
+    sharpe_ratio: float
+    max_drawdown: float  # as percentage (negative)
+    turnover: float  # sum of half the absolute weight changes at each rebalance
+    rebalances: int
+    equity_curve: pd.Series  # daily portfolio value
+    weights: pd.DataFrame  # end-of-day holdings weights (dates × symbols)
+    daily_turnover: pd.Series  # one-way turnover traded at each close
+    attribution: pd.DataFrame  # per symbol: pnl, contribution, avg_weight, days_held
+
+
+class PortfolioBacktester:
+    """Backtests a threshold strategy across a watchlist with shared capital.
+
+    Args:
+        initial_capital: Starting portfolio value (default: 100000).
+        buy_threshold: Score above which a symbol is bought (default: 0.3).
+        sell_threshold: Score below which it is sold (default: -0.3).
+        sizing: Name in `SIZING_RULES` or a custom `SizingRule`.
+        max_weight: Cap on any single symbol's target weight; capital above
+            the cap stays in cash.
+        rebalance_every: Rebalance to target weights every N days. The
+            portfolio is also rebalanced whenever a symbol is bought or sold.
+
+    Raises:
+        ValueError: If `sizing` is not a known rule name.
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 100000,
+        buy_threshold: float = 0.3,
+        sell_threshold: float = -0.3,
+        sizing: str | SizingRule = "equal",
+        max_weight: float = 1.0,
+        rebalance_every: int = 1,
+    ) -> None:
+        if isinstance(sizing, str):
+            if sizing not in SIZING_RULES:
+                raise ValueError(f"Unknown sizing rule: {sizing}. Options: {', '.join(SIZING_RULES)}")
+            sizing = SIZING_RULES[sizing]
+        self._initial_capital = initial_capital
+        self._buy_threshold = buy_threshold
+        self._sell_threshold = sell_threshold
+        self._sizing = sizing
+        self._max_weight = max_weight
+        self._rebalance_every = max(1, rebalance_every)
+
+    def run_panel(self, panel: Mapping[str, pd.DataFrame]) -> PortfolioResult:
+        """Score a price panel (see `analysis.panel.to_panel`) and backtest it."""
+        scores = compute_panel_indicators(panel)["score"]
+        return self.run(scores, panel["Close"])
+
+    def run(self, scores: pd.DataFrame, prices: pd.DataFrame) -> PortfolioResult:
+        """Backtest from score and close matrices.
+
+        Args:
+            scores: Trend scores, dates × symbols (NaN where not trading).
+            prices: Closes, aligned to `scores` (reindexed if needed).
+
+        Returns:
+            PortfolioResult with the equity curve, turnover and attribution.
+        """
+        index, symbols = scores.index, scores.columns
+        prices = prices.reindex(index=index, columns=symbols)
+        raw = prices.to_numpy(dtype=np.float64)
+        close = prices.ffill().to_numpy(dtype=np.float64)
+        score = scores.to_numpy(dtype=np.float64)
+        n, k = score.shape
+        if n == 0:
+            return self._empty_result(index, symbols)
+
+        # Skip each symbol's warm-up bars, as calculate_rolling_trend_scores does
+        bars = np.cumsum(~np.isnan(raw), axis=0)
+        score = np.where(bars >= MIN_HISTORY, score, np.nan)
+
+        returns = np.zeros((n, k))
+        returns[1:] = close[1:] / close[:-1] - 1
+        returns = np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+        # Per-symbol threshold positions, only while the symbol has a price
+        held = positions(score > self._buy_threshold, score < self._sell_threshold) & ~np.isnan(close)
+        target = np.nan_to_num(np.asarray(self._sizing(held, score, returns), dtype=np.float64))
+        target = np.where(held, np.clip(target, 0.0, self._max_weight), 0.0)
+        total = target.sum(axis=1, keepdims=True)
+        target = np.divide(target, total, out=target, where=total > 1)
+
+        # Rebalance days: the schedule, plus any change in the held set
+        rebalance = np.arange(n) % self._rebalance_every == 0
+        rebalance[1:] |= (held[1:] != held[:-1]).any(axis=1)
+        start = np.maximum.accumulate(np.where(rebalance, np.arange(n), 0))
+        weights = target[start]  # weights set at the last rebalance, per day
+        cash = 1 - weights.sum(axis=1)
+        safe_close = np.where(np.isnan(close), 1.0, close)
+        base = safe_close[start]
+
+        # Growth of the last rebalance's portfolio up to each day, before rebalancing
+        carried = np.ones(n)
+        carried[1:] = cash[:-1] + (weights[:-1] * safe_close[1:] / base[:-1]).sum(axis=1)
+
+        # Value at each rebalance, then every day from its segment's start value
+        segment_growth = np.where(rebalance, carried, 1.0)
+        segment_growth[0] = 1.0
+        rebalance_value = self._initial_capital * np.cumprod(segment_growth)
+        equity = np.empty(n)
+        equity[0] = self._initial_capital
+        equity[1:] = rebalance_value[start[:-1]] * carried[1:]
+
+        # Weights drifted to each close, before and after that day's rebalance
+        drifted = np.zeros((n, k))
+        drifted[1:] = weights[:-1] * safe_close[1:] / base[:-1] / carried[1:, None]
+        growth_today = cash + (weights * safe_close / base).sum(axis=1)
+        holdings = weights * safe_close / base / growth_today[:, None]
+        turnover = np.where(rebalance, np.abs(target - drifted).sum(axis=1) / 2, 0.0)
+
+        # P&L per symbol: capital held since the last rebalance × today's price change
+        pnl = np.zeros((n, k))
+        pnl[1:] = rebalance_value[start[:-1], None] * weights[:-1] * (safe_close[1:] - safe_close[:-1]) / base[:-1]
+        attribution = pd.DataFrame(
+            {
+                "pnl": pnl.sum(axis=0),
+                "contribution": pnl.sum(axis=0) / self._initial_capital * 100,
+                "avg_weight": holdings.mean(axis=0),
+                "days_held": (holdings > 0).sum(axis=0),
+            },
+            index=symbols,
+        )
+
+        years = backtest_years(index)
+        final_value = float(equity[-1])
+        annualized = ((final_value / self._initial_capital) ** (1 / years) - 1) * 100 if years is not None else 0.0
+        return PortfolioResult(
+            initial_capital=self._initial_capital,
+            final_value=round(final_value, 2),
+            total_return=round((final_value / self._initial_capital - 1) * 100, 4),
+            annualized_return=round(annualized, 4),
+            sharpe_ratio=round(float(sharpe_ratios(equity[:, None])[0]), 4),
+            max_drawdown=round(float(max_drawdowns(equity[:, None])[0]), 4),
+            turnover=round(float(turnover.sum()), 4),
+            rebalances=int(rebalance.sum()),
+            equity_curve=pd.Series(equity, index=index),
+            weights=pd.DataFrame(holdings, index=index, columns=symbols),
+            daily_turnover=pd.Series(turnover, index=index),
+            attribution=attribution,
+        )
+
+    def _empty_result(self, index: pd.Index, symbols: pd.Index) -> PortfolioResult:
+        return PortfolioResult(
+            initial_capital=self._initial_capital,
+            final_value=round(self._initial_capital, 2),
+            total_return=0.0,
+            annualized_return=0.0,
+            sharpe_ratio=0.0,
+            max_drawdown=0.0,
+            turnover=0.0,
+            rebalances=0,
+            equity_curve=pd.Series(dtype=float, index=index),
+            weights=pd.DataFrame(index=index, columns=symbols, dtype=float),
+            daily_turnover=pd.Series(dtype=float, index=index),
+            attribution=pd.DataFrame(0.0, index=symbols, columns=["pnl", "contribution", "avg_weight", "days_held"]),
+        )
@@ -0,0 +1,130 @@
+"""Threshold sweeps — backtest a whole grid of buy/sell thresholds at once.
+
+A threshold strategy only looks at the trend score and the close, so the
+score history is computed once (`score_history`) and every (buy, sell)
+pair is simulated together over NumPy arrays, one column per pair.
+
+Each pair is one path of `backtester.simulate`, the same array core
+behind `Backtester.run`, so every grid point reproduces its metrics
+exactly.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .backtester import METRIC_COLUMNS, backtest_years, simulate
+
+# Upper bound on days × grid points simulated per chunk (~32 MB per float matrix)
+_CHUNK_CELLS = 4_000_000
+
+
+def threshold_range(spec: str) -> np.ndarray:
+    """Parse a threshold grid spec.
+
+    Accepts ``start:stop:step`` (stop included), a comma-separated list of
+    values, or a single value.
+
+    Args:
+        spec: Spec string, e.g. ``"0.1:0.6:0.05"`` or ``"0.2,0.3"``.
+
+    Returns:
+        Sorted array of unique thresholds.
+
+    Raises:
+        ValueError: If the spec is malformed or the step is not positive.
+    """
+    parts = spec.split(":")
+    if len(parts) == 1:
+        values = [float(v) for v in spec.split(",")]
+    elif len(parts) == 3:
+        start, stop, step = (float(p) for p in parts)
+        if step <= 0:
+            raise ValueError(f"Step must be positive in {spec!r}")
+        count = int(np.floor((stop - start) / step + 1e-9)) + 1
+        # Round away the float drift of start + i * step (0.30000000000000004)
+        values = np.round(start + step * np.arange(max(count, 0)), 10).tolist()
+    else:
+        raise ValueError(f"Expected start:stop:step or comma-separated values, got {spec!r}")
+    return np.unique(values)
+
+
+def sweep_thresholds(
+    history: pd.DataFrame,
+    buy_thresholds: np.ndarray | list[float],
+    sell_thresholds: np.ndarray | list[float],
+    initial_capital: float = 100000,
+) -> pd.DataFrame:
+    """Backtest every (buy, sell) threshold pair over one score history.
+
+    Row ``(b, s)`` equals the metrics of ``Backtester(initial_capital).run``
+    on the signals of ``TrendScoreStrategy(b, s)``.
+
+    Args:
+        history: Output of `score_history` (score and price columns).
+        buy_thresholds: Buy thresholds to try.
+        sell_thresholds: Sell thresholds to try.
+        initial_capital: Starting portfolio value.
+
+    Returns:
+        DataFrame with one row per pair: buy_threshold, sell_threshold and
+        the `METRIC_COLUMNS` (same units and rounding as `BacktestResult`).
+    """
+    buy_grid, sell_grid = np.meshgrid(
+        np.asarray(buy_thresholds, dtype=float), np.asarray(sell_thresholds, dtype=float), indexing="ij"
+    )
+    buys, sells = buy_grid.ravel(), sell_grid.ravel()
+
+    scores = history["score"].to_numpy(dtype=float)
+    prices = history["price"].to_numpy(dtype=float)
+    metrics = sweep_metrics(scores[:, None], prices, buys, sells, initial_capital, backtest_years(history.index))
+
+    grid = pd.DataFrame({"buy_threshold": buys, "sell_threshold": sells})
+    for name in METRIC_COLUMNS:
+        grid[name] = round_metric(name, metrics[name])
+    return grid
+
+
+def sweep_metrics(
+    scores: np.ndarray,
+    prices: np.ndarray,
+    buys: np.ndarray,
+    sells: np.ndarray,
+    initial_capital: float,
+    years: float | None,
+) -> dict[str, np.ndarray]:
+    """Unrounded metrics for every score column × (buy, sell) pair.
+
+    Args:
+        scores: Scores, days × columns (e.g. one column per scoring setup).
+        prices: Closes, one per day.
+        buys: Buy threshold of each pair.
+        sells: Sell threshold of each pair (same length as `buys`).
+        initial_capital: Starting portfolio value.
+        years: Length of the history in years (see `backtest_years`).
+
+    Returns:
+        Metric name → array of ``columns * len(buys)`` values, column-major:
+        entry ``c * len(buys) + p`` is score column ``c`` with pair ``p``.
+    """
+    n, columns = scores.shape
+    total = columns * len(buys)
+    chunk = max(1, _CHUNK_CELLS // max(n, 1))
+    parts = []
+    for i in range(0, total, chunk):
+        column, pair = np.divmod(np.arange(i, min(i + chunk, total)), len(buys))
+        path_scores = scores[:, column]
+        # Signal per day and pair; buy wins when both fire, like generate_signals
+        buy = path_scores > buys[pair]
+        sell = path_scores < sells[pair]
+        parts.append(simulate(prices, buy, sell, initial_capital).metrics(initial_capital, years))
+    if not parts:
+        return {name: np.empty(0) for name in METRIC_COLUMNS}
+    return {name: np.concatenate([p[name] for p in parts]) for name in METRIC_COLUMNS}
+
+
+def round_metric(name: str, values: np.ndarray) -> np.ndarray | list[float]:
+    """Round one metric like `BacktestResult` (trade counts become ints)."""
+    if name == "total_trades":
+        return values.astype(int)
+    digits = 2 if name in ("final_value", "win_rate") else 4
+    return [round(v, digits) for v in values.tolist()]
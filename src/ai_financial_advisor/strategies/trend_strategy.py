@@ -6,10 +6,14 @@ trading decisions based on configurable thresholds.
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from ..analysis.indicators import compute_all_indicators
-from ..analysis.trend_score import calculate_trend_score
+from ..analysis.trend_score import trend_score_series
+
+# Bars needed before the trend score is stable enough to trade on
+MIN_HISTORY = 30
 
 
 @dataclass
@@ -49,50 +53,95 @@ class TrendScoreStrategy:
         Returns:
             List of Signal objects, one per trading day (after warmup).
         """
-        df = compute_all_indicators(df)
-        scores = calculate_rolling_trend_scores(df)
+        frame = self.generate_signal_frame(df)
+        return [
+            Signal(date=date, action=action, score=score, price=price)
+            for date, score, price, action in zip(
+                frame.index, frame["score"].tolist(), frame["price"].tolist(), frame["action"].tolist()
+            )
+        ]
+
+    def generate_signal_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Generate signals as one DataFrame instead of Signal objects.
 
-        signals = []
-        for date, score in scores.items():
-            price = float(df.loc[date, "Close"])
+        Args:
+            df: DataFrame with OHLCV columns.
 
-            if score > self._buy_threshold:
-                action = "buy"
-            elif score < self._sell_threshold:
-                action = "sell"
-            else:
-                action = "hold"
+        Returns:
+            `score_history` frame with an added action column ("buy",
+            "sell" or "hold"), ready for `Backtester.run_frame`.
+        """
+        history = score_history(df)
+        scores = history["score"].to_numpy()
+        history["action"] = np.select(
+            [scores > self._buy_threshold, scores < self._sell_threshold], ["buy", "sell"], "hold"
+        ).astype(object)
+        return history
 
-            signals.append(Signal(date=date, action=action, score=score, price=price))
 
-        return signals
+def score_history(
+    df: pd.DataFrame,
+    weights: dict[str, float] | None = None,
+    macd_std_window: int = 5,
+    obv_slope_window: int = 5,
+) -> pd.DataFrame:
+    """Compute the trend score and close price for every tradable day.
+
+    This is everything a threshold strategy looks at, so it can be computed
+    once and reused across thresholds (see `strategies.sweep`).
+
+    Args:
+        df: DataFrame with OHLCV columns.
+        weights: Trend score weights (see `trend_score_series`).
+        macd_std_window: Lookback for MACD histogram normalization.
+        obv_slope_window: Lookback for OBV slope calculation.
+
+    Returns:
+        DataFrame with score and price columns, indexed by date (after
+        warmup; empty if there is not enough data).
+    """
+    df = compute_all_indicators(df)
+    scores = calculate_rolling_trend_scores(
+        df, weights=weights, macd_std_window=macd_std_window, obv_slope_window=obv_slope_window
+    )
+    return pd.DataFrame(
+        {"score": scores.to_numpy(dtype=float), "price": df["Close"].reindex(scores.index).to_numpy(dtype=float)},
+        index=scores.index,
+    )
 
 
 def calculate_rolling_trend_scores(
     df: pd.DataFrame,
     window: int = 5,
+    weights: dict[str, float] | None = None,
+    macd_std_window: int = 5,
+    obv_slope_window: int = 5,
 ) -> pd.Series:
     """Calculate trend scores for each day using a rolling window.
 
+    Each value equals `calculate_trend_score` on the history up to that
+    day; all days are computed at once by `trend_score_series`.
+
     Args:
         df: DataFrame with indicator columns (MACD, OBV, MFI, etc.).
         window: Minimum rows needed for a valid score.
+        weights: Trend score weights (see `trend_score_series`).
+        macd_std_window: Lookback for MACD histogram normalization.
+        obv_slope_window: Lookback for OBV slope calculation.
 
     Returns:
         Series of trend scores indexed by date.
     """
-    # Need at least 30 rows for stable indicators
-    min_rows = max(30, window)
+    min_rows = max(MIN_HISTORY, window)
     if len(df) < min_rows:
         return pd.Series(dtype=float)
 
-    scores = {}
-    for i in range(min_rows, len(df) + 1):
-        subset = df.iloc[:i]
-        try:
-            result = calculate_trend_score(subset)
-            scores[df.index[i - 1]] = result.score
-        except Exception:
-            continue
+    try:
+        scores = trend_score_series(
+            df, weights=weights, macd_std_window=macd_std_window, obv_slope_window=obv_slope_window
+        )["score"]
+    except KeyError:
+        # Indicator columns missing — nothing to score
+        return pd.Series(dtype=float)
 
-    return pd.Series(scores)
+    return scores.iloc[min_rows - 1 :].rename(None)
@@ -0,0 +1,389 @@
+"""Walk-forward optimization for `TrendScoreStrategy`.
+
+The trend score weights, its two normalization windows and the buy/sell
+thresholds are free parameters. A walk-forward run splits the history
+into consecutive train/test windows, picks the parameters that score
+best on each train window (an exhaustive `ParameterGrid` search) and
+trades them on the test window that follows, so every reported number
+is out of sample.
+
+Indicators are computed once per symbol, and each scoring setup's score
+history once over the whole period (`ScoreCache`). Scores are causal, so
+a window's slice of the full history equals scoring that window with
+the bars before it as warm-up; folds only slice the cache. Each fold
+searches all scoring setups × threshold pairs as paths of one
+`sweep_metrics` call, and folds run in parallel on a worker pool.
+"""
+
+import itertools
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.indicators import compute_all_indicators
+from ..executor import PoolMode, create_pool, gather
+from .backtester import METRIC_COLUMNS, backtest_years
+from .sweep import round_metric, sweep_metrics
+from .trend_strategy import calculate_rolling_trend_scores
+
+
+def weight_grid(step: float = 0.25) -> list[dict[str, float]]:
+    """Every (macd, mfi, obv) weight set on a lattice summing to 1.0.
+
+    Args:
+        step: Lattice spacing; 1 / step must be a whole number.
+
+    Returns:
+        Weight dicts, MACD-heaviest first.
+
+    Raises:
+        ValueError: If `step` does not divide 1.
+    """
+    count = round(1 / step) if step > 0 else 0
+    if count < 1 or not math.isclose(count * step, 1.0):
+        raise ValueError(f"Weight step must divide 1, got {step}")
+    return [
+        {"macd": round(i / count, 10), "mfi": round(j / count, 10), "obv": round((count - i - j) / count, 10)}
+        for i in range(count, -1, -1)
+        for j in range(count - i, -1, -1)
+    ]
+
+
+@dataclass
+class ScoringParams:
+    """Trend score settings for one column of a `ScoreCache`."""
+
+    weights: dict[str, float]
+    macd_std_window: int
+    obv_slope_window: int
+
+
+@dataclass
+class ParameterGrid:
+    """Parameter space searched on each train window."""
+
+    weights: list[dict[str, float]] = field(default_factory=weight_grid)
+    macd_std_windows: Sequence[int] = (5, 10, 20)
+    obv_slope_windows: Sequence[int] = (5, 10, 20)
+    buy_thresholds: Sequence[float] = (0.1, 0.2, 0.3, 0.4, 0.5)
+    sell_thresholds: Sequence[float] = (-0.5, -0.4, -0.3, -0.2, -0.1)
+
+    def scoring(self) -> list[ScoringParams]:
+        """Every scoring setup (weights × windows) in the grid."""
+        return [
+            ScoringParams(dict(w), int(m), int(o))
+            for w, m, o in itertools.product(self.weights, self.macd_std_windows, self.obv_slope_windows)
+        ]
+
+    @property
+    def size(self) -> int:
+        """Number of parameter combinations tried per fold."""
+        return (
+            len(self.weights)
+            * len(self.macd_std_windows)
+            * len(self.obv_slope_windows)
+            * len(self.buy_thresholds)
+            * len(self.sell_thresholds)
+        )
+
+
+@dataclass
+class ScoreCache:
+    """Score histories for several scoring setups over one symbol's history.
+
+    Attributes:
+        index: Scored dates (after warm-up).
+        prices: Close on each scored date.
+        scores: Scores, dates × setups (column ``c`` uses ``scoring[c]``).
+        scoring: The setup of each score column.
+    """
+
+    index: pd.DatetimeIndex
+    prices: np.ndarray
+    scores: np.ndarray
+    scoring: list[ScoringParams]
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, scoring: list[ScoringParams]) -> "ScoreCache":
+        """Compute indicators once, then one score history per setup.
+
+        Args:
+            df: DataFrame with OHLCV columns.
+            scoring: Scoring setups to cache.
+
+        Returns:
+            ScoreCache; each column equals ``score_history(df, ...)["score"]``.
+        """
+        indicators = compute_all_indicators(df)
+        columns = [
+            calculate_rolling_trend_scores(
+                indicators,
+                weights=p.weights,
+                macd_std_window=p.macd_std_window,
+                obv_slope_window=p.obv_slope_window,
+            )
+            for p in scoring
+        ]
+        index = columns[0].index if columns else indicators.index[:0]
+        scores = np.empty((len(index), len(columns)), order="F")
+        for i, column in enumerate(columns):
+            scores[:, i] = column.to_numpy(dtype=float)
+        prices = indicators["Close"].reindex(index).to_numpy(dtype=float)
+        return cls(index=pd.DatetimeIndex(index), prices=prices, scores=scores, scoring=scoring)
+
+    def window(self, start: int, stop: int) -> "ScoreCache":
+        """The rows ``start:stop``, e.g. to ship one fold to a worker."""
+        return ScoreCache(
+            index=self.index[start:stop],
+            prices=self.prices[start:stop],
+            scores=np.asfortranarray(self.scores[start:stop]),
+            scoring=self.scoring,
+        )
+
+
+@dataclass
+class WalkForwardReport:
+    """Out-of-sample results of a walk-forward run.
+
+    `folds` has one row per fold: fold, train_start, train_end,
+    test_start, test_end, the chosen w_macd, w_mfi, w_obv,
+    macd_std_window, obv_slope_window, buy_threshold and sell_threshold,
+    train_objective (the objective on the train window), the test
+    window's `METRIC_COLUMNS` and seconds (fold wall-clock).
+    """
+
+    symbol: str
+    objective: str
+    folds: pd.DataFrame
+    total_return: float  # test returns compounded, as percentage
+    annualized_return: float  # as percentage
+    mean_sharpe: float  # mean test Sharpe ratio across folds
+    profitable_folds: int
+    seconds: float  # wall-clock of the whole run, including scoring
+    errors: dict[str, str] = field(default_factory=dict)  # fold label → error
+
+
+def walk_forward_splits(
+    n: int,
+    train_days: int,
+    test_days: int,
+    step_days: int | None = None,
+    anchored: bool = False,
+) -> list[tuple[slice, slice]]:
+    """Row windows for walk-forward folds.
+
+    Args:
+        n: Number of rows in the history.
+        train_days: Rows in each train window.
+        test_days: Rows in each test window; only full windows are used.
+        step_days: Rows between fold starts (default: `test_days`). Must
+            be at least `test_days` so test windows do not overlap.
+        anchored: Grow the train window from the first row instead of
+            rolling it forward.
+
+    Returns:
+        (train, test) slices, oldest fold first.
+
+    Raises:
+        ValueError: If a window size is too small or test windows overlap.
+    """
+    step = step_days or test_days
+    if train_days < 2 or test_days < 2:
+        raise ValueError("Train and test windows need at least 2 days each")
+    if step < test_days:
+        raise ValueError(f"Step ({step}) must be at least the test window ({test_days}) so test windows do not overlap")
+    splits = []
+    for start in range(0, n - train_days - test_days + 1, step):
+        split = start + train_days
+        splits.append((slice(0 if anchored else start, split), slice(split, split + test_days)))
+    return splits
+
+
+def evaluate_fold(
+    cache: ScoreCache,
+    train: slice,
+    test: slice,
+    buy_thresholds: Sequence[float],
+    sell_thresholds: Sequence[float],
+    objective: str = "sharpe_ratio",
+    initial_capital: float = 100000,
+) -> dict[str, Any]:
+    """Optimize on one train window and trade the result on its test window.
+
+    Module-level so it can run in a process pool.
+
+    Args:
+        cache: Score histories covering both windows.
+        train: Train rows of `cache`.
+        test: Test rows of `cache`.
+        buy_thresholds: Buy thresholds to try.
+        sell_thresholds: Sell thresholds to try.
+        objective: Metric in `METRIC_COLUMNS` to maximize on the train window.
+        initial_capital: Starting portfolio value of each window.
+
+    Returns:
+        One `WalkForwardReport.folds` row (without the fold number).
+    """
+    started = time.perf_counter()
+    buy_grid, sell_grid = np.meshgrid(
+        np.asarray(buy_thresholds, dtype=float), np.asarray(sell_thresholds, dtype=float), indexing="ij"
+    )
+    buys, sells = buy_grid.ravel(), sell_grid.ravel()
+
+    trained = sweep_metrics(
+        cache.scores[train], cache.prices[train], buys, sells, initial_capital, backtest_years(cache.index[train])
+    )
+    best = int(np.argmax(np.nan_to_num(trained[objective], nan=-np.inf)))
+    column, pair = divmod(best, len(buys))
+    tested = sweep_metrics(
+        cache.scores[test, column : column + 1],
+        cache.prices[test],
+        buys[pair : pair + 1],
+        sells[pair : pair + 1],
+        initial_capital,
+        backtest_years(cache.index[test]),
+    )
+
+    params = cache.scoring[column]
+    row: dict[str, Any] = {
+        "train_start": cache.index[train][0],
+        "train_end": cache.index[train][-1],
+        "test_start": cache.index[test][0],
+        "test_end": cache.index[test][-1],
+        "w_macd": params.weights["macd"],
+        "w_mfi": params.weights["mfi"],
+        "w_obv": params.weights["obv"],
+        "macd_std_window": params.macd_std_window,
+        "obv_slope_window": params.obv_slope_window,
+        "buy_threshold": float(buys[pair]),
+        "sell_threshold": float(sells[pair]),
+        "train_objective": round_metric(objective, trained[objective][best : best + 1])[0],
+    }
+    for name in METRIC_COLUMNS:
+        row[name] = round_metric(name, tested[name])[0]
+    row["seconds"] = time.perf_counter() - started
+    return row
+
+
+class WalkForwardOptimizer:
+    """Walk-forward parameter search for the trend score strategy.
+
+    Args:
+        grid: Parameter space searched on each train window.
+        train_days: Scored days in each train window (default: ~2 years).
+        test_days: Scored days in each test window (default: ~6 months).
+        step_days: Days between folds (default: `test_days`).
+        anchored: Grow the train window from the start of the history.
+        objective: Metric in `METRIC_COLUMNS` maximized on train windows.
+        initial_capital: Starting portfolio value of each window.
+        workers: Folds evaluated concurrently; 1 runs them inline.
+        mode: Pool for folds, "process" or "thread".
+
+    Raises:
+        ValueError: If `objective` is unknown or the grid is empty.
+    """
+
+    def __init__(
+        self,
+        grid: ParameterGrid | None = None,
+        train_days: int = 504,
+        test_days: int = 126,
+        step_days: int | None = None,
+        anchored: bool = False,
+        objective: str = "sharpe_ratio",
+        initial_capital: float = 100000,
+        workers: int = 1,
+        mode: PoolMode = "process",
+    ) -> None:
+        grid = grid or ParameterGrid()
+        if objective not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown objective: {objective}. Options: {', '.join(METRIC_COLUMNS)}")
+        if grid.size == 0:
+            raise ValueError("Parameter grid is empty")
+        self._grid = grid
+        self._train_days = train_days
+        self._test_days = test_days
+        self._step_days = step_days
+        self._anchored = anchored
+        self._objective = objective
+        self._initial_capital = initial_capital
+        self._workers = workers
+        self._mode = mode
+
+    def run(self, df: pd.DataFrame, symbol: str = "") -> WalkForwardReport:
+        """Run every fold on one symbol's OHLCV history.
+
+        Args:
+            df: DataFrame with OHLCV columns.
+            symbol: Ticker, for the report.
+
+        Returns:
+            WalkForwardReport with per-fold and combined out-of-sample results.
+
+        Raises:
+            ValueError: If the history is too short for a single fold.
+        """
+        started = time.perf_counter()
+        cache = ScoreCache.build(df, self._grid.scoring())
+        splits = walk_forward_splits(
+            len(cache.index), self._train_days, self._test_days, self._step_days, self._anchored
+        )
+        if not splits:
+            raise ValueError(
+                f"Need {self._train_days + self._test_days} scored days for one fold, got {len(cache.index)}"
+            )
+
+        evaluate = partial(
+            evaluate_fold,
+            buy_thresholds=self._grid.buy_thresholds,
+            sell_thresholds=self._grid.sell_thresholds,
+            objective=self._objective,
+            initial_capital=self._initial_capital,
+        )
+        folds = {}
+        for i, (train, test) in enumerate(splits, start=1):
+            # Each fold only needs its own rows of the cache
+            start = train.start
+            window = cache.window(start, test.stop)
+            fold_train = slice(0, train.stop - start)
+            fold_test = slice(test.start - start, test.stop - start)
+            folds[f"fold {i}"] = (window, fold_train, fold_test)
+
+        if self._workers > 1:
+            with create_pool(self._mode, self._workers) as pool:
+                futures = {label: pool.submit(evaluate, *fold) for label, fold in folds.items()}
+                results, errors = gather(futures)
+        else:
+            results, errors = {}, {}
+            for label, fold in folds.items():
+                try:
+                    results[label] = evaluate(*fold)
+                except Exception as exc:
+                    errors[label] = str(exc) or type(exc).__name__
+
+        rows = [{"fold": int(label.split()[-1]), **row} for label, row in results.items()]
+        return self._report(symbol, pd.DataFrame(rows), errors, time.perf_counter() - started)
+
+    def _report(self, symbol: str, folds: pd.DataFrame, errors: dict[str, str], seconds: float) -> WalkForwardReport:
+        if folds.empty:
+            return WalkForwardReport(symbol, self._objective, folds, 0.0, 0.0, 0.0, 0, seconds, errors)
+        growth = float(np.prod(1 + folds["total_return"].to_numpy() / 100))
+        years = backtest_years(pd.Index([folds["test_start"].iloc[0], folds["test_end"].iloc[-1]]))
+        annualized = (growth ** (1 / years) - 1) * 100 if years is not None else 0.0
+        return WalkForwardReport(
+            symbol=symbol,
+            objective=self._objective,
+            folds=folds,
+            total_return=round((growth - 1) * 100, 4),
+            annualized_return=round(annualized, 4),
+            mean_sharpe=round(float(folds["sharpe_ratio"].mean()), 4),
+            profitable_folds=int((folds["total_return"] > 0).sum()),
+            seconds=seconds,
+            errors=errors,
+        )
@@ -1,8 +1,9 @@
 """Gradio interactive demo for AI Financial Advisor.
 
-Provides a web-based interface with two tabs:
+Provides a web-based interface with three tabs:
 - Stock Trend Analyzer: enter a ticker, see trend score + indicator charts
 - News Report Browser: view generated reports by date
+- News Search: full-text search over stored articles and reports
 
 Launch locally:
     python -m ai_financial_advisor.web.gradio_app
@@ -158,6 +159,34 @@ def browse_report(date_str: str, language: str) -> str:
     return "No reports found. Run `ai-advisor news run` to generate one."
 
 
+def search_news(query: str, since: str, source: str) -> str:
+    """Search stored articles and reports, formatted as markdown."""
+    from ..data.storage.sqlite_store import SQLiteStore
+
+    if not query or not query.strip():
+        return "Please enter search terms."
+    try:
+        since_date = date.fromisoformat(since.strip()) if since and since.strip() else None
+    except ValueError:
+        return f"Invalid date: {since}. Use YYYY-MM-DD."
+
+    settings = get_settings()
+    store = SQLiteStore(settings.storage.sqlite_path)
+    try:
+        store.index_reports(settings.storage.reports_dir)
+        hits = store.search(query, since=since_date, source=(source or "").strip() or None)
+    finally:
+        store.close()
+
+    if not hits:
+        return f"No results for `{query}`."
+    lines = [f"**{len(hits)} results**\n"]
+    for hit in hits:
+        title = f"[{hit.title}]({hit.location})" if hit.kind == "article" else f"{hit.title} (`{hit.location}`)"
+        lines.append(f"- {title} — {hit.source}, {(hit.published or '')[:10]}\n\n  {hit.snippet}")
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # App assembly
 # ---------------------------------------------------------------------------
@@ -219,6 +248,21 @@ def create_app() -> gr.Blocks:
                 outputs=[report_output],
             )
 
+        with gr.Tab("News Search"):
+            with gr.Row():
+                query_input = gr.Textbox(label="Search", placeholder="e.g., rate cut, tariffs", scale=3)
+                since_input = gr.Textbox(label="Since (YYYY-MM-DD)", scale=1)
+                source_input = gr.Textbox(label="Source", placeholder="e.g., Reuters, report", scale=1)
+                search_btn = gr.Button("Search", variant="primary", scale=1)
+
+            search_output = gr.Markdown()
+
+            search_btn.click(
+                fn=search_news,
+                inputs=[query_input, since_input, source_input],
+                outputs=[search_output],
+            )
+
     return app
 
 
@@ -9,7 +9,7 @@ Produces a complete HTML site with:
 import logging
 import re
 import shutil
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 
@@ -225,6 +225,79 @@ class SiteBuilder:
                     (market_out / f"{stock.symbol}.html").write_text(html, encoding="utf-8")
 
 
+def load_market_data(
+    results_dir: str | Path = "data/results", run_date: str | None = None
+) -> dict[str, list[StockRow]]:
+    """Read stored scan results (``stock scan --output parquet``) as site market data.
+
+    Only the columns the market pages use are read.
+
+    Args:
+        results_dir: Root of the Parquet result tables.
+        run_date: Scan date (YYYY-MM-DD). Default: the latest stored.
+
+    Returns:
+        Market name → rows sorted by score, best first; empty if no scans
+        are stored.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    from ..data.storage.parquet_store import ParquetStore
+
+    store = ParquetStore(results_dir)
+    dates = store.dates("scans")
+    if not dates:
+        return {}
+    columns = [f.name for f in fields(StockRow)]
+    columns[columns.index("close")] = "latest_close"
+    df = store.read("scans", columns=[*columns, "market"], dates=[run_date or dates[-1]])
+
+    market_data: dict[str, list[StockRow]] = {}
+    for market, group in df.sort_values("score", ascending=False).groupby("market", sort=True):
+        market_data[str(market).upper()] = [
+            StockRow(**{("close" if k == "latest_close" else k): v for k, v in row.items() if k != "market"})
+            for row in group.to_dict("records")
+        ]
+    return market_data
+
+
+def market_data_from_scores(scores_path: str | Path = "data/scores.db") -> dict[str, list[StockRow]]:
+    """Latest recorded score of every symbol (``stock scan``) as site market data.
+
+    Args:
+        scores_path: Path to the `ScoreStore` database.
+
+    Returns:
+        Market name → rows sorted by score, best first; empty if no scans
+        are recorded.
+    """
+    from ..data.market_types import detect_market_type, get_currency
+    from ..data.storage.score_store import ScoreStore
+
+    store = ScoreStore(scores_path)
+    try:
+        records = store.latest()
+    finally:
+        store.close()
+
+    market_data: dict[str, list[StockRow]] = {}
+    for r in sorted(records, key=lambda r: r.score, reverse=True):
+        market_data.setdefault(detect_market_type(r.symbol).value.upper(), []).append(
+            StockRow(
+                symbol=r.symbol,
+                currency=get_currency(r.symbol),
+                close=r.close,
+                score=r.score,
+                interpretation=r.interpretation,
+                macd_signal=r.macd_signal,
+                mfi_signal=r.mfi_signal,
+                obv_signal=r.obv_signal,
+            )
+        )
+    return dict(sorted(market_data.items()))
+
+
 def _markdown_to_html(text: str) -> str:
     """Convert markdown text to HTML (simple converter).
 
@@ -1,5 +1,7 @@
 """Shared test fixtures."""
 
+from collections.abc import Callable
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -28,6 +30,22 @@ def sample_ohlcv() -> pd.DataFrame:
     return df
 
 
+@pytest.fixture
+def make_ohlcv() -> Callable[..., pd.DataFrame]:
+    """Factory for seeded random-walk OHLCV frames of `n` business days."""
+
+    def make(n: int, seed: int = 7) -> pd.DataFrame:
+        rng = np.random.RandomState(seed)
+        dates = pd.bdate_range("2022-01-03", periods=n)
+        close = 100 * np.exp(np.cumsum(rng.randn(n) * 0.015))
+        high = close * (1 + rng.uniform(0.001, 0.02, n))
+        low = close * (1 - rng.uniform(0.001, 0.02, n))
+        volume = rng.randint(1_000_000, 10_000_000, n).astype(float)
+        return pd.DataFrame({"Open": close, "High": high, "Low": low, "Close": close, "Volume": volume}, index=dates)
+
+    return make
+
+
 @pytest.fixture
 def downtrend_ohlcv() -> pd.DataFrame:
     """Create a synthetic 60-day downtrend OHLCV DataFrame."""
@@ -1,7 +1,12 @@
 """Tests for the alert manager."""
 
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from ai_financial_advisor.data.storage.score_store import ScoreRecord, ScoreStore
 from ai_financial_advisor.notifications.alert_manager import AlertManager
 from ai_financial_advisor.notifications.base import Notifier
 
@@ -40,3 +45,36 @@ class TestAlertManager:
         """Cannot instantiate Notifier directly."""
         with pytest.raises(TypeError):
             Notifier()
+
+    def test_send_alerts_scans_watchlist(self, monkeypatch):
+        dates = pd.date_range("2025-01-01", periods=60, freq="B")
+        close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 0.5, 60))
+        close[-1] = close[-2] * 1.2
+        frames = {"AAPL": pd.DataFrame({"Close": close, "Volume": 1_000_000.0}, index=dates)}
+        monkeypatch.setattr("ai_financial_advisor.data.stock_data.download_many", lambda symbols, period: frames)
+
+        notifier = FakeNotifier()
+        count = AlertManager(notifier).send_alerts(["AAPL", "MISSING"], days=5)
+        assert count >= 1
+        assert "`AAPL` price_spike" in notifier.messages[0]
+
+    def test_digest_reads_recorded_scores(self, monkeypatch, tmp_path):
+        analyzed: list[list[str]] = []
+
+        def fake_analyze(self, symbols, period="1y", **kwargs):
+            analyzed.append(list(symbols))
+            return []
+
+        monkeypatch.setattr("ai_financial_advisor.agents.stock_agent.StockAgent.analyze_multiple", fake_analyze)
+        scores = ScoreStore(tmp_path / "scores.db")
+        scores.record_run([ScoreRecord("AAPL", 240.0, -0.1, 0, 0, 0, "Neutral")], datetime.now() - timedelta(hours=30))
+        scores.record_run([ScoreRecord("AAPL", 247.99, 0.45, 0, 0, 0, "Bullish")])
+
+        notifier = FakeNotifier()
+        assert AlertManager(notifier).send_digest(["AAPL", "MSFT"], scores=scores, max_age=timedelta(hours=12))
+        assert analyzed == [["MSFT"]]  # AAPL comes from the store
+        assert "AAPL" in notifier.messages[0] and "+0.4500" in notifier.messages[0]
+        assert "Top Movers" in notifier.messages[0]
+
+        AlertManager(notifier).send_digest(["AAPL"], scores=scores, max_age=timedelta(0))
+        assert analyzed[-1] == ["AAPL"]
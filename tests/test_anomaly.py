@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from ai_financial_advisor.analysis.anomaly import Anomaly, AnomalyDetector
+from ai_financial_advisor.analysis.panel import to_panel
 
 
 @pytest.fixture
@@ -137,3 +138,68 @@ class TestAnomalyDetector:
         if len(anomalies) >= 2:
             dates = [a.date for a in anomalies]
             assert dates == sorted(dates, reverse=True)
+
+
+def _flatten(per_symbol: dict[str, list[Anomaly]]) -> list[Anomaly]:
+    merged = [a for anomalies in per_symbol.values() for a in anomalies]
+    merged.sort(key=lambda a: a.date, reverse=True)
+    return merged
+
+
+@pytest.fixture
+def watchlist(spike_df: pd.DataFrame, crash_df: pd.DataFrame, volume_surge_df: pd.DataFrame) -> dict:
+    """Frames on different calendars: a late listing and a sparse, volume-less one."""
+    sparse = spike_df.iloc[::2].copy()
+    sparse["Volume"] = 0.0
+    return {"SPIKE": spike_df, "CRASH": crash_df.iloc[10:], "SURGE": volume_surge_df, "SPARSE": sparse}
+
+
+class TestSinceWindow:
+    def test_since_matches_filtered_full_scan(self, spike_df: pd.DataFrame) -> None:
+        detector = AnomalyDetector(z_threshold=2.0)
+        since = spike_df.index[45]
+        expected = [a for a in detector.detect_all(spike_df, "TEST") if a.date >= since.date()]
+        assert expected
+        assert detector.detect_all(spike_df, "TEST", since=since) == expected
+
+    def test_since_accepts_strings(self, spike_df: pd.DataFrame) -> None:
+        detector = AnomalyDetector(z_threshold=2.0)
+        since = spike_df.index[45]
+        assert detector.detect_all(spike_df, "TEST", since=str(since.date())) == detector.detect_all(
+            spike_df, "TEST", since=since
+        )
+
+    def test_since_after_last_bar_is_empty(self, spike_df: pd.DataFrame) -> None:
+        detector = AnomalyDetector(z_threshold=2.0)
+        assert detector.detect_all(spike_df, "TEST", since="2030-01-01") == []
+
+    def test_recent_matches_full_scan(self, spike_df: pd.DataFrame) -> None:
+        detector = AnomalyDetector(z_threshold=2.0)
+        cutoff = (spike_df.index[-1] - pd.Timedelta(days=14)).date()
+        expected = [a for a in detector.detect_all(spike_df, "TEST") if a.date >= cutoff]
+        assert detector.get_recent_anomalies(spike_df, "TEST", days=14) == expected
+
+
+class TestPanelDetection:
+    def test_panel_matches_per_symbol(self, watchlist: dict) -> None:
+        detector = AnomalyDetector(z_threshold=2.0)
+        expected = _flatten({s: detector.detect_all(df, s) for s, df in watchlist.items()})
+        assert expected
+        assert detector.detect_panel(to_panel(watchlist)) == expected
+
+    def test_panel_since(self, watchlist: dict) -> None:
+        detector = AnomalyDetector(z_threshold=2.0)
+        since = watchlist["SPIKE"].index[40]
+        expected = _flatten({s: detector.detect_all(df, s, since=since) for s, df in watchlist.items()})
+        assert detector.detect_panel(to_panel(watchlist), since=since) == expected
+
+    @pytest.mark.parametrize("days", [1, 5, 30])
+    def test_recent_panel_uses_each_symbols_last_bar(self, watchlist: dict, days: int) -> None:
+        watchlist = {**watchlist, "STALE": watchlist["SPIKE"].iloc[:52]}
+        detector = AnomalyDetector(z_threshold=2.0)
+        expected = _flatten({s: detector.get_recent_anomalies(df, s, days=days) for s, df in watchlist.items()})
+        assert detector.get_recent_anomalies_panel(to_panel(watchlist), days=days) == expected
+
+    def test_volume_less_symbol_has_no_volume_anomalies(self, watchlist: dict) -> None:
+        anomalies = AnomalyDetector(z_threshold=1.0).detect_panel(to_panel(watchlist))
+        assert not [a for a in anomalies if a.symbol == "SPARSE" and a.type.startswith("volume")]
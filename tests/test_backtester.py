@@ -1,11 +1,16 @@
 """Tests for the backtesting engine."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from ai_financial_advisor.strategies.backtester import (
+    METRIC_COLUMNS,
     Backtester,
     Trade,
+    simulate,
 )
+from ai_financial_advisor.strategies.execution import ExecutionModel
 from ai_financial_advisor.strategies.trend_strategy import Signal
 
 
@@ -166,3 +171,141 @@ class TestBacktester:
 
         assert result.total_trades == 0
         assert result.final_value == 10000
+
+
+def _random_signals(n: int, seed: int) -> tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2022-01-03", periods=n)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    actions = rng.choice(["buy", "sell", "hold"], size=n, p=[0.1, 0.1, 0.8])
+    return dates, prices, actions
+
+
+class TestArrayCore:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_run_arrays_matches_run(self, seed):
+        dates, prices, actions = _random_signals(300, seed)
+        signals = [Signal(date=d, action=a, score=0.0, price=p) for d, a, p in zip(dates, actions, prices)]
+        bt = Backtester(initial_capital=10000)
+
+        expected = bt.run(signals, symbol="ARR")
+        result = bt.run_arrays(dates, prices, actions, symbol="ARR")
+
+        assert result.trades == expected.trades
+        assert result.total_trades > 0
+        pd.testing.assert_series_equal(result.equity_curve, expected.equity_curve, check_freq=False)
+        for column in METRIC_COLUMNS:
+            assert getattr(result, column) == getattr(expected, column)
+
+    def test_run_frame(self):
+        dates, prices, actions = _random_signals(120, 3)
+        frame = pd.DataFrame({"price": prices, "action": actions}, index=dates)
+        bt = Backtester(initial_capital=10000)
+
+        result = bt.run_frame(frame, symbol="FRM", period="6mo")
+        expected = bt.run_arrays(dates, prices, actions, symbol="FRM", period="6mo")
+
+        assert result.trades == expected.trades
+        assert (result.symbol, result.period, result.final_value) == ("FRM", "6mo", expected.final_value)
+
+    def test_trade_ledger(self):
+        signals = _make_signals(
+            [100, 100, 110, 110, 105, 105, 115],
+            ["hold", "buy", "hold", "sell", "hold", "buy", "hold"],
+        )
+        result = Backtester(initial_capital=10000).run(signals)
+
+        # The open second position is marked to market but not a trade
+        assert len(result.trades) == 1
+        trade = result.trades[0]
+        assert trade.buy_date == signals[1].date
+        assert trade.sell_date == signals[3].date
+        assert trade.return_pct == 10.0
+        assert trade.holding_days == 2
+        assert result.final_value == round(10000 * 1.1 / 105 * 115, 2)
+
+    def test_simulate_paths_are_independent(self):
+        _, prices, _ = _random_signals(200, 4)
+        rng = np.random.default_rng(4)
+        buy = rng.random((200, 5)) < 0.1
+        sell = rng.random((200, 5)) < 0.1
+
+        batch = simulate(prices, buy, sell, 5000)
+        for j in range(5):
+            single = simulate(prices, buy[:, j], sell[:, j], 5000)
+            np.testing.assert_array_equal(batch.equity[:, j], single.equity[:, 0])
+            assert batch.final_value[j] == single.final_value[0]
+            assert batch.n_exits[j] == single.n_exits[0]
+
+    def test_buy_wins_over_sell_on_same_day(self):
+        prices = np.array([100.0, 110.0, 120.0])
+        sim = simulate(prices, np.array([True, False, False]), np.array([True, True, False]))
+        assert sim.n_entries[0] == 1
+        assert sim.n_exits[0] == 1
+
+
+class TestExecutionCosts:
+    def _frame(self, prices: list[float], actions: list[str]) -> pd.DataFrame:
+        dates = pd.bdate_range("2024-01-01", periods=len(prices))
+        return pd.DataFrame({"price": prices, "action": actions}, index=dates)
+
+    def test_default_model_costs_nothing(self):
+        dates, prices, actions = _random_signals(300, 5)
+        free = Backtester(10000, ExecutionModel()).run_arrays(dates, prices, actions)
+        expected = Backtester(10000).run_arrays(dates, prices, actions)
+        assert free.trades == expected.trades
+        pd.testing.assert_series_equal(free.equity_curve, expected.equity_curve)
+        assert free.total_costs == 0.0
+
+    def test_commission_and_slippage(self):
+        frame = self._frame([100, 100, 110, 110], ["hold", "buy", "hold", "sell"])
+        model = ExecutionModel(commission_bps=10, slippage_bps=50)
+        result = Backtester(10000, model).run_frame(frame)
+
+        buy_fill, sell_fill = 100 * 1.005, 110 * 0.995
+        shares = 10000 / 1.001 / buy_fill
+        proceeds = shares * sell_fill
+        assert result.final_value == round(proceeds * 0.999, 2)
+        assert result.trades[0].buy_price == pytest.approx(buy_fill)
+        assert result.trades[0].sell_price == pytest.approx(sell_fill)
+        assert result.trades[0].return_pct == round((proceeds * 0.999 / 10000 - 1) * 100, 4)
+        assert result.total_costs == round(10000 - proceeds * 0.999 + shares * 10, 2)
+
+    def test_next_open_fills(self):
+        frame = self._frame([100, 100, 110, 120], ["buy", "hold", "sell", "hold"])
+        bars = pd.DataFrame({"Open": [99, 101, 108, 118], "High": 0, "Low": 0}, index=frame.index)
+        result = Backtester(10000, ExecutionModel(fill="next_open")).run_frame(frame, bars=bars)
+
+        trade = result.trades[0]
+        assert (trade.buy_date, trade.buy_price) == (frame.index[1], 101)
+        assert (trade.sell_date, trade.sell_price) == (frame.index[3], 118)
+        # Flat on the signal day, invested from the fill day's close
+        assert result.equity_curve.iloc[0] == 10000
+        assert result.equity_curve.iloc[1] == pytest.approx(10000 / 101 * 100)
+
+    def test_lots_keep_leftover_cash(self):
+        frame = self._frame([30, 30, 33], ["buy", "hold", "sell"])
+        result = Backtester(10000, ExecutionModel(lot_size=100)).run_frame(frame)
+        # 3 lots cost 9000; 1000 stays in cash
+        assert result.equity_curve.iloc[1] == 10000
+        assert result.final_value == 300 * 33 + 1000
+
+    def test_unaffordable_lot_is_not_a_trade(self):
+        frame = self._frame([300, 300, 330], ["buy", "hold", "sell"])
+        result = Backtester(10000, ExecutionModel(lot_size=100, min_commission=5)).run_frame(frame)
+        assert result.total_trades == 0
+        assert result.final_value == 10000
+        assert result.total_costs == 0.0
+
+    def test_costs_do_not_depend_on_batching(self):
+        _, prices, _ = _random_signals(200, 6)
+        rng = np.random.default_rng(6)
+        buy = rng.random((200, 4)) < 0.1
+        sell = rng.random((200, 4)) < 0.1
+        model = ExecutionModel(commission_tiers=((0, 20), (8000, 5)), min_commission=2, lot_size=10)
+
+        batch = simulate(prices, buy, sell, 10000, model)
+        for j in range(4):
+            single = simulate(prices, buy[:, j], sell[:, j], 10000, model)
+            np.testing.assert_array_equal(batch.equity[:, j], single.equity[:, 0])
+            np.testing.assert_array_equal(batch.costs[j, : single.costs.shape[1]], single.costs[0])
@@ -0,0 +1,121 @@
+"""Tests for bootstrap robustness checks."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.data.market_types import bars_per_year
+from ai_financial_advisor.strategies import bootstrap as bootstrap_module
+from ai_financial_advisor.strategies.backtester import Backtester, Trade
+from ai_financial_advisor.strategies.bootstrap import EQUITY_METRICS, TRADE_METRICS, Bootstrapper
+from ai_financial_advisor.strategies.intraday import IntradayBacktester
+from ai_financial_advisor.strategies.trend_strategy import TrendScoreStrategy
+
+
+@pytest.fixture
+def result(make_ohlcv):
+    signals = TrendScoreStrategy(buy_threshold=0.2, sell_threshold=-0.2).generate_signal_frame(make_ohlcv(400))
+    return Backtester(initial_capital=10000).run_frame(signals, symbol="TEST")
+
+
+def _trade(return_pct: float) -> Trade:
+    return Trade("2024-01-01", 100.0, "2024-01-10", 100 + return_pct, return_pct, 9)
+
+
+class TestEquityBootstrap:
+    def test_observed_matches_backtest(self, result):
+        boot = Bootstrapper(200, seed=1).equity(result.equity_curve)
+        assert list(boot.intervals.index) == list(EQUITY_METRICS)
+        observed = boot.intervals["observed"]
+        assert round(observed["total_return"], 4) == result.total_return
+        assert round(observed["sharpe_ratio"], 4) == result.sharpe_ratio
+        assert round(observed["max_drawdown"], 4) == result.max_drawdown
+
+    def test_observed_sharpe_matches_intraday_backtest(self, make_ohlcv):
+        df = make_ohlcv(2000)
+        df.index = pd.date_range("2024-01-02 09:30", periods=len(df), freq="5min")
+        result = IntradayBacktester(buy_threshold=0.2, sell_threshold=-0.2, interval="5m").run(df, symbol="AAPL")
+        assert result.sharpe_ratio != 0
+        boot = Bootstrapper(100, seed=1, periods_per_year=bars_per_year("5m")).equity(result.equity_curve)
+        assert boot.intervals.loc["sharpe_ratio", "observed"] == pytest.approx(result.sharpe_ratio, abs=1e-4)
+
+    def test_intervals_are_ordered(self, result):
+        boot = Bootstrapper(500, seed=1).equity(result.equity_curve)
+        assert boot.samples.shape == (500, len(EQUITY_METRICS))
+        intervals = boot.intervals
+        assert (intervals["lower"] <= intervals["median"]).all()
+        assert (intervals["median"] <= intervals["upper"]).all()
+        assert 0 <= boot.probability_of_loss <= 1
+
+    def test_seeded_runs_repeat(self, result):
+        a = Bootstrapper(300, seed=5).equity(result.equity_curve).samples
+        b = Bootstrapper(300, seed=5).equity(result.equity_curve).samples
+        c = Bootstrapper(300, seed=6).equity(result.equity_curve).samples
+        pd.testing.assert_frame_equal(a, b)
+        assert not a.equals(c)
+
+    def test_chunking_does_not_change_replicates(self, result, monkeypatch):
+        full = Bootstrapper(300, seed=5).equity(result.equity_curve).samples
+        monkeypatch.setattr(bootstrap_module, "_TEMPORARIES", 10**6)
+        chunked = Bootstrapper(300, seed=5, memory_mb=1).equity(result.equity_curve).samples
+        pd.testing.assert_frame_equal(full, chunked)
+
+    def test_replicate_matches_pandas_metrics(self):
+        curve = pd.Series([100.0, 102.0, 99.0, 101.0, 104.0, 103.0])
+        boot = Bootstrapper(64, block_size=1, seed=2)
+        draws = boot._draw(curve.pct_change().dropna().to_numpy(), 1, np.random.default_rng(0), 1)[0]
+        replicate = pd.Series(np.concatenate([[1.0], np.cumprod(1 + draws)]))
+        returns = replicate.pct_change().dropna()
+        metrics = bootstrap_module._equity_metrics(replicate.to_numpy()[:, None], draws[:, None])
+        assert metrics["sharpe_ratio"][0] == pytest.approx(returns.mean() / returns.std() * np.sqrt(252))
+        drawdown = ((replicate - replicate.cummax()) / replicate.cummax()).min() * 100
+        assert metrics["max_drawdown"][0] == pytest.approx(drawdown)
+
+    def test_shuffle_keeps_total_return(self, result):
+        boot = Bootstrapper(200, method="shuffle", seed=1).equity(result.equity_curve)
+        np.testing.assert_allclose(boot.samples["total_return"], result.total_return, atol=1e-4)
+        np.testing.assert_allclose(boot.samples["sharpe_ratio"], result.sharpe_ratio, atol=1e-4)
+
+    def test_block_draws_consecutive_days(self):
+        returns = np.arange(10, dtype=float)
+        draws = Bootstrapper(seed=1)._draw(returns, 5, np.random.default_rng(0), 50)
+        steps = np.diff(draws.reshape(50, 2, 5), axis=2) % 10
+        assert draws.shape == (50, 10)
+        assert (steps == 1).all()
+
+    def test_too_short(self):
+        with pytest.raises(ValueError):
+            Bootstrapper(seed=1).equity(pd.Series([100.0, 101.0]))
+
+
+class TestTradeBootstrap:
+    def test_trade_metrics(self):
+        trades = [_trade(10.0), _trade(-5.0), _trade(2.0)]
+        boot = Bootstrapper(1000, seed=1).trades(trades)
+        assert list(boot.intervals.index) == list(TRADE_METRICS)
+        observed = boot.intervals["observed"]
+        assert observed["total_return"] == pytest.approx((1.1 * 0.95 * 1.02 - 1) * 100)
+        assert observed["max_drawdown"] == pytest.approx(-5.0)
+        assert observed["win_rate"] == pytest.approx(200 / 3)
+        # iid resampling of three trades: win rate is a multiple of 1/3
+        wins = boot.samples["win_rate"] * 3 / 100
+        np.testing.assert_allclose(wins, wins.round(), atol=1e-9)
+
+    def test_run_combines_both(self, result):
+        report = Bootstrapper(100, seed=1).run(result)
+        assert report.equity.replicates == 100
+        assert (report.trades is None) == (not result.trades)
+
+    def test_no_trades(self):
+        with pytest.raises(ValueError):
+            Bootstrapper(seed=1).trades([])
+
+
+class TestValidation:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"method": "jackknife"}, {"replicates": 0}, {"block_size": 0}, {"confidence": 1.0}],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            Bootstrapper(**kwargs)
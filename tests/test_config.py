@@ -15,6 +15,9 @@ class TestSettings:
         assert settings.llm.model == "deepseek-reasoner"
         assert settings.llm.temperature == 0.5
         assert settings.llm.max_tokens == 8192
+        assert settings.llm.report_prompt_tokens == 32000
+        assert settings.llm.snippet_tokens == 400
+        assert settings.llm.sentiment_prompt_tokens == 4000
 
     def test_news_api_defaults(self) -> None:
         settings = Settings()
@@ -26,3 +29,14 @@ class TestSettings:
         settings = Settings()
         assert str(settings.storage.sqlite_path).endswith("news.db")
         assert str(settings.storage.reports_dir).endswith("reports")
+        assert settings.storage.bar_cache_enabled is True
+        assert str(settings.storage.bar_cache_path).endswith("bars.db")
+        assert settings.storage.bar_cache_format == "sqlite"
+
+    def test_scraper_defaults(self) -> None:
+        settings = Settings()
+        assert settings.scraper.workers == 8
+        assert settings.scraper.per_host_delay == 1.0
+        assert settings.scraper.timeout == 15.0
+        assert settings.scraper.extractor == "readability"
+        assert settings.scraper.fallback_extractor is None
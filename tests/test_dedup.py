@@ -0,0 +1,200 @@
+"""Tests for near-duplicate article clustering."""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ai_financial_advisor.agents.news_agent import NewsAgent
+from ai_financial_advisor.analysis.dedup import (
+    MinHasher,
+    article_text,
+    assign_clusters,
+    cluster_articles,
+    group_articles,
+    signature_from_bytes,
+    signature_to_bytes,
+    similarity,
+)
+from ai_financial_advisor.config import Settings
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.data.storage.base import ArticleSignature
+from ai_financial_advisor.data.storage.sqlite_store import SQLiteStore
+from ai_financial_advisor.llm.base import LLMProvider, LLMResponse
+
+_VOCABULARY = np.array([f"word{i}" for i in range(5_000)])
+
+
+def _story(seed: int, words: int = 300) -> list[str]:
+    return list(np.random.default_rng(seed).choice(_VOCABULARY, size=words))
+
+
+def _rewrite(story: list[str], seed: int, edits: float = 0.03) -> list[str]:
+    """A lightly edited copy: new intro, a few words changed, the ending cut."""
+    rng = np.random.default_rng(seed)
+    words = list(story[: int(len(story) * 0.9)])
+    for i in rng.choice(len(words), size=int(len(words) * edits), replace=False):
+        words[i] = str(rng.choice(_VOCABULARY))
+    return ["breaking", "news", "from", f"outlet{seed}", *words]
+
+
+def _article(url: str, words: list[str], source: str = "Reuters") -> Article:
+    return Article(
+        title=f"Headline {url}",
+        url=url,
+        source_name=source,
+        description="",
+        published_at=datetime(2025, 7, 11),
+        content=" ".join(words),
+    )
+
+
+class FakeLLM(LLMProvider):
+    """Records prompts instead of calling a model."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def complete(self, messages, *, temperature=0.5, max_tokens=8192) -> LLMResponse:
+        self.prompts.append(messages[-1]["content"])
+        return LLMResponse(content="report", model="fake")
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+
+class TestMinHasher:
+    def test_estimates_jaccard(self) -> None:
+        hasher = MinHasher(num_perm=256, bands=64)
+        a, b = _story(1), _story(1)
+        b[150:] = _story(2)[150:]
+        shingles = [{tuple(words[i : i + 5]) for i in range(len(words) - 4)} for words in (a, b)]
+        jaccard = len(shingles[0] & shingles[1]) / len(shingles[0] | shingles[1])
+        estimate = similarity(hasher.signature(" ".join(a)), hasher.signature(" ".join(b)))
+        assert estimate == pytest.approx(jaccard, abs=0.1)
+
+    def test_signatures_are_deterministic(self) -> None:
+        text = " ".join(_story(1))
+        signature = MinHasher().signature(text)
+        assert signature.dtype == np.uint32
+        assert len(signature) == 128
+        assert np.array_equal(signature, MinHasher().signature(text.upper()))
+        assert not np.array_equal(signature, MinHasher(seed=2).signature(text))
+        assert np.array_equal(signature_from_bytes(signature_to_bytes(signature)), signature)
+
+    def test_band_keys(self) -> None:
+        hasher = MinHasher()
+        a = hasher.signature(" ".join(_story(1)))
+        b = a.copy()
+        b[:4] += 1  # differs in the first band only
+        keys_a, keys_b = hasher.band_keys(a), hasher.band_keys(b)
+        assert len(keys_a) == 32
+        assert len(set(keys_a)) == 32
+        assert keys_a[0] != keys_b[0]
+        assert keys_a[1:] == keys_b[1:]
+
+    def test_short_and_cjk_text(self) -> None:
+        hasher = MinHasher()
+        assert similarity(hasher.signature("rates"), hasher.signature("rates")) == 1.0
+        first = "海关总署周一公布的数据显示，以美元计价，中国5月出口同比增长4.8%，低于市场预期的6%。"
+        second = "海关总署公布的数据显示，以美元计价，中国5月出口同比增长4.8%，低于市场预期。"
+        assert similarity(hasher.signature(first), hasher.signature(second)) > 0.5
+
+    def test_bands_must_divide_signature(self) -> None:
+        with pytest.raises(ValueError, match="must divide"):
+            MinHasher(num_perm=100, bands=32)
+
+
+class TestClusterArticles:
+    def test_groups_rewrites_of_the_same_story(self) -> None:
+        wire, other = _story(1), _story(2)
+        articles = [
+            _article("https://a/1", wire, "Reuters"),
+            _article("https://b/1", other, "Bloomberg"),
+            _article("https://c/1", _rewrite(wire, 3), "CNN"),
+            _article("https://d/1", _rewrite(wire, 4), "Reuters"),
+        ]
+        clusters = cluster_articles(articles)
+        assert [c.cluster_id for c in clusters] == ["https://a/1", "https://b/1"]
+        assert [a.url for a in clusters[0].articles] == ["https://a/1", "https://c/1", "https://d/1"]
+        assert clusters[0].sources == ["Reuters", "CNN"]
+        assert clusters[0].representative.url == "https://a/1"  # the uncut version
+
+    def test_unrelated_articles_stay_apart(self) -> None:
+        articles = [_article(f"https://x/{i}", _story(i)) for i in range(50)]
+        assert len(cluster_articles(articles)) == 50
+
+    def test_joins_known_clusters(self) -> None:
+        hasher = MinHasher()
+        wire = _story(1)
+        known = {
+            "https://old/1": ArticleSignature(
+                "https://old/1", signature_to_bytes(hasher.signature(" ".join(wire))), "https://old/0"
+            ),
+        }
+        fresh = {
+            "https://new/1": hasher.signature(" ".join(_rewrite(wire, 5))),
+            "https://new/2": hasher.signature(" ".join(_story(9))),
+            "https://new/3": hasher.signature(" ".join(_rewrite(_story(9), 6))),
+        }
+        assert assign_clusters(fresh, known, hasher) == {
+            "https://new/1": "https://old/0",
+            "https://new/2": "https://new/2",
+            "https://new/3": "https://new/2",
+        }
+
+    def test_group_articles(self) -> None:
+        articles = [_article(f"https://x/{i}", _story(i)) for i in range(3)]
+        clusters = group_articles(articles, {"https://x/0": "c", "https://x/2": "c"})
+        assert [(c.cluster_id, len(c.articles)) for c in clusters] == [("c", 2), ("https://x/1", 1)]
+
+    def test_article_text_falls_back_to_description(self) -> None:
+        article = _article("https://x/1", [])
+        article.content, article.description = None, "Summary"
+        assert article_text(article) == "Headline https://x/1\nSummary"
+
+
+class TestNewsAgentDedup:
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SQLiteStore:
+        store = SQLiteStore(tmp_path / "news.db")
+        yield store
+        store.close()
+
+    def test_report_prompt_lists_each_story_once(self) -> None:
+        llm = FakeLLM()
+        wire = _story(1)
+        articles = [
+            _article("https://a/1", wire, "Reuters"),
+            _article("https://b/1", _rewrite(wire, 2), "Associated Press"),
+            _article("https://c/1", _story(3), "Bloomberg"),
+        ]
+        NewsAgent(Settings(), llm=llm).generate_report(articles)
+        prompt = llm.prompts[0]
+        assert "News 2:" in prompt and "News 3:" not in prompt
+        assert "Source: Reuters, Associated Press\nReports: 2" in prompt
+        assert "https://b/1" not in prompt
+
+    def test_clusters_are_incremental_across_runs(self, store: SQLiteStore, monkeypatch: pytest.MonkeyPatch) -> None:
+        agent = NewsAgent(Settings(), llm=FakeLLM(), store=store)
+        wire = _story(1)
+        first = [_article("https://a/1", wire), _article("https://b/1", _story(2))]
+        agent.deduplicate(first)
+        assert set(store.get_article_signatures(["https://a/1", "https://b/1"])) == {"https://a/1", "https://b/1"}
+
+        hashed = []
+        signature = agent._hasher.signature
+        monkeypatch.setattr(agent._hasher, "signature", lambda text: hashed.append(text) or signature(text))
+        second = [*first, _article("https://c/1", _rewrite(wire, 3), "CNN")]
+        clusters = agent.deduplicate(second)
+        assert len(hashed) == 1  # only the new article
+        assert [(c.cluster_id, [a.url for a in c.articles]) for c in clusters] == [
+            ("https://a/1", ["https://a/1", "https://c/1"]),
+            ("https://b/1", ["https://b/1"]),
+        ]
+
+        # A later run sees only the rewrite: it still joins the stored cluster
+        third = agent.deduplicate([_article("https://d/1", _rewrite(wire, 4), "CNBC")])
+        assert third[0].cluster_id == "https://a/1"
@@ -0,0 +1,100 @@
+"""Tests for backtest execution models."""
+
+import numpy as np
+import pytest
+
+from ai_financial_advisor.strategies.execution import ExecutionModel, parse_commission
+
+
+class TestCommission:
+    def test_default_is_free(self):
+        model = ExecutionModel()
+        np.testing.assert_array_equal(model.commission(np.array([0.0, 1e6])), [0.0, 0.0])
+        np.testing.assert_array_equal(model.max_notional(np.array([100000.0])), [100000.0])
+
+    def test_flat_rate_and_minimum(self):
+        model = ExecutionModel(commission_bps=10, min_commission=5)
+        np.testing.assert_allclose(model.commission(np.array([1000.0, 100000.0])), [5.0, 100.0])
+
+    def test_tiers_are_marginal(self):
+        model = ExecutionModel(commission_tiers=((0, 20), (10000, 10), (50000, 2)))
+        # 10k at 20 bps + 40k at 10 bps + 50k at 2 bps
+        assert model.commission(np.array([100000.0]))[0] == pytest.approx(20 + 40 + 10)
+        assert model.commission(np.array([5000.0]))[0] == pytest.approx(10)
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            ExecutionModel(commission_bps=25),
+            ExecutionModel(commission_bps=5, min_commission=20),
+            ExecutionModel(commission_tiers=((0, 20), (10000, 10), (50000, 2)), min_commission=1),
+        ],
+    )
+    def test_max_notional_spends_all_capital(self, model):
+        capital = np.array([10.0, 500.0, 10000.0, 10010.0, 60000.0, 1e6])
+        notional = model.max_notional(capital)
+        spent = notional + model.commission(notional)
+        fits = notional > 0
+        np.testing.assert_allclose(spent[fits], capital[fits], rtol=1e-12)
+        assert (notional >= 0).all()
+
+    def test_parse_commission(self):
+        assert parse_commission("5") == ((0.0, 5.0),)
+        assert parse_commission("0:10,50000:5") == ((0.0, 10.0), (50000.0, 5.0))
+        with pytest.raises(ValueError):
+            parse_commission("a:b")
+
+
+class TestFills:
+    def test_slippage_and_spread(self):
+        close = np.array([100.0, 200.0])
+        bars = {"Open": close, "High": close + 4, "Low": close - 4}
+        model = ExecutionModel(slippage_bps=10, spread_fraction=0.5)
+        reference, buy, sell = model.fill_prices(close, bars)
+        np.testing.assert_array_equal(reference, close)
+        np.testing.assert_allclose(buy, close * 1.001 + 2)
+        np.testing.assert_allclose(sell, close * 0.999 - 2)
+
+    def test_next_open_uses_open(self):
+        close = np.array([100.0, 101.0])
+        bars = {"Open": np.array([99.0, 100.5]), "High": close, "Low": close}
+        reference, buy, sell = ExecutionModel(fill="next_open").fill_prices(close, bars)
+        np.testing.assert_array_equal(reference, bars["Open"])
+        np.testing.assert_array_equal(buy, sell)
+
+    def test_bars_required(self):
+        with pytest.raises(ValueError, match="bars"):
+            ExecutionModel(fill="next_open").fill_prices(np.array([100.0]))
+
+
+class TestLots:
+    def test_round_down_to_lots(self):
+        model = ExecutionModel(lot_size=100)
+        np.testing.assert_array_equal(model.round_shares(np.array([99.0, 250.0, 299.99999999999])), [0, 200, 300])
+
+    def test_fractional_by_default(self):
+        shares = np.array([1.2345])
+        assert ExecutionModel().round_shares(shares) is shares
+
+    def test_for_symbol(self):
+        model = ExecutionModel(commission_bps=3)
+        assert model.for_symbol("600519.SS").lot_size == 100
+        assert model.for_symbol("0005.HK").lot_size == 400
+        assert model.for_symbol("BTC-USD").lot_size is None
+        assert model.for_symbol("AAPL").commission_bps == 3
+
+
+class TestValidation:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"fill": "vwap"},
+            {"commission_bps": -1},
+            {"commission_tiers": ((100, 5),)},
+            {"commission_tiers": ((0, 5), (0, 3))},
+            {"lot_size": 0},
+        ],
+    )
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            ExecutionModel(**kwargs)
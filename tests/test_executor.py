@@ -0,0 +1,64 @@
+"""Tests for the bounded worker pools."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from ai_financial_advisor import executor
+from ai_financial_advisor.executor import create_pool, gather, worker_limit
+
+
+def _fail(symbol: str) -> str:
+    raise RuntimeError(f"boom {symbol}")
+
+
+class TestWorkerLimit:
+    def test_respects_request(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(executor, "available_memory_mb", lambda: 16_000)
+        assert worker_limit("thread", 4) == 4
+
+    def test_capped_by_memory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(executor, "available_memory_mb", lambda: 400)
+        monkeypatch.setattr(executor.os, "cpu_count", lambda: 16)
+        assert worker_limit("process", 32) == 2
+
+    def test_capped_by_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(executor, "available_memory_mb", lambda: 64_000)
+        assert worker_limit("thread", 500, budget_mb=1000) == 20
+
+    def test_process_capped_by_cpus(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(executor, "available_memory_mb", lambda: 64_000)
+        monkeypatch.setattr(executor.os, "cpu_count", lambda: 2)
+        assert worker_limit("process", 8) == 2
+
+    def test_at_least_one_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(executor, "available_memory_mb", lambda: 10)
+        assert worker_limit("process", 8) == 1
+        assert worker_limit("thread", 0) == 1
+
+    def test_unknown_mode(self) -> None:
+        with pytest.raises(ValueError):
+            worker_limit("fiber", 2)  # type: ignore[arg-type]
+
+
+class TestCreatePool:
+    def test_pool_types(self) -> None:
+        with create_pool("thread", 2) as pool:
+            assert isinstance(pool, ThreadPoolExecutor)
+        with create_pool("process", 1) as pool:
+            assert isinstance(pool, ProcessPoolExecutor)
+
+
+class TestGather:
+    def test_separates_results_and_errors_in_order(self) -> None:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = {
+                "B": pool.submit(str.lower, "B"),
+                "A": pool.submit(_fail, "A"),
+                "C": pool.submit(str.lower, "C"),
+            }
+            results, errors = gather(futures)
+
+        assert list(results) == ["B", "C"]
+        assert results["B"] == "b"
+        assert errors == {"A": "boom A"}
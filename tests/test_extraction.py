@@ -0,0 +1,157 @@
+"""Tests for the article extraction engines."""
+
+import pytest
+
+from ai_financial_advisor.config import ExtractorEngine, ScraperSettings
+from ai_financial_advisor.data.extraction import ContentExtractor, ExtractedContent, ReadabilityExtractor, get_extractor
+from ai_financial_advisor.data.extraction.base import FallbackExtractor
+
+_PARAGRAPHS = [
+    f"Paragraph {i} says stocks rose, bonds fell, and the dollar was steady as investors awaited the data."
+    for i in range(6)
+]
+_RELATED = "".join(
+    f'<li><a href="/{i}">A related headline about markets and the economy, number {i}</a></li>' for i in range(8)
+)
+
+
+def _page(body: str, head: str = "") -> str:
+    return f"<html><head><title>Markets rally | Example</title>{head}</head><body>{body}</body></html>"
+
+
+@pytest.fixture
+def extractor() -> ReadabilityExtractor:
+    return ReadabilityExtractor()
+
+
+class TestReadabilityExtractor:
+    def test_extracts_body_without_boilerplate(self, extractor: ReadabilityExtractor) -> None:
+        paragraphs = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS)
+        html = _page(
+            f"<header><nav><a href='/'>Home</a></nav></header><script>var x = 'Paragraph';</script>"
+            f"<article><h1>Markets rally</h1><div class='article-body'>{paragraphs}</div>"
+            f"<div class='share-tools'><a href='#'>Share</a></div></article>"
+            f"<aside><ul>{_RELATED}</ul></aside>"
+            "<div id='comments'><p>A reader comment that is long enough, with commas, to look like prose.</p></div>"
+            "<footer><p>Copyright Example News, all rights reserved.</p></footer>"
+        )
+        content = extractor.extract(html, "https://example.com/a")
+        assert content.text == "\n\n".join(_PARAGRAPHS)
+        assert content.title == "Markets rally | Example"
+
+    def test_splits_paragraphs_on_line_breaks(self, extractor: ReadabilityExtractor) -> None:
+        html = _page(f"<div class='post-content'>{'<br><br>'.join(_PARAGRAPHS)}</div>")
+        assert extractor.extract(html, "https://example.com/a").text.split("\n\n") == _PARAGRAPHS
+
+    def test_keeps_body_split_across_sections(self, extractor: ReadabilityExtractor) -> None:
+        first = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS[:3])
+        second = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS[3:])
+        html = _page(
+            f"<div class='main'><div class='section'>{first}</div><div class='ad-slot'><p>Advertisement</p></div>"
+            f"<div class='section'>{second}</div></div><div class='rail'><ol>{_RELATED}</ol></div>"
+        )
+        assert extractor.extract(html, "https://example.com/a").text.split("\n\n") == _PARAGRAPHS
+
+    def test_drops_hidden_elements_and_link_lists(self, extractor: ReadabilityExtractor) -> None:
+        paragraphs = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS)
+        html = _page(
+            f"<div class='story'>{paragraphs}<div hidden><p>Only shown to subscribers, a long hidden note.</p></div>"
+            f"<ul>{_RELATED}</ul></div>"
+        )
+        assert extractor.extract(html, "https://example.com/a").text == "\n\n".join(_PARAGRAPHS)
+
+    def test_keeps_page_wrapped_in_a_form(self, extractor: ReadabilityExtractor) -> None:
+        # ASP.NET WebForms put the whole page inside one <form>
+        paragraphs = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS)
+        html = _page(
+            "<form method='post' action='./Article.aspx' id='aspnetForm'>"
+            "<input type='hidden' name='__VIEWSTATE' value='/wEPDwUKMTY1NDU2MTA1MmRk'>"
+            "<div id='ctl00_Header'><a href='/'>Home</a> | <a href='/Markets.aspx'>Markets</a></div>"
+            f"<div id='ctl00_ContentPlaceHolder1_pnlStory'>{paragraphs}</div>"
+            "<div id='ctl00_Comments'><textarea name='comment'>Write your comment here</textarea></div></form>"
+        )
+        assert extractor.extract(html, "https://example.com/a").text == "\n\n".join(_PARAGRAPHS)
+
+    def test_drops_forms_without_prose(self, extractor: ReadabilityExtractor) -> None:
+        first = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS[:3])
+        second = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS[3:])
+        html = _page(
+            f"<div class='story'>{first}"
+            "<form action='/search'><label>Search the archive for more stories</label><input name='q'></form>"
+            f"<form action='/jump'><ul>{_RELATED}</ul></form>{second}</div>"
+        )
+        assert extractor.extract(html, "https://example.com/a").text == "\n\n".join(_PARAGRAPHS)
+
+    @pytest.mark.parametrize(
+        ("head", "body", "expected"),
+        [
+            ("<meta name='author' content='Jane Doe'>", "", ["Jane Doe"]),
+            ("<meta name='byl' content='By Jane Doe and John Roe'>", "", ["Jane Doe", "John Roe"]),
+            ("<meta property='article:author' content='https://example.com/jane'>", "", []),
+            ("", "<a rel='author' href='/jane'>Jane Doe</a>", ["Jane Doe"]),
+            ("", "<span class='author-name'>Posted by Jane Doe</span>", ["Jane Doe"]),
+        ],
+    )
+    def test_authors(self, extractor: ReadabilityExtractor, head: str, body: str, expected: list[str]) -> None:
+        paragraphs = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS)
+        assert extractor.extract(_page(body + paragraphs, head), "https://example.com/a").authors == expected
+
+    def test_non_latin_text(self, extractor: ReadabilityExtractor) -> None:
+        paragraph = "海关总署周一公布的数据显示，以美元计价，中国5月出口同比增长4.8%，低于市场预期。"
+        html = _page(
+            f"<div class='nav'><a href='/'>首页</a></div><div class='article-content'><p>{paragraph}</p></div>"
+        )
+        assert extractor.extract(html, "https://example.com/a").text == paragraph
+
+    def test_encoding_declaration(self, extractor: ReadabilityExtractor) -> None:
+        html = "<?xml version='1.0' encoding='utf-8'?>" + _page(f"<div><p>{_PARAGRAPHS[0]}</p></div>")
+        assert extractor.extract(html, "https://example.com/a").text == _PARAGRAPHS[0]
+
+    def test_encoding_declaration_without_document(self, extractor: ReadabilityExtractor) -> None:
+        html = "<?xml version='1.0' encoding='utf-8'?>"
+        assert extractor.extract(html, "https://example.com/a") == ExtractedContent(text="")
+
+    def test_empty_page(self, extractor: ReadabilityExtractor) -> None:
+        assert extractor.extract("", "https://example.com/a") == ExtractedContent(text="")
+        assert extractor.extract(_page(""), "https://example.com/a").text == ""
+
+
+class _Fixed(ContentExtractor):
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def extract(self, html: str, url: str) -> ExtractedContent:
+        self.calls += 1
+        return ExtractedContent(text=self.text)
+
+
+class TestGetExtractor:
+    def test_default_is_readability(self) -> None:
+        assert isinstance(get_extractor(ScraperSettings()), ReadabilityExtractor)
+
+    def test_fallback(self) -> None:
+        pytest.importorskip("newspaper")
+        extractor = get_extractor(ScraperSettings(fallback_extractor=ExtractorEngine.NEWSPAPER))
+        assert isinstance(extractor, FallbackExtractor)
+
+    def test_newspaper_engine(self) -> None:
+        pytest.importorskip("newspaper")
+        extractor = get_extractor(ScraperSettings(extractor=ExtractorEngine.NEWSPAPER))
+        paragraphs = "".join(f"<p>{p}</p>" for p in _PARAGRAPHS)
+        content = extractor.extract(_page(f"<article>{paragraphs}</article>"), "https://example.com/a")
+        assert "Paragraph 5 says stocks rose" in content.text
+
+
+class TestFallbackExtractor:
+    def test_uses_primary_when_long_enough(self) -> None:
+        primary, fallback = _Fixed("x" * 100), _Fixed("y" * 500)
+        assert FallbackExtractor(primary, fallback).extract("", "u").text == "x" * 100
+        assert fallback.calls == 0
+
+    def test_falls_back_on_short_text(self) -> None:
+        primary, fallback = _Fixed("short"), _Fixed("y" * 500)
+        assert FallbackExtractor(primary, fallback).extract("", "u").text == "y" * 500
+
+    def test_keeps_longer_result(self) -> None:
+        assert FallbackExtractor(_Fixed("short"), _Fixed("")).extract("", "u").text == "short"
@@ -0,0 +1,73 @@
+"""Tests for incremental indicator state."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.analysis.incremental import IndicatorState
+from ai_financial_advisor.analysis.indicators import compute_all_indicators
+from ai_financial_advisor.analysis.trend_score import trend_score_series
+
+
+def _replay(df: pd.DataFrame, state: IndicatorState | None = None) -> list:
+    state = state or IndicatorState()
+    return [state.update(bar, timestamp=ts) for ts, bar in zip(df.index, df.to_dict("records"))]
+
+
+class TestIndicatorState:
+    def test_matches_batch_indicators(self, sample_ohlcv: pd.DataFrame) -> None:
+        updates = _replay(sample_ohlcv)
+        batch = compute_all_indicators(sample_ohlcv)
+        for column, attr in [("MACD", "macd"), ("Signal", "signal"), ("Histogram", "histogram"), ("OBV", "obv")]:
+            np.testing.assert_allclose([getattr(u, attr) for u in updates], batch[column], rtol=1e-12)
+        np.testing.assert_allclose([u.mfi for u in updates], batch["MFI"], rtol=1e-9)
+
+    def test_matches_batch_trend_scores(self, sample_ohlcv: pd.DataFrame, downtrend_ohlcv: pd.DataFrame) -> None:
+        for df in (sample_ohlcv, downtrend_ohlcv):
+            updates = _replay(df)
+            expected = trend_score_series(compute_all_indicators(df))
+            np.testing.assert_allclose([u.trend.score for u in updates], expected["score"], atol=1e-4)
+            assert [u.trend.interpretation for u in updates] == list(expected["interpretation"])
+
+    def test_without_volume_matches_batch(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = sample_ohlcv.assign(Volume=0.0)
+        updates = _replay(df)
+        expected = trend_score_series(compute_all_indicators(df))
+        np.testing.assert_allclose([u.trend.score for u in updates], expected["score"], atol=1e-4)
+        assert updates[-1].trend.mfi_signal == 0.0
+        assert updates[-1].trend.obv_signal == 0.0
+
+    def test_checkpoint_round_trip(self, sample_ohlcv: pd.DataFrame) -> None:
+        head, tail = sample_ohlcv.iloc[:40], sample_ohlcv.iloc[40:]
+        uninterrupted = _replay(sample_ohlcv)
+
+        saved = json.dumps(IndicatorState.from_history(head).to_dict())
+        resumed = _replay(tail, IndicatorState.from_dict(json.loads(saved)))
+
+        assert resumed == uninterrupted[40:]
+
+    def test_from_history_matches_updates(self, sample_ohlcv: pd.DataFrame) -> None:
+        state = IndicatorState.from_history(sample_ohlcv)
+        replayed = IndicatorState()
+        _replay(sample_ohlcv, replayed)
+        assert state == replayed
+        assert state.bars == len(sample_ohlcv)
+        assert state.as_of == sample_ohlcv.index[-1].isoformat()
+
+    def test_custom_parameters(self, sample_ohlcv: pd.DataFrame) -> None:
+        state = IndicatorState.from_history(sample_ohlcv, fast=5, slow=10, signal=3)
+        batch = compute_all_indicators(sample_ohlcv)
+        assert state.ema_fast != pytest.approx(batch["EMA_fast"].iloc[-1])
+        assert state.ema_fast == pytest.approx(sample_ohlcv["Close"].ewm(span=5, adjust=False).mean().iloc[-1])
+
+    def test_rejects_stale_bar(self, sample_ohlcv: pd.DataFrame) -> None:
+        state = IndicatorState.from_history(sample_ohlcv)
+        bar = sample_ohlcv.iloc[-1].to_dict()
+        with pytest.raises(ValueError, match="not after"):
+            state.update(bar, timestamp=sample_ohlcv.index[-1])
+
+    def test_rejects_nan_close(self) -> None:
+        with pytest.raises(ValueError, match="NaN close"):
+            IndicatorState().update({"High": 1.0, "Low": 1.0, "Close": float("nan"), "Volume": 1.0})
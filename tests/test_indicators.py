@@ -1,15 +1,47 @@
 """Tests for technical indicator calculations."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from ai_financial_advisor.analysis.indicators import (
+    INDICATOR_COLUMNS,
     calculate_macd,
     calculate_mfi,
     calculate_obv,
     compute_all_indicators,
+    indicator_kernel,
 )
 
 
+def _reference_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Column-wise pandas formulas the array kernel must reproduce exactly."""
+    df = df.copy()
+    df["EMA_fast"] = df["Close"].ewm(span=12, adjust=False).mean()
+    df["EMA_slow"] = df["Close"].ewm(span=26, adjust=False).mean()
+    df["MACD"] = df["EMA_fast"] - df["EMA_slow"]
+    df["Signal"] = df["MACD"].ewm(span=9, adjust=False).mean()
+    df["Histogram"] = df["MACD"] - df["Signal"]
+
+    direction = np.sign(df["Close"].diff().fillna(0))
+    df["OBV"] = (direction * df["Volume"]).cumsum()
+
+    typical_price = (df["High"] + df["Low"] + df["Close"]) / 3
+    raw_money_flow = typical_price * df["Volume"]
+    tp_direction = np.sign(typical_price.diff().fillna(0))
+    positive_flow = (raw_money_flow * (tp_direction > 0)).rolling(window=14).sum()
+    negative_flow = (raw_money_flow * (tp_direction < 0)).rolling(window=14).sum().abs()
+    df["MFI"] = 100 - (100 / (1 + positive_flow / (negative_flow + 1e-9)))
+    return df
+
+
+def _with_gaps(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df.iloc[20:23] = np.nan
+    df.loc[df.index[40], "Volume"] = np.nan
+    return df
+
+
 class TestMACD:
     def test_adds_expected_columns(self, sample_ohlcv: pd.DataFrame) -> None:
         result = calculate_macd(sample_ohlcv)
@@ -73,3 +105,69 @@ class TestComputeAllIndicators:
         result = compute_all_indicators(sample_ohlcv)
         for col in ["Open", "High", "Low", "Close", "Volume"]:
             assert col in result.columns
+
+    def test_matches_reference_exactly(self, sample_ohlcv: pd.DataFrame) -> None:
+        result = compute_all_indicators(sample_ohlcv)
+        pd.testing.assert_frame_equal(result, _reference_indicators(sample_ohlcv), check_exact=True)
+
+    def test_matches_reference_with_gaps(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = _with_gaps(sample_ohlcv)
+        pd.testing.assert_frame_equal(compute_all_indicators(df), _reference_indicators(df), check_exact=True)
+
+    def test_matches_reference_with_integer_volume(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = sample_ohlcv.astype({"Volume": "int64"})
+        pd.testing.assert_frame_equal(compute_all_indicators(df), _reference_indicators(df), check_exact=True)
+
+    def test_single_indicators_match_reference(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = _with_gaps(sample_ohlcv)
+        expected = _reference_indicators(df)
+        pd.testing.assert_frame_equal(
+            calculate_macd(df), expected[list(df.columns) + list(INDICATOR_COLUMNS[:5])], check_exact=True
+        )
+        pd.testing.assert_series_equal(calculate_obv(df)["OBV"], expected["OBV"], check_exact=True)
+        pd.testing.assert_series_equal(calculate_mfi(df)["MFI"], expected["MFI"], check_exact=True)
+
+    def test_skips_volume_indicators_without_volume(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = sample_ohlcv.assign(Volume=0.0)
+        result = compute_all_indicators(df)
+        assert "OBV" not in result.columns
+        assert "MFI" not in result.columns
+        pd.testing.assert_series_equal(result["MACD"], calculate_macd(df)["MACD"], check_exact=True)
+
+    def test_does_not_mutate_input_by_default(self, sample_ohlcv: pd.DataFrame) -> None:
+        original_cols = list(sample_ohlcv.columns)
+        compute_all_indicators(sample_ohlcv)
+        assert list(sample_ohlcv.columns) == original_cols
+
+    def test_recomputing_overwrites_columns(self, sample_ohlcv: pd.DataFrame) -> None:
+        once = compute_all_indicators(sample_ohlcv)
+        twice = compute_all_indicators(once)
+        pd.testing.assert_frame_equal(twice, once, check_exact=True)
+
+
+class TestIndicatorKernel:
+    @staticmethod
+    def _arrays(df: pd.DataFrame) -> tuple[np.ndarray, ...]:
+        return tuple(df[col].to_numpy(dtype=float) for col in ["High", "Low", "Close", "Volume"])
+
+    def test_matches_frame_columns(self, sample_ohlcv: pd.DataFrame) -> None:
+        out = indicator_kernel(*self._arrays(sample_ohlcv))
+        expected = _reference_indicators(sample_ohlcv)[list(INDICATOR_COLUMNS)].to_numpy()
+        np.testing.assert_array_equal(out, expected)
+
+    def test_writes_into_provided_buffer(self, sample_ohlcv: pd.DataFrame, downtrend_ohlcv: pd.DataFrame) -> None:
+        out = np.empty((len(sample_ohlcv), len(INDICATOR_COLUMNS)))
+        for df in (sample_ohlcv, downtrend_ohlcv):
+            result = indicator_kernel(*self._arrays(df), out=out)
+            assert result is out
+            np.testing.assert_array_equal(out, indicator_kernel(*self._arrays(df)))
+
+    def test_without_volume_leaves_nan(self, sample_ohlcv: pd.DataFrame) -> None:
+        high, low, close, _ = self._arrays(sample_ohlcv)
+        out = indicator_kernel(high, low, close)
+        assert np.isnan(out[:, 5:]).all()
+        assert not np.isnan(out[:, :5]).any()
+
+    def test_rejects_wrong_buffer_shape(self, sample_ohlcv: pd.DataFrame) -> None:
+        with pytest.raises(ValueError, match="shape"):
+            indicator_kernel(*self._arrays(sample_ohlcv), out=np.empty((10, len(INDICATOR_COLUMNS))))
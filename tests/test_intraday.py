@@ -0,0 +1,98 @@
+"""Tests for the event-driven intraday backtester."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.data.market_types import bars_per_year
+from ai_financial_advisor.strategies.backtester import Backtester
+from ai_financial_advisor.strategies.execution import ExecutionModel
+from ai_financial_advisor.strategies.intraday import IntradayBacktester
+from ai_financial_advisor.strategies.trend_strategy import MIN_HISTORY, TrendScoreStrategy
+
+_METRICS = ("final_value", "total_return", "annualized_return", "max_drawdown", "win_rate", "total_trades")
+
+
+def _make_ohlcv(n: int = 400, seed: int = 3, freq: str = "B") -> pd.DataFrame:
+    rng = np.random.RandomState(seed)
+    index = pd.date_range("2024-01-02 09:30", periods=n, freq=freq)
+    close = 100 * np.exp(np.cumsum(rng.randn(n) * 0.01))
+    spread = rng.uniform(0.001, 0.01, n) * close
+    return pd.DataFrame(
+        {
+            "Open": close * (1 + rng.randn(n) * 0.002),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.randint(1_000, 100_000, n).astype(float),
+        },
+        index=index,
+    )
+
+
+class TestMatchesBacktester:
+    @pytest.mark.parametrize(
+        "execution",
+        [
+            None,
+            ExecutionModel(commission_bps=5, min_commission=1, slippage_bps=2, spread_fraction=0.1, lot_size=100),
+            ExecutionModel(commission_bps=5, fill="next_open"),
+        ],
+    )
+    def test_daily_bars(self, execution):
+        df = _make_ohlcv()
+        signals = TrendScoreStrategy().generate_signal_frame(df)
+        expected = Backtester(execution=execution).run_frame(signals, bars=df)
+        result = IntradayBacktester(interval="1d", execution=execution).run(df)
+
+        for name in _METRICS:
+            assert getattr(result, name) == getattr(expected, name), name
+        assert result.sharpe_ratio == pytest.approx(expected.sharpe_ratio, abs=1e-4)
+        assert result.total_costs == pytest.approx(expected.total_costs, abs=0.01)
+        assert [(t.buy_date, t.sell_date, t.return_pct) for t in result.trades] == [
+            (t.buy_date, t.sell_date, t.return_pct) for t in expected.trades
+        ]
+        pd.testing.assert_index_equal(result.equity_curve.index, expected.equity_curve.index)
+        np.testing.assert_allclose(result.equity_curve.to_numpy(), expected.equity_curve.to_numpy())
+
+
+class TestIntradayBacktester:
+    def test_sharpe_annualized_per_interval(self):
+        df = _make_ohlcv(2000, freq="5min")
+        result = IntradayBacktester(interval="5m").run(df, symbol="AAPL")
+        returns = result.equity_curve.pct_change().dropna()
+        expected = returns.mean() / returns.std() * np.sqrt(bars_per_year("5m"))
+        assert result.sharpe_ratio == pytest.approx(expected, abs=1e-4)
+
+    def test_streamed_events_without_equity(self):
+        df = _make_ohlcv(1000, freq="5min")
+        recorded = IntradayBacktester().run(df)
+        events = ((ts, row) for ts, row in zip(df.index, df.to_dict("records")))
+        streamed = IntradayBacktester(record_equity=False).run(events)
+
+        assert streamed.equity_curve.empty
+        for name in (*_METRICS, "sharpe_ratio", "total_costs"):
+            assert getattr(streamed, name) == getattr(recorded, name), name
+        assert len(recorded.equity_curve) == len(df) - MIN_HISTORY + 1
+
+    def test_missing_closes_skipped(self):
+        df = _make_ohlcv(300, freq="5min")
+        gappy = df.copy()
+        gappy.iloc[100:110] = np.nan
+        result = IntradayBacktester().run(gappy)
+        assert len(result.equity_curve) == len(df) - 10 - MIN_HISTORY + 1
+
+    def test_too_few_bars(self):
+        result = IntradayBacktester().run(_make_ohlcv(MIN_HISTORY - 1, freq="5min"))
+        assert result.final_value == 100000
+        assert result.total_trades == 0
+        assert result.equity_curve.empty
+
+    def test_out_of_order_events(self):
+        df = _make_ohlcv(50, freq="5min").iloc[::-1]
+        with pytest.raises(ValueError, match="not after"):
+            IntradayBacktester().run(df)
+
+    def test_unknown_interval(self):
+        with pytest.raises(ValueError, match="Unsupported interval"):
+            IntradayBacktester(interval="2m")
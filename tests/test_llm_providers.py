@@ -54,3 +54,17 @@ class TestFactory:
         )
         provider = get_llm(settings)
         assert "gpt-4o" in provider.name
+
+
+class TestCountTokens:
+    def test_ratios_per_provider(self) -> None:
+        english = "Stocks rallied after the central bank held rates steady. " * 10
+        chinese = "海关总署公布的数据显示中国出口同比增长。" * 10
+        openai = get_llm(LLMSettings(provider=LLMProviderType.OPENAI, api_key="key"))
+        deepseek = get_llm(LLMSettings(api_key="key", base_url="https://api.deepseek.com"))
+        claude = get_llm(LLMSettings(provider=LLMProviderType.CLAUDE, api_key="key"))
+        assert openai.count_tokens(english) == 143  # 570 characters at 4 per token, rounded up
+        assert openai.count_tokens(chinese) == 200
+        assert deepseek.count_tokens(chinese) < openai.count_tokens(chinese)
+        assert claude.count_tokens(english) > openai.count_tokens(english)
+        assert openai.count_tokens("") == 0
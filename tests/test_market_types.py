@@ -1,13 +1,18 @@
 """Tests for market type detection and watchlists."""
 
+from datetime import UTC, datetime
+
 import pytest
 
 from ai_financial_advisor.data.market_types import (
     MarketType,
+    bars_per_year,
     detect_market_type,
     get_currency,
+    get_lot_size,
     get_watchlist,
     has_volume,
+    last_session_close,
 )
 
 
@@ -99,3 +104,62 @@ class TestHasVolume:
 
     def test_forex_no_volume(self) -> None:
         assert has_volume("EURUSD=X") is False
+
+
+class TestLotSize:
+    def test_board_lots(self) -> None:
+        assert get_lot_size("AAPL") == 1
+        assert get_lot_size("600519.SS") == 100
+        assert get_lot_size("7203.T") == 100
+
+    def test_hk_lots_per_stock(self) -> None:
+        assert get_lot_size("0700.HK") == 100
+        assert get_lot_size("2318.hk") == 500
+
+    def test_fractional_markets(self) -> None:
+        assert get_lot_size("BTC-USD") is None
+        assert get_lot_size("EURUSD=X") is None
+
+
+class TestBarsPerYear:
+    def test_daily_is_trading_days(self) -> None:
+        assert bars_per_year("1d") == 252
+        assert bars_per_year("1d", MarketType.CRYPTO) == 252
+
+    def test_intraday_counts_session_bars(self) -> None:
+        assert bars_per_year("5m") == 78 * 252
+        assert bars_per_year("1h") == 7 * 252  # the last bar of the session is partial
+        assert bars_per_year("1m", MarketType.CN) == 240 * 252
+        assert bars_per_year("1h", MarketType.CRYPTO) == 24 * 365
+
+    def test_unsupported_interval(self) -> None:
+        with pytest.raises(ValueError):
+            bars_per_year("2m")
+
+
+class TestLastSessionClose:
+    def test_after_us_close_same_day(self) -> None:
+        now = datetime(2026, 3, 18, 21, 30, tzinfo=UTC)  # Wed 17:30 New York
+        close = last_session_close(MarketType.US, now)
+        assert close.astimezone(UTC) == datetime(2026, 3, 18, 20, 0, tzinfo=UTC)
+
+    def test_before_us_close_uses_previous_day(self) -> None:
+        now = datetime(2026, 3, 18, 15, 0, tzinfo=UTC)  # Wed 11:00 New York
+        close = last_session_close(MarketType.US, now)
+        assert close.date().isoformat() == "2026-03-17"
+
+    def test_weekend_rolls_back_to_friday(self) -> None:
+        now = datetime(2026, 3, 22, 12, 0, tzinfo=UTC)  # Sunday
+        close = last_session_close(MarketType.JP, now)
+        assert close.date().isoformat() == "2026-03-20"
+        assert close.weekday() == 4
+
+    def test_crypto_trades_on_weekends(self) -> None:
+        now = datetime(2026, 3, 22, 12, 0, tzinfo=UTC)  # Sunday
+        close = last_session_close(MarketType.CRYPTO, now)
+        assert close == datetime(2026, 3, 22, 0, 0, tzinfo=UTC)
+
+    def test_close_never_after_now(self) -> None:
+        now = datetime(2026, 3, 18, 7, 0, tzinfo=UTC)
+        for market in MarketType:
+            assert last_session_close(market, now) <= now
@@ -0,0 +1,251 @@
+"""Tests for the full-text scraper and its scrape cache, against a local HTTP server."""
+
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from ai_financial_advisor.agents.news_agent import NewsAgent
+from ai_financial_advisor.config import Settings
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.data.news_scraper import SCRAPING_FAILED, scrape_full_text
+from ai_financial_advisor.data.storage.base import ScrapeState
+from ai_financial_advisor.data.storage.sqlite_store import SQLiteStore
+
+_BODY = " ".join(f"Paragraph {i} of the article reports on markets, earnings and the economy." for i in range(12))
+_PAGE = (
+    "<html><head><title>Markets rally</title><meta name='author' content='Jane Doe'></head>"
+    f"<body><article><h1>Markets rally</h1><p>{_BODY}</p><p>{_BODY}</p></article></body></html>"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    port: int
+    starts: list[tuple[str, float]]  # (host, time) of every request
+    conditional: list[str]  # paths requested with a validator
+
+    def do_GET(self) -> None:
+        self.starts.append((self.headers["Host"].split(":")[0], time.monotonic()))
+        if self.headers["If-None-Match"] or self.headers["If-Modified-Since"]:
+            self.conditional.append(self.path)
+        if self.path.startswith("/etag"):
+            if self.headers["If-None-Match"] == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+        if self.path.startswith("/slow"):
+            time.sleep(1.0)
+        if self.path.startswith("/missing"):
+            self.send_error(404)
+            return
+        page = "<html><body><p>Too short.</p></body></html>" if self.path.startswith("/short") else _PAGE
+        payload = page.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", '"v1"')
+        if self.path.startswith("/dated"):
+            self.send_header("Last-Modified", "Fri, 11 Jul 2025 08:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request: object, client_address: object) -> None:
+        pass  # clients that timed out close the connection mid-response
+
+
+@pytest.fixture
+def server() -> Iterator[type[_Handler]]:
+    handler = type("Handler", (_Handler,), {"starts": [], "conditional": []})
+    httpd = _Server(("127.0.0.1", 0), handler)
+    handler.port = httpd.server_address[1]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield handler
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _article(url: str, **kwargs: object) -> Article:
+    return Article(
+        title="Markets rally",
+        url=url,
+        source_name="Reuters",
+        description="",
+        published_at=datetime(2025, 7, 11),
+        **kwargs,
+    )
+
+
+class TestScrapeFullText:
+    def test_extracts_content_and_author(self, server: type[_Handler]) -> None:
+        articles = [_article(f"http://127.0.0.1:{server.port}/news/{i}") for i in range(3)]
+        result = scrape_full_text(articles, per_host_delay=0.0)
+        assert result is articles
+        for article in articles:
+            assert "Paragraph 11 of the article" in article.content
+            assert article.author == "Jane Doe"
+
+    def test_failures_are_marked(self, server: type[_Handler]) -> None:
+        articles = [
+            _article(f"http://127.0.0.1:{server.port}/missing"),
+            _article(f"http://127.0.0.1:{server.port}/short"),
+            _article(f"http://127.0.0.1:{server.port}/slow"),
+            _article("http://127.0.0.1:1/unreachable"),
+            _article(f"http://127.0.0.1:{server.port}/news/ok"),
+        ]
+        scrape_full_text(articles, per_host_delay=0.0, timeout=0.3)
+        assert [a.content == SCRAPING_FAILED for a in articles] == [True, True, True, True, False]
+
+    def test_skips_articles_with_content(self, server: type[_Handler]) -> None:
+        articles = [_article(f"http://127.0.0.1:{server.port}/news/1", content="Already scraped", author="Staff")]
+        scrape_full_text(articles)
+        assert server.starts == []
+        assert articles[0].content == "Already scraped"
+        assert articles[0].author == "Staff"
+
+    def test_keeps_existing_author(self, server: type[_Handler]) -> None:
+        articles = [_article(f"http://127.0.0.1:{server.port}/news/1", author="Staff")]
+        scrape_full_text(articles, per_host_delay=0.0)
+        assert articles[0].author == "Staff"
+
+    def test_requests_to_one_host_are_spaced(self, server: type[_Handler]) -> None:
+        articles = [_article(f"http://127.0.0.1:{server.port}/news/{i}") for i in range(3)]
+        scrape_full_text(articles, per_host_delay=0.2)
+        times = sorted(t for _, t in server.starts)
+        assert len(times) == 3
+        assert all(later - earlier >= 0.15 for earlier, later in zip(times, times[1:]))
+
+    def test_spacing_holds_when_workers_are_busy(self, server: type[_Handler]) -> None:
+        # The only worker is busy with a slow page on another host while the others queue
+        articles = [_article(f"http://localhost:{server.port}/slow")]
+        articles += [_article(f"http://127.0.0.1:{server.port}/news/{i}") for i in range(3)]
+        scrape_full_text(articles, workers=1, per_host_delay=0.3)
+        times = sorted(t for host, t in server.starts if host == "127.0.0.1")
+        assert len(times) == 3
+        assert all(later - earlier >= 0.25 for earlier, later in zip(times, times[1:]))
+
+    def test_busy_host_does_not_starve_others(self, server: type[_Handler]) -> None:
+        # Pages of the busy host come first and outnumber the workers
+        articles = [_article(f"http://127.0.0.1:{server.port}/news/{i}") for i in range(6)]
+        articles.append(_article(f"http://localhost:{server.port}/news/1"))
+        scrape_full_text(articles, workers=2, per_host_delay=0.5)
+        first = min(t for _, t in server.starts)
+        (other,) = [t for host, t in server.starts if host == "localhost"]
+        assert other - first < 0.3
+
+    def test_hosts_are_scraped_concurrently(self, server: type[_Handler]) -> None:
+        articles = [_article(f"http://{host}:{server.port}/news/1") for host in ("127.0.0.1", "localhost")]
+        begin = time.monotonic()
+        scrape_full_text(articles, per_host_delay=5.0)
+        assert time.monotonic() - begin < 2.0
+        assert {host for host, _ in server.starts} == {"127.0.0.1", "localhost"}
+        assert all(a.content != SCRAPING_FAILED for a in articles)
+
+
+class TestRevalidation:
+    def test_records_validators_and_failures(self, server: type[_Handler]) -> None:
+        urls = [f"http://127.0.0.1:{server.port}/{path}" for path in ("etag/1", "dated/1", "missing")]
+        states: dict[str, ScrapeState] = {}
+        scrape_full_text([_article(url) for url in urls], per_host_delay=0.0, states=states)
+        assert states[urls[0]].etag == '"v1"'
+        assert states[urls[1]].last_modified == "Fri, 11 Jul 2025 08:00:00 GMT"
+        assert "Paragraph 11" in states[urls[0]].content
+        assert states[urls[0]].failures == 0
+        assert states[urls[2]].failures == 1
+        assert states[urls[2]].content is None
+        assert all(state.checked_at is not None for state in states.values())
+
+    def test_not_modified_keeps_cached_content(self, server: type[_Handler]) -> None:
+        url = f"http://127.0.0.1:{server.port}/etag/1"
+        states = {url: ScrapeState(url, content="Cached text", author="Staff", etag='"v1"')}
+        article = _article(url)
+        scrape_full_text([article], per_host_delay=0.0, states=states)
+        assert server.conditional == ["/etag/1"]
+        assert article.content == "Cached text"
+        assert article.author == "Staff"
+        assert states[url].etag == '"v1"'
+
+    def test_changed_page_replaces_content(self, server: type[_Handler]) -> None:
+        url = f"http://127.0.0.1:{server.port}/dated/1"
+        states = {url: ScrapeState(url, content="Old text", last_modified="Mon, 01 Jan 2024 00:00:00 GMT")}
+        article = _article(url)
+        scrape_full_text([article], per_host_delay=0.0, states=states)
+        assert server.conditional == ["/dated/1"]
+        assert "Paragraph 11" in article.content
+        assert states[url].last_modified == "Fri, 11 Jul 2025 08:00:00 GMT"
+
+    def test_failed_revalidation_keeps_cached_content(self, server: type[_Handler]) -> None:
+        url = f"http://127.0.0.1:{server.port}/missing"
+        states = {url: ScrapeState(url, content="Cached text", etag='"v0"')}
+        article = _article(url)
+        scrape_full_text([article], per_host_delay=0.0, states=states)
+        assert article.content == "Cached text"
+        assert states[url].failures == 1
+
+
+class TestNewsAgentCache:
+    @pytest.fixture
+    def agent(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[NewsAgent]:
+        monkeypatch.setenv("SCRAPER_PER_HOST_DELAY", "0")
+        store = SQLiteStore(tmp_path / "news.db")
+        yield NewsAgent(Settings(), llm=object(), store=store)
+        store.close()
+
+    def _run(self, agent: NewsAgent, urls: list[str], monkeypatch: pytest.MonkeyPatch) -> list[Article]:
+        monkeypatch.setattr(agent._fetcher, "fetch_headlines", lambda: [_article(url) for url in urls])
+        return agent.fetch_and_scrape()
+
+    def test_repeat_runs_only_fetch_new_articles(
+        self, agent: NewsAgent, server: type[_Handler], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        urls = [f"http://127.0.0.1:{server.port}/news/{i}" for i in range(3)]
+        self._run(agent, urls[:2], monkeypatch)
+        assert len(server.starts) == 2
+        assert agent._store.get_articles_without_content() == []
+
+        articles = self._run(agent, urls, monkeypatch)
+        assert len(server.starts) == 3
+        assert all("Paragraph 11" in a.content for a in articles)
+        assert len(agent._store.search("Paragraph")) == 3
+
+    def test_revalidates_stale_pages(
+        self, agent: NewsAgent, server: type[_Handler], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        url = f"http://127.0.0.1:{server.port}/etag/1"
+        self._run(agent, [url], monkeypatch)
+        self._run(agent, [url], monkeypatch)
+        assert len(server.starts) == 1  # fresh: reused without a request
+
+        state = agent._store.get_scrape_states([url])[url]
+        state.checked_at -= timedelta(days=2)
+        agent._store.save_scrape_states([state])
+        articles = self._run(agent, [url], monkeypatch)
+        assert server.conditional == ["/etag/1"]
+        assert "Paragraph 11" in articles[0].content
+        assert agent._store.get_scrape_states([url])[url].checked_at > state.checked_at
+
+    def test_failed_pages_back_off(
+        self, agent: NewsAgent, server: type[_Handler], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        url = f"http://127.0.0.1:{server.port}/missing"
+        self._run(agent, [url], monkeypatch)
+        articles = self._run(agent, [url], monkeypatch)
+        assert len(server.starts) == 1
+        assert articles[0].content == SCRAPING_FAILED
+
+        state = agent._store.get_scrape_states([url])[url]
+        state.checked_at -= timedelta(hours=1)
+        agent._store.save_scrape_states([state])
+        self._run(agent, [url], monkeypatch)
+        assert len(server.starts) == 2
+        assert agent._store.get_scrape_states([url])[url].failures == 2
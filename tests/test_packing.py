@@ -0,0 +1,199 @@
+"""Tests for token estimates, prompt packing and per-stage token usage."""
+
+import re
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from ai_financial_advisor.agents.news_agent import NewsAgent
+from ai_financial_advisor.analysis.dedup import ArticleCluster
+from ai_financial_advisor.analysis.packing import PromptEntry, pack_entries, rank_stories, story_score
+from ai_financial_advisor.analysis.sentiment import analyze_sentiment
+from ai_financial_advisor.config import LLMSettings, Settings
+from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.llm.base import LLMProvider, LLMResponse
+from ai_financial_advisor.llm.tokens import TokenUsage, clip_text, estimate_tokens
+
+_NOW = datetime(2025, 7, 11, 12, 0)
+_VOCABULARY = np.array([f"word{i}" for i in range(5_000)])
+
+
+def _article(i: int, title: str = "", hours_old: float = 0.0, source: str = "Reuters", words: int = 300) -> Article:
+    text = " ".join(np.random.default_rng(i).choice(_VOCABULARY, size=words))
+    return Article(
+        title=title or f"Story {i}",
+        url=f"https://example.com/{i}",
+        source_name=source,
+        description=f"Summary of story {i}.",
+        published_at=_NOW - timedelta(hours=hours_old),
+        content=". ".join(text[j : j + 60] for j in range(0, len(text), 60)) + ".",
+    )
+
+
+class FakeLLM(LLMProvider):
+    """Records prompts and reports token usage like a real provider."""
+
+    def __init__(self, content: str = "report") -> None:
+        self.messages: list[list[dict[str, str]]] = []
+        self._content = content
+
+    def complete(self, messages, *, temperature=0.5, max_tokens=8192) -> LLMResponse:
+        self.messages.append(messages)
+        prompt_tokens = sum(self.count_tokens(m["content"]) for m in messages)
+        return LLMResponse(self._content, "fake", {"prompt_tokens": prompt_tokens, "completion_tokens": 7})
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+
+class TestTokens:
+    def test_estimate(self) -> None:
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("abcde") == 2  # rounded up
+        assert estimate_tokens("央行维持利率不变。") == 9
+        assert estimate_tokens("abcd" * 10, chars_per_token=2) == 20
+
+    def test_clip_keeps_whole_sentences(self) -> None:
+        text = 'The Fed held rates. Stocks rose 1.2% on the day. "We are patient," Powell said. Bonds were flat.'
+        assert clip_text(text, 100) == text
+        assert clip_text(text, 12) == "The Fed held rates. Stocks rose 1.2% on the day."
+        assert clip_text(text, 22) == 'The Fed held rates. Stocks rose 1.2% on the day. "We are patient," Powell said.'
+        assert clip_text(text, 0) == ""
+
+    def test_clip_chinese_and_lines(self) -> None:
+        text = "海关总署公布的数据显示，中国5月出口同比增长4.8%。低于市场预期。进口下降。"
+        assert clip_text(text, 30) == "海关总署公布的数据显示，中国5月出口同比增长4.8%。"
+        assert clip_text("first line\nsecond line", 4) == "first line"
+
+    def test_clip_overlong_sentence_at_a_word(self) -> None:
+        clipped = clip_text("one two three four five six seven eight", 4)
+        assert clipped == "one two three…"
+        assert clip_text("海关总署公布的数据", 5) == "海关总署…"
+
+    def test_clip_with_provider_counter(self) -> None:
+        llm = FakeLLM()
+        llm.chars_per_token = 2.0
+        text = "Short one. Another short one. A third."
+        assert clip_text(text, 10, llm.count_tokens) == "Short one."
+
+    def test_usage_summary(self) -> None:
+        usage = TokenUsage.record(
+            "news report", 4000, 2110, {"prompt_tokens": 1874, "completion_tokens": 412}, detailed=3
+        )
+        assert usage.summary() == "~2,110 of 4,000 budgeted in; 1,874 in / 412 out; 3 detailed"
+        assert TokenUsage("outlook", None, 900).summary() == "~900 in"
+
+
+class TestRanking:
+    def test_reports_finance_and_recency(self) -> None:
+        single = ArticleCluster("a", [_article(1)])
+        carried = ArticleCluster("b", [_article(2), _article(3, source="CNN")])
+        finance = ArticleCluster("c", [_article(4, title="Oil prices jump")])
+        old = ArticleCluster("d", [_article(5, hours_old=48), _article(6, hours_old=48)])
+        assert story_score(single, _NOW) == 1.0
+        assert story_score(carried, _NOW) == 2.0
+        assert story_score(finance, _NOW) == 2.0
+        assert story_score(old, _NOW) == pytest.approx(0.5)
+        assert rank_stories([single, old, finance, carried], _NOW) == [finance, carried, single, old]
+
+    def test_mixed_time_zones(self) -> None:
+        article = _article(1)
+        article.published_at = (_NOW - timedelta(hours=24)).astimezone(UTC)
+        assert story_score(ArticleCluster("a", [article]), _NOW) == pytest.approx(0.5)
+
+
+class TestPackEntries:
+    @staticmethod
+    def _entries(n: int) -> list[PromptEntry]:
+        return [PromptEntry(ArticleCluster(str(i), [_article(i)]), f"snippet {i}") for i in range(n)]
+
+    def test_everything_fits_in_detail(self) -> None:
+        entries = self._entries(3)
+        packed = pack_entries(entries, 100, lambda e: 30, lambda e: 5)
+        assert packed.detailed == entries and not packed.headlines and not packed.dropped
+        assert packed.tokens == 90
+
+    def test_overflow_is_listed_by_headline(self) -> None:
+        entries = self._entries(10)
+        packed = pack_entries(entries, 100, lambda e: 30, lambda e: 2)
+        # Headlines for all ten (20 tokens), then 28 more per detailed entry
+        assert packed.detailed == entries[:2]
+        assert packed.headlines == entries[2:]
+        assert packed.tokens == 76
+
+    def test_headlines_are_capped_and_the_rest_dropped(self) -> None:
+        entries = self._entries(100)
+        packed = pack_entries(entries, 100, lambda e: 30, lambda e: 2, headline_share=0.25)
+        assert len(packed.detailed) + len(packed.headlines) == 12
+        assert packed.dropped == entries[12:]
+        assert len(packed.detailed) == 2  # 24 tokens of headlines, then 28 more per detailed entry
+        assert packed.tokens == 80
+
+    def test_rank_decides_detail(self) -> None:
+        entries = self._entries(3)
+        costs = {entries[0].snippet: 30, entries[1].snippet: 80, entries[2].snippet: 10}
+        packed = pack_entries(entries, 100, lambda e: costs[e.snippet], lambda e: 1)
+        # The third entry would fit in detail, but not ahead of the second
+        assert packed.detailed == entries[:1]
+        assert packed.headlines == entries[1:]
+
+
+class TestNewsReportBudget:
+    def test_prompt_fits_the_budget(self) -> None:
+        llm = FakeLLM()
+        settings = Settings(llm=LLMSettings(report_prompt_tokens=3000, snippet_tokens=200))
+        agent = NewsAgent(settings, llm=llm)
+        articles = [_article(i, title=f"Story {i}") for i in range(40)]
+        articles[25].title = "Central bank raises interest rates"
+
+        agent.generate_report(articles)
+        system, user = llm.messages[0]
+        assert llm.count_tokens(system["content"]) + llm.count_tokens(user["content"]) <= 3000
+        prompt = user["content"]
+        # The finance story ranks first and is detailed; the overflow is listed by headline
+        assert prompt.index("Title: Central bank raises interest rates") < prompt.index("Title: Story 0")
+        assert "More stories, by headline only:\n- Story " in prompt
+        snippets = [line for line in prompt.splitlines() if line.startswith("Content Snippet:")]
+        assert snippets and all(line.endswith(".") for line in snippets)
+
+        [usage] = agent.token_usage
+        assert usage.stage == "news report"
+        assert usage.budget == 3000
+        assert usage.estimated == usage.prompt_tokens <= 3000
+        assert usage.completion_tokens == 7
+        assert usage.items["detailed"] == len(re.findall(r"^News \d+:$", prompt, re.M))
+        assert sum(usage.items.values()) == 40
+
+    def test_small_runs_are_unchanged(self) -> None:
+        llm = FakeLLM()
+        NewsAgent(Settings(), llm=llm).generate_report([_article(1), _article(2)])
+        prompt = llm.messages[0][1]["content"]
+        assert "News 2:" in prompt
+        assert "More stories" not in prompt
+
+
+class TestSentimentBudget:
+    def test_report_is_clipped_at_a_sentence(self) -> None:
+        llm = FakeLLM('{"overall_sentiment": "bullish", "confidence": 0.8, "market_impact_score": 0.4}')
+        report = " ".join(f"Paragraph {i} says markets rose on strong earnings." for i in range(500))
+        usage: list[TokenUsage] = []
+        result = analyze_sentiment(report, llm, max_prompt_tokens=1000, usage=usage)
+        assert result.overall_sentiment == "bullish"
+
+        system, user = llm.messages[0]
+        assert llm.count_tokens(system["content"]) + llm.count_tokens(user["content"]) <= 1000
+        sent = user["content"].split("---\n")[1]
+        assert sent.rstrip().endswith("earnings.")
+        assert len(sent) < len(report)
+        [stage] = usage
+        assert stage.stage == "sentiment"
+        assert stage.estimated == stage.prompt_tokens
+        assert stage.items["clipped_chars"] == len(report) - stage.items["report_chars"] > 0
+
+    def test_short_report_is_sent_whole(self) -> None:
+        llm = FakeLLM("{}")
+        analyze_sentiment("Markets were flat.", llm)
+        assert "Markets were flat.\n---" in llm.messages[0][1]["content"]
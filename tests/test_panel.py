@@ -0,0 +1,96 @@
+"""Tests for panel-mode indicator computation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.analysis.indicators import INDICATOR_COLUMNS, compute_all_indicators
+from ai_financial_advisor.analysis.panel import SCORE_COLUMNS, compute_panel_indicators, to_panel
+from ai_financial_advisor.analysis.trend_score import trend_score_series
+
+
+def _frame(n: int, seed: int, start: str = "2024-01-01") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000, 10_000, n).astype(float),
+        },
+        index=pd.bdate_range(start, periods=n),
+    )
+
+
+@pytest.fixture
+def ragged_frames() -> dict[str, pd.DataFrame]:
+    """Symbols with different listing dates, calendars and volume data."""
+    us = _frame(200, seed=1)
+    late_listing = _frame(90, seed=2, start="2024-05-01")
+    # A market closed on every seventh US business day
+    other_calendar = _frame(200, seed=3).iloc[lambda df: np.arange(len(df)) % 7 != 3]
+    forex = _frame(150, seed=4).assign(Volume=0.0)
+    volume_gap = _frame(200, seed=5)
+    volume_gap.iloc[40:43, volume_gap.columns.get_loc("Volume")] = np.nan
+    return {"US": us, "LATE": late_listing, "OTHER": other_calendar, "FX": forex, "GAP": volume_gap}
+
+
+class TestToPanel:
+    def test_union_calendar(self, ragged_frames: dict[str, pd.DataFrame]) -> None:
+        panel = to_panel(ragged_frames)
+        union = ragged_frames["US"].index.union(ragged_frames["LATE"].index)
+        assert list(panel) == ["Open", "High", "Low", "Close", "Volume"]
+        assert panel["Close"].index.equals(union)
+        assert list(panel["Close"].columns) == list(ragged_frames)
+
+    def test_missing_rows_are_nan(self, ragged_frames: dict[str, pd.DataFrame]) -> None:
+        close = to_panel(ragged_frames)["Close"]
+        assert close["LATE"].loc[:"2024-04-30"].isna().all()
+        assert close["OTHER"].isna().sum() == len(close) - len(ragged_frames["OTHER"])
+
+    def test_omits_absent_fields(self) -> None:
+        frames = {"A": _frame(30, seed=1).drop(columns="Volume")}
+        assert "Volume" not in to_panel(frames)
+
+
+class TestComputePanelIndicators:
+    def test_matches_per_symbol_calculation(self, ragged_frames: dict[str, pd.DataFrame]) -> None:
+        result = compute_panel_indicators(to_panel(ragged_frames))
+
+        for symbol, df in ragged_frames.items():
+            expected = compute_all_indicators(df)
+            for column in INDICATOR_COLUMNS:
+                got = result[column][symbol].reindex(df.index)
+                if column in expected:
+                    np.testing.assert_array_equal(got.to_numpy(), expected[column].to_numpy())
+                else:
+                    assert got.isna().all()
+
+            scores = trend_score_series(expected)
+            for column in SCORE_COLUMNS:
+                got = result[column][symbol].reindex(df.index)
+                np.testing.assert_array_equal(got.to_numpy(), scores[column].to_numpy())
+
+    def test_non_trading_rows_are_empty(self, ragged_frames: dict[str, pd.DataFrame]) -> None:
+        result = compute_panel_indicators(to_panel(ragged_frames))
+        closed = ~result["MACD"].index.isin(ragged_frames["OTHER"].index)
+        assert result["MACD"]["OTHER"][closed].isna().all()
+        assert result["score"]["OTHER"][closed].isna().all()
+        assert result["interpretation"]["OTHER"][closed].isna().all()
+
+    def test_result_shapes(self, ragged_frames: dict[str, pd.DataFrame]) -> None:
+        panel = to_panel(ragged_frames)
+        result = compute_panel_indicators(panel)
+        assert set(result) == set(INDICATOR_COLUMNS) | set(SCORE_COLUMNS)
+        for matrix in result.values():
+            assert matrix.index.equals(panel["Close"].index)
+            assert list(matrix.columns) == list(ragged_frames)
+
+    def test_without_volume_field(self) -> None:
+        frames = {"A": _frame(60, seed=1).drop(columns="Volume"), "B": _frame(60, seed=2).drop(columns="Volume")}
+        result = compute_panel_indicators(to_panel(frames))
+        assert result["OBV"].isna().all().all()
+        expected = trend_score_series(compute_all_indicators(frames["A"]))
+        np.testing.assert_array_equal(result["score"]["A"].to_numpy(), expected["score"].to_numpy())
@@ -0,0 +1,126 @@
+"""Tests for the portfolio backtester."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.analysis.panel import to_panel
+from ai_financial_advisor.strategies.backtester import positions
+from ai_financial_advisor.strategies.portfolio import (
+    SIZING_RULES,
+    PortfolioBacktester,
+    equal_weight,
+    score_weight,
+)
+from ai_financial_advisor.strategies.trend_strategy import MIN_HISTORY
+
+
+@pytest.fixture
+def universe() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Scores and closes for 6 symbols: one listed late, one on a sparse calendar."""
+    rng = np.random.default_rng(3)
+    n, k = 250, 6
+    index = pd.bdate_range("2023-01-02", periods=n)
+    symbols = [f"S{i}" for i in range(k)]
+    prices = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n, k)), axis=0)), index=index, columns=symbols)
+    prices.iloc[:60, 1] = np.nan
+    prices.iloc[::4, 2] = np.nan
+    scores = pd.DataFrame(np.tanh(np.cumsum(rng.normal(0, 0.3, (n, k)), axis=0) * 0.2), index=index, columns=symbols)
+    return scores.where(prices.notna()), prices
+
+
+def _reference(bt: PortfolioBacktester, scores: pd.DataFrame, prices: pd.DataFrame) -> tuple:
+    """Day-by-day simulation with explicit share counts."""
+    close = prices.ffill().to_numpy()
+    score = scores.to_numpy().copy()
+    score[np.cumsum(prices.notna().to_numpy(), axis=0) < MIN_HISTORY] = np.nan
+    held = positions(score > bt._buy_threshold, score < bt._sell_threshold) & ~np.isnan(close)
+    returns = np.zeros_like(close)
+    returns[1:] = np.nan_to_num(close[1:] / close[:-1] - 1)
+    target = np.where(held, np.clip(bt._sizing(held, score, returns), 0, bt._max_weight), 0.0)
+    target /= np.maximum(target.sum(axis=1, keepdims=True), 1)
+
+    cash, shares, equity, pnl, turnover = bt._initial_capital, np.zeros(close.shape[1]), [], 0.0, 0.0
+    for t in range(len(close)):
+        price = np.nan_to_num(close[t], nan=1.0)
+        if t:
+            pnl = pnl + shares * (price - np.nan_to_num(close[t - 1], nan=1.0))
+        value = cash + (shares * price).sum()
+        if t % bt._rebalance_every == 0 or (t and (held[t] != held[t - 1]).any()):
+            turnover += np.abs(target[t] - shares * price / value).sum() / 2
+            shares = target[t] * value / price
+            cash = value - (shares * price).sum()
+        equity.append(value)
+    return np.array(equity), pnl, turnover
+
+
+class TestSizingRules:
+    def test_equal_weight(self):
+        held = np.array([[True, True, False], [False, False, False]])
+        np.testing.assert_allclose(equal_weight(held, np.zeros((2, 3)), np.zeros((2, 3))), [[0.5, 0.5, 0], [0, 0, 0]])
+
+    def test_score_weight_ignores_negative_scores(self):
+        held = np.array([[True, True, True]])
+        weights = score_weight(held, np.array([[0.6, 0.2, -0.4]]), np.zeros((1, 3)))
+        np.testing.assert_allclose(weights, [[0.75, 0.25, 0.0]])
+
+    def test_unknown_rule(self):
+        with pytest.raises(ValueError, match="Unknown sizing rule"):
+            PortfolioBacktester(sizing="kelly")
+
+
+class TestPortfolioBacktester:
+    @pytest.mark.parametrize("sizing", sorted(SIZING_RULES))
+    @pytest.mark.parametrize("rebalance_every", [1, 7])
+    def test_matches_daily_simulation(self, universe, sizing, rebalance_every):
+        scores, prices = universe
+        bt = PortfolioBacktester(
+            buy_threshold=0.1, sell_threshold=-0.1, sizing=sizing, max_weight=0.4, rebalance_every=rebalance_every
+        )
+        result = bt.run(scores, prices)
+        equity, pnl, turnover = _reference(bt, scores, prices)
+
+        np.testing.assert_allclose(result.equity_curve.to_numpy(), equity, rtol=1e-12)
+        np.testing.assert_allclose(result.attribution["pnl"].to_numpy(), pnl, atol=1e-6)
+        assert result.turnover == pytest.approx(turnover, abs=1e-4)
+        assert result.rebalances > 0
+
+    def test_attribution_sums_to_pnl(self, universe):
+        scores, prices = universe
+        result = PortfolioBacktester(buy_threshold=0.1, sell_threshold=-0.1).run(scores, prices)
+        assert result.attribution["pnl"].sum() == pytest.approx(result.final_value - result.initial_capital, abs=0.01)
+        assert result.attribution["contribution"].sum() == pytest.approx(result.total_return, abs=1e-3)
+
+    def test_weights_respect_cap_and_budget(self, universe):
+        scores, prices = universe
+        result = PortfolioBacktester(buy_threshold=0.1, sell_threshold=-0.1, max_weight=0.25).run(scores, prices)
+        assert (result.weights.sum(axis=1) <= 1 + 1e-9).all()
+        # Drift can push a capped weight slightly over between rebalances, never on a rebalance day
+        rebalanced = result.daily_turnover > 0
+        assert (result.weights[rebalanced] <= 0.25 + 1e-9).all().all()
+
+    def test_no_position_before_warmup_or_listing(self, universe):
+        scores, prices = universe
+        result = PortfolioBacktester(buy_threshold=-1.0, sell_threshold=-2.0).run(scores, prices)
+        assert (result.weights.iloc[: MIN_HISTORY - 1] == 0).all().all()
+        assert (result.weights["S1"].iloc[: 60 + MIN_HISTORY - 1] == 0).all()
+
+    def test_nothing_bought(self, universe):
+        scores, prices = universe
+        result = PortfolioBacktester(buy_threshold=5.0).run(scores, prices)
+        assert result.final_value == 100000
+        assert result.turnover == 0.0
+        assert (result.equity_curve == 100000).all()
+
+    def test_run_panel(self):
+        rng = np.random.default_rng(0)
+        frames = {}
+        for i, periods in enumerate([200, 160]):
+            close = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, periods)))
+            frames[f"S{i}"] = pd.DataFrame(
+                {"High": close * 1.01, "Low": close * 0.99, "Close": close, "Volume": 1e6},
+                index=pd.bdate_range("2024-01-01", periods=periods),
+            )
+        result = PortfolioBacktester().run_panel(to_panel(frames))
+        assert len(result.equity_curve) == 200
+        assert list(result.attribution.index) == ["S0", "S1"]
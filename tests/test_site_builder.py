@@ -1,13 +1,18 @@
 """Tests for the site builder (financial dashboard generator)."""
 
+from datetime import date
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
+from ai_financial_advisor.data.storage.score_store import ScoreRecord, ScoreStore
 from ai_financial_advisor.web.site_builder import (
     SiteBuilder,
     StockRow,
     generate_site,
+    load_market_data,
+    market_data_from_scores,
 )
 
 
@@ -102,3 +107,61 @@ class TestGenerateSite:
         result = generate_site(reports_dir, output_dir)
         assert result == output_dir
         assert (output_dir / "index.html").exists()
+
+
+class TestLoadMarketData:
+    def test_reads_latest_scan(self, tmp_path: Path, output_dir: Path, reports_dir: Path) -> None:
+        pytest.importorskip("pyarrow")
+        from ai_financial_advisor.data.storage.parquet_store import ParquetStore
+
+        store = ParquetStore(tmp_path / "results")
+        scans = pd.DataFrame(
+            {
+                "symbol": ["AAPL", "MSFT", "BTC-USD"],
+                "period": "1y",
+                "currency": "USD",
+                "latest_close": [247.99, 381.87, 70392.95],
+                "score": [-0.53, 0.27, 0.28],
+                "macd_signal": 0.0,
+                "mfi_signal": 0.0,
+                "obv_signal": 0.0,
+                "interpretation": ["Bearish", "Neutral", "Neutral"],
+            }
+        )
+        store.write("scans", scans.iloc[:1], run_date=date(2026, 3, 20))
+        store.write("scans", scans, run_date=date(2026, 3, 21))
+
+        market_data = load_market_data(tmp_path / "results")
+        assert sorted(market_data) == ["CRYPTO", "US"]
+        assert [s.symbol for s in market_data["US"]] == ["MSFT", "AAPL"]
+        assert market_data["US"][1].close == 247.99
+        assert len(load_market_data(tmp_path / "results", run_date="2026-03-20")["US"]) == 1
+
+        generate_site(reports_dir, output_dir, market_data=market_data)
+        assert (output_dir / "market" / "MSFT.html").exists()
+
+    def test_nothing_stored(self, tmp_path: Path) -> None:
+        pytest.importorskip("pyarrow")
+        assert load_market_data(tmp_path / "results") == {}
+
+
+class TestMarketDataFromScores:
+    def test_groups_latest_scores_by_market(self, tmp_path: Path) -> None:
+        store = ScoreStore(tmp_path / "scores.db")
+        store.record_run([ScoreRecord("AAPL", 240.0, 0.1, 0, 0, 0, "Neutral")])
+        store.record_run(
+            [
+                ScoreRecord("AAPL", 247.99, -0.53, -1.0, -0.29, -0.14, "Bearish"),
+                ScoreRecord("MSFT", 381.87, 0.27, 0.5, 0.1, 0.05, "Neutral"),
+                ScoreRecord("BTC-USD", 70392.95, 0.28, 0.49, 0.37, -0.1, "Neutral"),
+            ]
+        )
+        store.close()
+
+        market_data = market_data_from_scores(tmp_path / "scores.db")
+        assert list(market_data) == ["CRYPTO", "US"]
+        assert [s.symbol for s in market_data["US"]] == ["MSFT", "AAPL"]
+        assert market_data["US"][1] == StockRow("AAPL", "USD", 247.99, -0.53, "Bearish", -1.0, -0.29, -0.14)
+
+    def test_nothing_recorded(self, tmp_path: Path) -> None:
+        assert market_data_from_scores(tmp_path / "scores.db") == {}
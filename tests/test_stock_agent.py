@@ -0,0 +1,113 @@
+"""Tests for the stock agent."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.agents import stock_agent
+from ai_financial_advisor.agents.stock_agent import StockAgent, StockAnalysis, _analyze_frame, scan_tables
+
+
+def _frame(n: int = 80, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1_000, 10_000, n).astype(float),
+        },
+        index=pd.bdate_range("2025-01-01", periods=n),
+    )
+
+
+@pytest.fixture
+def fake_download(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Replace download_many with a stub; records each requested symbol list."""
+    calls: list[list[str]] = []
+
+    def download_many(symbols: list[str], period: str = "1y") -> dict[str, pd.DataFrame]:
+        calls.append(list(symbols))
+        frames = {s: _frame(seed=sum(map(ord, s))) for s in symbols if s != "BAD"}
+        if "SHORT" in frames:
+            frames["SHORT"] = frames["SHORT"].iloc[:3]
+        if "LATE" in frames:
+            frames["LATE"] = frames["LATE"].iloc[40:]
+        return frames
+
+    monkeypatch.setattr(stock_agent, "download_many", download_many)
+    return calls
+
+
+class TestAnalyzeMultiple:
+    def test_single_batched_fetch(self, fake_download: list[list[str]]) -> None:
+        results = StockAgent().analyze_multiple(["AAPL", "MSFT", "NVDA"], period="6mo")
+        assert fake_download == [["AAPL", "MSFT", "NVDA"]]
+        assert [r.symbol for r in results] == ["AAPL", "MSFT", "NVDA"]
+        assert all(isinstance(r, StockAnalysis) for r in results)
+
+    def test_skips_failed_symbols(self, fake_download: list[list[str]]) -> None:
+        results = StockAgent().analyze_multiple(["AAPL", "BAD", "MSFT"])
+        assert [r.symbol for r in results] == ["AAPL", "MSFT"]
+
+    def test_records_errors_per_symbol(self, fake_download: list[list[str]]) -> None:
+        agent = StockAgent()
+        agent.analyze_multiple(["AAPL", "BAD"])
+        assert list(agent.last_errors) == ["BAD"]
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_concurrent_matches_sequential(self, fake_download: list[list[str]], mode: str) -> None:
+        symbols = [f"S{i}" for i in range(30)] + ["BAD"]
+        sequential = StockAgent().analyze_multiple(symbols)
+
+        agent = StockAgent()
+        concurrent = agent.analyze_multiple(symbols, max_workers=3, mode=mode)
+
+        assert [r.symbol for r in concurrent] == [r.symbol for r in sequential]
+        assert [r.trend.score for r in concurrent] == [r.trend.score for r in sequential]
+        assert list(agent.last_errors) == ["BAD"]
+
+    def test_concurrent_fetches_in_batches(self, fake_download: list[list[str]]) -> None:
+        symbols = [f"S{i}" for i in range(60)]
+        StockAgent().analyze_multiple(symbols, max_workers=4)
+        assert sorted(len(batch) for batch in fake_download) == [10, 25, 25]
+
+    def test_results_include_indicators(self, fake_download: list[list[str]]) -> None:
+        result = StockAgent().analyze_multiple(["AAPL"])[0]
+        assert {"MACD", "OBV", "MFI"} <= set(result.data.columns)
+        assert result.latest_close == pytest.approx(float(result.data["Close"].iloc[-1]))
+        assert -1.0 <= result.trend.score <= 1.0
+
+    def test_panel_matches_per_symbol_analysis(self, fake_download: list[list[str]]) -> None:
+        symbols = ["AAPL", "LATE", "MSFT"]
+        results = StockAgent().analyze_multiple(symbols)
+        frames = stock_agent.download_many(symbols)
+
+        for result in results:
+            expected = _analyze_frame(result.symbol, frames[result.symbol], "1y")
+            assert result.trend == expected.trend
+            assert result.latest_close == expected.latest_close
+            pd.testing.assert_frame_equal(result.data, expected.data, check_exact=True)
+
+    def test_short_history_is_an_error(self, fake_download: list[list[str]]) -> None:
+        agent = StockAgent()
+        results = agent.analyze_multiple(["AAPL", "SHORT"])
+        assert [r.symbol for r in results] == ["AAPL"]
+        assert "Not enough history" in agent.last_errors["SHORT"]
+
+
+class TestScanTables:
+    def test_flattens_results(self, sample_ohlcv: pd.DataFrame) -> None:
+        result = _analyze_frame("AAPL", sample_ohlcv, "3mo")
+        tables = scan_tables([result])
+
+        scans = tables["scans"]
+        assert scans[["symbol", "period", "currency"]].iloc[0].tolist() == ["AAPL", "3mo", "USD"]
+        assert scans["score"].iloc[0] == result.trend.score
+        assert scans["latest_close"].iloc[0] == result.latest_close
+        bars = tables["bars"]
+        assert len(bars) == len(result.data)
+        assert {"timestamp", "symbol", "Close"} <= set(bars.columns)
+        assert (bars["symbol"] == "AAPL").all()
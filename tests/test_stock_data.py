@@ -0,0 +1,260 @@
+"""Tests for the stock data downloader and its bar cache read-through."""
+
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.data import stock_data
+from ai_financial_advisor.data.stock_data import BarCache, download_many, download_stock_data, period_start
+from ai_financial_advisor.data.storage.bar_store import BarStore
+from ai_financial_advisor.data.storage.columnar_store import ColumnarBarStore
+
+
+class FakeYahoo:
+    """Stands in for yf.download, serving slices of a fixed history.
+
+    A list of tickers returns yfinance's grouped MultiIndex layout on a
+    union calendar; tickers listed in `missing` come back as all-NaN and
+    `holidays` blanks individual rows for one ticker.
+    """
+
+    def __init__(self, history: pd.DataFrame) -> None:
+        self.history = history
+        self.missing: set[str] = set()
+        self.holidays: dict[str, list[pd.Timestamp]] = {}
+        self.calls: list[dict] = []
+
+    def download(
+        self,
+        tickers: str | list[str],
+        interval: str = "1d",
+        progress: bool = False,
+        group_by: str = "column",
+        **kwargs: str,
+    ) -> pd.DataFrame:
+        self.calls.append({"symbol": tickers, "interval": interval, **kwargs})
+        if isinstance(tickers, list):
+            frames = {t.upper(): self._slice(kwargs) for t in tickers}
+            for t in self.missing & set(tickers):
+                frames[t] = frames[t] * np.nan
+            for t, days in self.holidays.items():
+                if t in frames:
+                    frames[t].loc[frames[t].index.isin(days)] = np.nan
+            return pd.concat(frames, axis=1)
+        return self._slice(kwargs)
+
+    def _slice(self, kwargs: dict) -> pd.DataFrame:
+        df = self.history
+        if "start" in kwargs and kwargs["start"]:
+            df = df[df.index >= pd.Timestamp(kwargs["start"])]
+        elif kwargs.get("period") not in (None, "max"):
+            df = df[df.index >= period_start(kwargs["period"], datetime.now(UTC))]
+        return df.copy()
+
+
+def _history(n: int = 400, end: pd.Timestamp | None = None) -> pd.DataFrame:
+    end = end or pd.Timestamp(date.today())
+    idx = pd.bdate_range(end=end, periods=n, name="Date")
+    close = 100 + np.arange(n, dtype=float)
+    return pd.DataFrame(
+        {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1_000.0},
+        index=idx,
+    )
+
+
+@pytest.fixture(params=["sqlite", "columnar"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> BarCache:
+    if request.param == "columnar":
+        return ColumnarBarStore(tmp_path / "bars")
+    return BarStore(tmp_path / "bars.db")
+
+
+@pytest.fixture
+def fake(monkeypatch: pytest.MonkeyPatch) -> FakeYahoo:
+    fake = FakeYahoo(_history())
+    monkeypatch.setattr(stock_data.yf, "download", fake.download)
+    return fake
+
+
+class TestPeriodStart:
+    def test_months(self) -> None:
+        now = datetime(2026, 3, 31, tzinfo=UTC)
+        assert period_start("6mo", now) == pd.Timestamp("2025-09-30")
+
+    def test_years_and_ytd(self) -> None:
+        now = datetime(2026, 3, 20, tzinfo=UTC)
+        assert period_start("2y", now) == pd.Timestamp("2024-03-20")
+        assert period_start("ytd", now) == pd.Timestamp("2026-01-01")
+
+    def test_days_are_business_days(self) -> None:
+        now = datetime(2026, 3, 23, tzinfo=UTC)  # Monday
+        assert period_start("5d", now) == pd.Timestamp("2026-03-16")
+
+    def test_max_is_unbounded(self) -> None:
+        assert period_start("max", datetime.now(UTC)) is None
+
+    def test_invalid_period(self) -> None:
+        with pytest.raises(ValueError):
+            period_start("forever", datetime.now(UTC))
+
+
+class TestReadThroughCache:
+    def test_cold_fetch_populates_store(self, store: BarCache, fake: FakeYahoo) -> None:
+        df = download_stock_data("AAPL", period="6mo", store=store)
+        assert len(fake.calls) == 1
+        assert fake.calls[0]["period"] == "6mo"
+        assert len(store.load("AAPL", "1d")) == len(df)
+
+    def test_fresh_cache_skips_download(self, store: BarCache, fake: FakeYahoo) -> None:
+        first = download_stock_data("AAPL", period="6mo", store=store)
+        second = download_stock_data("AAPL", period="6mo", store=store)
+        assert len(fake.calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_shorter_period_served_from_cache(self, store: BarCache, fake: FakeYahoo) -> None:
+        download_stock_data("AAPL", period="1y", store=store)
+        df = download_stock_data("AAPL", period="3mo", store=store)
+        assert len(fake.calls) == 1
+        assert df.index[0] >= period_start("3mo", datetime.now(UTC))
+
+    def test_longer_period_refetches(self, store: BarCache, fake: FakeYahoo) -> None:
+        download_stock_data("AAPL", period="3mo", store=store)
+        download_stock_data("AAPL", period="1y", store=store)
+        assert [c["period"] for c in fake.calls] == ["3mo", "1y"]
+
+    def test_stale_cache_tops_up_incrementally(self, store: BarCache, fake: FakeYahoo) -> None:
+        old = fake.history.iloc[:-3]
+        store.replace(
+            "AAPL",
+            "1d",
+            old,
+            covered_from=old.index[0].date(),
+            fetched_at=datetime.now(UTC) - timedelta(days=7),
+        )
+
+        df = download_stock_data("AAPL", period="6mo", store=store)
+
+        assert len(fake.calls) == 1
+        assert fake.calls[0]["start"] == old.index[-2].strftime("%Y-%m-%d")
+        assert df.index[-1] == fake.history.index[-1]
+        assert df["Close"].iloc[-1] == fake.history["Close"].iloc[-1]
+
+    def test_readjusted_history_triggers_full_refresh(self, store: BarCache, fake: FakeYahoo) -> None:
+        # Cache holds pre-split prices: the provider now reports everything halved
+        store.replace(
+            "AAPL",
+            "1d",
+            fake.history.iloc[:-3].assign(Close=lambda d: d["Close"] * 2),
+            covered_from=fake.history.index[0].date(),
+            fetched_at=datetime.now(UTC) - timedelta(days=7),
+        )
+
+        download_stock_data("AAPL", period="6mo", store=store)
+
+        assert len(fake.calls) == 2
+        assert fake.calls[1]["start"] == fake.history.index[0].date().isoformat()
+        cached = store.load("AAPL", "1d")
+        np.testing.assert_array_equal(cached["Close"].to_numpy(), fake.history["Close"].to_numpy())
+
+    def test_forex_volume_zeroed_before_caching(self, store: BarCache, fake: FakeYahoo) -> None:
+        df = download_stock_data("EURUSD=X", period="6mo", store=store)
+        assert (df["Volume"] == 0).all()
+        assert (store.load("EURUSD=X", "1d")["Volume"] == 0).all()
+
+    def test_empty_response_raises(self, store: BarCache, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(stock_data.yf, "download", lambda *a, **k: pd.DataFrame())
+        with pytest.raises(ValueError):
+            download_stock_data("NOPE", period="6mo", store=store)
+
+    def test_multiindex_columns_flattened(self, store: BarCache, fake: FakeYahoo) -> None:
+        history = fake.history.copy()
+        history.columns = pd.MultiIndex.from_product([history.columns, ["AAPL"]])
+        fake.history = history
+        df = download_stock_data("AAPL", period="6mo", store=store)
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+
+class TestDownloadMany:
+    def test_batches_requests(self, store: BarCache, fake: FakeYahoo) -> None:
+        symbols = [f"S{i}" for i in range(5)]
+        frames = download_many(symbols, period="6mo", store=store, batch_size=2)
+        assert list(frames) == symbols
+        assert len(fake.calls) == 3
+        assert fake.calls[0]["symbol"] == ["S0", "S1"]
+
+    def test_without_store(self, fake: FakeYahoo, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(stock_data, "get_bar_store", lambda: None)
+        frames = download_many(["AAPL", "MSFT", "AAPL"], period="6mo")
+        assert list(frames) == ["AAPL", "MSFT"]
+        assert len(fake.calls) == 1
+
+    def test_failed_symbol_isolated(self, store: BarCache, fake: FakeYahoo) -> None:
+        fake.missing = {"BAD"}
+        frames = download_many(["AAPL", "BAD", "MSFT"], period="6mo", store=store)
+        assert list(frames) == ["AAPL", "MSFT"]
+        assert store.get_info("BAD", "1d") is None
+
+    def test_union_calendar_padding_dropped(self, store: BarCache, fake: FakeYahoo) -> None:
+        holiday = fake.history.index[-10]
+        fake.holidays = {"0700.HK": [holiday]}
+        frames = download_many(["AAPL", "0700.HK"], period="6mo", store=store)
+        assert holiday in frames["AAPL"].index
+        assert holiday not in frames["0700.HK"].index
+        assert not frames["0700.HK"]["Close"].isna().any()
+
+    def test_lowercase_symbols(self, store: BarCache, fake: FakeYahoo) -> None:
+        frames = download_many(["aapl", "msft"], period="6mo", store=store)
+        assert list(frames) == ["aapl", "msft"]
+
+    def test_forex_volume_zeroed(self, store: BarCache, fake: FakeYahoo) -> None:
+        frames = download_many(["AAPL", "EURUSD=X"], period="6mo", store=store)
+        assert (frames["EURUSD=X"]["Volume"] == 0).all()
+        assert (frames["AAPL"]["Volume"] > 0).all()
+
+    def test_fresh_symbols_served_from_cache(self, store: BarCache, fake: FakeYahoo) -> None:
+        download_many(["AAPL", "MSFT"], period="6mo", store=store)
+        download_many(["AAPL", "MSFT", "NVDA"], period="6mo", store=store)
+        assert fake.calls[-1]["symbol"] == ["NVDA"]
+        assert len(fake.calls) == 2
+
+    def test_stale_symbols_topped_up_in_one_request(self, store: BarCache, fake: FakeYahoo) -> None:
+        old = fake.history.iloc[:-3]
+        stale_at = datetime.now(UTC) - timedelta(days=7)
+        store.replace("AAPL", "1d", old, covered_from=old.index[0].date(), fetched_at=stale_at)
+        store.replace("MSFT", "1d", old.iloc[:-2], covered_from=old.index[0].date(), fetched_at=stale_at)
+
+        frames = download_many(["AAPL", "MSFT"], period="6mo", store=store)
+
+        assert len(fake.calls) == 1
+        assert fake.calls[0]["start"] == old.index[-4].strftime("%Y-%m-%d")
+        for df in frames.values():
+            assert df.index[-1] == fake.history.index[-1]
+
+
+class TestIntervals:
+    def test_intraday_bypasses_store(self, store: BarCache, fake: FakeYahoo) -> None:
+        download_stock_data("AAPL", period="5d", store=store, interval="5m")
+        download_stock_data("AAPL", period="5d", store=store, interval="5m")
+        assert [call["interval"] for call in fake.calls] == ["5m", "5m"]
+        assert store.get_info("AAPL", "5m") is None
+        assert store.get_info("AAPL", "1d") is None
+
+    def test_download_many_intraday(self, store: BarCache, fake: FakeYahoo) -> None:
+        frames = download_many(["AAPL", "MSFT"], period="5d", store=store, interval="1h")
+        assert list(frames) == ["AAPL", "MSFT"]
+        assert fake.calls[0]["interval"] == "1h"
+        assert store.get_info("AAPL", "1d") is None
+
+    def test_daily_default(self, store: BarCache, fake: FakeYahoo) -> None:
+        download_stock_data("AAPL", period="6mo", store=store)
+        assert fake.calls[0]["interval"] == "1d"
+
+    def test_unsupported_interval(self, store: BarCache, fake: FakeYahoo) -> None:
+        with pytest.raises(ValueError, match="Unsupported interval"):
+            download_stock_data("AAPL", store=store, interval="2m")
+        with pytest.raises(ValueError, match="Unsupported interval"):
+            download_many(["AAPL"], store=store, interval="1wk")
+        assert not fake.calls
@@ -1,12 +1,22 @@
-"""Tests for SQLite storage backend."""
+"""Tests for the storage backends."""
 
-from datetime import datetime
+import mmap
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from ai_financial_advisor.analysis.anomaly import Anomaly, anomaly_frame
 from ai_financial_advisor.data.news_fetcher import Article
+from ai_financial_advisor.data.storage.bar_store import BarStore
+from ai_financial_advisor.data.storage.base import ArticleSignature, ScrapeState
+from ai_financial_advisor.data.storage.columnar_store import ColumnarBarStore
+from ai_financial_advisor.data.storage.parquet_store import ParquetStore
+from ai_financial_advisor.data.storage.score_store import ScoreRecord, ScoreStore
 from ai_financial_advisor.data.storage.sqlite_store import SQLiteStore
+from ai_financial_advisor.strategies.backtester import BacktestResult, Trade, backtest_tables
 
 
 @pytest.fixture
@@ -59,3 +69,454 @@ class TestSQLiteStore:
 
         no_content = store.get_articles_without_content()
         assert len(no_content) == 1
+
+    def test_counts_only_new_rows(self, store: SQLiteStore, sample_articles: list[Article]) -> None:
+        store.save_articles(sample_articles[:1])
+        # One stored URL, one new URL given twice
+        inserted = store.save_articles([sample_articles[0], sample_articles[1], sample_articles[1]])
+        assert inserted == 1
+        assert len(store.get_articles_without_content()) == 2
+
+    def test_update_contents_batch(self, store: SQLiteStore, sample_articles: list[Article]) -> None:
+        store.save_articles(sample_articles)
+        updated = store.update_article_contents(
+            [
+                ("https://example.com/1", "Text 1", "A"),
+                ("https://example.com/2", "Text 2", None),
+                ("https://example.com/missing", "Text", "B"),
+            ]
+        )
+        assert updated == 2
+        assert store.get_articles_without_content() == []
+
+    def test_wal_mode(self, store: SQLiteStore) -> None:
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestScrapeStates:
+    def test_round_trip(self, store: SQLiteStore, sample_articles: list[Article]) -> None:
+        store.save_articles(sample_articles)
+        checked = datetime(2025, 7, 11, 12, 0)
+        store.update_article_contents([("https://example.com/1", "Full text", "Jane")])
+        store.save_scrape_states(
+            [
+                ScrapeState("https://example.com/1", etag='"v1"', checked_at=checked),
+                ScrapeState("https://example.com/2", failures=2, checked_at=checked),
+            ]
+        )
+        states = store.get_scrape_states(a.url for a in sample_articles)
+        assert states["https://example.com/1"] == ScrapeState(
+            "https://example.com/1", "Full text", "Jane", '"v1"', None, 0, checked
+        )
+        assert states["https://example.com/2"].failures == 2
+        assert states["https://example.com/2"].content is None
+
+        store.save_scrape_states([ScrapeState("https://example.com/2", etag="x", checked_at=checked)])
+        assert store.get_scrape_states(["https://example.com/2"])["https://example.com/2"].failures == 0
+
+    def test_unscraped_urls_are_absent(self, store: SQLiteStore, sample_articles: list[Article]) -> None:
+        store.save_articles(sample_articles)
+        store.update_article_content("https://example.com/1", "Scraped before the cache existed", "A")
+        states = store.get_scrape_states([a.url for a in sample_articles] + ["https://example.com/missing"])
+        assert list(states) == ["https://example.com/1"]
+        assert states["https://example.com/1"].checked_at is None
+
+    def test_is_due(self) -> None:
+        now = datetime(2025, 7, 11, 12, 0)
+        day, hour = timedelta(days=1), timedelta(hours=1)
+
+        def state(age: timedelta | None, **kwargs: object) -> ScrapeState:
+            return ScrapeState("u", checked_at=None if age is None else now - age, **kwargs)
+
+        assert state(None).is_due(now, day, hour)
+        assert not state(None, content="text").is_due(now, day, hour)
+        assert not state(2 * day, content="text").is_due(now, day, hour)  # no validator to revalidate with
+        assert not state(hour, content="text", etag="v").is_due(now, day, hour)
+        assert state(day, content="text", last_modified="Mon").is_due(now, day, hour)
+        # Failed pages back off: 1h, 2h, 4h, ... capped at a week
+        assert state(hour, failures=1).is_due(now, day, hour)
+        assert not state(3 * hour, failures=3).is_due(now, day, hour)
+        assert state(4 * hour, failures=3).is_due(now, day, hour)
+        assert state(timedelta(days=7), failures=20).is_due(now, day, hour)
+
+
+class TestArticleSignatures:
+    def test_round_trip(self, store: SQLiteStore) -> None:
+        signature = bytes(range(16))
+        store.save_article_signatures([ArticleSignature("https://example.com/1", signature, "c1", [5, -9])])
+        saved = store.get_article_signatures(["https://example.com/1", "https://example.com/missing"])
+        assert list(saved) == ["https://example.com/1"]
+        assert saved["https://example.com/1"].cluster == "c1"
+        assert saved["https://example.com/1"].signature == signature
+
+    def test_find_by_band(self, store: SQLiteStore) -> None:
+        signature = bytes(16)
+        store.save_article_signatures(
+            [
+                ArticleSignature("https://example.com/1", signature, "c1", [1, 2]),
+                ArticleSignature("https://example.com/2", signature, "c1", [2, 3]),
+                ArticleSignature("https://example.com/3", signature, "c3", [4]),
+            ]
+        )
+        assert set(store.find_article_signatures([2])) == {"https://example.com/1", "https://example.com/2"}
+        assert set(store.find_article_signatures([3, 4])) == {"https://example.com/2", "https://example.com/3"}
+        assert store.find_article_signatures([9]) == {}
+
+        # Re-saving replaces the bands and the cluster
+        store.save_article_signatures([ArticleSignature("https://example.com/1", signature, "c3", [9])])
+        assert list(store.find_article_signatures([1, 2])) == ["https://example.com/2"]
+        assert store.find_article_signatures([9])["https://example.com/1"].cluster == "c3"
+
+
+class TestArticleSearch:
+    def test_finds_saved_and_updated_articles(self, store: SQLiteStore, sample_articles: list[Article]) -> None:
+        store.save_articles(sample_articles)
+        assert [h.location for h in store.search("article 2")] == ["https://example.com/2"]
+        assert store.search("tariffs") == []
+
+        store.update_article_content("https://example.com/1", "New tariffs weigh on exporters.", "Staff")
+        hits = store.search("tariffs")
+        assert [h.location for h in hits] == ["https://example.com/1"]
+        assert "**tariffs**" in hits[0].snippet
+        assert hits[0].kind == "article" and hits[0].source == "Reuters"
+
+        store.update_article_content("https://example.com/1", "Oil prices fell.", "Staff")
+        assert store.search("tariffs") == []
+
+    def test_ranks_title_matches_first(self, store: SQLiteStore) -> None:
+        published = datetime(2025, 7, 11)
+        store.save_articles(
+            [
+                Article("Markets wrap", "https://e.com/a", "CNBC", "Stocks and inflation data", published),
+                Article("Inflation cools", "https://e.com/b", "Reuters", "Prices eased", published),
+            ]
+        )
+        assert [h.location for h in store.search("inflation")] == ["https://e.com/b", "https://e.com/a"]
+        assert all(h.score > 0 for h in store.search("inflation"))
+
+    def test_filters(self, store: SQLiteStore, sample_articles: list[Article]) -> None:
+        store.save_articles(sample_articles)
+        store.save_articles([Article("Old article", "https://example.com/old", "Reuters", "", datetime(2024, 1, 2))])
+
+        assert len(store.search("article")) == 3
+        assert len(store.search("article", since=date(2025, 1, 1))) == 2
+        assert [h.location for h in store.search("article", source="bloomberg")] == ["https://example.com/2"]
+        assert len(store.search("article", limit=1)) == 1
+
+    def test_query_syntax_is_quoted(self, store: SQLiteStore, sample_articles: list[Article]) -> None:
+        store.save_articles(sample_articles)
+        assert store.search('"Test" AND (') == []
+        assert len(store.search("test OR nothing", raw=True)) == 2
+        assert store.search("   ") == []
+
+    def test_indexes_existing_database(self, tmp_path: Path, sample_articles: list[Article]) -> None:
+        store = SQLiteStore(tmp_path / "news.db")
+        store.save_articles(sample_articles)
+        store._conn.executescript("DROP TABLE articles_fts")
+        store.close()
+
+        assert len(SQLiteStore(tmp_path / "news.db").search("article")) == 2
+
+    def test_reports(self, store: SQLiteStore, tmp_path: Path) -> None:
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        (reports / "NR_2026-03-20.md").write_text(
+            "# Global News Daily Report (2026-03-20)\n\nFed signals a rate cut.\n"
+        )
+        (reports / "NR_2026-03-21.md").write_text("# Global News Daily Report (2026-03-21)\n\nOil rallies.\n")
+
+        assert store.index_reports(reports) == 2
+        assert store.index_reports(reports) == 0  # unchanged files are not re-read
+        hits = store.search("rate cut")
+        assert [(h.kind, h.location, h.published) for h in hits] == [("report", "NR_2026-03-20.md", "2026-03-20")]
+        assert hits[0].title == "Global News Daily Report (2026-03-20)"
+        assert store.search("rate cut", since=date(2026, 3, 21)) == []
+        assert len(store.search("report", source="report")) == 2
+
+        (reports / "NR_2026-03-20.md").unlink()
+        store.index_reports(reports)
+        assert store.search("rate cut") == []
+
+
+def _bars(start: str, n: int) -> pd.DataFrame:
+    idx = pd.bdate_range(start, periods=n, name="Date")
+    close = [100.0 + i for i in range(n)]
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1000.0},
+        index=idx,
+    )
+
+
+class TestBarStore:
+    def test_empty_store(self, tmp_path: Path) -> None:
+        store = BarStore(tmp_path / "bars.db")
+        assert store.get_info("AAPL", "1d") is None
+        assert store.load("AAPL", "1d").empty
+
+    def test_replace_and_load_roundtrip(self, tmp_path: Path) -> None:
+        store = BarStore(tmp_path / "bars.db")
+        bars = _bars("2025-01-01", 10)
+        fetched = datetime(2025, 1, 15, 22, 0)
+        store.replace("AAPL", "1d", bars, covered_from=date(2025, 1, 1), fetched_at=fetched)
+
+        loaded = store.load("AAPL", "1d")
+        pd.testing.assert_frame_equal(loaded, bars, check_freq=False)
+        info = store.get_info("AAPL", "1d")
+        assert info.covered_from == date(2025, 1, 1)
+        assert info.fetched_at == fetched
+
+    def test_load_from_start(self, tmp_path: Path) -> None:
+        store = BarStore(tmp_path / "bars.db")
+        store.replace("AAPL", "1d", _bars("2025-01-01", 10), covered_from=None, fetched_at=datetime.now())
+        loaded = store.load("AAPL", "1d", start=pd.Timestamp("2025-01-08"))
+        assert loaded.index[0] == pd.Timestamp("2025-01-08")
+
+    def test_append_upserts_overlap(self, tmp_path: Path) -> None:
+        store = BarStore(tmp_path / "bars.db")
+        store.replace("AAPL", "1d", _bars("2025-01-01", 5), covered_from=None, fetched_at=datetime(2025, 1, 1))
+        newer = _bars("2025-01-07", 3).assign(Close=1.0)
+        store.append("AAPL", "1d", newer, fetched_at=datetime(2025, 1, 10))
+
+        loaded = store.load("AAPL", "1d")
+        assert len(loaded) == 7
+        assert loaded.loc["2025-01-07", "Close"] == 1.0
+        assert store.get_info("AAPL", "1d").fetched_at == datetime(2025, 1, 10)
+
+    def test_series_keyed_by_interval(self, tmp_path: Path) -> None:
+        store = BarStore(tmp_path / "bars.db")
+        store.replace("AAPL", "1d", _bars("2025-01-01", 5), covered_from=None, fetched_at=datetime.now())
+        assert store.load("AAPL", "1h").empty
+        assert store.load("MSFT", "1d").empty
+
+
+class TestColumnarBarStore:
+    def test_empty_store(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        assert store.get_info("AAPL", "1d") is None
+        assert store.load("AAPL", "1d").empty
+        assert store.symbols("1d") == []
+
+    def test_replace_and_load_roundtrip(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        bars = _bars("2025-01-01", 10)
+        fetched = datetime(2025, 1, 15, 22, 0)
+        store.replace("^GSPC", "1d", bars, covered_from=date(2025, 1, 1), fetched_at=fetched)
+
+        pd.testing.assert_frame_equal(store.load("^GSPC", "1d"), bars, check_freq=False)
+        info = store.get_info("^GSPC", "1d")
+        assert info.covered_from == date(2025, 1, 1)
+        assert info.fetched_at == fetched
+        assert store.symbols("1d") == ["^GSPC"]
+
+    def test_load_is_zero_copy(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        store.replace("AAPL", "1d", _bars("2025-01-01", 10), covered_from=None, fetched_at=datetime.now())
+        loaded = store.load("AAPL", "1d", start=pd.Timestamp("2025-01-08"))
+        assert loaded.index[0] == pd.Timestamp("2025-01-08")
+        for name in loaded.columns:
+            assert _is_mapped(loaded[name].to_numpy())
+        assert _is_mapped(loaded.index.values)
+
+    def test_append_extends_in_place(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        store.replace("AAPL", "1d", _bars("2025-01-01", 5), covered_from=None, fetched_at=datetime(2025, 1, 1))
+        before = store.load("AAPL", "1d")
+        store.append("AAPL", "1d", _bars("2025-01-08", 3), fetched_at=datetime(2025, 1, 10))
+
+        assert len(store.load("AAPL", "1d")) == 8
+        assert len(before) == 5
+        assert sorted(p.name for p in (tmp_path / "bars" / "1d" / "AAPL").glob("Close.*")) == ["Close.1.f8"]
+
+    def test_append_after_interrupted_append(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        store.replace("AAPL", "1d", _bars("2025-01-01", 5), covered_from=None, fetched_at=datetime(2025, 1, 1))
+        # An append that wrote some of its bytes but died before updating the manifest
+        series = tmp_path / "bars" / "1d" / "AAPL"
+        for path in series.glob("*.1.?8"):
+            with open(path, "ab") as f:
+                f.write(b"\xff" * 12)
+        store.append("AAPL", "1d", _bars("2025-01-08", 3), fetched_at=datetime(2025, 1, 10))
+
+        loaded = store.load("AAPL", "1d")
+        expected = pd.concat([_bars("2025-01-01", 5), _bars("2025-01-08", 3)])
+        pd.testing.assert_frame_equal(loaded, expected, check_freq=False)
+        assert all(path.stat().st_size == 8 * 8 for path in series.glob("*.1.?8"))
+
+    def test_append_upserts_overlap(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        store.replace("AAPL", "1d", _bars("2025-01-01", 5), covered_from=None, fetched_at=datetime(2025, 1, 1))
+        before = store.load("AAPL", "1d")
+        newer = _bars("2025-01-07", 3).assign(Close=1.0)
+        store.append("AAPL", "1d", newer, fetched_at=datetime(2025, 1, 10))
+
+        loaded = store.load("AAPL", "1d")
+        assert len(loaded) == 7
+        assert loaded.loc["2025-01-07", "Close"] == 1.0
+        assert store.get_info("AAPL", "1d").fetched_at == datetime(2025, 1, 10)
+        # Frames loaded before the rewrite keep reading the previous generation
+        assert before.loc["2025-01-07", "Close"] == 104.0
+
+    def test_append_requires_series(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        with pytest.raises(ValueError):
+            store.append("AAPL", "1d", _bars("2025-01-01", 2), fetched_at=datetime.now())
+
+    def test_timezone_aware_index(self, tmp_path: Path) -> None:
+        store = ColumnarBarStore(tmp_path / "bars")
+        index = pd.date_range("2025-01-02 09:30", periods=6, freq="5min", tz="America/New_York", name="Date")
+        bars = _bars("2025-01-01", 6).set_axis(index)
+        store.replace("AAPL", "5m", bars, covered_from=None, fetched_at=datetime.now())
+
+        pd.testing.assert_frame_equal(store.load("AAPL", "5m"), bars, check_freq=False)
+        assert len(store.load("AAPL", "5m", start=pd.Timestamp("2025-01-02 09:45"))) == 3
+
+
+@pytest.fixture
+def results(tmp_path: Path) -> ParquetStore:
+    pytest.importorskip("pyarrow")
+    return ParquetStore(tmp_path / "results")
+
+
+def _scans(symbols: list[str], score: float = 0.5) -> pd.DataFrame:
+    return pd.DataFrame({"symbol": symbols, "score": score, "interpretation": "Bullish"})
+
+
+class TestParquetStore:
+    def test_round_trip(self, results: ParquetStore) -> None:
+        results.write("scans", _scans(["AAPL", "0700.HK"]), run_date=date(2026, 3, 20))
+
+        df = results.read("scans").sort_values("symbol", ignore_index=True)
+        assert list(df["symbol"]) == ["0700.HK", "AAPL"]
+        assert list(df["market"]) == ["hk", "us"]
+        assert set(df["date"]) == {"2026-03-20"}
+        assert results.tables() == ["scans"]
+        assert (results.dataset("scans").files[0]).count("date=2026-03-20/market=") == 1
+
+    def test_rewrite_replaces_touched_partitions_only(self, results: ParquetStore) -> None:
+        results.write("scans", _scans(["AAPL", "0700.HK"]), run_date=date(2026, 3, 20))
+        results.write("scans", _scans(["AAPL"], score=-0.5), run_date=date(2026, 3, 21))
+        results.write("scans", _scans(["MSFT"], score=0.1), run_date=date(2026, 3, 21))
+
+        assert results.dates("scans") == ["2026-03-20", "2026-03-21"]
+        latest = results.read("scans", dates=["2026-03-21"])
+        assert list(latest["symbol"]) == ["MSFT"]
+        assert len(results.read("scans", dates=[date(2026, 3, 20)])) == 2
+
+    def test_projection_and_filters(self, results: ParquetStore) -> None:
+        results.write("scans", _scans(["AAPL", "MSFT", "0700.HK"]), run_date=date(2026, 3, 20))
+
+        df = results.read("scans", columns=["symbol", "score"], markets=["us"], symbols=["MSFT", "0700.HK"])
+        assert list(df.columns) == ["symbol", "score"]
+        assert list(df["symbol"]) == ["MSFT"]
+
+    def test_dataset_is_lazy(self, results: ParquetStore) -> None:
+        results.write("scans", _scans(["AAPL"]), run_date=date(2026, 3, 20))
+        dataset = results.dataset("scans")
+        assert dataset.count_rows() == 1
+        assert "score" in dataset.schema.names
+
+    def test_rejects_bad_tables(self, results: ParquetStore) -> None:
+        with pytest.raises(ValueError, match="symbol"):
+            results.write("scans", pd.DataFrame({"score": [1.0]}))
+        with pytest.raises(ValueError, match="partition key"):
+            results.write("scans", _scans(["AAPL"]).assign(date="2026-03-20"))
+        with pytest.raises(FileNotFoundError):
+            results.read("missing")
+        assert results.dates("missing") == []
+
+    def test_backtest_tables(self, results: ParquetStore) -> None:
+        idx = pd.bdate_range("2025-01-01", periods=3)
+        result = BacktestResult(
+            symbol="AAPL",
+            period="1y",
+            initial_capital=100000,
+            final_value=101000.0,
+            total_return=1.0,
+            annualized_return=12.0,
+            sharpe_ratio=1.5,
+            max_drawdown=-0.5,
+            win_rate=100.0,
+            total_trades=1,
+            trades=[Trade(idx[0], 100.0, idx[2], 101.0, 1.0, 2)],
+            equity_curve=pd.Series([100000.0, 100500.0, 101000.0], index=idx),
+        )
+        for name, df in backtest_tables([result]).items():
+            results.write(name, df, run_date=date(2026, 3, 20))
+
+        equity = results.read("equity", columns=["timestamp", "equity"])
+        assert list(equity["equity"]) == [100000.0, 100500.0, 101000.0]
+        assert list(pd.DatetimeIndex(equity["timestamp"])) == list(idx)
+        assert results.read("backtests", columns=["total_trades"])["total_trades"].tolist() == [1]
+        assert results.read("trades", columns=["holding_days"])["holding_days"].tolist() == [2]
+
+    def test_anomaly_frame(self, results: ParquetStore) -> None:
+        anomaly = Anomaly(date(2026, 3, 19), "AAPL", "volume_surge", "alert", 4.2, "Volume 5x average")
+        results.write("anomalies", anomaly_frame([anomaly]), run_date=date(2026, 3, 20))
+
+        df = results.read("anomalies", columns=["day", "symbol", "z_score"])
+        assert df["day"].iloc[0] == pd.Timestamp("2026-03-19")
+        assert df["z_score"].iloc[0] == 4.2
+
+
+def _record(symbol: str, score: float, close: float = 100.0) -> ScoreRecord:
+    return ScoreRecord(symbol, close, score, 0.1, 0.2, 0.3, "Neutral")
+
+
+class TestScoreStore:
+    def test_empty_store(self, tmp_path: Path) -> None:
+        store = ScoreStore(tmp_path / "scores.db")
+        assert store.latest() == []
+        assert store.top_movers() == []
+        assert store.history("AAPL").empty
+        assert store.last_run() is None
+
+    def test_latest_and_history(self, tmp_path: Path) -> None:
+        store = ScoreStore(tmp_path / "scores.db")
+        store.record_run([_record("AAPL", 0.1), _record("MSFT", 0.2)], run_ts=datetime(2026, 3, 20, 9))
+        store.record_run([_record("AAPL", 0.4, close=105.0)], run_ts=datetime(2026, 3, 20, 15))
+
+        latest = {r.symbol: r for r in store.latest()}
+        assert latest["AAPL"].score == 0.4
+        assert latest["AAPL"].run_ts == datetime(2026, 3, 20, 15)
+        assert latest["MSFT"].run_ts == datetime(2026, 3, 20, 9)
+        assert [r.symbol for r in store.latest(["MSFT", "NVDA"])] == ["MSFT"]
+        assert [r.symbol for r in store.latest(since=datetime(2026, 3, 20, 12))] == ["AAPL"]
+
+        history = store.history("AAPL")
+        assert list(history["score"]) == [0.1, 0.4]
+        assert list(history["close"]) == [100.0, 105.0]
+        assert history.index[-1] == pd.Timestamp("2026-03-20 15:00")
+        assert len(store.history("AAPL", since=datetime(2026, 3, 20, 12))) == 1
+        assert store.last_run() == datetime(2026, 3, 20, 15)
+
+    def test_top_movers(self, tmp_path: Path) -> None:
+        store = ScoreStore(tmp_path / "scores.db")
+        store.record_run([_record("AAPL", 0.1), _record("MSFT", 0.2), _record("NVDA", 0.0)], datetime(2026, 3, 19))
+        store.record_run([_record("AAPL", -0.3), _record("MSFT", 0.25)], datetime(2026, 3, 20))
+        store.record_run([_record("TSLA", 0.5)], datetime(2026, 3, 21))
+
+        moves = store.top_movers()
+        assert [m.symbol for m in moves] == ["AAPL", "MSFT"]  # NVDA and TSLA have one scan each
+        assert moves[0].change == pytest.approx(-0.4)
+        assert moves[0].previous_run_ts == datetime(2026, 3, 19)
+        assert [m.symbol for m in store.top_movers(limit=1)] == ["AAPL"]
+        assert [m.symbol for m in store.top_movers(symbols=["MSFT"])] == ["MSFT"]
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        store = ScoreStore(tmp_path / "scores.db")
+        store.record_run([_record("AAPL", 0.1)])
+        store.record_run([_record("AAPL", 0.3)])
+        store.close()
+
+        reopened = ScoreStore(tmp_path / "scores.db")
+        assert reopened.top_movers()[0].change == pytest.approx(0.2)
+
+
+def _is_mapped(values: np.ndarray) -> bool:
+    """Whether an array is a view of a memory-mapped file."""
+    base = values
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return True
+        base = getattr(base, "base", None)
+    return False
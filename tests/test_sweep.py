@@ -0,0 +1,68 @@
+"""Tests for threshold sweeps."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.strategies.backtester import Backtester
+from ai_financial_advisor.strategies.sweep import METRIC_COLUMNS, sweep_thresholds, threshold_range
+from ai_financial_advisor.strategies.trend_strategy import TrendScoreStrategy, score_history
+
+
+class TestThresholdRange:
+    def test_inclusive_range(self):
+        np.testing.assert_array_equal(threshold_range("0.1:0.3:0.05"), [0.1, 0.15, 0.2, 0.25, 0.3])
+
+    def test_negative_range(self):
+        np.testing.assert_array_equal(threshold_range("-0.6:-0.5:0.05"), [-0.6, -0.55, -0.5])
+
+    def test_list_and_single_value(self):
+        np.testing.assert_array_equal(threshold_range("0.3,0.1,0.3"), [0.1, 0.3])
+        np.testing.assert_array_equal(threshold_range("0.2"), [0.2])
+
+    @pytest.mark.parametrize("spec", ["0.1:0.5", "0.1:0.5:0", "0.1:0.5:-0.1", "abc"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            threshold_range(spec)
+
+
+class TestSweepThresholds:
+    def test_grid_shape(self, make_ohlcv):
+        grid = sweep_thresholds(score_history(make_ohlcv(250)), [0.1, 0.2, 0.3], [-0.3, -0.2])
+        assert len(grid) == 6
+        assert list(grid.columns) == ["buy_threshold", "sell_threshold", *METRIC_COLUMNS]
+        assert set(zip(grid["buy_threshold"], grid["sell_threshold"])) == {
+            (b, s) for b in (0.1, 0.2, 0.3) for s in (-0.3, -0.2)
+        }
+
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_matches_backtester_run(self, make_ohlcv, seed):
+        df = make_ohlcv(250, seed=seed)
+        buys, sells = threshold_range("-0.1:0.5:0.1"), threshold_range("-0.5:0.1:0.1")
+        grid = sweep_thresholds(score_history(df), buys, sells, initial_capital=10000)
+
+        for row in grid.itertuples():
+            strategy = TrendScoreStrategy(buy_threshold=row.buy_threshold, sell_threshold=row.sell_threshold)
+            result = Backtester(initial_capital=10000).run(strategy.generate_signals(df))
+            for column in METRIC_COLUMNS:
+                assert getattr(row, column) == getattr(result, column), (row.buy_threshold, row.sell_threshold)
+
+    def test_chunked_grid_matches(self, make_ohlcv, monkeypatch):
+        history = score_history(make_ohlcv(250))
+        buys, sells = threshold_range("0:0.4:0.1"), threshold_range("-0.4:0:0.1")
+        expected = sweep_thresholds(history, buys, sells)
+        monkeypatch.setattr("ai_financial_advisor.strategies.sweep._CHUNK_CELLS", len(history) * 3)
+        pd.testing.assert_frame_equal(sweep_thresholds(history, buys, sells), expected)
+
+    def test_no_trades(self, make_ohlcv):
+        grid = sweep_thresholds(score_history(make_ohlcv(250)), [5.0], [-5.0], initial_capital=5000)
+        row = grid.iloc[0]
+        assert row["total_trades"] == 0
+        assert row["final_value"] == 5000
+        assert row["total_return"] == 0.0
+        assert row["win_rate"] == 0.0
+
+    def test_empty_history(self, make_ohlcv):
+        grid = sweep_thresholds(score_history(make_ohlcv(20)), [0.3], [-0.3])
+        assert grid.iloc[0]["final_value"] == 100000
+        assert grid.iloc[0]["total_trades"] == 0
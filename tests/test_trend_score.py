@@ -1,14 +1,29 @@
 """Tests for composite trend score calculation."""
 
+import numpy as np
 import pandas as pd
 
 from ai_financial_advisor.analysis.indicators import compute_all_indicators
 from ai_financial_advisor.analysis.trend_score import (
     TrendScoreResult,
     calculate_trend_score,
+    trend_score_series,
 )
 
 
+def _assert_matches_per_row(df: pd.DataFrame, start: int = 30, **kwargs: object) -> None:
+    """Every row of trend_score_series must equal the per-prefix scalar result."""
+    series = trend_score_series(df, **kwargs)
+    for i in range(start, len(df) + 1):
+        expected = calculate_trend_score(df.iloc[:i], **kwargs)
+        row = series.iloc[i - 1]
+        assert row["score"] == expected.score
+        assert row["macd_signal"] == expected.macd_signal
+        assert row["mfi_signal"] == expected.mfi_signal
+        assert row["obv_signal"] == expected.obv_signal
+        assert row["interpretation"] == expected.interpretation
+
+
 class TestTrendScore:
     def test_returns_result_dataclass(self, sample_ohlcv: pd.DataFrame) -> None:
         df = compute_all_indicators(sample_ohlcv)
@@ -53,3 +68,60 @@ class TestTrendScore:
         # All weight on MACD
         result = calculate_trend_score(df, weights={"macd": 1.0, "mfi": 0.0, "obv": 0.0})
         assert result.score == result.macd_signal
+
+
+class TestTrendScoreSeries:
+    def test_returns_row_per_input(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = compute_all_indicators(sample_ohlcv)
+        series = trend_score_series(df)
+        assert list(series.index) == list(df.index)
+        assert {"score", "macd_signal", "mfi_signal", "obv_signal", "interpretation"} <= set(series.columns)
+
+    def test_last_row_matches_scalar(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = compute_all_indicators(sample_ohlcv)
+        last = trend_score_series(df).iloc[-1]
+        result = calculate_trend_score(df)
+        assert last["score"] == result.score
+        assert last["interpretation"] == result.interpretation
+
+    def test_matches_every_prefix(self, sample_ohlcv: pd.DataFrame, downtrend_ohlcv: pd.DataFrame) -> None:
+        _assert_matches_per_row(compute_all_indicators(sample_ohlcv))
+        _assert_matches_per_row(compute_all_indicators(downtrend_ohlcv))
+
+    def test_matches_with_custom_params(self, sample_ohlcv: pd.DataFrame) -> None:
+        df = compute_all_indicators(sample_ohlcv)
+        _assert_matches_per_row(
+            df,
+            weights={"macd": 0.5, "mfi": 0.2, "obv": 0.3},
+            macd_std_window=10,
+            obv_slope_window=8,
+        )
+
+    def test_matches_without_volume(self, sample_ohlcv: pd.DataFrame) -> None:
+        # Forex-style data: compute_all_indicators skips MFI and OBV
+        df = compute_all_indicators(sample_ohlcv.assign(Volume=0.0))
+        assert "MFI" not in df.columns
+        _assert_matches_per_row(df)
+        assert (trend_score_series(df)["mfi_signal"] == 0.0).all()
+
+    def test_matches_during_mfi_warmup(self, sample_ohlcv: pd.DataFrame) -> None:
+        # MFI is NaN for the first rows, so early prefixes redistribute its weight to MACD/OBV
+        df = compute_all_indicators(sample_ohlcv)
+        assert df["MFI"].iloc[:5].isna().all()
+        _assert_matches_per_row(df, start=6)
+
+    def test_matches_long_random_walk(self) -> None:
+        rng = np.random.default_rng(7)
+        n = 400
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        raw = pd.DataFrame(
+            {
+                "Open": close,
+                "High": close * 1.01,
+                "Low": close * 0.99,
+                "Close": close,
+                "Volume": rng.integers(1_000, 100_000, n).astype(float),
+            },
+            index=pd.bdate_range("2020-01-01", periods=n),
+        )
+        _assert_matches_per_row(compute_all_indicators(raw))
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from ai_financial_advisor.analysis.indicators import compute_all_indicators
+from ai_financial_advisor.analysis.trend_score import calculate_trend_score
 from ai_financial_advisor.strategies.trend_strategy import (
     Signal,
     TrendScoreStrategy,
@@ -57,6 +58,14 @@ class TestCalculateRollingTrendScores:
         scores = calculate_rolling_trend_scores(df)
         assert (scores >= -1.0).all() and (scores <= 1.0).all()
 
+    def test_matches_per_day_calculation(self):
+        df = compute_all_indicators(_make_ohlcv(120))
+        scores = calculate_rolling_trend_scores(df)
+        expected = pd.Series(
+            {df.index[i - 1]: calculate_trend_score(df.iloc[:i]).score for i in range(30, len(df) + 1)}
+        )
+        pd.testing.assert_series_equal(scores, expected, check_freq=False)
+
     def test_custom_window(self):
         df = compute_all_indicators(_make_ohlcv(60))
         scores_5 = calculate_rolling_trend_scores(df, window=5)
@@ -94,6 +103,17 @@ class TestTrendScoreStrategy:
         holds_loose = sum(1 for s in signals_loose if s.action == "hold")
         assert holds_loose >= holds_tight
 
+    def test_signal_frame_matches_signals(self):
+        df = _make_ohlcv(80)
+        strategy = TrendScoreStrategy(buy_threshold=0.1, sell_threshold=-0.1)
+        frame = strategy.generate_signal_frame(df)
+        signals = strategy.generate_signals(df)
+
+        assert list(frame.columns) == ["score", "price", "action"]
+        assert list(frame.index) == [s.date for s in signals]
+        assert frame["action"].tolist() == [s.action for s in signals]
+        assert frame["price"].tolist() == [s.price for s in signals]
+
     def test_signals_have_prices(self):
         df = _make_ohlcv(60)
         strategy = TrendScoreStrategy()
@@ -0,0 +1,139 @@
+"""Tests for walk-forward optimization."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_financial_advisor.strategies.backtester import METRIC_COLUMNS
+from ai_financial_advisor.strategies.sweep import sweep_thresholds
+from ai_financial_advisor.strategies.trend_strategy import score_history
+from ai_financial_advisor.strategies.walk_forward import (
+    ParameterGrid,
+    ScoreCache,
+    WalkForwardOptimizer,
+    walk_forward_splits,
+    weight_grid,
+)
+
+
+def _small_grid() -> ParameterGrid:
+    return ParameterGrid(
+        weights=weight_grid(0.5),
+        macd_std_windows=(5, 10),
+        obv_slope_windows=(5, 20),
+        buy_thresholds=(0.1, 0.3),
+        sell_thresholds=(-0.3, -0.1),
+    )
+
+
+class TestWeightGrid:
+    def test_weights_sum_to_one(self):
+        weights = weight_grid(0.25)
+        assert len(weights) == 15
+        assert all(w["macd"] + w["mfi"] + w["obv"] == pytest.approx(1.0) for w in weights)
+        assert weights[0] == {"macd": 1.0, "mfi": 0.0, "obv": 0.0}
+
+    @pytest.mark.parametrize("step", [0, -0.1, 0.3, 2])
+    def test_invalid_step(self, step):
+        with pytest.raises(ValueError):
+            weight_grid(step)
+
+
+class TestSplits:
+    def test_rolling(self):
+        splits = walk_forward_splits(10, train_days=4, test_days=2)
+        assert splits == [
+            (slice(0, 4), slice(4, 6)),
+            (slice(2, 6), slice(6, 8)),
+            (slice(4, 8), slice(8, 10)),
+        ]
+
+    def test_anchored_with_step(self):
+        splits = walk_forward_splits(12, train_days=4, test_days=2, step_days=3, anchored=True)
+        assert splits == [(slice(0, 4), slice(4, 6)), (slice(0, 7), slice(7, 9)), (slice(0, 10), slice(10, 12))]
+
+    def test_too_short(self):
+        assert walk_forward_splits(5, train_days=4, test_days=2) == []
+
+    def test_overlapping_tests_rejected(self):
+        with pytest.raises(ValueError):
+            walk_forward_splits(100, train_days=20, test_days=10, step_days=5)
+
+
+class TestScoreCache:
+    def test_columns_match_score_history(self, make_ohlcv):
+        df = make_ohlcv(600)
+        cache = ScoreCache.build(df, _small_grid().scoring())
+        for i, params in enumerate(cache.scoring):
+            history = score_history(
+                df,
+                weights=params.weights,
+                macd_std_window=params.macd_std_window,
+                obv_slope_window=params.obv_slope_window,
+            )
+            pd.testing.assert_index_equal(cache.index, pd.DatetimeIndex(history.index))
+            np.testing.assert_array_equal(cache.scores[:, i], history["score"].to_numpy())
+            np.testing.assert_array_equal(cache.prices, history["price"].to_numpy())
+
+
+class TestWalkForwardOptimizer:
+    def test_folds_pick_best_train_params(self, make_ohlcv):
+        df = make_ohlcv(600)
+        grid = _small_grid()
+        report = WalkForwardOptimizer(grid, train_days=250, test_days=100).run(df, symbol="TEST")
+
+        assert report.symbol == "TEST"
+        assert list(report.folds["fold"]) == [1, 2, 3]
+        assert set(METRIC_COLUMNS) <= set(report.folds.columns)
+        assert (report.folds["seconds"] > 0).all()
+
+        for row in report.folds.itertuples():
+            weights = {"macd": row.w_macd, "mfi": row.w_mfi, "obv": row.w_obv}
+            history = score_history(
+                df, weights=weights, macd_std_window=row.macd_std_window, obv_slope_window=row.obv_slope_window
+            )
+            # Out of sample: the chosen pair traded on the test window alone
+            test = sweep_thresholds(
+                history.loc[row.test_start : row.test_end], [row.buy_threshold], [row.sell_threshold]
+            )
+            for column in METRIC_COLUMNS:
+                assert getattr(row, column) == test[column].iloc[0]
+
+            # In sample: nothing in the grid beats the chosen parameters
+            assert row.train_objective == pytest.approx(_best_train_sharpe(df, grid, row.train_start, row.train_end))
+
+    def test_report_compounds_test_returns(self, make_ohlcv):
+        report = WalkForwardOptimizer(_small_grid(), train_days=250, test_days=100).run(make_ohlcv(600))
+        growth = np.prod(1 + report.folds["total_return"] / 100)
+        assert report.total_return == pytest.approx((growth - 1) * 100, abs=1e-4)
+        assert report.mean_sharpe == pytest.approx(report.folds["sharpe_ratio"].mean(), abs=1e-4)
+        assert report.profitable_folds == (report.folds["total_return"] > 0).sum()
+
+    def test_pool_matches_inline(self, make_ohlcv):
+        df = make_ohlcv(600)
+        inline = WalkForwardOptimizer(_small_grid(), train_days=250, test_days=100).run(df)
+        pooled = WalkForwardOptimizer(_small_grid(), train_days=250, test_days=100, workers=2, mode="thread").run(df)
+        assert not pooled.errors
+        pd.testing.assert_frame_equal(inline.folds.drop(columns="seconds"), pooled.folds.drop(columns="seconds"))
+
+    def test_too_little_history(self, make_ohlcv):
+        with pytest.raises(ValueError, match="scored days"):
+            WalkForwardOptimizer(_small_grid(), train_days=500, test_days=200).run(make_ohlcv(300))
+
+    def test_unknown_objective(self):
+        with pytest.raises(ValueError, match="Unknown objective"):
+            WalkForwardOptimizer(objective="profit")
+
+
+def _best_train_sharpe(df: pd.DataFrame, grid: ParameterGrid, start, end) -> float:
+    best = -np.inf
+    for params in grid.scoring():
+        history = score_history(
+            df,
+            weights=params.weights,
+            macd_std_window=params.macd_std_window,
+            obv_slope_window=params.obv_slope_window,
+        )
+        sweep = sweep_thresholds(history.loc[start:end], grid.buy_thresholds, grid.sell_thresholds)
+        best = max(best, sweep["sharpe_ratio"].max())
+    return best